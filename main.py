@@ -20,7 +20,12 @@ from pathlib import Path
 import logging
 import os
 import multiprocessing
-import time
+
+# Imported first so its clock and the optional import hook
+# (WIFI_TOOL_PROFILE_STARTUP=1 or --profile-startup) cover the GUI imports.
+from src.util.startup_profiler import STARTUP_PROFILER
+
+STARTUP_PROFILER.install_import_hook()
 
 from PyQt5.QtWidgets import QApplication
 from qfluentwidgets import setTheme, Theme
@@ -39,21 +44,20 @@ sys.excepthook = log_exception
 
 if __name__ == "__main__":
     multiprocessing.freeze_support()
-    _t0 = time.perf_counter()
     logging.basicConfig(
         level=logging.WARNING,
         format="%(asctime)s - %(levelname)s - %(message)s",
     )
     try:
-        print(f"[STARTUP_TIME] start: 0.000s")
+        STARTUP_PROFILER.mark("start")
         app = QApplication(sys.argv)
-        print(f"[STARTUP_TIME] QApplication: {time.perf_counter() - _t0:.3f}s")
+        STARTUP_PROFILER.mark("QApplication")
         setTheme(Theme.DARK)
-        print(f"[STARTUP_TIME] setTheme: {time.perf_counter() - _t0:.3f}s")
+        STARTUP_PROFILER.mark("setTheme")
         window = MainWindow()
-        print(f"[STARTUP_TIME] MainWindow(): {time.perf_counter() - _t0:.3f}s")
+        STARTUP_PROFILER.mark("MainWindow()")
         window.show()
-        print(f"[STARTUP_TIME] show(): {time.perf_counter() - _t0:.3f}s")
+        STARTUP_PROFILER.mark("show()")
         sys.exit(app.exec())
     finally:
         cleanup_temp_dir()
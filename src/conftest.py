@@ -21,8 +21,6 @@ from contextlib import suppress
 from datetime import datetime
 from pathlib import Path
 from typing import Annotated
-import pandas as pd
-from openpyxl.styles import Font
 import yaml
 
 import pytest
@@ -39,7 +37,8 @@ from src.tools.performance_result import PerformanceResult
 from src.util.constants import load_config
 from src.tools.router_tool.Router import Router
 from src.tools.reporting import generate_project_report
-from src.test.pyqt_log import emit_pyqt_message
+from src.util.run_events import CaseProgress, CaseStarted, publish
+from src.util.run_estimator import RUN_ESTIMATOR, plan_steps_from_items
 from src.test.compatibility.results import write_compatibility_results
 from collections import defaultdict
 
@@ -106,6 +105,11 @@ def _maybe_apply_xiaomi_presets(pytest_config: pytest.Config) -> None:
 
 
 def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line(
+        "markers",
+        "lab_resources(*claims): lab resources the script needs, e.g. 'router:shared', 'serial'; "
+        "read by the Excel plan runner to run non-conflicting cases in parallel",
+    )
     _maybe_apply_xiaomi_presets(config)
 
 # ------------------------------------# Helpers# -----------------------------
@@ -498,6 +502,15 @@ def _maybe_generate_project_report() -> None:
         logging.exception("Failed to generate project Wi‑Fi performance report")
 
 
+def _worker_log_dir() -> Path:
+    """Directory holding ``pytest.log`` and ``kernel_log.txt`` for this worker.
+
+    Workers that run side by side (one per DUT) get their own directory via
+    ``PYTEST_WORKER_LOG_DIR``; otherwise the logs live in the working directory.
+    """
+    return Path(os.environ.get("PYTEST_WORKER_LOG_DIR") or ".")
+
+
 # ----------------------------------------------------------------------------
 # Pytest hooks
 # ----------------------------------------------------------------------------
@@ -536,7 +549,12 @@ def pytest_sessionstart(session):
 
     # Connection type setup
     connect_cfg = pytest.config.get("connect_type") or {}
-    pytest.connect_type = session.config.getoption("--dut-type") or connect_cfg.get("type")
+    # Multi-DUT workers pin their DUT through the environment, which also
+    # works in EXE mode where custom command-line options are filtered out.
+    dut_override = json.loads(os.environ.get("PYTEST_DUT_OVERRIDE") or "{}")
+    pytest.connect_type = (
+        dut_override.get("type") or session.config.getoption("--dut-type") or connect_cfg.get("type")
+    )
     pytest.third_party_cfg = connect_cfg.get("third_party", {})
 
     # Serial (kernel log) setup
@@ -552,6 +570,7 @@ def pytest_sessionstart(session):
         serial_inst = serial_tool(
             serial_port=serial_cfg.get('port', ''),
             baud=serial_cfg.get('baud', ''),
+            log_file=str(_worker_log_dir() / "kernel_log.txt"),
             enable_log=True,
         )
         logging.info("Serial logging enabled; kernel_log.txt will be captured.")
@@ -563,7 +582,12 @@ def pytest_sessionstart(session):
     match pytest.connect_type:
         case "Android" | "adb":
             adb_cfg = connect_cfg.get("Android") or {}
-            device = session.config.getoption("--android-device") or adb_cfg.get("device") or ""
+            device = (
+                dut_override.get("address")
+                or session.config.getoption("--android-device")
+                or adb_cfg.get("device")
+                or ""
+            )
             project_cfg = pytest.config.get("project") or {}
             customer = session.config.getoption("--project-customer") or project_cfg.get("customer") or ""
             customer = str(customer).strip().upper()
@@ -574,7 +598,9 @@ def pytest_sessionstart(session):
                     pytest.dut = android(serialnumber=device)
         case "Linux"| "telnet":
             telnet_cfg = connect_cfg.get("Linux") or {}
-            telnet_ip = session.config.getoption("--linux-ip") or telnet_cfg.get("ip")
+            telnet_ip = (
+                dut_override.get("address") or session.config.getoption("--linux-ip") or telnet_cfg.get("ip")
+            )
             project_cfg = pytest.config.get("project") or {}
             customer = session.config.getoption("--project-customer") or project_cfg.get("customer") or ""
             customer = str(customer).strip().upper()
@@ -620,6 +646,7 @@ def pytest_collection_finish(session):
     After test collection completes:
       - Detect selected Wi‑Fi test types from collected paths.
       - Record total test count for PyQt progress display.
+      - Start the step-based run-time estimate for performance sweeps.
 
     Args:
         session (pytest.Session): The current pytest session object.
@@ -628,6 +655,10 @@ def pytest_collection_finish(session):
     # fixtures are already expanded into individual items, so this total
     # naturally reflects (ip, port, band, test) combinations.
     session.total_test_count = len(session.items)
+    try:
+        RUN_ESTIMATOR.begin(plan_steps_from_items(session.items))
+    except Exception as exc:
+        logging.debug("Run-time estimate unavailable: %s", exc)
 
     # Detect selected test types based on path hints
     selected_types: set[str] = set()
@@ -663,7 +694,7 @@ def pytest_runtest_setup(item):
     Args:
         item (pytest.Item): The test item about to run.
     """
-    emit_pyqt_message("CASE", item.originalname)
+    publish(CaseStarted(item.originalname))
 
 
 def pytest_runtest_logreport(report):
@@ -745,7 +776,7 @@ def pytest_runtest_teardown(item, nextitem):
         return
     session.pyqt_finished += 1
     total = getattr(session, "total_test_count", None) or len(session.items)
-    emit_pyqt_message("PROGRESS", f" {session.pyqt_finished}/{total}")
+    publish(CaseProgress(session.pyqt_finished, total))
     item._pyqt_progress_recorded = True
 
 
@@ -788,6 +819,10 @@ def pytest_sessionfinish(session, exitstatus):
         exitstatus (int): Pytest exit status code.
     """
     result_path = getattr(pytest, "_result_path", None)
+    RUN_ESTIMATOR.finish()
+    test_result = getattr(pytest, "testResult", None)
+    if isinstance(test_result, PerformanceResult):
+        test_result.close()
     try:
         pytest._session_duration_seconds = max(0.0, time.time() - float(getattr(pytest, "_session_start_ts", time.time())))
     except Exception:
@@ -856,11 +891,11 @@ def pytest_sessionfinish(session, exitstatus):
             )
 
         # --- [原有逻辑] 复制日志文件 ---
-        src_log = Path("pytest.log")
+        src_log = _worker_log_dir() / "pytest.log"
         if destination_dir and src_log.exists():
             shutil.copy(src_log, destination_dir / "debug.log")
 
-        ser_log = Path("kernel_log.txt")
+        ser_log = _worker_log_dir() / "kernel_log.txt"
         if destination_dir and ser_log.exists():
             try:
                 shutil.copy(ser_log, destination_dir / "kernel.log")
@@ -971,6 +1006,8 @@ def _update_excel_with_tcid_result(tcid: str, final_status: str, step_details: s
         return
 
     if re.match(r"^WiFi-STA-[A-Z0-9]+$", tcid):
+        import pandas as pd
+
         try:
             df_headers = pd.read_excel(excel_path, nrows=0)  # 只读表头
             required_cols = ["Status", "Step_Details"]
@@ -0,0 +1,298 @@
+"""Pipelined AP power scheduling for compatibility runs.
+
+The compatibility suite iterates over every router attached to the PDU and
+historically powered exactly one of them at a time, paying the full boot time
+of each AP as idle lab time.  :class:`CompatibilityPipeline` keeps the same
+ordering but powers up the next AP(s) while the current one is being tested,
+bounded by :class:`PipelinePolicy`:
+
+* ``max_powered`` limits how many APs may be energised at once.
+* ``rf_isolation`` describes which APs can radiate concurrently without the
+  DUT seeing a look-alike SSID: ``"none"`` (no overlap, legacy behaviour),
+  ``"pdu"`` (APs on different PDUs sit in separate shield boxes) or
+  ``"port"`` (every PDU port has its own shield box).
+
+The policy is read from ``compatibility.pipeline`` in
+``config_compatibility.yaml``; when disabled the pipeline degrades to the
+original "power on, wait, test, power off" sequence.  With ``readiness``
+enabled the fixed ``boot_seconds`` wait is replaced by an active probe (see
+:mod:`src.tools.network_tool.readiness`) bounded by ``boot_timeout``.
+
+An optional ``prepare`` hook pre-configures each AP: for pre-powered APs it
+runs in the background thread right after power-on, so the AP's setup is
+ready when the fixture reaches it; :meth:`CompatibilityPipeline.prepared`
+returns the result (running the hook in the foreground when it has not run).
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional, Sequence
+
+__all__ = ["PipelinePolicy", "CompatibilityPipeline"]
+
+Target = tuple[str, int]
+
+RF_ISOLATION_MODES = ("none", "pdu", "port")
+
+
+@dataclass(frozen=True)
+class PipelinePolicy:
+    """Normalized pipeline configuration."""
+
+    enabled: bool = False
+    max_powered: int = 1
+    rf_isolation: str = "none"
+    boot_seconds: float = 30.0
+    readiness: bool = False
+    boot_timeout: float = 180.0
+    beacon_scan: bool = False
+
+    @classmethod
+    def from_config(cls, config: Mapping[str, Any] | None) -> "PipelinePolicy":
+        """Build a policy from the merged configuration mapping."""
+
+        compat = config.get("compatibility") if isinstance(config, Mapping) else None
+        section = compat.get("pipeline") if isinstance(compat, Mapping) else None
+        if not isinstance(section, Mapping):
+            return cls()
+        try:
+            max_powered = max(1, int(section.get("max_powered") or 1))
+        except (TypeError, ValueError):
+            max_powered = 1
+        try:
+            boot_seconds = max(0.0, float(section.get("boot_seconds", 30)))
+        except (TypeError, ValueError):
+            boot_seconds = 30.0
+        try:
+            boot_timeout = max(1.0, float(section.get("boot_timeout", 180)))
+        except (TypeError, ValueError):
+            boot_timeout = 180.0
+        isolation = str(section.get("rf_isolation") or "none").strip().lower()
+        if isolation not in RF_ISOLATION_MODES:
+            logging.warning("Unknown rf_isolation %r; falling back to 'none'", isolation)
+            isolation = "none"
+        return cls(
+            enabled=bool(section.get("enabled")),
+            max_powered=max_powered,
+            rf_isolation=isolation,
+            boot_seconds=boot_seconds,
+            readiness=bool(section.get("readiness")),
+            boot_timeout=boot_timeout,
+            beacon_scan=bool(section.get("beacon_scan")),
+        )
+
+    @property
+    def overlapping(self) -> bool:
+        """Return True when more than one AP may be powered at once."""
+
+        return self.enabled and self.max_powered > 1 and self.rf_isolation != "none"
+
+    def isolated(self, first: Target, second: Target) -> bool:
+        """Return True when ``first`` and ``second`` may radiate concurrently."""
+
+        if first == second:
+            return False
+        if self.rf_isolation == "port":
+            return True
+        if self.rf_isolation == "pdu":
+            return first[0] != second[0]
+        return False
+
+
+class CompatibilityPipeline:
+    """Power APs ahead of time so boot overlaps with testing.
+
+    Parameters:
+        power: Relay controller exposing ``switch(ip, port, status)``.
+        order: Targets in the order the fixture will request them.
+        policy: Concurrency and RF isolation policy.
+        wait_ready: Optional callable ``(target, powered_at, timeout) -> float | None``
+            used instead of the fixed ``boot_seconds`` wait.  It returns the
+            measured boot time or ``None`` on timeout.
+        prepare: Optional callable ``(target) -> Any`` that pre-configures an
+            AP; see :meth:`prepared`.
+    """
+
+    ON = 1
+    OFF = 2
+
+    def __init__(
+        self,
+        power: Any,
+        order: Sequence[Target] | Iterable[Target],
+        policy: PipelinePolicy | None = None,
+        *,
+        wait_ready: Optional[Callable[[Target, float, float], Optional[float]]] = None,
+        prepare: Optional[Callable[[Target], Any]] = None,
+    ) -> None:
+        self._power = power
+        self._order: list[Target] = [(str(ip), int(port)) for ip, port in order]
+        self.policy = policy or PipelinePolicy()
+        self._wait_ready = wait_ready
+        self._prepare = prepare
+        self._prepared: Dict[Target, Any] = {}
+        self._lock = threading.Lock()
+        self._powered_at: Dict[Target, float] = {}
+        self._switching: Dict[Target, threading.Thread] = {}
+        self._done: set[Target] = set()
+        self._active: Optional[Target] = None
+        self.boot_times: Dict[Target, Optional[float]] = {}
+
+    # ------------------------------------------------------------------
+    # public API
+    # ------------------------------------------------------------------
+    def acquire(self, target: Target) -> Optional[float]:
+        """Ensure ``target`` is powered and booted, then prefetch the next APs.
+
+        Returns the boot time in seconds measured from power-on, or ``None``
+        when the readiness probe timed out.
+        """
+
+        target = (str(target[0]), int(target[1]))
+        with self._lock:
+            self._active = target
+            pending = self._switching.pop(target, None)
+        if pending is not None:
+            pending.join()
+        with self._lock:
+            powered_at = self._powered_at.get(target)
+        if powered_at is None:
+            # Make sure no RF-conflicting AP is still radiating before we boot.
+            self._power_off_conflicts(target)
+            powered_at = self._power_on(target)
+        else:
+            logging.info("[PIPELINE] %s:%s was pre-powered %.1fs ago", *target, time.time() - powered_at)
+
+        boot_time = self._wait_booted(target, powered_at)
+        self.boot_times[target] = boot_time
+        if self.policy.overlapping:
+            self._prefetch(target)
+        return boot_time
+
+    def prepared(self, target: Target) -> Any:
+        """Return the ``prepare`` result for ``target``, running the hook if needed."""
+
+        target = (str(target[0]), int(target[1]))
+        with self._lock:
+            if target in self._prepared:
+                return self._prepared[target]
+        if self._prepare is None:
+            return None
+        result = self._prepare(target)
+        with self._lock:
+            self._prepared[target] = result
+        return result
+
+    def release(self, target: Target) -> None:
+        """Power off ``target`` once its tests have finished."""
+
+        target = (str(target[0]), int(target[1]))
+        with self._lock:
+            self._done.add(target)
+            if self._active == target:
+                self._active = None
+            self._powered_at.pop(target, None)
+            self._prepared.pop(target, None)
+        logging.info("[PIPELINE] test done, shutting down %s:%s", *target)
+        self._power.switch(target[0], target[1], self.OFF)
+
+    def shutdown(self) -> None:
+        """Wait for in-flight power switches and turn every pre-powered AP off."""
+
+        with self._lock:
+            threads = list(self._switching.values())
+            self._switching.clear()
+        for thread in threads:
+            thread.join()
+        with self._lock:
+            leftover = list(self._powered_at)
+            self._powered_at.clear()
+        if leftover and hasattr(self._power, "switch_many"):
+            self._power.switch_many(leftover, self.OFF)
+            return
+        for target in leftover:
+            self._power.switch(target[0], target[1], self.OFF)
+
+    # ------------------------------------------------------------------
+    # helpers
+    # ------------------------------------------------------------------
+    def _power_on(self, target: Target) -> float:
+        self._power.switch(target[0], target[1], self.ON)
+        powered_at = time.time()
+        with self._lock:
+            self._powered_at[target] = powered_at
+        return powered_at
+
+    def _preboot(self, target: Target) -> None:
+        self._power_on(target)
+        if self._prepare is None:
+            return
+        try:
+            result = self._prepare(target)
+        except Exception as exc:
+            # acquire() retries the hook in the foreground and surfaces the error there.
+            logging.warning("[PIPELINE] pre-configuring %s:%s failed: %s", *target, exc)
+            return
+        with self._lock:
+            self._prepared[target] = result
+
+    def _power_off_conflicts(self, target: Target) -> None:
+        with self._lock:
+            conflicts = [
+                other
+                for other in self._powered_at
+                if other != target and not self.policy.isolated(target, other)
+            ]
+            for other in conflicts:
+                self._powered_at.pop(other, None)
+        for other in conflicts:
+            logging.info("[PIPELINE] powering off %s:%s to keep RF isolation", *other)
+            self._power.switch(other[0], other[1], self.OFF)
+
+    def _wait_booted(self, target: Target, powered_at: float) -> Optional[float]:
+        if self._wait_ready is not None and self.policy.readiness:
+            return self._wait_ready(target, powered_at, self.policy.boot_timeout)
+        remaining = powered_at + self.policy.boot_seconds - time.time()
+        if remaining > 0:
+            time.sleep(remaining)
+        return time.time() - powered_at
+
+    def _prefetch(self, current: Target) -> None:
+        """Power up and pre-configure the next eligible targets in the background."""
+
+        with self._lock:
+            powered = set(self._powered_at) | set(self._switching)
+            budget = self.policy.max_powered - len(powered)
+            if budget <= 0:
+                return
+            try:
+                start = self._order.index(current) + 1
+            except ValueError:
+                start = 0
+            candidates: list[Target] = []
+            for target in self._order[start:]:
+                if budget <= 0:
+                    break
+                if target in self._done or target in powered:
+                    continue
+                # Prefetch strictly in order: stop at the first AP that would
+                # interfere with anything already radiating.
+                if not all(self.policy.isolated(target, other) for other in powered | set(candidates)):
+                    break
+                candidates.append(target)
+                budget -= 1
+            for target in candidates:
+                thread = threading.Thread(
+                    target=self._preboot,
+                    args=(target,),
+                    name=f"ap-preboot-{target[0]}-{target[1]}",
+                    daemon=True,
+                )
+                self._switching[target] = thread
+                thread.start()
+        for target in candidates:
+            logging.info("[PIPELINE] pre-powering %s:%s while %s:%s is under test", *target, *current)
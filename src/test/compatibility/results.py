@@ -6,7 +6,7 @@ from src.util.constants import load_config
 from src.tools.router_tool.Router import Router
 import threading
 from pathlib import Path
-from typing import Any, Dict, Tuple, Optional
+from typing import Any, Dict, Tuple, Optional, List
 
 # 全局状态（模块级）
 _ap_test_state: Dict[Tuple[str, int, str], Dict[str, Any]] = {}
@@ -190,6 +190,10 @@ def update_compat_test_result(
         compat_compare: "PASS" / "FAIL"
         return_value: tuple from test function
         metadata: optional dict containing pdu_ip, port, band, etc.
+
+    Returns:
+        The (ip, port, band) key that was updated, or None when metadata is
+        incomplete.
     """
 
     # 缓存元数据（如果提供了）
@@ -239,10 +243,14 @@ def update_compat_test_result(
                 "rx_channel": "N/A",
                 "rx_rssi": "N/A",
                 "rx_criteria": "N/A",
-                "rx_throughput": "N/A"
+                "rx_throughput": "N/A",
+                "boot_time": "N/A",
             }
 
         state = _ap_test_state[key]
+        boot_time = meta.get("boot_time")
+        if isinstance(boot_time, (int, float)):
+            state["boot_time"] = f"{boot_time:.1f}"
         status = "PASS" if compat_compare == "PASS" else "FAIL"
 
         def safe_get(lst, idx, default="N/A"):
@@ -271,82 +279,174 @@ def update_compat_test_result(
             state["rx_criteria"] = safe_get(return_value, 2)
             state["rx_throughput"] = safe_get(return_value, 3)
 
-    # test_compatibility.py
+    return key
+
+REALTIME_HEADER = [
+    "PDU IP", "PDU Port", "AP Brand", "AP Model", "Band", "Ssid",
+    "WiFi Mode", "Bandwidth", "Security",
+    "Scan", "Connect", "Ping",
+    "Channel", "RSSI",  "TX Throughtput(Mbps)","TX Criteria", "TX Result",
+    "RX Throughtput(Mbps)", "RX Criteria", "RX Result",
+    "AP Boot Time (s)",
+]
+
+
+def _evaluate_pass_fail(throughput_val, criteria_val):
+    """判断吞吐量是否达标"""
+    if throughput_val in ("N/A", "SKIP") or criteria_val == "N/A":
+        return "N/A"
+    try:
+        # 处理多值情况（如 "100,120,95"）
+        throughput_vals = [float(x) for x in str(throughput_val).split(',') if x.strip()]
+        criteria = float(criteria_val)
+        return "PASS" if all(v >= criteria for v in throughput_vals) else "FAIL"
+    except (ValueError, TypeError):
+        return "N/A"
+
+
+def _build_realtime_row(key: Tuple[str, int, str], state: Dict[str, Any]) -> List[Any]:
+    """Return the realtime CSV row for one (ip, port, band) state."""
+    ip, port, band = key
+
+    # === 智能推导 Scan / Connect ===
+    # 即使 TX/RX 是 SKIP，只要测试流程走到这里，Scan/Connect 就应为 PASS
+    scan_status = "PASS"
+    connect_status = "PASS"
+
+    # 显示 SKIP 而非 N/A
+    tx_val = state.get("tx_throughput", "N/A")
+    rx_val = state.get("rx_throughput", "N/A")
+    tx_display = "SKIP" if tx_val == "N/A" else tx_val
+    rx_display = "SKIP" if rx_val == "N/A" else rx_val
+    tx_result = _evaluate_pass_fail(tx_display, state["tx_criteria"])
+    rx_result = _evaluate_pass_fail(rx_display, state["rx_criteria"])
+
+    return [
+        ip,
+        port,
+        state["brand"],
+        state["modem2"],
+        band,
+        state["ssid"],
+        state["wifi_mode"],
+        state["bandwidth"],
+        state["security"],
+        scan_status,
+        connect_status,
+        state["ping"],
+        state["tx_channel"],  # Channel
+        state["tx_rssi"],  # RSSI
+        tx_display,  # TX Throughtput(Mbps)
+        state["tx_criteria"],  # TX Criteria
+        tx_result,
+        rx_display,  # RX Throughtput(Mbps)
+        state["rx_criteria"],  # RX Criteria
+        rx_result,
+        state.get("boot_time", "N/A"),
+    ]
 
-def write_realtime_compat_csv(csv_path: str):
-    """Write full compatibility_result.csv based on current _ap_test_state."""
-    rows = []
 
-    def evaluate_pass_fail(throughput_val, criteria_val):
-        """判断吞吐量是否达标"""
-        if throughput_val in ("N/A", "SKIP") or criteria_val == "N/A":
-            return "N/A"
-        try:
-            # 处理多值情况（如 "100,120,95"）
-            throughput_vals = [float(x) for x in str(throughput_val).split(',') if x.strip()]
-            criteria = float(criteria_val)
-            return "PASS" if all(v >= criteria for v in throughput_vals) else "FAIL"
-        except (ValueError, TypeError):
-            return "N/A"
+def _row_sort_key(row: List[Any]) -> Tuple[str, Any, str]:
+    """Report order of realtime CSV rows: PDU IP, numeric PDU port, AP model."""
+    try:
+        port: Any = (0, int(row[1]))
+    except (TypeError, ValueError):
+        port = (1, str(row[1]))
+    return str(row[0]), port, str(row[3])
 
 
+class RealtimeCompatWriter:
+    """
+    Append-only writer for compatibility_result.csv.
+
+    Each finished test appends the latest row of its (ip, port, band), so the
+    cost per test stays constant and a crash can at most lose the row being
+    written.  Superseded rows are dropped by a periodic compaction that
+    rewrites the file to a temporary sibling and atomically renames it over
+    the original.
+    """
+
+    def __init__(self, csv_path: str, compact_every: int = 50) -> None:
+        self.path = Path(csv_path)
+        self.compact_every = max(1, int(compact_every))
+        self._rows: Dict[Tuple[str, int, str], List[Any]] = {}
+        self._appended = 0
+        self._lock = threading.Lock()
+        self._started = False
+
+    def upsert(self, key: Tuple[str, int, str], row: List[Any]) -> None:
+        """Record the latest row for ``key`` and append it to the CSV."""
+        with self._lock:
+            self._rows[key] = row
+            if not self._started:
+                # A new session replaces whatever a previous run left behind.
+                self._rewrite()
+                self._started = True
+                return
+            with open(self.path, "a", newline="", encoding="utf-8") as f:
+                csv.writer(f).writerow(row)
+                f.flush()
+                os.fsync(f.fileno())
+            self._appended += 1
+            if self._appended >= self.compact_every:
+                self._rewrite()
+
+    def compact(self) -> None:
+        """Rewrite the CSV with one row per key."""
+        with self._lock:
+            if self._started:
+                self._rewrite()
+
+    def _rewrite(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f".{self.path.name}.tmp")
+        rows = sorted(self._rows.values(), key=_row_sort_key)
+        with open(tmp_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(REALTIME_HEADER)
+            writer.writerows(rows)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+        self._appended = 0
+
+
+_realtime_writers: Dict[str, RealtimeCompatWriter] = {}
+_realtime_writers_lock = threading.Lock()
+
+
+def _realtime_writer(csv_path: str) -> RealtimeCompatWriter:
+    path = os.path.abspath(csv_path)
+    with _realtime_writers_lock:
+        writer = _realtime_writers.get(path)
+        if writer is None:
+            writer = _realtime_writers[path] = RealtimeCompatWriter(path)
+        return writer
+
+
+def write_realtime_compat_csv(csv_path: str, key: Optional[Tuple[str, int, str]] = None):
+    """
+    Upsert rows of compatibility_result.csv from the current _ap_test_state.
+
+    With ``key`` only that AP/band row is appended; without it every known
+    row is refreshed.  Call :func:`compact_realtime_compat_csv` at session end
+    to leave exactly one row per AP/band in the file.
+    """
     with _ap_lock:
-        for key, state in _ap_test_state.items():
-            ip, port, band = key
-
-            # === 智能推导 Scan / Connect ===
-            tx_val = state.get("tx_throughput", "N/A")
-            rx_val = state.get("rx_throughput", "N/A")
-
-            if tx_val != "N/A" or rx_val != "N/A":
-                scan_status = "PASS"
-                connect_status = "PASS"
-            else:
-                # 即使 TX/RX 是 SKIP，只要测试流程走到这里，Scan/Connect 就应为 PASS
-                scan_status = "PASS"
-                connect_status = "PASS"
-
-            # 显示 SKIP 而非 N/A
-            tx_display = "SKIP" if tx_val == "N/A" else tx_val
-            rx_display = "SKIP" if rx_val == "N/A" else rx_val
-            tx_result = evaluate_pass_fail(tx_display, state["tx_criteria"])
-            rx_result = evaluate_pass_fail(rx_display, state["rx_criteria"])
-
-            row = [
-                ip,
-                port,
-                state["brand"],
-                state["modem2"],
-                band,
-                state["ssid"],
-                state["wifi_mode"],
-                state["bandwidth"],
-                state["security"],
-                scan_status,
-                connect_status,
-                state["ping"],
-                state["tx_channel"],  # Channel
-                state["tx_rssi"],  # RSSI
-                tx_display,  # TX Throughtput(Mbps)
-                state["tx_criteria"],  # TX Criteria rx_display,  # RX Result state["rx_channel"],  # Channe state["rx_rssi"],  # RSSI
-                tx_result,
-                rx_display,  # RX Throughtput(Mbps)
-                state["rx_criteria"],  # RX Criteria
-                rx_result
-            ]
-            rows.append(row)
-
-    # 排序
-    rows.sort(key=lambda x: (x[0], x[1], x[3]))
-
-    # 写入
-    with open(csv_path, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.writer(f)
-        writer.writerow([
-            "PDU IP", "PDU Port", "AP Brand", "AP Model", "Band", "Ssid",
-            "WiFi Mode", "Bandwidth", "Security",
-            "Scan", "Connect", "Ping",
-            "Channel", "RSSI",  "TX Throughtput(Mbps)","TX Criteria", "TX Result",
-            "RX Throughtput(Mbps)", "RX Criteria", "RX Result",
-        ])
-        writer.writerows(rows)
+        if key is not None:
+            keys = [key] if key in _ap_test_state else []
+        else:
+            keys = list(_ap_test_state)
+        rows = [(k, _build_realtime_row(k, _ap_test_state[k])) for k in keys]
+
+    writer = _realtime_writer(csv_path)
+    for k, row in rows:
+        writer.upsert(k, row)
+
+
+def compact_realtime_compat_csv() -> None:
+    """Compact every realtime CSV written in this process."""
+    with _realtime_writers_lock:
+        writers = list(_realtime_writers.values())
+    for writer in writers:
+        writer.compact()
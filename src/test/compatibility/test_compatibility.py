@@ -16,6 +16,8 @@ from src.tools.router_tool.router_performance import (
 )
 from src.util.constants import load_config
 from src.tools.relay_tool.pdusnmp import power_ctrl as PduSnmpCtrl
+from src.test.compatibility.pipeline import CompatibilityPipeline, PipelinePolicy
+from src.tools.network_tool.readiness import BootReadinessProber
 
 _ap_test_state = {}
 _ap_test_lock = threading.Lock()
@@ -36,6 +38,76 @@ passwd = '@Aml#*st271'
 #passwd = '88888888'
 _rvr_tool_initialized = False
 
+
+def _find_router_info(ip, port):
+    """Return the compatibility_router.json entry wired to PDU ``ip``/``port``."""
+    for entry in compatibility_router._instances:
+        if str(entry.get('port')) == str(port) and entry.get('ip') == ip:
+            return entry
+    return None
+
+
+def _ap_subnet(info):
+    """LAN subnet the host should get a lease in behind ``info``'s AP, if known.
+
+    Router entries may set ``lan_subnet`` (e.g. ``192.168.50.0/24``); otherwise
+    the /24 around the optional ``lan_ip`` is assumed.
+    """
+    if not info:
+        return None
+    subnet = str(info.get('lan_subnet') or '').strip()
+    if subnet:
+        return subnet
+    lan_ip = str(info.get('lan_ip') or '').strip()
+    return f"{lan_ip}/24" if lan_ip else None
+
+
+def _wait_ap_ready(target, powered_at, timeout):
+    """Readiness hook for the AP pipeline; returns the measured boot time."""
+    policy = ap_pipeline.policy
+    entry = _find_router_info(*target) or {}
+    prober = BootReadinessProber(
+        entry.get('lan_ip'),
+        ssids=tuple(ssid.values()) if policy.beacon_scan else (),
+    )
+    if not prober.has_signals:
+        # Nothing to probe for this AP: keep the configured fixed boot wait.
+        remaining = powered_at + policy.boot_seconds - time.time()
+        if remaining > 0:
+            time.sleep(remaining)
+        return time.time() - powered_at
+    return prober.wait(timeout, since=powered_at).boot_seconds
+
+
+def _build_router(info, band):
+    """Router settings and expected rates of ``info`` for ``band``."""
+    expect_tx = perf_handle_expectdata(info, band, 'UL', pytest.chip_info)
+    expect_rx = perf_handle_expectdata(info, band, 'DL', pytest.chip_info)
+    return Router(
+        band=band,
+        wireless_mode=info[band]['mode'],
+        channel='default',
+        security_mode=info[band].get('security_mode'),
+        bandwidth=info[band]['bandwidth'],
+        ssid=ssid[band],
+        password=passwd,
+        expected_rate=f'{expect_tx} {expect_rx}',
+    )
+
+
+def _prepare_ap(target):
+    """Pre-configuration hook for the AP pipeline: per-band Router objects of ``target``."""
+    info = _find_router_info(*target)
+    if not info:
+        return {}
+    return {band: _build_router(info, band) for band in ssid if band in info}
+
+
+_pipeline_policy = PipelinePolicy.from_config(power_delay.config)
+ap_pipeline = CompatibilityPipeline(
+    power_delay, power_ctrl, _pipeline_policy, wait_ready=_wait_ap_ready, prepare=_prepare_ap
+)
+
 # Project and chip info
 project_cfg = pytest.config.get("project") or {}
 wifi_module = str(project_cfg.get("wifi_module", "")).strip().upper()
@@ -58,30 +130,31 @@ def initialize_all_relays():
     all_relays = temp.ctrl
     temp.shutdown()
 
-    return "PDU initialized"
+    yield "PDU initialized"
+    # Pre-powered APs that never got their turn (e.g. -x) must not stay on.
+    ap_pipeline.shutdown()
+    compact_realtime_compat_csv()
 
 @pytest.fixture(scope='module', autouse=True, params=power_ctrl, ids=[str(i) for i in power_ctrl])
 def power_setting(request):
     ip, port = request.param
     try:
-        power_delay.switch(ip, port, 1)
-        time.sleep(30)
-        info = [
-            x
-            for x in filter(
-                lambda x: str(x.get('port')) == str(port) and x.get('ip') == ip,
-                compatibility_router._instances,
-            )
-        ]
+        boot_time = ap_pipeline.acquire((ip, port))
+        info = _find_router_info(ip, port)
         if not info:
             raise RuntimeError(f"Router info not found for ip={ip} port={port}")
 
         current_ap_key = f"{ip}:{port}"
         pytest.current_target_ap = current_ap_key
-        yield info[0]
+        pytest.current_ap_boot_time = boot_time
+        pytest.current_ap_routers = ap_pipeline.prepared((ip, port)) or {}
+        if boot_time is None:
+            logging.warning(f"AP {current_ap_key} did not report ready within {_pipeline_policy.boot_timeout}s")
+        else:
+            logging.info(f"AP {current_ap_key} ready after {boot_time:.1f}s")
+        yield info
     finally:
-        logging.info('test done shutdown the router')
-        power_delay.switch(ip, port, 2)
+        ap_pipeline.release((ip, port))
 
 
 
@@ -118,7 +191,13 @@ def router_setting(power_setting, request):
         while current_retry < max_retries:
             current_retry += 1
             logging.info(f"[{band} | {current_ap_key}] Attempt {current_retry}/{max_retries} on NIC: {nic}")
-            pc_ip = pytest.host_os.dynamic_flush_network_card(nic)
+            # On Linux the renewal is netlink driven and rejects the previous AP's lease itself.
+            pc_ip = pytest.host_os.dynamic_flush_network_card(
+                nic, expected_network=_ap_subnet(power_setting), exclude=(last_ap_ip,)
+            )
+            flush_seconds = getattr(pytest.host_os, 'last_flush_seconds', None)
+            if flush_seconds is not None:
+                logging.info(f"[{band}] Host NIC {nic} renewed in {flush_seconds:.2f}s")
 
             if pc_ip is None:
                 logging.warning(f"[{band}] Failed to get IP...")
@@ -158,19 +237,7 @@ def router_setting(power_setting, request):
     logging.info(f'✅ [{band}] PC IP for {current_ap_key}: {pc_ip}')
 
     logging.info(f'pc_ip {pytest.dut.pc_ip}')
-    router_set = power_setting
-    expect_tx = perf_handle_expectdata(router_set, band, 'UL', pytest.chip_info)
-    expect_rx = perf_handle_expectdata(router_set, band, 'DL', pytest.chip_info)
-    router_obj = Router(
-        band=band,
-        wireless_mode=router_set[band]['mode'],
-        channel='default',
-        security_mode=router_set[band].get('security_mode'),
-        bandwidth=router_set[band]['bandwidth'],
-        ssid=ssid[band],
-        password=passwd,
-        expected_rate=f'{expect_tx} {expect_rx}',
-    )
+    router_obj = getattr(pytest, 'current_ap_routers', {}).get(band) or _build_router(power_setting, band)
     logging.info(f'router yield {router_obj}')
     yield router_obj
 
@@ -383,7 +450,11 @@ def test_multi_throughtput_rx(router_setting, request):
     request.node._store['return_value'] = (pytest.dut.channel, pytest.dut.rssi_num, expect_data, rx_result)
     logging.info(f"request.node._store {request.node._store['return_value']}")
 
-from src.test.compatibility.results import update_compat_test_result, write_realtime_compat_csv
+from src.test.compatibility.results import (
+    compact_realtime_compat_csv,
+    update_compat_test_result,
+    write_realtime_compat_csv,
+)
 @pytest.fixture(autouse=True)
 def _realtime_compat_csv_update(request):
     # --- 提前缓存元数据 ---
@@ -400,7 +471,8 @@ def _realtime_compat_csv_update(request):
                 "ssid": getattr(router, "ssid", "N/A"),
                 "wifi_mode": getattr(router, "wireless_mode", "N/A"),
                 "bandwidth": getattr(router, "bandwidth", "N/A"),
-                "security": getattr(router, "security_mode", "open") or "open"
+                "security": getattr(router, "security_mode", "open") or "open",
+                "boot_time": getattr(pytest, "current_ap_boot_time", None),
             }
         except Exception as e:
             logging.warning(f"[CSV METADATA] Failed: {e}")
@@ -412,7 +484,7 @@ def _realtime_compat_csv_update(request):
     compat_compare = store.get("compat_compare", "UNKNOWN")
     return_value = store.get("return_value", ("N/A", "N/A", "N/A", "N/A"))
 
-    update_compat_test_result(
+    key = update_compat_test_result(
         nodeid=request.node.nodeid,
         test_name=request.node.name,
         compat_compare=compat_compare,
@@ -423,4 +495,5 @@ def _realtime_compat_csv_update(request):
     report_dir = os.environ.get("PYTEST_REPORT_DIR")
     if report_dir:
         csv_path = Path(report_dir) / "compatibility_result.csv"
-        write_realtime_compat_csv(str(csv_path))
+        if key is not None:
+            write_realtime_compat_csv(str(csv_path), key)
@@ -18,6 +18,8 @@ from src.util.constants import load_config
 from src.tools.relay_tool.pdusnmp import power_ctrl as PduSnmpCtrl
 from src.util.constants import load_config
 from src.tools.connect_tool.mixins.ui_mixin import UiAutomationMixin
+from src.tools.connect_tool.console_timeline import ConsoleTimeline
+from src.util.telemetry import TelemetrySink, telemetry_settings
 
 _ap_test_state = {}
 _ap_test_lock = threading.Lock()
@@ -25,6 +27,8 @@ _test_metadata_cache = {}
 _metadata_lock = threading.Lock()
 _str_result_lock = threading.Lock()
 _str_test_results = defaultdict(dict)
+_telemetry_settings = telemetry_settings(load_config(refresh=True))
+_telemetry = TelemetrySink("str_ap_power_reboot", enabled=_telemetry_settings["enabled"])
 
 power_delay = power_ctrl()
 # power_delay.shutdown()
@@ -198,6 +202,8 @@ def test_wifi_reconnect_full_flow(power_setting):
         pytest.fail("Failed to get DUT serial from config for reboot.")
     logging.info(f"Using DUT serial: {dut_serial}")
 
+    # Console milestones give millisecond reconnect breakdowns when the DUT has a serial console.
+    timeline = ConsoleTimeline.for_dut(pytest.dut).start()
     try:
         # 遍历频段：先 2.4G，再 5G
         for band in ['2.4G', '5G']:
@@ -343,6 +349,7 @@ def test_wifi_reconnect_full_flow(power_setting):
                     power_delay.switch(pdu_ip, pdu_port, 2)
                     time.sleep(10)
                     power_on_time = time.time()
+                    timeline.mark("power_on", power_on_time)
                     power_delay.switch(pdu_ip, pdu_port, 1)
                     time.sleep(30)
 
@@ -353,7 +360,9 @@ def test_wifi_reconnect_full_flow(power_setting):
                     reconnection_time = None
                     try:
                         #connected, dut_ip_addr = pytest.dut.wifi_wait_ip(timeout_s=300)
-                        connected, dut_ip_addr = _wait_for_wifi_association_and_ip(pytest.dut, timeout_s=300)
+                        connected, dut_ip_addr = _wait_for_wifi_association_and_ip(
+                            pytest.dut, timeout_s=300, timeline=timeline, since=power_on_time
+                        )
                         if connected and dut_ip_addr:
                             pytest.dut.dut_ip = dut_ip_addr
                             reconnection_time = time.time() - power_on_time
@@ -368,6 +377,20 @@ def test_wifi_reconnect_full_flow(power_setting):
                             f"DUT failed to reconnect after AP reboot in Round {round_index} for {band}! Error: {e}")
                         reconnection_time = "Fail"
 
+                if round_index > 0:
+                    _telemetry.record(
+                        "reconnect",
+                        reconnection_time if connected else time.time() - power_on_time,
+                        iteration=round_index,
+                        status="ok" if connected else "fail",
+                        started_at=power_on_time,
+                        ap=current_ap_key,
+                        band=band,
+                    )
+                    timeline.report(
+                        "power_on", _telemetry, iteration=round_index, ap=current_ap_key, band=band
+                    )
+
                 # --- Connect 验证 (频段等) ---
                 connect_pass = True
                 try:
@@ -391,7 +414,11 @@ def test_wifi_reconnect_full_flow(power_setting):
                     logging.warning(f"Skipping Ping for {band} Round {round_index + 1} because DUT is not connected.")
                     ping_result = "SKIP"
                 else:
-                    ping_success = _perform_ping_test()
+                    with _telemetry.phase(
+                        "ping_recovery", iteration=round_index, ap=current_ap_key, band=band
+                    ) as ping_attrs:
+                        ping_success = _perform_ping_test()
+                        ping_attrs["status"] = "ok" if ping_success else "fail"
                     ping_result = "PASS" if ping_success else "FAIL"
 
                 # --- Throughput 测试 ---
@@ -449,13 +476,14 @@ def test_wifi_reconnect_full_flow(power_setting):
 
     finally:
         # 清理工作已在 fixture 的 finally 块中完成
-        pass
+        timeline.stop()
+        _telemetry.close(mysql_sync=_telemetry_settings["mysql_sync"])
 
 
 import ipaddress
 
 
-def _wait_for_wifi_association_and_ip(dut, timeout_s=300, check_interval=5):
+def _wait_for_wifi_association_and_ip(dut, timeout_s=300, check_interval=5, timeline=None, since=None):
     """
     Waits for the DUT to acquire a valid IP address and confirms Wi-Fi association.
 
@@ -468,6 +496,12 @@ def _wait_for_wifi_association_and_ip(dut, timeout_s=300, check_interval=5):
         dut: The DUT object.
         timeout_s (int): Total wait timeout in seconds.
         check_interval (int): Interval between checks in seconds.
+        timeline (ConsoleTimeline): Optional console timeline.  When attached,
+            the pause between checks ends early once the console reports
+            association, after which the IP is checked every second; the
+            confirmed IP is marked as ``ip_confirmed``.  The console wait
+            never extends past ``timeout_s``.
+        since (float): Only console events after this host time count.
 
     Returns:
         tuple: (is_connected: bool, ip_address: str or None)
@@ -478,6 +512,8 @@ def _wait_for_wifi_association_and_ip(dut, timeout_s=300, check_interval=5):
     start_time = time.time()
     # Use a short internal timeout to prevent `wifi_wait_ip` from blocking too long
     SHORT_TIMEOUT_S = 10
+    # Without a console there is nothing to wake on; poll at check_interval
+    associated = timeline is None or not timeline.active
 
     # --- Retrieve the PC's IP from the test context ---
     pc_ip = getattr(pytest.dut, 'pc_ip', None)
@@ -523,6 +559,8 @@ def _wait_for_wifi_association_and_ip(dut, timeout_s=300, check_interval=5):
                 try:
                     dut.get_rssi()  # If this succeeds, we are connected.
                     logging.info(f"✅ Valid IP in correct subnet and confirmed association: {ip_addr}")
+                    if timeline is not None:
+                        timeline.mark("ip_confirmed")
                     return True, ip_addr
                 except Exception as e:
                     logging.debug(f"Failed to confirm association via get_rssi: {e}. Retrying...")
@@ -534,8 +572,14 @@ def _wait_for_wifi_association_and_ip(dut, timeout_s=300, check_interval=5):
             # Catch any exceptions from `wifi_wait_ip` (e.g., timeouts) and treat them as non-fatal retries
             logging.debug(f"wifi_wait_ip call failed (non-fatal, retrying): {e}")
 
-        # Wait for the specified check interval before the next attempt
-        time.sleep(check_interval)
+        # Wait for the specified check interval before the next attempt,
+        # waking early when the console reports association
+        pause = max(0.0, min(check_interval, timeout_s - (time.time() - start_time)))
+        if associated:
+            time.sleep(pause)
+        elif timeline.wait_for("association", since=since, timeout=pause):
+            associated = True
+            check_interval = min(check_interval, 1)
 
     logging.error(
         f"❌ Timed out waiting for a valid IP in the correct subnet and confirmed Wi-Fi association after {timeout_s} seconds."
@@ -18,6 +18,8 @@ from src.util.constants import load_config
 from src.tools.relay_tool.pdusnmp import power_ctrl as PduSnmpCtrl
 from src.util.constants import load_config
 from src.tools.connect_tool.mixins.ui_mixin import UiAutomationMixin
+from src.tools.connect_tool.console_timeline import ConsoleTimeline
+from src.util.telemetry import TelemetrySink, telemetry_settings
 
 _ap_test_state = {}
 _ap_test_lock = threading.Lock()
@@ -25,6 +27,8 @@ _test_metadata_cache = {}
 _metadata_lock = threading.Lock()
 _str_result_lock = threading.Lock()
 _str_test_results = defaultdict(dict)
+_telemetry_settings = telemetry_settings(load_config(refresh=True))
+_telemetry = TelemetrySink("str_ap_reboot", enabled=_telemetry_settings["enabled"])
 
 power_delay = power_ctrl()
 # power_delay.shutdown()
@@ -197,6 +201,8 @@ def test_wifi_reconnect_full_flow(power_setting):
         pytest.fail("Failed to get DUT serial from config for reboot.")
     logging.info(f"Using DUT serial: {dut_serial}")
 
+    # Console milestones give millisecond reconnect breakdowns when the DUT has a serial console.
+    timeline = ConsoleTimeline.for_dut(pytest.dut).start()
     try:
         # 遍历频段：先 2.4G，再 5G
         for band in ['2.4G', '5G']:
@@ -310,6 +316,7 @@ def test_wifi_reconnect_full_flow(power_setting):
                     power_delay.switch(pdu_ip, pdu_port, 2)
                     time.sleep(10)
                     power_on_time = time.time()
+                    timeline.mark("power_on", power_on_time)
                     power_delay.switch(pdu_ip, pdu_port, 1)
                     time.sleep(30)
 
@@ -319,7 +326,10 @@ def test_wifi_reconnect_full_flow(power_setting):
                     dut_ip_addr = None
                     reconnection_time = None
                     try:
+                        # wifi_wait_ip keeps the full budget; the console only supplies the breakdown.
                         connected, dut_ip_addr = pytest.dut.wifi_wait_ip(timeout_s=300)
+                        if connected:
+                            timeline.mark("ip_confirmed")
                         if connected and dut_ip_addr:
                             pytest.dut.dut_ip = dut_ip_addr
                             reconnection_time = time.time() - power_on_time
@@ -330,6 +340,20 @@ def test_wifi_reconnect_full_flow(power_setting):
                             f"DUT failed to reconnect after AP reboot in Round {round_index} for {band}! Error: {e}")
                         reconnection_time = time.time() - power_on_time
 
+                if round_index > 0:
+                    _telemetry.record(
+                        "reconnect",
+                        reconnection_time if connected else time.time() - power_on_time,
+                        iteration=round_index,
+                        status="ok" if connected else "fail",
+                        started_at=power_on_time,
+                        ap=current_ap_key,
+                        band=band,
+                    )
+                    timeline.report(
+                        "power_on", _telemetry, iteration=round_index, ap=current_ap_key, band=band
+                    )
+
                 # --- Connect 验证 (频段等) ---
                 connect_pass = True
                 try:
@@ -353,7 +377,11 @@ def test_wifi_reconnect_full_flow(power_setting):
                     logging.warning(f"Skipping Ping for {band} Round {round_index + 1} because DUT is not connected.")
                     ping_result = "SKIP"
                 else:
-                    ping_success = _perform_ping_test()
+                    with _telemetry.phase(
+                        "ping_recovery", iteration=round_index, ap=current_ap_key, band=band
+                    ) as ping_attrs:
+                        ping_success = _perform_ping_test()
+                        ping_attrs["status"] = "ok" if ping_success else "fail"
                     ping_result = "PASS" if ping_success else "FAIL"
 
                 # --- Throughput 测试 ---
@@ -411,7 +439,8 @@ def test_wifi_reconnect_full_flow(power_setting):
 
     finally:
         # 清理工作已在 fixture 的 finally 块中完成
-        pass
+        timeline.stop()
+        _telemetry.close(mysql_sync=_telemetry_settings["mysql_sync"])
 
 # ========================
 # 辅助函数：Ping 测试
@@ -13,7 +13,8 @@ from typing import Any, Optional
 
 import pytest
 
-from src.util.constants import load_config
+from src.util.constants import config_snapshot, load_config
+from src.util.run_estimator import STEP_ROUTER_CONFIG, STEP_WIFI_CONNECT, record_step
 from src.tools.performance_result import PerformanceResult
 from src.tools.router_tool.Router import Router
 from src.tools.router_tool.router_factory import get_router
@@ -116,6 +117,8 @@ def scenario_group(router_info: Router):
     finally:
         if test_result is not None:
             test_result.clear_scenario_group_key()
+            # Scenario end: make its rows durable.
+            test_result.sync()
 
 
 class _DebugRFController:
@@ -267,6 +270,7 @@ def common_setup(router: Router, router_info: Router) -> bool:
         logging.info("Debug flag (%s) enabled, skip router setup steps", reason)
         return True
 
+    started = time.perf_counter()
     router.change_setting(router_info), "Can't set ap , pls check first"
     # if pytest.connect_type == 'Linux':
     #     if router_info.band == "2.4G":
@@ -275,7 +279,7 @@ def common_setup(router: Router, router_info: Router) -> bool:
     #         router.change_country("美国")
     #     router.driver.quit()
     logging.info('router set done')
-    cfg = load_config(refresh=True)
+    cfg = config_snapshot(refresh=True)
     rvr_tool = cfg['rvr']['tool']
     if rvr_tool == 'ixchariot':
         script = (
@@ -286,6 +290,7 @@ def common_setup(router: Router, router_info: Router) -> bool:
         pytest.dut.ix.modify_tcl_script("set script ", script)
         pytest.dut.checkoutput(pytest.dut.IX_ENDPOINT_COMMAND)
         time.sleep(3)
+    record_step(STEP_ROUTER_CONFIG, time.perf_counter() - started)
 
 
 def wait_connect(router_info: Router):
@@ -299,6 +304,7 @@ def wait_connect(router_info: Router):
             getattr(router_info, "ssid", "<unknown>"),
         )
         return True
+    started = time.perf_counter()
     if third_party_cfg == 'true':
         wait_seconds = _parse_optional_int(
             third_party_cfg.get("wait_seconds"),
@@ -338,6 +344,7 @@ def wait_connect(router_info: Router):
     logging.info(f'dut_ip:{pytest.dut.dut_ip}')
     logging.info(f'pc_ip:{pytest.dut.pc_ip}')
     logging.info('dut connected')
+    record_step(STEP_WIFI_CONNECT, time.perf_counter() - started)
     return connect_status
 
 
@@ -7,7 +7,6 @@ from typing import Callable, Dict, Optional
 import pytest
 
 from src.tools.mysql_tool.MySqlControl import MySqlClient, sync_file_to_db
-from src.tools.performance.rvr_chart_generator import generate_rvr_charts
 from src.util.constants import (
     TEST_REPORT_PEAK_THROUGHPUT,
     TEST_REPORT_RVO,
@@ -29,10 +28,20 @@ def _resolve_db_report_type(data_type: str) -> str:
 
 
 def _generate_charts(data_type: str, log_file: str) -> None:
+    # pandas/matplotlib are only loaded when a session actually charts.
+    from src.tools.performance.rvr_chart_generator import generate_rvr_charts
+
     charts_subdir = "rvo_charts" if data_type == "RVO" else "rvr_charts"
     logging.info("Trigger auto chart generation for %s: %s", data_type, log_file)
+    # Chart the rows held by the writer instead of re-reading the CSV.
+    test_result = getattr(pytest, "testResult", None)
+    raw = None
+    if test_result is not None and hasattr(test_result, "dataframe"):
+        test_result.flush()
+        if getattr(test_result, "log_file", None) == log_file:
+            raw = test_result.dataframe()
     try:
-        generated = generate_rvr_charts(log_file, charts_subdir=charts_subdir)
+        generated = generate_rvr_charts(log_file, charts_subdir=charts_subdir, raw=raw)
     except Exception:
         logging.exception("Failed to generate %s charts for %s", data_type, log_file)
         return
@@ -80,6 +89,9 @@ class _PerformanceSyncSession:
             _generate_charts(normalized_type, log_file)
 
     def flush(self) -> None:
+        test_result = getattr(pytest, "testResult", None)
+        if test_result is not None and hasattr(test_result, "sync"):
+            test_result.sync()
         if not self.pending or not self._can_use_mysql():
             return
         for info in self.pending.values():
@@ -32,6 +32,7 @@ from src.test.performance import (
     scenario_group,
     wait_connect,
 )
+from src.util.run_estimator import STEP_ATTENUATION, STEP_TURNTABLE, timed_step
 
 
 def _safe_int(value) -> Optional[int]:
@@ -465,9 +466,11 @@ def setup_rvo_case(request, setup_router):
     # --- 关键修改：在 fixture 内部初始化 rf_tool ---
     local_rf_tool = init_rf()
 
-    corner_tool.execute_turntable_cmd('rt', angle=corner_angle)
-    corner_tool.get_turntanle_current_angle()
-    measured_rssi, attenuation_db = _apply_profile(profile, local_rf_tool)
+    with timed_step(STEP_TURNTABLE):
+        corner_tool.execute_turntable_cmd('rt', angle=corner_angle)
+        corner_tool.get_turntanle_current_angle()
+    with timed_step(STEP_ATTENUATION):
+        measured_rssi, attenuation_db = _apply_profile(profile, local_rf_tool)
 
     try:
         yield setup_router[0], expected_router_info, corner_angle, attenuation_db, measured_rssi, profile, local_rf_tool
@@ -17,6 +17,7 @@ from src.test import get_testdata
 from src.test.pyqt_log import log_fixture_params
 from src.test.performance import common_setup, ensure_performance_result, get_cfg, get_rf_step_list, init_rf, init_router, scenario_group, wait_connect
 from src.tools.router_tool.Router import router_str
+from src.util.run_estimator import STEP_ATTENUATION, timed_step
 
 _test_data = get_testdata(init_router())
 rf_tool = init_rf()
@@ -62,21 +63,22 @@ def setup_attenuation(request, setup_router, db_set):
     #db_set = rf_step_list
     max_retries = 1
     success = False
-    for attempt in range(max_retries + 1):  # +1 to include the initial try
-        logging.info(f"[RF] Attempt {attempt + 1}/{max_retries + 1} to set attenuation to {db_set} dB")
-        rf_tool.execute_rf_cmd(db_set)
-        current_value = rf_tool.get_rf_current_value()
-
-        if current_value == db_set or current_value:
-            logging.info(f"[RF] Successfully set attenuation to {db_set} dB")
-            success = True
-            break
-        else:
-            logging.warning(f"[RF] Failed to set attenuation. Expected: {db_set} dB, Got: {current_value} dB")
-            if attempt < max_retries:
-                logging.info(f"[RF] Retrying in 1 second...")
-                import time
-                time.sleep(5)  # Optional: add a short delay between retries
+    with timed_step(STEP_ATTENUATION):
+        for attempt in range(max_retries + 1):  # +1 to include the initial try
+            logging.info(f"[RF] Attempt {attempt + 1}/{max_retries + 1} to set attenuation to {db_set} dB")
+            rf_tool.execute_rf_cmd(db_set)
+            current_value = rf_tool.get_rf_current_value()
+
+            if current_value == db_set or current_value:
+                logging.info(f"[RF] Successfully set attenuation to {db_set} dB")
+                success = True
+                break
+            else:
+                logging.warning(f"[RF] Failed to set attenuation. Expected: {db_set} dB, Got: {current_value} dB")
+                if attempt < max_retries:
+                    logging.info(f"[RF] Retrying in 1 second...")
+                    import time
+                    time.sleep(5)  # Optional: add a short delay between retries
 
     if not success:
         logging.error(f"[RF] Failed to set attenuation to {db_set} dB after {max_retries + 1} attempts.")
@@ -1,11 +1,10 @@
-import json
 import functools
 import inspect
-import logging
 from collections.abc import Mapping, Sequence
 import pytest
 
 from src.util.constants import PYQT_ACTUAL_PARAMS_ATTR as _ACTUAL_PARAMS_ATTR
+from src.util.run_events import FixtureParams, publish
 
 def _ensure_actual_params(node):
     actual_params = getattr(node, _ACTUAL_PARAMS_ATTR, None)
@@ -104,18 +103,7 @@ def update_fixture_params(request, params, *, tag="FIX", name=None, log=True):
 
 
 def pyqt_log(tag: str, fixture: str, params):
-    def default(o):
-        try:
-            return str(o)
-        except Exception:
-            return repr(o)
-
-    payload = json.dumps({"fixture": fixture, "params": params}, default=default, ensure_ascii=False)
-    logging.info("[PYQT_%s]%s", tag, payload)
-
-
-def emit_pyqt_message(tag: str, payload: str) -> None:
-    logging.info("[PYQT_%s]%s", tag, payload)
+    publish(FixtureParams(str(fixture), str(params), tag))
 
 
 # def log_fixture_params(tag="FIX", name=None):
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import json
 import os
 import logging
-from dataclasses import dataclass
+import threading
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterable, Iterator, Mapping, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, Mapping, Optional
 import sys
 import time
 
@@ -14,6 +16,9 @@ import pytest
 
 from src.util import parse_host_list
 
+if TYPE_CHECKING:
+    from src.util.telemetry import TelemetrySink
+
 __all__ = [
     "StabilityPlan",
     "extract_checkpoints",
@@ -31,6 +36,11 @@ __all__ = [
     "STABILITY_MODE_ENV",
     "STABILITY_DURATION_ENV",
     "CheckpointConfig",
+    "StabilityCheckpoint",
+    "STABILITY_CHECKPOINT_ENV",
+    "stability_checkpoint_path",
+    "load_stability_checkpoints",
+    "clear_stability_checkpoints",
 ]
 
 
@@ -38,6 +48,7 @@ STABILITY_MODE_ENV = "WIFI_STABILITY_MODE"
 STABILITY_LOOPS_ENV = "WIFI_STABILITY_LOOPS"
 STABILITY_DURATION_ENV = "WIFI_STABILITY_DURATION_HOURS"
 STABILITY_COMPLETED_LOOPS_ENV = "WIFI_STABILITY_COMPLETED_LOOPS"
+STABILITY_CHECKPOINT_ENV = "WIFI_STABILITY_CHECKPOINT"
 
 
 @dataclass(frozen=True)
@@ -49,6 +60,7 @@ class StabilityPlan:
     duration_hours: Optional[float]
     exit_first: bool = False
     retry_limit: int = 0
+    resume: bool = False
 
 
 @dataclass(frozen=True)
@@ -68,6 +80,127 @@ class CheckpointConfig:
     ping_targets: tuple[str, ...] = ()
 
 
+@dataclass(frozen=True)
+class StabilityCheckpoint:
+    """Durable loop progress of one stability case.
+
+    ``completed`` is the last finished iteration, ``elapsed_seconds`` the
+    execution budget already consumed and ``outcomes`` maps checkpoint labels
+    to ``{"passed": n, "failed": n}`` counters.
+    """
+
+    case: str
+    mode: str
+    total_loops: Optional[int]
+    duration_hours: Optional[float]
+    completed: int = 0
+    elapsed_seconds: float = 0.0
+    outcomes: Mapping[str, Mapping[str, int]] = field(default_factory=dict)
+    updated_at: float = 0.0
+
+    def matches(self, mode: str, total_loops: Optional[int], duration_hours: Optional[float]) -> bool:
+        """Return True when the checkpoint was written for the same plan."""
+
+        return (
+            self.mode == mode
+            and self.total_loops == total_loops
+            and self.duration_hours == duration_hours
+        )
+
+
+_checkpoint_lock = threading.Lock()
+_active_outcomes: Optional[Dict[str, Dict[str, int]]] = None
+
+
+def stability_checkpoint_path() -> Path:
+    """Return the checkpoint file shared by the controller and test workers."""
+
+    override = os.environ.get(STABILITY_CHECKPOINT_ENV, "").strip()
+    if override:
+        return Path(override)
+    return Path.cwd() / "report" / "stability_checkpoint.json"
+
+
+def _read_checkpoint_file(path: Path) -> Dict[str, Any]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as exc:
+        logging.warning("Ignoring unreadable stability checkpoint %s: %s", path, exc)
+        return {}
+    cases = data.get("cases") if isinstance(data, dict) else None
+    return dict(cases) if isinstance(cases, dict) else {}
+
+
+def _write_checkpoint_file(path: Path, cases: Mapping[str, Any]) -> None:
+    """Atomically replace ``path``: write a sibling, fsync, then rename."""
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as handle:
+        json.dump({"version": 1, "cases": cases}, handle, ensure_ascii=False, indent=2)
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(tmp_path, path)
+
+
+def load_stability_checkpoints(path: Path | None = None) -> Dict[str, StabilityCheckpoint]:
+    """Return persisted checkpoints keyed by case name."""
+
+    path = path or stability_checkpoint_path()
+    with _checkpoint_lock:
+        raw_cases = _read_checkpoint_file(path)
+    checkpoints: Dict[str, StabilityCheckpoint] = {}
+    for name, entry in raw_cases.items():
+        if not isinstance(entry, dict):
+            continue
+        try:
+            checkpoints[name] = StabilityCheckpoint(**entry)
+        except TypeError as exc:
+            logging.warning("Ignoring malformed stability checkpoint for %s: %s", name, exc)
+    return checkpoints
+
+
+def _save_stability_checkpoint(checkpoint: StabilityCheckpoint, path: Path | None = None) -> None:
+    path = path or stability_checkpoint_path()
+    with _checkpoint_lock:
+        cases = _read_checkpoint_file(path)
+        cases[checkpoint.case] = asdict(checkpoint)
+        try:
+            _write_checkpoint_file(path, cases)
+        except OSError as exc:
+            logging.warning("Failed to persist stability checkpoint %s: %s", path, exc)
+
+
+def _discard_stability_checkpoint(case: str, path: Path | None = None) -> None:
+    path = path or stability_checkpoint_path()
+    with _checkpoint_lock:
+        cases = _read_checkpoint_file(path)
+        if cases.pop(case, None) is None:
+            return
+        try:
+            if cases:
+                _write_checkpoint_file(path, cases)
+            else:
+                path.unlink()
+        except OSError as exc:
+            logging.warning("Failed to discard stability checkpoint %s: %s", path, exc)
+
+
+def clear_stability_checkpoints(path: Path | None = None) -> None:
+    """Remove every persisted checkpoint."""
+
+    path = path or stability_checkpoint_path()
+    with _checkpoint_lock:
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as exc:
+            logging.warning("Failed to clear stability checkpoint %s: %s", path, exc)
+
+
 def _iter_segments(candidate: Path) -> Iterable[str]:
     """Yield lowercase path segments for ``candidate``."""
 
@@ -162,7 +295,22 @@ def run_checkpoints(
 
     config = _coerce_checkpoint_config(checkpoints)
     if config.ping_enabled:
-        _execute_ping_checkpoint(label, config.ping_targets)
+        try:
+            _execute_ping_checkpoint(label, config.ping_targets)
+        except BaseException:
+            _record_checkpoint_outcome(label, False)
+            raise
+        _record_checkpoint_outcome(label, True)
+
+
+def _record_checkpoint_outcome(label: str, passed: bool) -> None:
+    """Count a checkpoint result against the running stability loop."""
+
+    outcomes = _active_outcomes
+    if outcomes is None:
+        return
+    entry = outcomes.setdefault(label, {"passed": 0, "failed": 0})
+    entry["passed" if passed else "failed"] += 1
 
 
 def _coerce_checkpoint_config(
@@ -190,14 +338,21 @@ def _execute_ping_checkpoint(label: str, targets: Iterable[str]) -> None:
     if not target_list:
         pytest.fail(f"[{label}] Ping checkpoint requires at least one target", pytrace=False)
 
-    failures: list[bool] = []
-    for target in target_list:
-        result = dut.ping(hostname=target)
-        failures.append(result)
+    ping_many = getattr(dut, "ping_many", None)
+    if callable(ping_many):
+        # All targets are probed concurrently; the checkpoint costs as long
+        # as the slowest target instead of the sum.
+        stats = ping_many(target_list)
+        for target in target_list:
+            result = stats.get(target)
+            logging.info("[%s] ping %s", label, result.describe() if result else f"{target}: no result")
+        failed = [target for target in target_list if not (stats.get(target) and stats[target].ok)]
+    else:
+        failed = [target for target in target_list if not dut.ping(hostname=target)]
 
-    if any(not x for x in failures):
+    if failed:
         pytest.fail(
-            f"[{label}] Ping failures", pytrace=False
+            f"[{label}] Ping failures: {', '.join(failed)}", pytrace=False
         )
 
 
@@ -229,6 +384,7 @@ def normalize_stability_config(raw_value: Any) -> StabilityPlan:
     duration_value = _coerce_positive_float(normalized.get("duration_hours"))
     exit_first = bool(normalized.get("exitfirst"))
     retry_limit = _coerce_positive_int(normalized.get("retry_limit")) or 0
+    resume = bool(normalized.get("resume"))
 
     if loop_value and duration_value:
         logging.info(
@@ -236,11 +392,12 @@ def normalize_stability_config(raw_value: Any) -> StabilityPlan:
         )
         duration_value = None
 
+    options = {"exit_first": exit_first, "retry_limit": retry_limit, "resume": resume}
     if loop_value:
-        return StabilityPlan("loops", loop_value, None, exit_first=exit_first, retry_limit=retry_limit)
+        return StabilityPlan("loops", loop_value, None, **options)
     if duration_value:
-        return StabilityPlan("duration", None, duration_value, exit_first=exit_first, retry_limit=retry_limit)
-    return StabilityPlan("limit", None, None, exit_first=exit_first, retry_limit=retry_limit)
+        return StabilityPlan("duration", None, duration_value, **options)
+    return StabilityPlan("limit", None, None, **options)
 
 
 def load_stability_plan() -> StabilityPlan:
@@ -256,8 +413,25 @@ def load_stability_plan() -> StabilityPlan:
     return normalize_stability_config(duration_cfg)
 
 
-def iterate_stability_loops(plan: StabilityPlan) -> Iterator[tuple[int, LoopBudget, Callable[[bool], None]]]:
-    """Yield iteration index, budget snapshot, and completion reporter."""
+def iterate_stability_loops(
+    plan: StabilityPlan,
+    *,
+    case: Optional[str] = None,
+    telemetry: Optional["TelemetrySink"] = None,
+) -> Iterator[tuple[int, LoopBudget, Callable[[bool], None]]]:
+    """Yield iteration index, budget snapshot, and completion reporter.
+
+    When ``case`` is given the loop state is checkpointed atomically after
+    every reported iteration.  With ``plan.resume`` a matching checkpoint is
+    picked up and the loop continues after its last completed iteration with
+    the remaining duration budget.  The checkpoint is discarded once the loop
+    runs to completion.
+
+    With ``telemetry`` the sink follows the current iteration and records an
+    ``iteration`` phase for every reported loop.
+    """
+
+    global _active_outcomes
 
     loops = plan.loops if plan.mode == "loops" else None
     loops = _coerce_positive_int(loops)
@@ -268,14 +442,55 @@ def iterate_stability_loops(plan: StabilityPlan) -> Iterator[tuple[int, LoopBudg
     if override is not None:
         loops = override
 
+    resumed: Optional[StabilityCheckpoint] = None
+    if case and plan.resume:
+        resumed = load_stability_checkpoints().get(case)
+        if resumed is not None and not resumed.matches(plan.mode, loops, plan.duration_hours):
+            logging.warning("Stability checkpoint for %s belongs to a different plan; starting over", case)
+            resumed = None
+    base_elapsed = resumed.elapsed_seconds if resumed is not None else 0.0
+    outcomes: Dict[str, Dict[str, int]] = (
+        {label: dict(counts) for label, counts in resumed.outcomes.items()}
+        if resumed is not None
+        else {}
+    )
+    started = time.monotonic()
+
     deadline = None
     if plan.mode == "duration" and plan.duration_hours:
-        deadline = time.monotonic() + plan.duration_hours * 3600
+        deadline = started + plan.duration_hours * 3600 - base_elapsed
 
     completed = _coerce_positive_int(os.environ.get(STABILITY_COMPLETED_LOOPS_ENV)) or 0
+    iteration = 0
+    if resumed is not None:
+        completed = max(completed, resumed.completed)
+        iteration = resumed.completed
+        logging.info(
+            "Resuming stability case %s after iteration %s (%.0fs of budget used)",
+            case,
+            resumed.completed,
+            base_elapsed,
+        )
     os.environ[STABILITY_COMPLETED_LOOPS_ENV] = str(completed)
 
-    iteration = 0
+    def _persist() -> None:
+        if not case:
+            return
+        _save_stability_checkpoint(
+            StabilityCheckpoint(
+                case=case,
+                mode=plan.mode,
+                total_loops=loops,
+                duration_hours=plan.duration_hours,
+                completed=completed,
+                elapsed_seconds=base_elapsed + time.monotonic() - started,
+                outcomes=outcomes,
+                updated_at=time.time(),
+            )
+        )
+
+    finished = False
+    _active_outcomes = outcomes if case else None
     try:
         while True:
             if loops is not None and iteration >= loops:
@@ -296,6 +511,9 @@ def iterate_stability_loops(plan: StabilityPlan) -> Iterator[tuple[int, LoopBudg
             )
 
             reported = False
+            iteration_start = time.perf_counter()
+            if telemetry is not None:
+                telemetry.iteration = current_iteration
 
             def _report(success: bool = True) -> None:
                 nonlocal completed, reported
@@ -304,11 +522,28 @@ def iterate_stability_loops(plan: StabilityPlan) -> Iterator[tuple[int, LoopBudg
                 if success:
                     completed = max(completed, current_iteration)
                 reported = True
+                if telemetry is not None:
+                    telemetry.record(
+                        "iteration",
+                        time.perf_counter() - iteration_start,
+                        iteration=current_iteration,
+                        status="ok" if success else "fail",
+                    )
                 os.environ[STABILITY_COMPLETED_LOOPS_ENV] = str(completed)
+                _persist()
 
             yield current_iteration, budget, _report
+        finished = True
     finally:
         os.environ[STABILITY_COMPLETED_LOOPS_ENV] = str(completed)
+        _active_outcomes = None
+        if case:
+            if finished:
+                _discard_stability_checkpoint(case)
+            else:
+                # Interrupted (failure, stop request, crash unwinding): keep
+                # the latest budget and outcomes so the run can resume.
+                _persist()
 
 
 def describe_iteration(iteration: int, budget: LoopBudget, mode: str) -> str:
@@ -353,8 +588,19 @@ def run_stability_plan(
     last_exit_code = 0
     stop_reason = ""
     overall_start = time.monotonic()
+    resumed_elapsed = 0.0
+    if plan.resume:
+        resumed = [
+            checkpoint
+            for checkpoint in load_stability_checkpoints().values()
+            if checkpoint.mode == plan.mode
+        ]
+        if resumed:
+            resumed_elapsed = max(checkpoint.elapsed_seconds for checkpoint in resumed)
+    else:
+        clear_stability_checkpoints()
     deadline = (
-        overall_start + plan.duration_hours * 3600
+        overall_start + plan.duration_hours * 3600 - resumed_elapsed
         if plan.mode == "duration" and plan.duration_hours is not None
         else None
     )
@@ -382,6 +628,15 @@ def run_stability_plan(
         os.environ[key] = value
     try:
         emit_event("plan_started", {"plan": plan})
+        if plan.resume and resumed:
+            emit_event(
+                "plan_resumed",
+                {
+                    "plan": plan,
+                    "completed_loops": max(checkpoint.completed for checkpoint in resumed),
+                    "elapsed_seconds": resumed_elapsed,
+                },
+            )
 
         while True:
             next_iteration = total_runs + 1
@@ -22,7 +22,9 @@ from src.test.stability import (
     run_checkpoints,
 )
 from src.util.constants import load_config
+from src.util.telemetry import TelemetrySink, telemetry_settings
 from src.tools.relay_tool import Relay, get_relay_controller
+from src.tools.network_tool.readiness import BootReadinessProber
 from src.util.constants import (
     AUTH_OPTIONS,
     SWITCH_WIFI_CASE_ALIASES,
@@ -164,12 +166,21 @@ def _cycle_targets(
     checkpoints: CheckpointConfig | Mapping[str, Any] | None,
     failures: list[str],
     iteration_label: str,
+    telemetry: TelemetrySink | None = None,
 ) -> None:
     for target in targets:
         label = f"SSID {target['ssid']}"
         success = False
         try:
+            start = time.perf_counter()
             success = _connect_wifi(target)
+            if telemetry is not None:
+                telemetry.record(
+                    "wifi_connect",
+                    time.perf_counter() - start,
+                    status="ok" if success else "fail",
+                    ssid=target["ssid"],
+                )
             if success:
                 run_checkpoints(label, checkpoints)
         finally:
@@ -224,6 +235,7 @@ def _build_cycle_config(data: Mapping[str, Any] | None) -> CycleConfig | None:
         "enabled": enabled,
         "on_duration": _coerce_duration(data.get("on_duration")),
         "off_duration": _coerce_duration(data.get("off_duration")),
+        "ready_timeout": _coerce_duration(data.get("ready_timeout")),
         "port": port,
         "mode": mode,
         "relay_type": relay_type,
@@ -232,7 +244,7 @@ def _build_cycle_config(data: Mapping[str, Any] | None) -> CycleConfig | None:
     }
 
 
-def _run_cycle(label: str, cycle: CycleConfig | None) -> None:
+def _run_cycle(label: str, cycle: CycleConfig | None, telemetry: TelemetrySink | None = None) -> None:
     if not cycle or not cycle.get("enabled"):
         logging.info("[%s] cycle disabled or not configured; skipping", label)
         return
@@ -253,12 +265,54 @@ def _run_cycle(label: str, cycle: CycleConfig | None) -> None:
     try:
         if cycle["on_duration"] > 0:
             time.sleep(cycle["on_duration"])
+        off_start = time.perf_counter()
         controller.pulse("power_off")
         if cycle["off_duration"] > 0:
             time.sleep(cycle["off_duration"])
         controller.pulse("power_on")
+        powered_at = time.time()
+        if telemetry is not None:
+            telemetry.record(f"{label.lower()}_power_off", time.perf_counter() - off_start)
     except Exception as exc:  # pragma: no cover - hardware dependent
         logging.error("[%s] relay operation failed: %s", label, exc)
+        return
+    if cycle.get("ready_timeout"):
+        boot_seconds = _wait_dut_ready(label, cycle["ready_timeout"], powered_at)
+        if telemetry is not None:
+            waited = time.time() - powered_at
+            telemetry.record(
+                f"{label.lower()}_resume",
+                boot_seconds if boot_seconds is not None else waited,
+                status="ok" if boot_seconds is not None else "fail",
+                started_at=powered_at,
+            )
+
+
+def _android_boot_completed() -> bool:
+    output = pytest.dut.checkoutput("getprop sys.boot_completed")
+    return str(output or "").strip() == "1"
+
+
+def _wait_dut_ready(label: str, timeout: int, powered_at: float) -> float | None:
+    """Block until the DUT is serviceable again after a relay cycle."""
+
+    dut = getattr(pytest, "dut", None)
+    if dut is None:
+        return None
+    connect_type = str(getattr(pytest, "connect_type", "") or "").lower()
+    if connect_type == "android":
+        prober = BootReadinessProber(checks={"boot_completed": _android_boot_completed}, interval=2.0)
+    else:
+        # Avoid the dut_ip property: it queries the (still booting) device.
+        host = str(getattr(dut, "_dut_ip", "") or "").strip()
+        prober = BootReadinessProber(host or None, ports=(22, 23))
+    if not prober.has_signals:
+        logging.info("[%s] no readiness signal for DUT; skipping boot wait", label)
+        return None
+    result = prober.wait(timeout, since=powered_at)
+    if not result.ready:
+        logging.warning("[%s] DUT not ready within %ss", label, timeout)
+    return result.boot_seconds
 
 
 def _load_switch_wifi_str_components() -> tuple[
@@ -281,14 +335,25 @@ def _load_switch_wifi_str_components() -> tuple[
     return ac_cycle, str_cycle, wifi_targets, checkpoints
 
 
+def _timed_checkpoints(label: str, checkpoints: Any, telemetry: TelemetrySink | None) -> None:
+    if telemetry is None:
+        run_checkpoints(label, checkpoints)
+        return
+    with telemetry.phase(f"{label.lower()}_ping_recovery"):
+        run_checkpoints(label, checkpoints)
+
+
 @pytest.fixture(scope="session")
 def switch_wifi_str_components() -> dict[str, Any]:
     ac_cycle, str_cycle, wifi_targets, checkpoints = _load_switch_wifi_str_components()
+    settings = telemetry_settings(load_config(refresh=True))
     return {
         "ac_cycle": ac_cycle,
         "str_cycle": str_cycle,
         "wifi_targets": wifi_targets,
         "checkpoints": checkpoints,
+        "telemetry": TelemetrySink("switch_wifi_str", enabled=settings["enabled"]),
+        "telemetry_mysql_sync": settings["mysql_sync"],
     }
 
 
@@ -296,13 +361,14 @@ def switch_wifi_str_components() -> dict[str, Any]:
 def ac_control(switch_wifi_str_components: Mapping[str, Any]) -> Callable[[], None]:
     cycle: CycleConfig | None = switch_wifi_str_components.get("ac_cycle")
     checkpoints = switch_wifi_str_components.get("checkpoints")
+    telemetry = switch_wifi_str_components.get("telemetry")
 
     def _runner() -> None:
         if not cycle:
             return
-        _run_cycle("AC", cycle)
+        _run_cycle("AC", cycle, telemetry)
         if checkpoints is not None:
-            run_checkpoints("AC", checkpoints)
+            _timed_checkpoints("AC", checkpoints, telemetry)
 
     return _runner
 
@@ -311,13 +377,14 @@ def ac_control(switch_wifi_str_components: Mapping[str, Any]) -> Callable[[], No
 def str_control(switch_wifi_str_components: Mapping[str, Any]) -> Callable[[], None]:
     cycle: CycleConfig | None = switch_wifi_str_components.get("str_cycle")
     checkpoints = switch_wifi_str_components.get("checkpoints")
+    telemetry = switch_wifi_str_components.get("telemetry")
 
     def _runner() -> None:
         if not cycle:
             return
-        _run_cycle("STR", cycle)
+        _run_cycle("STR", cycle, telemetry)
         if checkpoints is not None:
-            run_checkpoints("STR", checkpoints)
+            _timed_checkpoints("STR", checkpoints, telemetry)
 
     return _runner
 
@@ -328,11 +395,12 @@ def wifi_control(
 ) -> Callable[[list[str], str], None]:
     targets: tuple[WifiTarget, ...] = switch_wifi_str_components.get("wifi_targets", ())
     checkpoints = switch_wifi_str_components.get("checkpoints")
+    telemetry = switch_wifi_str_components.get("telemetry")
 
     def _runner(failures: list[str], iteration_label: str) -> None:
         if not targets:
             return
-        _cycle_targets(targets, checkpoints, failures, iteration_label)
+        _cycle_targets(targets, checkpoints, failures, iteration_label, telemetry)
 
     return _runner
 
@@ -365,17 +433,24 @@ def test_switch_wifi_str_workflow(
         pytest.skip("Switch Wi-Fi stability currently supports Android DUT only")
 
     failures: list[str] = []
+    telemetry: TelemetrySink | None = switch_wifi_str_components.get("telemetry")
 
-    for iteration, budget, report_completion in iterate_stability_loops(plan):
-        iteration_label = describe_iteration(iteration, budget, plan.mode)
-        logging.info("[Switch Wi-Fi STR] stability %s start", iteration_label)
-
-        ac_control()
-        str_control()
-        wifi_control(failures, iteration_label)
-
-        report_completion()
-        logging.info("[Switch Wi-Fi STR] stability %s complete", iteration_label)
+    try:
+        for iteration, budget, report_completion in iterate_stability_loops(
+            plan, case=SWITCH_WIFI_CASE_KEY, telemetry=telemetry
+        ):
+            iteration_label = describe_iteration(iteration, budget, plan.mode)
+            logging.info("[Switch Wi-Fi STR] stability %s start", iteration_label)
+
+            ac_control()
+            str_control()
+            wifi_control(failures, iteration_label)
+
+            report_completion()
+            logging.info("[Switch Wi-Fi STR] stability %s complete", iteration_label)
+    finally:
+        if telemetry is not None:
+            telemetry.close(mysql_sync=bool(switch_wifi_str_components.get("telemetry_mysql_sync")))
 
     if failures:
         logging.warning(
@@ -0,0 +1,221 @@
+"""Console-anchored reconnect timing for STR suites.
+
+The STR reconnect tests measured reconnect latency by polling Wi-Fi state
+with sleeps, so every result was quantised to the poll interval.
+:class:`ConsoleTimeline` subscribes to the DUT serial console (see
+``serial_tool.add_line_listener``) and timestamps kernel and supplicant
+milestones -- suspend entry, resume, kernel boot, wlan up, association,
+DHCP bound -- when their line arrives.  Host-side probes add their own
+marks with :meth:`ConsoleTimeline.mark`, and :meth:`ConsoleTimeline.breakdown`
+reports every milestone as a millisecond offset from an anchor such as
+``power_on``.
+
+The timeline never polls: :meth:`ConsoleTimeline.wait_for` blocks on a
+condition variable signalled by the serial reader thread.  When the DUT has
+no serial console the timeline is inert and callers keep their own timing.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, Mapping, Optional, Pattern
+
+__all__ = ["CONSOLE_MARKERS", "ConsoleEvent", "ConsoleTimeline"]
+
+#: Milestone name -> console pattern.  Kernel, wpa_supplicant and dhcpcd
+#: wording varies between platforms, hence the alternatives.
+CONSOLE_MARKERS: Dict[str, Pattern[str]] = {
+    "suspend_entry": re.compile(r"PM: suspend entry|Freezing user space processes", re.IGNORECASE),
+    "resume": re.compile(r"PM: suspend exit|PM: resume of devices complete|Restarting tasks", re.IGNORECASE),
+    "kernel_boot": re.compile(r"Booting Linux on physical CPU|Linux version \d", re.IGNORECASE),
+    "wlan_up": re.compile(
+        r"wlan\d+: link becomes ready|ADDRCONF\(NETDEV_(?:UP|CHANGE)\):\s*wlan\d+", re.IGNORECASE
+    ),
+    "association": re.compile(
+        r"wlan\d+: associated|CTRL-EVENT-CONNECTED|wlan\d+: Associated with", re.IGNORECASE
+    ),
+    "dhcp_bound": re.compile(r"DHCPACK|wlan\d+: leased \S+|dhcp.*\bbound to\b", re.IGNORECASE),
+}
+
+_KERNEL_TS_RE = re.compile(r"^\s*\[\s*(\d+\.\d+)\]")
+
+
+@dataclass(frozen=True)
+class ConsoleEvent:
+    """A console milestone or host-side mark."""
+
+    name: str
+    timestamp: float
+    kernel_time: Optional[float] = None
+    line: str = ""
+
+
+class ConsoleTimeline:
+    """Timestamp console milestones and host marks on one time base.
+
+    Parameters:
+        console: Object exposing ``add_line_listener``/``remove_line_listener``
+            (``serial_tool``); ``None`` makes the timeline inert.
+        markers: Milestone patterns, defaults to :data:`CONSOLE_MARKERS`.
+        max_events: Number of events kept in memory.
+    """
+
+    def __init__(
+        self,
+        console: Any = None,
+        markers: Mapping[str, Pattern[str]] | None = None,
+        *,
+        max_events: int = 4096,
+    ) -> None:
+        self._console = console if hasattr(console, "add_line_listener") else None
+        self._markers = dict(markers or CONSOLE_MARKERS)
+        self._events: Deque[ConsoleEvent] = deque(maxlen=max_events)
+        self._cond = threading.Condition()
+        self._started = False
+
+    @classmethod
+    def for_dut(cls, dut: Any, **kwargs: Any) -> "ConsoleTimeline":
+        """Build a timeline on ``dut.serial`` when the DUT has a serial console."""
+
+        return cls(getattr(dut, "serial", None), **kwargs)
+
+    @property
+    def active(self) -> bool:
+        """Return True while console lines are being observed."""
+
+        return self._started
+
+    def start(self) -> "ConsoleTimeline":
+        if self._console is not None and not self._started:
+            self._console.add_line_listener(self._on_line)
+            self._started = True
+            logging.info("[CONSOLE] reconnect timeline attached to serial console")
+        return self
+
+    def stop(self) -> None:
+        if self._started:
+            self._console.remove_line_listener(self._on_line)
+            self._started = False
+
+    def __enter__(self) -> "ConsoleTimeline":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+    # ------------------------------------------------------------------
+    # recording
+    # ------------------------------------------------------------------
+    def _append(self, event: ConsoleEvent) -> None:
+        with self._cond:
+            self._events.append(event)
+            self._cond.notify_all()
+
+    def _on_line(self, timestamp: float, line: str) -> None:
+        for name, pattern in self._markers.items():
+            if pattern.search(line):
+                match = _KERNEL_TS_RE.match(line)
+                kernel_time = float(match.group(1)) if match else None
+                self._append(ConsoleEvent(name, timestamp, kernel_time, line.strip()))
+                logging.debug("[CONSOLE] %s: %s", name, line.strip())
+
+    def mark(self, name: str, timestamp: Optional[float] = None) -> ConsoleEvent:
+        """Record a host-side event (power on, IP confirmed, ...)."""
+
+        event = ConsoleEvent(name, time.time() if timestamp is None else timestamp)
+        self._append(event)
+        return event
+
+    # ------------------------------------------------------------------
+    # queries
+    # ------------------------------------------------------------------
+    def _first_locked(self, name: str, since: Optional[float]) -> Optional[ConsoleEvent]:
+        for event in self._events:
+            if event.name == name and (since is None or event.timestamp >= since):
+                return event
+        return None
+
+    def first(self, name: str, since: Optional[float] = None) -> Optional[ConsoleEvent]:
+        """Return the first ``name`` event at or after ``since``."""
+
+        with self._cond:
+            return self._first_locked(name, since)
+
+    def last(self, name: str) -> Optional[ConsoleEvent]:
+        """Return the most recent ``name`` event."""
+
+        with self._cond:
+            for event in reversed(self._events):
+                if event.name == name:
+                    return event
+        return None
+
+    def wait_for(self, name: str, *, since: Optional[float] = None, timeout: float = 60.0) -> Optional[ConsoleEvent]:
+        """Block until a ``name`` event at or after ``since`` arrives.
+
+        Returns immediately with ``None`` when the timeline is inert.
+        """
+
+        if not self._started:
+            return None
+        deadline = time.monotonic() + max(0.0, timeout)
+        with self._cond:
+            while True:
+                event = self._first_locked(name, since)
+                if event is not None:
+                    return event
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                self._cond.wait(remaining)
+
+    def breakdown(self, anchor: str = "power_on") -> Dict[str, float]:
+        """Return milliseconds from the latest ``anchor`` mark to each later milestone.
+
+        Only the first occurrence of every milestone is reported, ordered by
+        time; an empty dict means the anchor was never marked.
+        """
+
+        with self._cond:
+            anchor_event = None
+            for event in reversed(self._events):
+                if event.name == anchor:
+                    anchor_event = event
+                    break
+            if anchor_event is None:
+                return {}
+            offsets: Dict[str, float] = {}
+            for event in self._events:
+                if event.timestamp < anchor_event.timestamp or event is anchor_event:
+                    continue
+                if event.name == anchor or event.name in offsets:
+                    continue
+                offsets[event.name] = round((event.timestamp - anchor_event.timestamp) * 1000, 1)
+        return offsets
+
+    @staticmethod
+    def describe(breakdown: Mapping[str, float]) -> str:
+        return ", ".join(f"{name} +{ms:.0f} ms" for name, ms in breakdown.items()) or "no console milestones"
+
+    def report(self, anchor: str = "power_on", telemetry: Any = None, **attrs: Any) -> Dict[str, float]:
+        """Log the breakdown from ``anchor`` and record it as ``console_<name>`` phases."""
+
+        breakdown = self.breakdown(anchor)
+        if not breakdown:
+            return breakdown
+        logging.info("⏱️ Reconnect breakdown from %s: %s", anchor, self.describe(breakdown))
+        if telemetry is not None:
+            anchor_event = self.last(anchor)
+            for name, offset_ms in breakdown.items():
+                telemetry.record(
+                    f"console_{name}",
+                    offset_ms / 1000,
+                    started_at=anchor_event.timestamp if anchor_event else None,
+                    **attrs,
+                )
+        return breakdown
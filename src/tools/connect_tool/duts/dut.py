@@ -5,8 +5,10 @@ import time
 import random
 import pytest
 import threading
-from src.util.constants import load_config
+from src.util.constants import config_snapshot
+from src.util.run_estimator import STEP_IPERF, timed_step
 from src.tools.ixchariot import ix
+from src.tools.network_tool.icmp import PingStats, parse_ping_output
 from src.tools.connect_tool.command_batch import CommandBatch, CommandRunner, CommandExecutionError, CommandTimeoutError
 from src.tools.connect_tool.mixins.app_mixin import AppMixin
 from src.tools.connect_tool.mixins.dut_mixins import WifiMixin
@@ -107,7 +109,7 @@ class dut(WifiMixin, PerfMixin, SystemMixin, InputMixin, AppMixin, UiAutomationM
         self.rssi_num = -1
         self._freq_num = 0
         self.channel = 0
-        cfg = load_config(refresh=True)
+        cfg = config_snapshot(refresh=True)
         rvr_cfg = cfg.get('rvr', {})
         self.rvr_tool = rvr_cfg.get('tool', 'iperf')
         iperf_cfg = rvr_cfg.get('iperf', {})
@@ -153,7 +155,22 @@ class dut(WifiMixin, PerfMixin, SystemMixin, InputMixin, AppMixin, UiAutomationM
                 f"set ixchariot_installation_dir \"{self.script_path}\"\n",
             )
 
-    def ping(
+    @staticmethod
+    def _ping_command(hostname, interface=None, interval_in_seconds=1, ping_time_in_seconds=5, size_in_bytes=None):
+        """Return ``(command, count, interval)`` for a DUT-side ping."""
+
+        interval = max(float(interval_in_seconds or 1), 0.2)
+        duration = max(float(ping_time_in_seconds or 1), interval)
+        count = max(int(duration / interval), 1)
+        cmd = f"ping -i {interval:.2f}"
+        if interface:
+            cmd += f" -I {interface}"
+        cmd += f" -c {count}"
+        if size_in_bytes:
+            cmd += f" -s {size_in_bytes}"
+        return f"{cmd} {hostname}", count, interval
+
+    def ping_stats(
         self,
         interface=None,
         hostname="www.baidu.com",
@@ -161,61 +178,112 @@ class dut(WifiMixin, PerfMixin, SystemMixin, InputMixin, AppMixin, UiAutomationM
         ping_time_in_seconds=5,
         timeout_in_seconds=10,
         size_in_bytes=None,
-    ):
-        """Run an ICMP ping on the DUT side and return True when packet loss is acceptable."""
+    ) -> PingStats:
+        """Run an ICMP ping on the DUT side and return loss and RTT statistics."""
 
         if not hostname or not isinstance(hostname, str):
             logging.error("Ping checkpoint missing hostname")
-            return False
-        interval = max(float(interval_in_seconds or 1), 0.2)
-        duration = max(float(ping_time_in_seconds or 1), interval)
-        count = max(int(duration / interval), 1)
-        timeout = max(int(timeout_in_seconds or 1), 1) + count
-
-        if interface:
-            if size_in_bytes:
-                cmd = f"ping -i {interval:.2f} -I {interface} -c {count} -s {size_in_bytes} {hostname}"
-            else:
-                cmd = f"ping -i {interval:.2f} -I {interface} -c {count} {hostname}"
-        else:
-            if size_in_bytes:
-                cmd = f"ping -i {interval:.2f} -c {count} -s {size_in_bytes} {hostname}"
-            else:
-                cmd = f"ping -i {interval:.2f} -c {count} {hostname}"
+            return PingStats(str(hostname or ""), error="missing hostname")
+        cmd, _, _ = self._ping_command(
+            hostname, interface, interval_in_seconds, ping_time_in_seconds, size_in_bytes
+        )
 
         logging.debug("Ping command: %s", cmd)
         try:
             output = self.checkoutput(cmd)
         except Exception as exc:  # pragma: no cover - transports differ per DUT
             logging.error("Ping command failed: %s", exc)
-            return False
+            return PingStats(hostname, error=str(exc))
         if not output:
-            return False
+            return PingStats(hostname, error="no output")
 
         # Inspect tracked return code/stderr to flag remote ping failures.
         last_code = getattr(self, "_last_command_returncode", 0)
         stderr_output = getattr(self, "_last_command_stderr", "")
-        if last_code:
+        stats = parse_ping_output(hostname, output, stderr_output)
+        if last_code and not stats.error:
             logging.debug("Ping exit code %s stderr: %s", last_code, stderr_output.strip())
-            return False
-
-        lowered = output.lower()
-        error_lowered = stderr_output.lower()
-        if "unknown host" in lowered or "name or service not known" in lowered:
-            logging.debug("Ping reported unknown host: %s", hostname)
-            return False
-        if "unknown host" in error_lowered or "name or service not known" in error_lowered:
-            logging.debug("Ping stderr reported unknown host: %s", hostname)
-            return False
-
-        loss_match = re.search(r"(\d+)% packet loss", output)
-        if loss_match:
-            packet_loss = int(loss_match.group(1))
-            logging.debug("Ping packet loss = %s%%", packet_loss)
-            return packet_loss == 0
-
-        logging.debug("Ping output unparsable:\n%s", output)
-        return False
+            stats.error = stats.error or f"exit code {last_code}"
+        if stats.error == "unparsable ping output":
+            logging.debug("Ping output unparsable:\n%s", output)
+        logging.debug("Ping %s", stats.describe())
+        return stats
+
+    def ping(
+        self,
+        interface=None,
+        hostname="www.baidu.com",
+        interval_in_seconds=1,
+        ping_time_in_seconds=5,
+        timeout_in_seconds=10,
+        size_in_bytes=None,
+    ):
+        """Run an ICMP ping on the DUT side and return True when packet loss is acceptable."""
+
+        return self.ping_stats(
+            interface=interface,
+            hostname=hostname,
+            interval_in_seconds=interval_in_seconds,
+            ping_time_in_seconds=ping_time_in_seconds,
+            timeout_in_seconds=timeout_in_seconds,
+            size_in_bytes=size_in_bytes,
+        ).ok
+
+    def ping_many(
+        self,
+        hostnames,
+        interface=None,
+        interval_in_seconds=1,
+        ping_time_in_seconds=5,
+        timeout_in_seconds=10,
+        size_in_bytes=None,
+    ) -> dict[str, PingStats]:
+        """Ping every host concurrently on the DUT in a single transport round trip.
+
+        The pings run as background jobs of one shell command and each output
+        line is tagged with its target index, so the call lasts as long as the
+        slowest target.  Targets whose output cannot be recovered (e.g. shells
+        without ``sed``) are retried one by one with :meth:`ping_stats`.
+        """
+
+        targets = [h for h in dict.fromkeys(hostnames or ()) if h and isinstance(h, str)]
+        if len(targets) <= 1:
+            return {
+                host: self.ping_stats(
+                    interface, host, interval_in_seconds, ping_time_in_seconds, timeout_in_seconds, size_in_bytes
+                )
+                for host in targets
+            }
+        jobs = []
+        for index, host in enumerate(targets):
+            cmd, _, _ = self._ping_command(
+                host, interface, interval_in_seconds, ping_time_in_seconds, size_in_bytes
+            )
+            jobs.append(f"{cmd} 2>&1 | sed s/^/@{index}@/ &")
+        compound = " ".join(jobs) + " wait"
+        logging.debug("Concurrent ping command: %s", compound)
+        try:
+            output = self.checkoutput(compound) or ""
+        except Exception as exc:  # pragma: no cover - transports differ per DUT
+            logging.error("Concurrent ping failed: %s", exc)
+            output = ""
+
+        per_target = {index: [] for index in range(len(targets))}
+        for line in output.splitlines():
+            match = re.match(r"@(\d+)@(.*)", line.strip())
+            if match and int(match.group(1)) in per_target:
+                per_target[int(match.group(1))].append(match.group(2))
+
+        results = {}
+        for index, host in enumerate(targets):
+            stats = parse_ping_output(host, "\n".join(per_target[index]))
+            if stats.error == "unparsable ping output":
+                stats = self.ping_stats(
+                    interface, host, interval_in_seconds, ping_time_in_seconds, timeout_in_seconds, size_in_bytes
+                )
+            logging.debug("Ping %s", stats.describe())
+            results[host] = stats
+        return results
 
     @property
     def dut_ip(self):
@@ -410,13 +478,14 @@ class dut(WifiMixin, PerfMixin, SystemMixin, InputMixin, AppMixin, UiAutomationM
         )
         rssi_thread.start()
 
-        return super().get_rx_rate(
-            router_info,
-            type=type,
-            corner_tool=corner_tool,
-            db_set=db_set,
-            debug=debug,
-        )
+        with timed_step(STEP_IPERF):
+            return super().get_rx_rate(
+                router_info,
+                type=type,
+                corner_tool=corner_tool,
+                db_set=db_set,
+                debug=debug,
+            )
 
     @step
     def get_tx_rate(self, router_info, type='TCP', corner_tool=None, db_set='', debug=False):
@@ -431,13 +500,14 @@ class dut(WifiMixin, PerfMixin, SystemMixin, InputMixin, AppMixin, UiAutomationM
             daemon=True  # 主线程结束，子线程自动销毁
         )
         rssi_thread.start()
-        return super().get_tx_rate(
-            router_info,
-            type=type,
-            corner_tool=corner_tool,
-            db_set=db_set,
-            debug=debug,
-        )
+        with timed_step(STEP_IPERF):
+            return super().get_tx_rate(
+                router_info,
+                type=type,
+                corner_tool=corner_tool,
+                db_set=db_set,
+                debug=debug,
+            )
 
     @step
     def get_rssi(self):
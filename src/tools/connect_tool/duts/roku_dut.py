@@ -26,7 +26,7 @@ from src.tools.connect_tool.transports.telnet_tool import telnet_tool
 from src.tools.connect_tool.duts.linux import linux
 from src.tools.connect_tool.mixins.dut_mixins import WifiConnectParams
 from src.tools.connect_tool.roku_wpa import roku_wpa
-from src.util.constants import load_config
+from src.util.constants import config_snapshot
 from src.util.constants import RokuConst
 from typing import Annotated
 
@@ -35,7 +35,7 @@ def _get_roku_ip() -> Optional[str]:
     """
     Load the latest Roku IP address from the configuration.
 
-    This helper refreshes the configuration using :func:`load_config` and
+    This helper refreshes the configuration using :func:`config_snapshot` and
     returns the IP address defined under the ``connect_type`` section and logs
     the result for debugging purposes.
 
@@ -44,7 +44,7 @@ def _get_roku_ip() -> Optional[str]:
     Optional[str]
         The configured Roku IP address, or ``None`` if not defined.
     """
-    cfg = load_config(refresh=True) or {}
+    cfg = config_snapshot(refresh=True)
     connect_cfg = cfg.get("connect_type", {})
     linux_cfg = connect_cfg.get("Linux") or {}
     ip = linux_cfg.get("ip")
@@ -4,6 +4,7 @@ import re
 from src.tools.connect_tool import command_batch as subprocess
 import time
 import locale
+import platform
 
 from src.tools.yamlTool import yamlTool
 
@@ -16,6 +17,7 @@ class LocalOS:
 
     def __init__(self):
         self.ip = ''
+        self.last_flush_seconds = None
 
     def checkoutput(self, cmd):
         result = subprocess.run(
@@ -95,8 +97,11 @@ class LocalOS:
 
         return found_fallback
 
-    def dynamic_flush_network_card(self, net_card='', max_retries=3):
+    def dynamic_flush_network_card(self, net_card='', max_retries=3, expected_network=None, exclude=()):
+        if platform.system() == 'Linux':
+            return self._flush_network_card_netlink(net_card, max_retries, expected_network, exclude)
         #Try interface down max 3 times, and wait max 30 seconds after down/up
+        started = time.monotonic()
         for retry in range(max_retries):
             print(f"[Retry {retry + 1}/{max_retries}] Disabling/enabling NIC '{net_card}'...")
 
@@ -112,8 +117,36 @@ class LocalOS:
                 ip = self.get_ipaddress(net_card)
                 if ip:
                     self.ip = ip
+                    self.last_flush_seconds = time.monotonic() - started
                     return ip
 
         self.ip = None
+        self.last_flush_seconds = None
+        logging.error(f"Failed to renew IP for '{net_card}' after {max_retries} retries")
+        return None
+
+    def _flush_network_card_netlink(self, net_card, max_retries=3, expected_network=None, exclude=()):
+        """Renew the lease on Linux and return as soon as rtnetlink reports the new address."""
+        from src.tools.network_tool.netlink import renew_dhcp_lease
+
+        for retry in range(max_retries):
+            try:
+                result = renew_dhcp_lease(
+                    net_card,
+                    expected_network=expected_network,
+                    exclude=tuple(ip for ip in exclude if ip),
+                    timeout=30,
+                )
+            except (OSError, RuntimeError) as exc:
+                logging.error(f"Netlink renew on '{net_card}' failed: {exc}")
+                break
+            if result.ip:
+                self.ip = result.ip
+                self.last_flush_seconds = result.seconds
+                return result.ip
+            logging.warning(f"[Retry {retry + 1}/{max_retries}] no lease on '{net_card}'")
+
+        self.ip = None
+        self.last_flush_seconds = None
         logging.error(f"Failed to renew IP for '{net_card}' after {max_retries} retries")
         return None
\ No newline at end of file
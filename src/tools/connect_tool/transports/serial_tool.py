@@ -83,6 +83,9 @@ class serial_tool:
 
         self._rx_queue = Queue()  # Thread‑safe receive buffer
         self._stop_flag = threading.Event()
+        self._line_listeners = []  # Callables fed (timestamp, line) per console line
+        self._line_listeners_lock = threading.Lock()
+        self._partial_line = ''
         if enable_log:
             self.log_thread = threading.Thread(
                 target=self._save_and_detect_log, daemon=True)
@@ -249,18 +252,58 @@ class serial_tool:
                 if not self._is_serial_open():
                     time.sleep(0.5)
                     continue
-                data = self.ser.read(1024)  # Do not decode immediately
+                # Read whatever is buffered, or block for the first byte, so a
+                # chunk returns as soon as the console prints instead of after
+                # the port timeout; listener timestamps depend on it.
+                data = self.ser.read(max(1, getattr(self.ser, 'in_waiting', 0) or 0))  # Do not decode immediately
                 if not data:
                     continue
+                received_at = time.time()
                 chunk = data.decode("utf-8", errors="ignore")
                 chunk = chunk.replace("\r\n", "\n").replace("\r", "\n")
                 file.write(chunk)
+                self._dispatch_lines(received_at, chunk)
                 self._rx_queue.put(data)  # Feed data to the business thread
                 with self.keyword_flags_lock:
                     for kw in list(self.keyword_flags):
                         if kw.encode() in data:
                             self.keyword_flags[kw] = True
 
+    def add_line_listener(self, callback):
+        """
+        Register ``callback(timestamp, line)`` for every complete console line.
+
+        The callback runs on the log thread with the host ``time.time()`` at
+        which the line's last chunk arrived; it must return quickly.
+        """
+        with self._line_listeners_lock:
+            if callback not in self._line_listeners:
+                self._line_listeners.append(callback)
+
+    def remove_line_listener(self, callback):
+        """Unregister a callback added with :meth:`add_line_listener`."""
+        with self._line_listeners_lock:
+            if callback in self._line_listeners:
+                self._line_listeners.remove(callback)
+
+    def _dispatch_lines(self, received_at, chunk):
+        """Split ``chunk`` into lines and feed complete ones to the listeners."""
+        with self._line_listeners_lock:
+            listeners = list(self._line_listeners)
+        if not listeners:
+            self._partial_line = ''
+            return
+        text = self._partial_line + chunk
+        *lines, self._partial_line = text.split('\n')
+        for line in lines:
+            if not line:
+                continue
+            for callback in listeners:
+                try:
+                    callback(received_at, line)
+                except Exception as exc:
+                    logging.debug('Serial line listener failed: %s', exc)
+
     def start_keyword_detection(self, keyword):
         """
         Start keyword detection.
@@ -16,6 +16,8 @@ from .schema import (
     read_csv_rows,
 )
 from .sql_writer import SqlWriter
+from src.tools.result_store import open_result_table
+from src.tools.result_writer import recover_result_journal
 from src.util.constants import (
     AP_MODEL_CHOICES,
     AP_REGION_CHOICES,
@@ -74,6 +76,7 @@ __all__ = [
     "sync_test_result_to_db",
     "sync_file_to_db",
     "sync_compatibility_artifacts_to_db",
+    "sync_telemetry_to_db",
 ]
 
 ColumnNormalizer = Callable[[Any], Any]
@@ -1888,8 +1891,13 @@ def sync_test_result_to_db(
     if not file_path.is_file():
         logging.error("Log file %s not found, skip syncing test results.", log_file)
         return 0
+    recover_result_journal(file_path)
 
-    headers, rows = read_csv_rows(file_path)
+    table = open_result_table(file_path)
+    if table is not None:
+        headers, rows = table.headers, table.rows()
+    else:
+        headers, rows = read_csv_rows(file_path)
     logging.info(
         "Loaded CSV %s | header_count=%s row_count=%s",
         file_path,
@@ -2131,6 +2139,59 @@ def sync_compatibility_artifacts_to_db(
         return affected
 
 
+def sync_telemetry_to_db(
+        config: dict | None,
+        *,
+        suite: str,
+        summary: Mapping[str, Mapping[str, Any]],
+        csv_file: str,
+        case_path: Optional[str] = None,
+        run_source: str = "local",
+) -> int:
+    """
+    Sync stability phase telemetry summaries into `stability_telemetry`.
+
+    Stores one row per phase statistic (``<phase>_p50`` etc., unit ``s``)
+    under the project and suite.  Telemetry is not a test report, so no
+    `execution`/`test_report` rows are registered for it.
+    """
+    active_config = config if isinstance(config, Mapping) and config else load_config(refresh=True) or {}
+    if not active_config:
+        logging.debug("sync_telemetry_to_db: skipped, config missing")
+        return 0
+    rows: list[tuple[str, str, Decimal]] = []
+    for phase, stats in summary.items():
+        for stat in ("min", "p50", "p95", "max", "mean"):
+            value = stats.get(f"{stat}_s")
+            if value is None:
+                continue
+            rows.append((f"{phase}_{stat}"[:64], "s", Decimal(f"{float(value):.4f}")))
+        rows.append((f"{phase}_failed"[:64], "count", Decimal(int(stats.get("failed") or 0))))
+    if not rows:
+        return 0
+
+    with MySqlClient() as client:
+        prepare_database(client)
+        project_id = ensure_project(client, _build_project_payload(active_config))
+        resolved_case_path = case_path or _resolve_case_path(active_config)
+        insert_sql = (
+            "INSERT INTO `stability_telemetry` "
+            "(`project_id`, `suite`, `case_path`, `csv_name`, `run_source`, "
+            "`metric_name`, `metric_unit`, `metric_value`) "
+            "VALUES (%s, %s, %s, %s, %s, %s, %s, %s)"
+        )
+        source = (run_source or "local").strip().upper()[:32]
+        affected = client.executemany(
+            insert_sql,
+            [
+                (int(project_id), suite[:64], resolved_case_path, Path(csv_file).name, source, name, unit, value)
+                for name, unit, value in rows
+            ],
+        )
+        logging.info("Synced %s telemetry metrics for %s into DB", affected, suite)
+        return affected
+
+
 def sync_file_to_db(
         file_path: str,
         data_type: str,
@@ -522,6 +522,30 @@ _TABLE_SPECS: Dict[str, TableSpec] = {
             ),
         ),
     ),
+    "stability_telemetry": TableSpec(
+        columns=(
+            ColumnDefinition("project_id", "INT NOT NULL"),
+            ColumnDefinition("suite", "VARCHAR(64) NOT NULL"),
+            ColumnDefinition("case_path", "VARCHAR(512)"),
+            ColumnDefinition("csv_name", "VARCHAR(255)"),
+            ColumnDefinition("run_source", "VARCHAR(32)"),
+            ColumnDefinition("metric_name", "VARCHAR(64) NOT NULL"),
+            ColumnDefinition("metric_unit", "VARCHAR(16)"),
+            ColumnDefinition("metric_value", "DECIMAL(12,4) NOT NULL"),
+        ),
+        indexes=(
+            TableIndex(
+                "idx_telemetry_project_suite",
+                "INDEX idx_telemetry_project_suite (`project_id`, `suite`)",
+            ),
+        ),
+        constraints=(
+            TableConstraint(
+                "fk_telemetry_project",
+                "CONSTRAINT fk_telemetry_project FOREIGN KEY (`project_id`) REFERENCES `project`(`id`) ON DELETE CASCADE",
+            ),
+        ),
+    ),
     "artifact": TableSpec(
         columns=(
             ColumnDefinition("test_report_id", "INT NOT NULL"),
@@ -855,6 +879,7 @@ def ensure_report_tables(client, *, apply_migrations: bool = False) -> None:
     ensure_table(client, "artifact", _TABLE_SPECS["artifact"])
     ensure_table(client, "perf_metric_kv", _TABLE_SPECS["perf_metric_kv"])
     ensure_table(client, "compatibility", _TABLE_SPECS["compatibility"])
+    ensure_table(client, "stability_telemetry", _TABLE_SPECS["stability_telemetry"])
     if apply_migrations:
         _migrate_project_table(client)
         _migrate_execution_table(client)
@@ -883,6 +908,8 @@ def ensure_report_tables(client, *, apply_migrations: bool = False) -> None:
     _ensure_table_constraints(client, "perf_metric_kv", _TABLE_SPECS["perf_metric_kv"].constraints)
     _ensure_table_indexes(client, "compatibility", _TABLE_SPECS["compatibility"].indexes)
     _ensure_table_constraints(client, "compatibility", _TABLE_SPECS["compatibility"].constraints)
+    _ensure_table_indexes(client, "stability_telemetry", _TABLE_SPECS["stability_telemetry"].indexes)
+    _ensure_table_constraints(client, "stability_telemetry", _TABLE_SPECS["stability_telemetry"].constraints)
     _ensure_views(client)
 
 
@@ -0,0 +1,232 @@
+"""Concurrent ICMP echo sampling with RTT statistics.
+
+Two sources feed the same :class:`PingStats` record:
+
+* :func:`icmp_ping_many` probes every host from an in-process ICMP socket.
+  It prefers an unprivileged datagram socket (Linux ``ping_group_range``)
+  and falls back to a raw socket when running as root.  All targets share
+  one socket and one send schedule, so probing N hosts takes as long as
+  the slowest one.
+* :func:`parse_ping_output` turns the text printed by ``ping`` (iputils,
+  toybox, busybox or Windows) into the same statistics.  DUT-side pings use
+  it.
+
+When no ICMP socket can be opened (Windows without admin rights, restricted
+containers), :func:`icmp_ping_many` returns ``None`` and the caller should
+fall back to the system ``ping`` command.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import re
+import select
+import socket
+import struct
+import time
+from dataclasses import dataclass, field
+from typing import Iterable, Optional
+
+from src.util import percentile
+
+__all__ = [
+    "PingStats",
+    "percentile",
+    "parse_ping_output",
+    "icmp_ping_many",
+]
+
+_ICMP_ECHO_REQUEST = 8
+_ICMP_ECHO_REPLY = 0
+_ICMP_HEADER = struct.Struct("!BBHHH")
+
+_RTT_RE = re.compile(r"time\s*[=<]\s*([\d.]+)\s*ms", re.IGNORECASE)
+_UNIX_SUMMARY_RE = re.compile(r"(\d+)\s+packets transmitted,\s*(\d+)\s+(?:packets\s+)?received")
+_WINDOWS_SUMMARY_RE = re.compile(r"Sent\s*=\s*(\d+),\s*Received\s*=\s*(\d+)", re.IGNORECASE)
+_UNKNOWN_HOST_MARKERS = ("unknown host", "name or service not known", "could not find host")
+
+
+@dataclass
+class PingStats:
+    """Loss and round-trip statistics for one ping target."""
+
+    target: str
+    sent: int = 0
+    received: int = 0
+    rtts_ms: list[float] = field(default_factory=list)
+    error: str = ""
+
+    @property
+    def loss_percent(self) -> float:
+        if self.sent <= 0:
+            return 100.0
+        return max(0.0, (self.sent - self.received) / self.sent * 100)
+
+    @property
+    def ok(self) -> bool:
+        """Return True when every echo request was answered."""
+
+        return not self.error and self.sent > 0 and self.received >= self.sent
+
+    @property
+    def min_ms(self) -> Optional[float]:
+        return min(self.rtts_ms) if self.rtts_ms else None
+
+    @property
+    def p50_ms(self) -> Optional[float]:
+        return percentile(self.rtts_ms, 0.5)
+
+    @property
+    def p95_ms(self) -> Optional[float]:
+        return percentile(self.rtts_ms, 0.95)
+
+    @property
+    def max_ms(self) -> Optional[float]:
+        return max(self.rtts_ms) if self.rtts_ms else None
+
+    def describe(self) -> str:
+        if self.error:
+            return f"{self.target}: {self.error}"
+        summary = f"{self.target}: {self.received}/{self.sent} received, {self.loss_percent:.0f}% loss"
+        if self.rtts_ms:
+            summary += (
+                f", rtt min/p50/p95/max = {self.min_ms:.2f}/{self.p50_ms:.2f}/"
+                f"{self.p95_ms:.2f}/{self.max_ms:.2f} ms"
+            )
+        return summary
+
+
+def parse_ping_output(target: str, output: str, stderr: str = "") -> PingStats:
+    """Build :class:`PingStats` from the text printed by a ``ping`` command."""
+
+    text = output or ""
+    lowered = f"{text}\n{stderr or ''}".lower()
+    if any(marker in lowered for marker in _UNKNOWN_HOST_MARKERS):
+        return PingStats(target, error="unknown host")
+    rtts = [float(value) for value in _RTT_RE.findall(text)]
+    match = _UNIX_SUMMARY_RE.search(text) or _WINDOWS_SUMMARY_RE.search(text)
+    if match:
+        return PingStats(target, int(match.group(1)), int(match.group(2)), rtts)
+    if rtts:
+        # Interrupted before the summary: only replies are known.
+        return PingStats(target, len(rtts), len(rtts), rtts)
+    return PingStats(target, error="unparsable ping output")
+
+
+def _checksum(data: bytes) -> int:
+    if len(data) % 2:
+        data += b"\0"
+    total = sum(struct.unpack(f"!{len(data) // 2}H", data))
+    total = (total >> 16) + (total & 0xFFFF)
+    total += total >> 16
+    return ~total & 0xFFFF
+
+
+def _echo_request(ident: int, seq: int, payload: bytes) -> bytes:
+    header = _ICMP_HEADER.pack(_ICMP_ECHO_REQUEST, 0, 0, ident, seq)
+    checksum = _checksum(header + payload)
+    return _ICMP_HEADER.pack(_ICMP_ECHO_REQUEST, 0, checksum, ident, seq) + payload
+
+
+def _open_icmp_socket() -> Optional[tuple[socket.socket, bool]]:
+    """Return ``(socket, is_raw)`` or ``None`` when ICMP sockets are not permitted."""
+
+    for kind, is_raw in ((socket.SOCK_DGRAM, False), (socket.SOCK_RAW, True)):
+        try:
+            return socket.socket(socket.AF_INET, kind, socket.IPPROTO_ICMP), is_raw
+        except OSError:
+            continue
+    return None
+
+
+def icmp_ping_many(
+    hosts: Iterable[str],
+    *,
+    count: int = 5,
+    interval: float = 1.0,
+    timeout: float = 2.0,
+    payload_size: int = 56,
+) -> Optional[dict[str, PingStats]]:
+    """Ping every host concurrently from an in-process ICMP socket.
+
+    Parameters:
+        hosts: Host names or IPv4 addresses.
+        count: Echo requests per host.
+        interval: Seconds between request rounds.
+        timeout: Seconds to wait for replies after the last round.
+        payload_size: ICMP payload bytes.
+
+    Returns:
+        Mapping of host to :class:`PingStats`, or ``None`` when no ICMP socket
+        can be opened on this host.
+    """
+
+    targets = list(dict.fromkeys(h.strip() for h in hosts if h and h.strip()))
+    results = {host: PingStats(host) for host in targets}
+    addresses: dict[str, str] = {}
+    for host in targets:
+        try:
+            addresses[host] = socket.gethostbyname(host)
+        except OSError:
+            results[host].error = "unknown host"
+    opened = _open_icmp_socket()
+    if opened is None:
+        logging.debug("ICMP sockets not permitted; caller should use the system ping")
+        return None
+    sock, is_raw = opened
+    ident = os.getpid() & 0xFFFF
+    payload = bytes(max(0, int(payload_size)))
+    by_address: dict[str, list[str]] = {}
+    for host, address in addresses.items():
+        by_address.setdefault(address, []).append(host)
+    sent_at: dict[tuple[str, int], float] = {}
+
+    def _receive_until(deadline: float) -> None:
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            readable, _, _ = select.select([sock], [], [], remaining)
+            if not readable:
+                return
+            try:
+                packet, (address, _) = sock.recvfrom(65535)
+            except OSError:
+                return
+            received = time.monotonic()
+            if is_raw:
+                packet = packet[(packet[0] & 0x0F) * 4:]
+            if len(packet) < _ICMP_HEADER.size:
+                continue
+            kind, _, _, reply_ident, seq = _ICMP_HEADER.unpack_from(packet)
+            # Datagram sockets get their identifier rewritten by the kernel,
+            # which also filters replies per socket.
+            if kind != _ICMP_ECHO_REPLY or (is_raw and reply_ident != ident):
+                continue
+            started = sent_at.pop((address, seq), None)
+            if started is None:
+                continue
+            for host in by_address.get(address, ()):
+                results[host].received += 1
+                results[host].rtts_ms.append((received - started) * 1000)
+
+    try:
+        for seq in range(1, max(1, int(count)) + 1):
+            round_start = time.monotonic()
+            for address, hosts_for_address in by_address.items():
+                try:
+                    sock.sendto(_echo_request(ident, seq, payload), (address, 0))
+                except OSError as exc:
+                    for host in hosts_for_address:
+                        results[host].error = str(exc)
+                    continue
+                sent_at[(address, seq)] = time.monotonic()
+                for host in hosts_for_address:
+                    results[host].sent += 1
+            if seq < count:
+                _receive_until(round_start + interval)
+        _receive_until(time.monotonic() + timeout)
+    finally:
+        sock.close()
+    return results
@@ -0,0 +1,289 @@
+"""rtnetlink-driven DHCP renewal for Linux hosts.
+
+``LocalOS.dynamic_flush_network_card`` originally released/renewed the host
+NIC and then polled the address with sleeps.  On Linux the kernel announces
+every link, address and route change on the ``NETLINK_ROUTE`` socket, so the
+renewal can return the moment the new lease is bound:
+
+1. subscribe to link / IPv4 address / IPv4 route multicast groups,
+2. release the current lease (``RTM_DELADDR`` follows),
+3. start the DHCP client without waiting for it,
+4. return on the first ``RTM_NEWADDR`` for the interface whose address lies
+   in the expected subnet (any non link-local address when none is given).
+
+Only the handful of netlink structures needed for this are decoded.
+"""
+
+from __future__ import annotations
+
+import ipaddress
+import logging
+import select
+import shutil
+import socket
+import struct
+import time
+from dataclasses import dataclass, field
+from typing import Iterator, Optional
+
+from src.tools.connect_tool import command_batch as subprocess
+
+__all__ = ["NetlinkEvent", "RenewResult", "RouteMonitor", "parse_messages", "renew_dhcp_lease"]
+
+# rtnetlink message types
+RTM_NEWLINK = 16
+RTM_DELLINK = 17
+RTM_NEWADDR = 20
+RTM_DELADDR = 21
+RTM_NEWROUTE = 24
+RTM_DELROUTE = 25
+NLMSG_ERROR = 2
+NLMSG_DONE = 3
+
+# multicast groups
+RTMGRP_LINK = 0x1
+RTMGRP_IPV4_IFADDR = 0x10
+RTMGRP_IPV4_ROUTE = 0x40
+
+IFLA_IFNAME = 3
+IFA_ADDRESS = 1
+IFA_LOCAL = 2
+RTA_DST = 1
+RTA_OIF = 4
+RTA_GATEWAY = 5
+
+IFF_UP = 0x1
+IFF_LOWER_UP = 0x10000
+
+_NLMSGHDR = struct.Struct("=LHHLL")
+_IFINFOMSG = struct.Struct("=BxHiII")
+_IFADDRMSG = struct.Struct("=BBBBI")
+_RTMSG = struct.Struct("=BBBBBBBBI")
+_RTATTR = struct.Struct("=HH")
+
+_EVENT_NAMES = {
+    RTM_NEWLINK: "link",
+    RTM_DELLINK: "link_removed",
+    RTM_NEWADDR: "address",
+    RTM_DELADDR: "address_removed",
+    RTM_NEWROUTE: "route",
+    RTM_DELROUTE: "route_removed",
+}
+
+
+@dataclass
+class NetlinkEvent:
+    """Decoded rtnetlink notification."""
+
+    kind: str
+    index: int
+    timestamp: float
+    address: Optional[str] = None
+    prefixlen: Optional[int] = None
+    link_up: Optional[bool] = None
+    gateway: Optional[str] = None
+    default_route: bool = False
+
+
+@dataclass
+class RenewResult:
+    """Outcome of :func:`renew_dhcp_lease`."""
+
+    ip: Optional[str]
+    seconds: float
+    milestones: dict[str, float] = field(default_factory=dict)
+
+
+def _align(length: int) -> int:
+    return (length + 3) & ~3
+
+
+def _iter_rtattrs(data: bytes, offset: int) -> Iterator[tuple[int, bytes]]:
+    while offset + _RTATTR.size <= len(data):
+        length, kind = _RTATTR.unpack_from(data, offset)
+        if length < _RTATTR.size:
+            break
+        yield kind, data[offset + _RTATTR.size:offset + length]
+        offset += _align(length)
+
+
+def _ipv4(raw: bytes) -> Optional[str]:
+    return socket.inet_ntoa(raw) if len(raw) == 4 else None
+
+
+def parse_messages(data: bytes, timestamp: Optional[float] = None) -> list[NetlinkEvent]:
+    """Decode every rtnetlink notification contained in ``data``."""
+
+    now = time.time() if timestamp is None else timestamp
+    events: list[NetlinkEvent] = []
+    offset = 0
+    while offset + _NLMSGHDR.size <= len(data):
+        length, msg_type, _, _, _ = _NLMSGHDR.unpack_from(data, offset)
+        if length < _NLMSGHDR.size:
+            break
+        body = data[offset + _NLMSGHDR.size:offset + length]
+        offset += _align(length)
+        kind = _EVENT_NAMES.get(msg_type)
+        if kind is None:
+            continue
+        if msg_type in (RTM_NEWLINK, RTM_DELLINK) and len(body) >= _IFINFOMSG.size:
+            _, _, index, flags, _ = _IFINFOMSG.unpack_from(body)
+            up = bool(flags & IFF_UP) and bool(flags & IFF_LOWER_UP)
+            events.append(NetlinkEvent(kind, index, now, link_up=up))
+        elif msg_type in (RTM_NEWADDR, RTM_DELADDR) and len(body) >= _IFADDRMSG.size:
+            family, prefixlen, _, _, index = _IFADDRMSG.unpack_from(body)
+            if family != socket.AF_INET:
+                continue
+            attrs = dict(_iter_rtattrs(body, _IFADDRMSG.size))
+            address = _ipv4(attrs.get(IFA_LOCAL) or attrs.get(IFA_ADDRESS) or b"")
+            events.append(NetlinkEvent(kind, index, now, address=address, prefixlen=prefixlen))
+        elif msg_type in (RTM_NEWROUTE, RTM_DELROUTE) and len(body) >= _RTMSG.size:
+            family, dst_len = _RTMSG.unpack_from(body)[:2]
+            if family != socket.AF_INET:
+                continue
+            attrs = dict(_iter_rtattrs(body, _RTMSG.size))
+            oif = attrs.get(RTA_OIF)
+            index = struct.unpack("=i", oif)[0] if oif and len(oif) == 4 else 0
+            events.append(
+                NetlinkEvent(
+                    kind,
+                    index,
+                    now,
+                    gateway=_ipv4(attrs.get(RTA_GATEWAY) or b""),
+                    default_route=dst_len == 0,
+                )
+            )
+    return events
+
+
+class RouteMonitor:
+    """Context manager subscribed to link, IPv4 address and route notifications."""
+
+    GROUPS = RTMGRP_LINK | RTMGRP_IPV4_IFADDR | RTMGRP_IPV4_ROUTE
+
+    def __init__(self, groups: int = GROUPS) -> None:
+        self.groups = groups
+        self._sock: Optional[socket.socket] = None
+
+    def __enter__(self) -> "RouteMonitor":
+        sock = socket.socket(socket.AF_NETLINK, socket.SOCK_RAW, socket.NETLINK_ROUTE)
+        # Port id 0 lets the kernel pick a unique one, so monitors can coexist.
+        sock.bind((0, self.groups))
+        self._sock = sock
+        return self
+
+    def __exit__(self, *exc) -> None:
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
+    def events(self, deadline: float) -> Iterator[NetlinkEvent]:
+        """Yield notifications until ``deadline`` (a ``time.monotonic()`` value)."""
+
+        if self._sock is None:
+            raise RuntimeError("RouteMonitor is not open")
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            readable, _, _ = select.select([self._sock], [], [], remaining)
+            if not readable:
+                return
+            data = self._sock.recv(65535)
+            yield from parse_messages(data)
+
+
+def _dhcp_commands(ifname: str) -> tuple[list[str], list[str]]:
+    """Return (release, renew) commands for the DHCP client managing ``ifname``."""
+
+    if shutil.which("nmcli"):
+        return [f"nmcli device disconnect {ifname}"], [f"nmcli device connect {ifname}"]
+    if shutil.which("networkctl"):
+        return [], [f"networkctl renew {ifname}"]
+    if shutil.which("dhclient"):
+        return [f"dhclient -r {ifname}"], [f"dhclient -nw {ifname}"]
+    if shutil.which("dhcpcd"):
+        return [f"dhcpcd -k {ifname}"], [f"dhcpcd -n {ifname}"]
+    raise RuntimeError("No supported DHCP client (nmcli/networkctl/dhclient/dhcpcd) found")
+
+
+def _in_network(address: str, network: Optional[ipaddress.IPv4Network]) -> bool:
+    ip = ipaddress.IPv4Address(address)
+    if ip.is_link_local or ip.is_unspecified or ip.is_loopback:
+        return False
+    return network is None or ip in network
+
+
+def renew_dhcp_lease(
+    ifname: str,
+    *,
+    expected_network: str | ipaddress.IPv4Network | None = None,
+    exclude: tuple[str, ...] = (),
+    timeout: float = 60.0,
+) -> RenewResult:
+    """Release and renew the DHCP lease of ``ifname`` and wait for the new address.
+
+    Parameters:
+        ifname: Host interface name, e.g. ``eth1``.
+        expected_network: Optional subnet the new address must belong to.
+        exclude: Addresses that must not be accepted (e.g. the lease handed out
+            by the previous AP).
+        timeout: Maximum seconds to wait for the new lease.
+
+    Returns:
+        RenewResult: Bound address (``None`` on timeout), elapsed seconds and
+        the time offsets of link-up, address-removal, address-bound and
+        default-route events.
+    """
+
+    index = socket.if_nametoindex(ifname)
+    network = ipaddress.IPv4Network(expected_network, strict=False) if expected_network else None
+    release, renew = _dhcp_commands(ifname)
+    milestones: dict[str, float] = {}
+    bound: Optional[str] = None
+    start = time.monotonic()
+    renewing: list[tuple[str, subprocess.Popen]] = []
+    with RouteMonitor() as monitor:
+        for cmd in release:
+            try:
+                subprocess.run(cmd, shell=True, capture_output=True, timeout=15)
+            except subprocess.TimeoutExpired:
+                logging.warning("DHCP release timed out: %s", cmd)
+        for cmd in renew:
+            # Started in the background so the lease events are seen as they happen.
+            renewing.append(
+                (cmd, subprocess.Popen(cmd, shell=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL))
+            )
+        for event in monitor.events(start + timeout):
+            if event.index != index:
+                continue
+            offset = time.monotonic() - start
+            if event.kind == "link" and event.link_up:
+                milestones.setdefault("link_up", offset)
+            elif event.kind == "address_removed":
+                milestones.setdefault("released", offset)
+            elif event.kind == "route" and event.default_route:
+                milestones.setdefault("default_route", offset)
+            elif event.kind == "address" and event.address:
+                if event.address in exclude or not _in_network(event.address, network):
+                    logging.debug("Ignoring address %s on %s", event.address, ifname)
+                    continue
+                milestones["bound"] = offset
+                bound = event.address
+                break
+    for cmd, proc in renewing:
+        try:
+            code = proc.wait(timeout=max(5.0, start + timeout - time.monotonic()))
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            code = proc.wait()
+            logging.warning("DHCP renew did not finish and was killed: %s", cmd)
+            continue
+        if code != 0:
+            logging.warning("DHCP renew exited with %s: %s", code, cmd)
+    result = RenewResult(bound, time.monotonic() - start, milestones)
+    if bound:
+        logging.info("DHCP lease on %s bound %s in %.2fs %s", ifname, bound, result.seconds, milestones)
+    else:
+        logging.error("No DHCP lease on %s within %ss %s", ifname, timeout, milestones)
+    return result
@@ -0,0 +1,279 @@
+"""Active boot-readiness detection for power-cycled routers and DUTs.
+
+After a relay power cycle the test flows used to sleep for a fixed period.
+:class:`BootReadinessProber` instead polls cheap signals and returns as soon
+as the device is serviceable:
+
+* ARP / ICMP reachability of the device address (ARP only counts when the
+  stale entry from before the power cycle could be flushed first),
+* TCP service ports (HTTP admin page, SSH, telnet),
+* optionally, the SSID beacon seen by a host-side Wi-Fi scan,
+* optionally, caller supplied checks (e.g. ``sys.boot_completed`` over ADB).
+
+The prober enforces a timeout and records when each signal first appeared so
+boot durations can be reported alongside the test results.
+"""
+
+from __future__ import annotations
+
+import logging
+import platform
+import re
+import socket
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Iterable, Mapping, Optional, Sequence
+
+from src.tools.connect_tool import command_batch as subprocess
+from src.tools.network_tool.icmp import icmp_ping_many
+
+__all__ = [
+    "DEFAULT_SERVICE_PORTS",
+    "BootReadiness",
+    "BootReadinessProber",
+    "arp_resolved",
+    "flush_arp_entry",
+    "icmp_reachable",
+    "probe_tcp_port",
+    "scan_host_ssids",
+]
+
+DEFAULT_SERVICE_PORTS: tuple[int, ...] = (80, 22, 23)
+
+_IS_WINDOWS = platform.system() == "Windows"
+_ARP_TABLE = Path("/proc/net/arp")
+
+
+@dataclass
+class BootReadiness:
+    """Outcome of a readiness wait.
+
+    ``milestones`` maps signal names (``reachable``, ``tcp:80``, ``ssid:<name>``,
+    ``check:<name>``) to the seconds after ``since`` at which they were first
+    observed.
+    """
+
+    ready: bool
+    boot_seconds: Optional[float]
+    waited_seconds: float
+    milestones: dict[str, float] = field(default_factory=dict)
+
+    def describe(self) -> str:
+        if not self.ready:
+            return f"not ready after {self.waited_seconds:.1f}s"
+        parts = ", ".join(f"{name}@{offset:.1f}s" for name, offset in sorted(self.milestones.items(), key=lambda kv: kv[1]))
+        return f"ready in {self.boot_seconds:.1f}s ({parts})"
+
+
+def arp_resolved(host: str) -> bool:
+    """Return True when the host ARP cache holds a complete entry for ``host``."""
+
+    if _IS_WINDOWS:
+        result = subprocess.run(f"arp -a {host}", shell=True, capture_output=True, text=True)
+        pattern = rf"\b{re.escape(host)}\s+([0-9a-f]{{2}}[-:]){{5}}[0-9a-f]{{2}}"
+        return bool(re.search(pattern, result.stdout or "", re.IGNORECASE))
+    try:
+        lines = _ARP_TABLE.read_text(encoding="utf-8").splitlines()[1:]
+    except OSError:
+        return False
+    for line in lines:
+        fields = line.split()
+        # IP address, HW type, Flags, HW address, Mask, Device
+        if len(fields) >= 4 and fields[0] == host and int(fields[2], 16) & 0x2:
+            return fields[3] != "00:00:00:00:00:00"
+    return False
+
+
+def flush_arp_entry(host: str) -> bool:
+    """Drop ``host`` from the ARP cache; return True when no complete entry is left.
+
+    Needs root (``ip neigh``) or an elevated shell (``arp -d``); callers must not
+    trust :func:`arp_resolved` for a fresh boot when this returns False.
+    """
+
+    cmd = f"arp -d {host}" if _IS_WINDOWS else f"ip neigh flush to {host}"
+    try:
+        subprocess.run(cmd, shell=True, capture_output=True, text=True, timeout=5)
+    except Exception as exc:  # pragma: no cover - platform dependent
+        logging.debug("[READY] cannot flush ARP entry of %s: %s", host, exc)
+    return not arp_resolved(host)
+
+
+def icmp_reachable(host: str, timeout: float = 1.0) -> bool:
+    """Send a single echo request to ``host``.
+
+    An in-process ICMP socket is used where permitted; otherwise the system
+    ``ping`` command is spawned.
+    """
+
+    sampled = icmp_ping_many([host], count=1, timeout=timeout)
+    if sampled is not None:
+        return sampled[host].ok
+    wait_ms = max(int(timeout * 1000), 200)
+    if _IS_WINDOWS:
+        cmd = f"ping -n 1 -w {wait_ms} {host}"
+    else:
+        cmd = f"ping -c 1 -W {max(int(round(timeout)), 1)} {host}"
+    result = subprocess.run(cmd, shell=True, capture_output=True, text=True, timeout=timeout + 2)
+    if result.returncode != 0:
+        return False
+    # Windows returns 0 for "Destination host unreachable" replies from the gateway.
+    return "TTL=" in (result.stdout or "").upper() if _IS_WINDOWS else True
+
+
+def probe_tcp_port(host: str, port: int, timeout: float = 1.0) -> Optional[bool]:
+    """Return True if ``port`` accepts connections, False if refused, None on silence.
+
+    A refused connection still proves the IP stack is up, which callers use as
+    a reachability signal.
+    """
+
+    try:
+        with socket.create_connection((host, int(port)), timeout=timeout):
+            return True
+    except ConnectionRefusedError:
+        return False
+    except OSError:
+        return None
+
+
+def scan_host_ssids() -> set[str]:
+    """Return SSIDs currently visible to the host Wi-Fi adapter."""
+
+    if _IS_WINDOWS:
+        result = subprocess.run("netsh wlan show networks", shell=True, capture_output=True, text=True)
+        pattern = r"^\s*SSID\s+\d+\s*:\s*(.*)$"
+    else:
+        result = subprocess.run(
+            "nmcli -t -f SSID dev wifi list --rescan yes", shell=True, capture_output=True, text=True
+        )
+        pattern = r"^(.+)$"
+    if result.returncode != 0:
+        return set()
+    return {
+        match.group(1).strip()
+        for match in re.finditer(pattern, result.stdout or "", re.MULTILINE)
+        if match.group(1).strip()
+    }
+
+
+class BootReadinessProber:
+    """Poll readiness signals of a freshly powered device.
+
+    Parameters:
+        host: Management IP of the device, or ``None`` when unknown.
+        ports: TCP ports of which at least one must accept connections.
+            Pass an empty tuple to only require reachability.
+        ssids: SSIDs that must be visible in a host scan before the device
+            counts as ready.
+        checks: Extra named callables returning True once satisfied.
+        interval: Seconds between probe rounds.
+        probe_timeout: Per-probe socket / ping timeout.
+    """
+
+    def __init__(
+        self,
+        host: Optional[str] = None,
+        *,
+        ports: Sequence[int] = DEFAULT_SERVICE_PORTS,
+        ssids: Iterable[str] = (),
+        checks: Mapping[str, Callable[[], bool]] | None = None,
+        interval: float = 1.0,
+        probe_timeout: float = 1.0,
+        scanner: Callable[[], set[str]] = scan_host_ssids,
+    ) -> None:
+        self.host = (host or "").strip() or None
+        self.ports = tuple(int(p) for p in ports)
+        self.ssids = tuple(s for s in ssids if s)
+        self.checks = dict(checks or {})
+        self.interval = max(0.1, float(interval))
+        self.probe_timeout = max(0.1, float(probe_timeout))
+        self._scanner = scanner
+        self._trust_arp = False
+
+    @property
+    def has_signals(self) -> bool:
+        """Return True when at least one readiness signal is configured."""
+
+        return bool(self.host or self.ssids or self.checks)
+
+    def wait(self, timeout: float, *, since: Optional[float] = None) -> BootReadiness:
+        """Block until the device is ready or ``timeout`` seconds elapsed.
+
+        Parameters:
+            timeout: Maximum seconds to wait from now.
+            since: ``time.time()`` of the power-on event; boot time is measured
+                from it.  Defaults to the call time.
+        """
+
+        start = time.time()
+        origin = since if since is not None else start
+        # An entry cached before the power cycle says nothing about this boot.
+        self._trust_arp = bool(self.host) and flush_arp_entry(self.host)
+        if self.host and not self._trust_arp:
+            logging.debug("[READY] ARP entry of %s not flushable; using ICMP/TCP only", self.host)
+        deadline = time.monotonic() + max(0.0, float(timeout))
+        milestones: dict[str, float] = {}
+
+        def _mark(name: str) -> None:
+            milestones.setdefault(name, time.time() - origin)
+
+        while True:
+            if self._probe_round(_mark, milestones):
+                boot = max(milestones.values()) if milestones else time.time() - origin
+                result = BootReadiness(True, boot, time.time() - start, milestones)
+                logging.info("[READY] %s %s", self._label(), result.describe())
+                return result
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(min(self.interval, remaining))
+
+        result = BootReadiness(False, None, time.time() - start, milestones)
+        logging.warning("[READY] %s %s (seen: %s)", self._label(), result.describe(), sorted(milestones))
+        return result
+
+    def _probe_round(self, mark: Callable[[str], None], milestones: Mapping[str, float]) -> bool:
+        ready = True
+        if self.host:
+            if "reachable" not in milestones:
+                if (self._trust_arp and arp_resolved(self.host)) or icmp_reachable(self.host, self.probe_timeout):
+                    mark("reachable")
+            service_up = not self.ports
+            for port in self.ports:
+                key = f"tcp:{port}"
+                if key in milestones:
+                    service_up = True
+                    continue
+                state = probe_tcp_port(self.host, port, self.probe_timeout)
+                if state is not None:
+                    mark("reachable")
+                if state:
+                    mark(key)
+                    service_up = True
+                    break
+            ready = "reachable" in milestones and service_up
+        if self.ssids and any(f"ssid:{ssid}" not in milestones for ssid in self.ssids):
+            visible = self._scanner()
+            for ssid in self.ssids:
+                if ssid in visible:
+                    mark(f"ssid:{ssid}")
+            ready = ready and all(f"ssid:{ssid}" in milestones for ssid in self.ssids)
+        for name, check in self.checks.items():
+            key = f"check:{name}"
+            if key in milestones:
+                continue
+            try:
+                passed = bool(check())
+            except Exception as exc:  # pragma: no cover - device dependent
+                logging.debug("[READY] check %s raised: %s", name, exc)
+                passed = False
+            if passed:
+                mark(key)
+            else:
+                ready = False
+        return ready
+
+    def _label(self) -> str:
+        return self.host or ",".join(self.ssids) or ",".join(self.checks) or "device"
@@ -1,8 +1,18 @@
-"""Performance tooling helpers."""
+"""Performance tooling helpers.
 
-from .rvr_chart_generator import PerformanceRvrChartGenerator, generate_rvr_charts
+The chart generator pulls in pandas and matplotlib, so it is imported when
+one of its names is first accessed rather than with the package.
+"""
+
+from importlib import import_module
 
 __all__ = [
     "PerformanceRvrChartGenerator",
     "generate_rvr_charts",
 ]
+
+
+def __getattr__(name):
+    if name in __all__:
+        return getattr(import_module(".rvr_chart_generator", __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,15 +5,26 @@ import math
 from pathlib import Path
 from typing import List, Optional
 
-import matplotlib
-
-matplotlib.use("Agg", force=True)
-import matplotlib.pyplot as plt
 import pandas as pd
-from matplotlib.lines import Line2D
 
 from src.util.constants import CHART_DPI
-from src.util.report.rvr_chart_facade import RvrChartLogic
+from src.util.report.rvr_chart_facade import RvrChartLogic
+
+_PYPLOT = None
+
+
+def _pyplot():
+    """Return ``matplotlib.pyplot`` on the Agg backend, importing it on first use."""
+    global _PYPLOT
+    if _PYPLOT is None:
+        import matplotlib
+
+        matplotlib.use("Agg", force=True)
+        import matplotlib.pyplot as pyplot
+
+        pyplot.rcParams["font.family"] = ["SimHei"]
+        _PYPLOT = pyplot
+    return _PYPLOT
 
 
 class PerformanceRvrChartGenerator(RvrChartLogic):
@@ -47,7 +58,7 @@ class PerformanceRvrChartGenerator(RvrChartLogic):
         super().__init__()
         self._charts_subdir = charts_subdir or "rvr_charts"
 
-    def generate(self, path: Path) -> List[Path]:
+    def generate(self, path: Path, raw: Optional[pd.DataFrame] = None) -> List[Path]:
         """
         Generate
 
@@ -58,6 +69,9 @@ class PerformanceRvrChartGenerator(RvrChartLogic):
         ----------
         path : object
             File system path pointing to a CSV report or result directory.
+        raw : pandas.DataFrame, optional
+            Rows already held in memory (``PerformanceResult.dataframe()``);
+            when given, ``path`` only names the output and is not read.
 
         Returns
         -------
@@ -65,10 +79,10 @@ class PerformanceRvrChartGenerator(RvrChartLogic):
             Description of the returned value.
         """
         path = path.resolve()
-        if not path.exists():
+        if raw is None and not path.exists():
             logging.warning("RVR result file not found: %s", path)
             return []
-        df = self._load_rvr_dataframe(path)
+        df = self._load_rvr_dataframe(path, raw=raw)
         charts_dir = path.parent / self._charts_subdir
         charts_dir.mkdir(exist_ok=True)
         if df.empty:
@@ -173,6 +187,8 @@ class PerformanceRvrChartGenerator(RvrChartLogic):
             if handles:
                 annotations = self._collect_user_annotations(group)
                 if annotations:
+                    from matplotlib.lines import Line2D
+
                     dummy_handles = [Line2D([], [], linestyle="None", marker="", linewidth=0) for _ in annotations]
                     handles.extend(dummy_handles)
                     labels.extend(annotations)
@@ -195,7 +211,7 @@ class PerformanceRvrChartGenerator(RvrChartLogic):
             logging.exception("Failed to save RVR line chart: %s", title)
             return None
         finally:
-            plt.close(fig)
+            _pyplot().close(fig)
 
     def _save_rvo_chart(self, group: pd.DataFrame, title: str, charts_dir: Path) -> Optional[Path]:
         """
@@ -273,7 +289,7 @@ class PerformanceRvrChartGenerator(RvrChartLogic):
             logging.exception("Failed to save RVO chart: %s", title)
             return None
         finally:
-            plt.close(fig)
+            _pyplot().close(fig)
 
     def _create_empty_chart(
         self, charts_dir: Path, title: str, steps: List[str], chart_type: str = "line"
@@ -302,7 +318,7 @@ class PerformanceRvrChartGenerator(RvrChartLogic):
         """
         chart_type = (chart_type or "line").lower()
         if chart_type == "polar":
-            fig = plt.figure(figsize=(8.0, 6.2), dpi=CHART_DPI)
+            fig = _pyplot().figure(figsize=(8.0, 6.2), dpi=CHART_DPI)
             try:
                 ax = fig.add_subplot(111, projection="polar")
                 ax.set_theta_zero_location("N")
@@ -321,9 +337,9 @@ class PerformanceRvrChartGenerator(RvrChartLogic):
                 logging.exception("Failed to save polar placeholder chart: %s", title)
                 return None
             finally:
-                plt.close(fig)
+                _pyplot().close(fig)
 
-        fig, ax = plt.subplots(figsize=(7.5, 4.2), dpi=CHART_DPI)
+        fig, ax = _pyplot().subplots(figsize=(7.5, 4.2), dpi=CHART_DPI)
         try:
             if steps:
                 self._configure_step_axis(ax, steps)
@@ -344,20 +360,20 @@ class PerformanceRvrChartGenerator(RvrChartLogic):
             logging.exception("Failed to save placeholder chart: %s", title)
             return None
         finally:
-            plt.close(fig)
+            _pyplot().close(fig)
 
     def _build_chart_layout(self, *, chart_type: str, title: str):
         """Return a Matplotlib figure/axes pair configured for the chart type."""
         chart_key = (chart_type or "line").lower()
         if chart_key == "polar":
-            fig, ax = plt.subplots(figsize=(8.0, 6.2), dpi=CHART_DPI, subplot_kw={"projection": "polar"})
+            fig, ax = _pyplot().subplots(figsize=(8.0, 6.2), dpi=CHART_DPI, subplot_kw={"projection": "polar"})
             ax.set_theta_zero_location("N")
             ax.set_theta_direction(-1)
             ax.set_rlabel_position(135)
             ax.grid(alpha=0.3, linestyle="--")
             ax.set_title(title, pad=8)
             return fig, ax
-        fig, ax = plt.subplots(figsize=(7.8, 4.4), dpi=CHART_DPI)
+        fig, ax = _pyplot().subplots(figsize=(7.8, 4.4), dpi=CHART_DPI)
         ax.set_title(title, loc="left", pad=4)
         ax.grid(alpha=0.3, linestyle="--")
         return fig, ax
@@ -429,7 +445,12 @@ class PerformanceRvrChartGenerator(RvrChartLogic):
         return save_path
 
 
-def generate_rvr_charts(result_file: Path | str, *, charts_subdir: str | None = None) -> List[Path]:
+def generate_rvr_charts(
+    result_file: Path | str,
+    *,
+    charts_subdir: str | None = None,
+    raw: Optional[pd.DataFrame] = None,
+) -> List[Path]:
     """
     Generate RVR charts
 
@@ -439,6 +460,8 @@ def generate_rvr_charts(result_file: Path | str, *, charts_subdir: str | None =
         Description of parameter 'result_file'.
     charts_subdir : object
         Description of parameter 'charts_subdir'.
+    raw : pandas.DataFrame, optional
+        In-memory rows to chart instead of reading ``result_file``.
 
     Returns
     -------
@@ -446,4 +469,4 @@ def generate_rvr_charts(result_file: Path | str, *, charts_subdir: str | None =
         Description of the returned value.
     """
     generator = PerformanceRvrChartGenerator(charts_subdir=charts_subdir)
-    return generator.generate(Path(result_file))
+    return generator.generate(Path(result_file), raw=raw)
@@ -7,20 +7,32 @@ appropriate CSV headers based on the number of repeat runs, writes
 results to disk, and provides helpers for normalizing profile and
 scenario metadata. All public methods and parameters are documented
 using a ``Parameters`` section.
+
+Rows go through a :class:`~src.tools.result_writer.ResultRowWriter`: the CSV
+stays open with buffered writes, each row is journaled before
+:meth:`PerformanceResult.save_result` returns, and the file is flushed at
+step boundaries (:meth:`PerformanceResult.flush`) and fsynced at scenario
+end (:meth:`PerformanceResult.sync`).  The same rows are mirrored into a
+columnar :class:`~src.tools.result_store.ResultStore` beside the CSV, committed
+at the same points, so readers can load columns without parsing the CSV.
+
+This module only records results and imports no analysis libraries;
+pandas is loaded by :meth:`PerformanceResult.dataframe` on first use and
+charts live in :mod:`src.tools.performance`.
 """
 
+import io
 import logging
 import os
 import time
 from pathlib import Path
-from typing import Any, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Tuple
 
-import matplotlib.pyplot as plt
-import numpy as np
-import pandas as pd
-from matplotlib.backends.backend_pdf import PdfPages
+from src.tools.result_store import RESULT_BASE_HEADERS, ResultStore
+from src.tools.result_writer import ResultRowWriter
 
-plt.rcParams["font.family"] = ["SimHei"]
+if TYPE_CHECKING:  # pragma: no cover
+    import pandas as pd
 
 
 class PerformanceResult:
@@ -41,32 +53,7 @@ class PerformanceResult:
             Defaults to ``0``.
     """
 
-    _BASE_HEADERS: Tuple[str, ...] = (
-        "SerianNumber",
-        "Test_Category",
-        "Standard",
-        "Freq_Band",
-        "BW",
-        "Data_Rate",
-        "Channel",
-        "Angel",
-        "Protocol",
-        "Direction",
-        "Total_Path_Loss",
-        "DB",
-        "RSSI",
-        "MCS_Rate",
-        "Throughput",
-        "Expect_Rate",
-        "Beacon_RSSI",
-        "WF0_RSSI",
-        "WF1_RSSI",
-        "Latency",
-        "Packet_Loss",
-        "Profile_Mode",
-        "Profile_Value",
-        "Scenario_Group_Key",
-    )
+    _BASE_HEADERS: Tuple[str, ...] = RESULT_BASE_HEADERS
 
     def __init__(self, logdir: str, step: List[Any], repeat_times: int = 0) -> None:
         """Initialize a new PerformanceResult instance and prepare result storage.
@@ -96,6 +83,9 @@ class PerformanceResult:
         self._repeat_times = max(0, repeat)
         self._throughput_header: List[str] = self._build_throughput_header()
         self._headers: List[str] = self._build_header_row()
+        self._rows: List[str] = []
+        self._writer: Optional[ResultRowWriter] = None
+        self._store: Optional[ResultStore] = None
         self.init_rvr_result()
 
     def ensure_log_file_prefix(self, test_type: str) -> None:
@@ -127,7 +117,10 @@ class PerformanceResult:
             new_name = f"{prefix}_{current_path.name}"
         new_path = current_path.with_name(new_name)
         try:
-            os.replace(current_path, new_path)
+            if self._writer is not None:
+                self._writer.rename(new_path)
+            else:
+                os.replace(current_path, new_path)
         except FileNotFoundError:
             return
         except OSError as exc:
@@ -139,6 +132,7 @@ class PerformanceResult:
             )
             return
         self.log_file = str(new_path)
+        self._update_store(lambda store: store.rename(new_path))
 
     def _build_throughput_header(self) -> List[str]:
         """Construct the list of throughput column headers.
@@ -189,9 +183,16 @@ class PerformanceResult:
                 + time.asctime().replace(" ", "_").replace(":", "_")
                 + ".csv",
             )
-            with open(self.log_file, "a", encoding="utf-8-sig") as f:
-                f.write(",".join(self._headers))
-                f.write("\n")
+            self._writer = ResultRowWriter(self.log_file, ",".join(self._headers))
+            self._store = self._open_store()
+
+    def _open_store(self) -> Optional[ResultStore]:
+        """Open the columnar store of :attr:`log_file`; the CSV works without it."""
+        try:
+            return ResultStore(self.log_file, self._headers)
+        except Exception as exc:
+            logging.warning("Result store disabled for %s: %s", self.log_file, exc)
+            return None
 
     def save_result(self, result: str) -> None:
         """Append a result line to the CSV log file.
@@ -208,11 +209,59 @@ class PerformanceResult:
         mode, value = self._get_active_profile_columns()
         scenario_key = self._get_scenario_group_key()
         line = f"{result},{mode},{value},{scenario_key}"
-        with open(self.log_file, "a", encoding="utf-8-sig") as f:
-            f.write(line)
-            f.write("\n")
+        if self._writer is None or self._writer.closed:
+            self._writer = ResultRowWriter(self.log_file)
+            self._store = self._open_store()
+        self._writer.append(line)
+        self._rows.append(line)
+        self._update_store(lambda store: store.append(line))
         logging.info("Write done")
 
+    def _update_store(self, action: Callable[[ResultStore], None]) -> None:
+        """Run ``action`` on the store; a store that fails once is dropped."""
+        if self._store is None:
+            return
+        try:
+            action(self._store)
+        except Exception as exc:
+            logging.warning("Result store disabled for %s: %s", self.log_file, exc)
+            self._store.discard()
+            self._store = None
+
+    def flush(self) -> None:
+        """Make written rows visible to readers of :attr:`log_file` (step boundary)."""
+        if self._writer is not None:
+            self._writer.flush()
+        self._update_store(ResultStore.commit)
+
+    def sync(self) -> None:
+        """Flush and fsync the result file (scenario end)."""
+        if self._writer is not None:
+            self._writer.sync()
+        self._update_store(ResultStore.commit)
+
+    def close(self) -> None:
+        """Sync and close the result file; a later ``save_result`` reopens it."""
+        if self._writer is not None:
+            self._writer.close()
+        self._update_store(ResultStore.close)
+
+    @property
+    def headers(self) -> List[str]:
+        """CSV header names of :attr:`log_file`."""
+        return list(self._headers)
+
+    def rows(self) -> List[str]:
+        """CSV lines saved by this instance, in order."""
+        return list(self._rows)
+
+    def dataframe(self) -> "pd.DataFrame":
+        """Saved rows as the DataFrame ``pd.read_csv(log_file)`` would return."""
+        import pandas as pd
+
+        text = "\n".join([",".join(self._headers), *self._rows])
+        return pd.read_csv(io.StringIO(text))
+
     # --- profile helpers -------------------------------------------------
 
     def set_active_profile(self, mode: Optional[str], value: Any) -> None:
@@ -1,25 +1,26 @@
 """High-level control interfaces for SNMP-based power distribution units.
 
-This module provides a simple wrapper around SNMP commands to control power
+This module provides a simple wrapper around SNMP requests to control power
 relays. It exposes a :class:`power_ctrl` class that reads configuration
-information, constructs SNMP command strings and executes them using
-``subprocess``. All function and method arguments are documented in a
-``Parameters`` section.
+information and talks to the PDU through the in-process
+:class:`~src.tools.relay_tool.snmp_client.SnmpClient`, so no ``snmpset``
+binary is spawned and multi-outlet operations are pipelined on one socket.
+All function and method arguments are documented in a ``Parameters`` section.
 """
 import logging
-from src.tools.connect_tool import command_batch as subprocess
-import time
-from typing import Any, Sequence
+from typing import Any, Iterable, Sequence
 
 from src.util.constants import load_config
 from src.tools.relay_tool import Relay
+from src.tools.relay_tool.snmp_client import PDU_GET, PDU_SET, SNMP_V1, SnmpClient, SnmpRequest
 
 
 class power_ctrl(Relay):
-    """Encapsulate control of power relays using SNMP via shell commands."""
+    """Encapsulate control of power relays using SNMP over UDP."""
 
-    SWITCH_CMD = 'snmpset -v1 -c private {} .1.3.6.1.4.1.23280.9.1.2.{} i {}'
-    SET_CMD = 'snmpset -v1 -c private {} 1.3.6.1.4.1.23273.4.4{}.0 i 255'
+    COMMUNITY = 'private'
+    SWITCH_OID = '1.3.6.1.4.1.23280.9.1.2.{}'
+    SET_OID = '1.3.6.1.4.1.23273.4.4{}.0'
     Relay_IP = ['192.168.200.3', '192.168.200.4', '192.168.200.5', '192.168.200.6', '192.168.200.7', '192.168.200.8']
 
     def __init__(self, default_port: tuple[str, int] | Sequence[Any] | None = None) -> None:
@@ -49,6 +50,7 @@ class power_ctrl(Relay):
         self.power_ctrl = power_relay
         self.ip_list = list(self.power_ctrl.keys())
         self.ctrl = self._handle_env_data()
+        self.snmp = SnmpClient(self.COMMUNITY, SNMP_V1, timeout=1.0, retries=3)
 
     @staticmethod
     def _coerce_default_port(value: tuple[str, int] | Sequence[Any] | None) -> tuple[str, int] | None:
@@ -89,23 +91,7 @@ class power_ctrl(Relay):
                     temp.append((k, i))
         return temp
 
-    @staticmethod
-    def check_output(cmd: str) -> bytes | None:
-        for attempt in range(1, 4):
-            result = subprocess.run(cmd, shell=True, capture_output=True)
-            logging.info("SNMP cmd[%s]: %s", attempt, cmd)
-            if result.stdout:
-                logging.info("SNMP stdout[%s]: %s", attempt, result.stdout)
-            if result.stderr:
-                logging.info("SNMP stderr[%s]: %s", attempt, result.stderr)
-            if result.returncode == 0:
-                return result.stdout
-            logging.error("SNMP exit code[%s]: %s", attempt, result.returncode)
-            time.sleep(1)
-        return None
-
-
-    def switch(self, ip: str, port: int, status: int) -> None:
+    def switch(self, ip: str, port: int, status: int) -> bool:
         """Toggle an individual relay on or off.
 
         Parameters:
@@ -115,27 +101,79 @@ class power_ctrl(Relay):
                 it off depending on the underlying SNMP semantics.
 
         Returns:
-            None
+            bool: ``True`` when the PDU acknowledged the SET request.
         """
         logging.info(
             f'Setting power relay: {ip} port {port} {"on" if status == 1 else "off"}'
         )
-        cmd = self.SWITCH_CMD.format(ip, port, status)
-        self.check_output(cmd)
+        return self.snmp.set(ip, [(self.SWITCH_OID.format(port), int(status))])
+
+    def switch_many(self, targets: Iterable[tuple[str, int]], status: int) -> dict[tuple[str, int], bool]:
+        """Toggle several relays concurrently.
+
+        Parameters:
+            targets (Iterable[tuple[str, int]]): ``(ip, port)`` pairs to switch.
+            status (int): Same semantics as :meth:`switch`.
+
+        Returns:
+            dict[tuple[str, int], bool]: Acknowledgement per target.
+        """
+        targets = [(str(ip), int(port)) for ip, port in targets]
+        logging.info(
+            f'Setting {len(targets)} power relay(s) {"on" if status == 1 else "off"}: {targets}'
+        )
+        requests = [
+            SnmpRequest(ip, [(self.SWITCH_OID.format(port), int(status))], PDU_SET)
+            for ip, port in targets
+        ]
+        responses = self.snmp.request_many(requests)
+        return {
+            target: response is not None and response.ok
+            for target, response in zip(targets, responses)
+        }
+
+    def read_states(self, targets: Iterable[tuple[str, int]] | None = None) -> dict[tuple[str, int], int | None]:
+        """Read back relay states, issuing one GET per PDU concurrently.
+
+        Parameters:
+            targets (Iterable[tuple[str, int]] | None): ``(ip, port)`` pairs to
+                query; defaults to every configured relay port.
+
+        Returns:
+            dict[tuple[str, int], int | None]: Raw outlet state per target or
+            ``None`` when the PDU did not answer.
+        """
+        by_ip: dict[str, list[int]] = {}
+        for ip, port in (self.ctrl if targets is None else targets):
+            by_ip.setdefault(str(ip), []).append(int(port))
+        hosts = list(by_ip)
+        requests = [
+            SnmpRequest(ip, [(self.SWITCH_OID.format(port), None) for port in by_ip[ip]], PDU_GET)
+            for ip in hosts
+        ]
+        states: dict[tuple[str, int], int | None] = {}
+        for ip, response in zip(hosts, self.snmp.request_many(requests)):
+            values = response.values() if response is not None and response.ok else {}
+            for port in by_ip[ip]:
+                value = values.get(self.SWITCH_OID.format(port))
+                states[(ip, port)] = value if isinstance(value, int) else None
+        return states
 
     def set_all(self, status: bool) -> None:
         """Set all configured relays to the given state.
 
         Parameters:
             status (bool): ``True`` to power on all relays or ``False`` to shut
-                them down.  The SNMP command is constructed accordingly.
+                them down.  The SNMP request is constructed accordingly.
 
         Returns:
             None
         """
-        for k in self.Relay_IP:
-            cmd = self.SET_CMD.format(k, 0 if status else 1)
-            self.check_output(cmd)
+        oid = self.SET_OID.format(0 if status else 1)
+        requests = [SnmpRequest(ip, [(oid, 255)], PDU_SET) for ip in self.Relay_IP]
+        for ip, response in zip(self.Relay_IP, self.snmp.request_many(requests)):
+            if response is None or not response.ok:
+                logging.error("Failed to %s relays on %s", "enable" if status else "disable", ip)
 
     def shutdown(self) -> None:
         """Shut down all relays via SNMP.
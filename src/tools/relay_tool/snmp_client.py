@@ -0,0 +1,376 @@
+"""Minimal in-process SNMP v1/v2c client over UDP.
+
+Only the subset needed to drive PDU outlets is implemented: ``GetRequest``
+and ``SetRequest`` PDUs carrying INTEGER / OCTET STRING / NULL values, BER
+encoding of the message envelope and decoding of ``GetResponse`` PDUs.
+
+Requests are pipelined: :meth:`SnmpClient.request_many` sends every request
+on a single socket, then collects responses by request id and retransmits
+only the outstanding ones.  Switching N outlets therefore costs roughly one
+round trip instead of N process spawns.  A response is only accepted from the
+address its request was sent to.
+
+``tools/check_snmp_client.py`` exercises the client against a local UDP
+responder.
+"""
+
+from __future__ import annotations
+
+import itertools
+import logging
+import random
+import select
+import socket
+import time
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Sequence
+
+__all__ = [
+    "SNMP_V1",
+    "SNMP_V2C",
+    "SnmpError",
+    "SnmpRequest",
+    "SnmpResponse",
+    "SnmpClient",
+    "encode_message",
+    "decode_message",
+]
+
+SNMP_V1 = 0
+SNMP_V2C = 1
+
+# ASN.1 / SNMP tags
+_INTEGER = 0x02
+_OCTET_STRING = 0x04
+_NULL = 0x05
+_OID = 0x06
+_SEQUENCE = 0x30
+_IP_ADDRESS = 0x40
+_COUNTER32 = 0x41
+_GAUGE32 = 0x42
+_TIMETICKS = 0x43
+_COUNTER64 = 0x46
+_NO_SUCH_OBJECT = 0x80
+_NO_SUCH_INSTANCE = 0x81
+_END_OF_MIB_VIEW = 0x82
+
+PDU_GET = 0xA0
+PDU_RESPONSE = 0xA2
+PDU_SET = 0xA3
+
+_UNSIGNED_TAGS = {_COUNTER32, _GAUGE32, _TIMETICKS, _COUNTER64}
+_EXCEPTION_TAGS = {
+    _NO_SUCH_OBJECT: "noSuchObject",
+    _NO_SUCH_INSTANCE: "noSuchInstance",
+    _END_OF_MIB_VIEW: "endOfMibView",
+}
+
+
+class SnmpError(RuntimeError):
+    """Raised for malformed SNMP packets."""
+
+
+@dataclass
+class SnmpRequest:
+    """One outstanding SNMP request.
+
+    Parameters:
+        host: Agent IP address.
+        varbinds: Sequence of ``(oid, value)``; use ``None`` values for GET.
+        pdu_type: :data:`PDU_GET` or :data:`PDU_SET`.
+    """
+
+    host: str
+    varbinds: Sequence[tuple[str, Any]]
+    pdu_type: int = PDU_GET
+    request_id: int = 0
+
+
+@dataclass
+class SnmpResponse:
+    """Decoded ``GetResponse`` PDU."""
+
+    request_id: int
+    error_status: int
+    error_index: int
+    varbinds: list[tuple[str, Any]] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return self.error_status == 0
+
+    def values(self) -> dict[str, Any]:
+        return dict(self.varbinds)
+
+
+# ----------------------------------------------------------------------
+# BER encoding
+# ----------------------------------------------------------------------
+def _encode_length(length: int) -> bytes:
+    if length < 0x80:
+        return bytes([length])
+    body = length.to_bytes((length.bit_length() + 7) // 8, "big")
+    return bytes([0x80 | len(body)]) + body
+
+
+def _tlv(tag: int, payload: bytes) -> bytes:
+    return bytes([tag]) + _encode_length(len(payload)) + payload
+
+
+def _encode_integer(value: int, tag: int = _INTEGER) -> bytes:
+    size = max(1, (value + (value < 0)).bit_length() // 8 + 1)
+    return _tlv(tag, int(value).to_bytes(size, "big", signed=True))
+
+
+def _encode_oid(oid: str) -> bytes:
+    parts = [int(p) for p in oid.strip().strip(".").split(".") if p != ""]
+    if len(parts) < 2:
+        raise SnmpError(f"OID too short: {oid!r}")
+    body = bytearray([parts[0] * 40 + parts[1]])
+    for part in parts[2:]:
+        chunk = [part & 0x7F]
+        part >>= 7
+        while part:
+            chunk.append(0x80 | (part & 0x7F))
+            part >>= 7
+        body.extend(reversed(chunk))
+    return _tlv(_OID, bytes(body))
+
+
+def _encode_value(value: Any) -> bytes:
+    if value is None:
+        return _tlv(_NULL, b"")
+    if isinstance(value, bool):
+        return _encode_integer(int(value))
+    if isinstance(value, int):
+        return _encode_integer(value)
+    if isinstance(value, bytes):
+        return _tlv(_OCTET_STRING, value)
+    if isinstance(value, str):
+        return _tlv(_OCTET_STRING, value.encode("utf-8"))
+    raise SnmpError(f"Unsupported SNMP value type: {type(value).__name__}")
+
+
+def encode_message(
+    request: SnmpRequest,
+    *,
+    community: str = "private",
+    version: int = SNMP_V1,
+) -> bytes:
+    """Return the BER encoded SNMP message for ``request``."""
+
+    varbinds = b"".join(
+        _tlv(_SEQUENCE, _encode_oid(oid) + _encode_value(value))
+        for oid, value in request.varbinds
+    )
+    pdu = _tlv(
+        request.pdu_type,
+        _encode_integer(request.request_id)
+        + _encode_integer(0)
+        + _encode_integer(0)
+        + _tlv(_SEQUENCE, varbinds),
+    )
+    return _tlv(
+        _SEQUENCE,
+        _encode_integer(version) + _tlv(_OCTET_STRING, community.encode("utf-8")) + pdu,
+    )
+
+
+# ----------------------------------------------------------------------
+# BER decoding
+# ----------------------------------------------------------------------
+def _read_tlv(data: bytes, offset: int) -> tuple[int, bytes, int]:
+    if offset + 2 > len(data):
+        raise SnmpError("Truncated SNMP packet")
+    tag = data[offset]
+    length = data[offset + 1]
+    offset += 2
+    if length & 0x80:
+        count = length & 0x7F
+        if not count or offset + count > len(data):
+            raise SnmpError("Invalid BER length")
+        length = int.from_bytes(data[offset:offset + count], "big")
+        offset += count
+    end = offset + length
+    if end > len(data):
+        raise SnmpError("Truncated SNMP packet")
+    return tag, data[offset:end], end
+
+
+def _decode_oid(payload: bytes) -> str:
+    if not payload:
+        raise SnmpError("Empty OID")
+    first = payload[0]
+    parts = [min(first // 40, 2), first - 40 * min(first // 40, 2)]
+    value = 0
+    for byte in payload[1:]:
+        value = (value << 7) | (byte & 0x7F)
+        if not byte & 0x80:
+            parts.append(value)
+            value = 0
+    return ".".join(str(p) for p in parts)
+
+
+def _decode_value(tag: int, payload: bytes) -> Any:
+    if tag == _INTEGER:
+        return int.from_bytes(payload, "big", signed=True) if payload else 0
+    if tag in _UNSIGNED_TAGS:
+        return int.from_bytes(payload, "big", signed=False) if payload else 0
+    if tag == _OCTET_STRING:
+        return payload
+    if tag == _NULL:
+        return None
+    if tag == _OID:
+        return _decode_oid(payload)
+    if tag == _IP_ADDRESS:
+        return ".".join(str(b) for b in payload)
+    if tag in _EXCEPTION_TAGS:
+        return _EXCEPTION_TAGS[tag]
+    return payload
+
+
+def decode_message(data: bytes) -> tuple[int, str, int, SnmpResponse]:
+    """Decode an SNMP message and return ``(version, community, pdu_type, pdu)``."""
+
+    tag, message, _ = _read_tlv(data, 0)
+    if tag != _SEQUENCE:
+        raise SnmpError("SNMP message is not a SEQUENCE")
+    tag, version_raw, offset = _read_tlv(message, 0)
+    tag, community, offset = _read_tlv(message, offset)
+    pdu_type, pdu, _ = _read_tlv(message, offset)
+
+    _, request_id, pos = _read_tlv(pdu, 0)
+    _, error_status, pos = _read_tlv(pdu, pos)
+    _, error_index, pos = _read_tlv(pdu, pos)
+    _, varbind_seq, _ = _read_tlv(pdu, pos)
+
+    varbinds: list[tuple[str, Any]] = []
+    pos = 0
+    while pos < len(varbind_seq):
+        _, varbind, pos = _read_tlv(varbind_seq, pos)
+        _, oid_raw, inner = _read_tlv(varbind, 0)
+        value_tag, value_raw, _ = _read_tlv(varbind, inner)
+        varbinds.append((_decode_oid(oid_raw), _decode_value(value_tag, value_raw)))
+
+    response = SnmpResponse(
+        request_id=_decode_value(_INTEGER, request_id),
+        error_status=_decode_value(_INTEGER, error_status),
+        error_index=_decode_value(_INTEGER, error_index),
+        varbinds=varbinds,
+    )
+    return (
+        _decode_value(_INTEGER, version_raw),
+        community.decode("utf-8", errors="replace"),
+        pdu_type,
+        response,
+    )
+
+
+# ----------------------------------------------------------------------
+# client
+# ----------------------------------------------------------------------
+class SnmpClient:
+    """Pipelined SNMP v1/v2c client.
+
+    Parameters:
+        community: Community string used for every request.
+        version: :data:`SNMP_V1` or :data:`SNMP_V2C`.
+        timeout: Seconds to wait for responses per attempt.
+        retries: Number of attempts for requests that receive no answer.
+        port: Agent UDP port.
+    """
+
+    def __init__(
+        self,
+        community: str = "private",
+        version: int = SNMP_V1,
+        *,
+        timeout: float = 1.0,
+        retries: int = 3,
+        port: int = 161,
+    ) -> None:
+        self.community = community
+        self.version = version
+        self.timeout = timeout
+        self.retries = max(1, int(retries))
+        self.port = port
+        self._ids = itertools.count(random.randint(1, 0x3FFFFFFF))
+
+    def get(self, host: str, oids: Iterable[str]) -> dict[str, Any] | None:
+        """Read ``oids`` from ``host`` in one exchange."""
+
+        response = self.request_many([SnmpRequest(host, [(oid, None) for oid in oids], PDU_GET)])[0]
+        return response.values() if response is not None and response.ok else None
+
+    def set(self, host: str, varbinds: Sequence[tuple[str, Any]]) -> bool:
+        """Write ``varbinds`` to ``host`` and return True on success."""
+
+        response = self.request_many([SnmpRequest(host, list(varbinds), PDU_SET)])[0]
+        return response is not None and response.ok
+
+    def request_many(self, requests: Sequence[SnmpRequest]) -> list[SnmpResponse | None]:
+        """Send all ``requests`` concurrently and return their responses in order.
+
+        Entries are ``None`` when the agent never answered within
+        ``retries * timeout`` seconds.
+        """
+
+        results: list[SnmpResponse | None] = [None] * len(requests)
+        if not requests:
+            return results
+        pending: dict[int, tuple[int, bytes, tuple[str, int]]] = {}
+        for index, request in enumerate(requests):
+            try:
+                address = (socket.gethostbyname(request.host), self.port)
+            except OSError as exc:
+                logging.error("SNMP cannot resolve %s: %s", request.host, exc)
+                continue
+            request.request_id = next(self._ids) & 0x7FFFFFFF
+            packet = encode_message(request, community=self.community, version=self.version)
+            pending[request.request_id] = (index, packet, address)
+
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            for attempt in range(1, self.retries + 1):
+                for _, packet, address in pending.values():
+                    try:
+                        sock.sendto(packet, address)
+                    except OSError as exc:
+                        logging.error("SNMP send to %s failed: %s", address[0], exc)
+                deadline = time.monotonic() + self.timeout
+                while pending:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    readable, _, _ = select.select([sock], [], [], remaining)
+                    if not readable:
+                        break
+                    try:
+                        data, source = sock.recvfrom(65535)
+                        _, _, pdu_type, response = decode_message(data)
+                    except (OSError, SnmpError) as exc:
+                        logging.debug("Ignoring SNMP datagram: %s", exc)
+                        continue
+                    entry = pending.get(response.request_id) if pdu_type == PDU_RESPONSE else None
+                    if entry is None:
+                        continue
+                    if tuple(source[:2]) != entry[2]:
+                        logging.debug("Ignoring SNMP response from %s:%s for %s:%s", *source[:2], *entry[2])
+                        continue
+                    del pending[response.request_id]
+                    results[entry[0]] = response
+                    if not response.ok:
+                        logging.error(
+                            "SNMP %s error-status=%s index=%s",
+                            entry[2][0],
+                            response.error_status,
+                            response.error_index,
+                        )
+                if not pending:
+                    break
+                logging.info("SNMP attempt %s: %s request(s) unanswered", attempt, len(pending))
+        finally:
+            sock.close()
+        for index, _, address in pending.values():
+            logging.error("SNMP request to %s timed out after %s attempt(s)", address[0], self.retries)
+        return results
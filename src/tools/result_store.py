@@ -0,0 +1,588 @@
+"""Typed columnar store kept next to each performance result CSV.
+
+Chart generation, the project report and the DB sync each re-parsed the
+result CSV as text and re-inferred column types.  :class:`ResultStore` keeps
+``<csv stem>.columns/`` beside the CSV with a fixed schema derived from
+:data:`RESULT_BASE_HEADERS` (``Throughput`` expands to the repeat columns):
+
+* measurement columns are little-endian float64 arrays (``c<i>.f8``); cells
+  that are not numbers (``NULL``, ``N/A``) are ``NaN`` there.  Cells whose
+  text the number does not reproduce (``NULL``, ``007``, ``12.50``) keep it
+  as int32 ``(row, code)`` pairs in ``c<i>.x4``;
+* label columns are dictionary encoded: int32 codes (``c<i>.i4``).  Codes
+  index the distinct texts of the column (for measurement columns, the
+  kept cell texts), one JSON string per line of ``c<i>.dict``;
+* ``meta.json`` holds the row count, per-column statistics (text cells,
+  empty cells, fractional numbers) and the CSV's ``(size, mtime_ns)`` at the
+  last commit.  It is replaced atomically after the column files were
+  appended, so bytes past its row count are ignored.
+
+:meth:`ResultTable.frame` loads selected columns and row ranges straight
+from the arrays and rebuilds the dtypes ``pd.read_csv`` would infer
+(``True``/``False`` columns included; text columns are left to pandas'
+inference, so they come back as ``object`` on pandas 2 and ``str`` on 3);
+:meth:`ResultTable.rows` returns the cell texts ``csv.DictReader`` would,
+unchanged.  :func:`open_result_table` only serves a store whose stamp matches
+the CSV; a stale store is rebuilt from the CSV unless a writer still holds
+its journal, in which case callers fall back to parsing the CSV.  The CSV
+stays the source of truth; the store can always be deleted.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import logging
+import math
+import os
+import re
+import shutil
+import sys
+import threading
+from array import array
+from contextlib import suppress
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from src.tools.result_writer import JOURNAL_SUFFIX
+
+__all__ = [
+    "RESULT_BASE_HEADERS",
+    "STORE_SUFFIX",
+    "ResultStore",
+    "ResultTable",
+    "open_result_table",
+    "store_path",
+]
+
+STORE_SUFFIX = ".columns"
+# Bump when the file layout changes; older stores are rebuilt.
+_STORE_VERSION = 2
+
+RESULT_BASE_HEADERS: Tuple[str, ...] = (
+    "SerianNumber",
+    "Test_Category",
+    "Standard",
+    "Freq_Band",
+    "BW",
+    "Data_Rate",
+    "Channel",
+    "Angel",
+    "Protocol",
+    "Direction",
+    "Total_Path_Loss",
+    "DB",
+    "RSSI",
+    "MCS_Rate",
+    "Throughput",
+    "Expect_Rate",
+    "Beacon_RSSI",
+    "WF0_RSSI",
+    "WF1_RSSI",
+    "Latency",
+    "Packet_Loss",
+    "Profile_Mode",
+    "Profile_Value",
+    "Scenario_Group_Key",
+)
+_REAL_COLUMNS = frozenset(
+    {
+        "Channel",
+        "Angel",
+        "Total_Path_Loss",
+        "DB",
+        "RSSI",
+        "Expect_Rate",
+        "Beacon_RSSI",
+        "WF0_RSSI",
+        "WF1_RSSI",
+        "Latency",
+        "Packet_Loss",
+        "Profile_Value",
+    }
+)
+# ``pd.read_csv`` default NA strings.
+_NA_TEXT = frozenset(
+    {
+        "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan",
+        "1.#IND", "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None",
+        "n/a", "nan", "null",
+    }
+)
+# ``pd.read_csv`` default true/false strings.
+_BOOL_TEXT = {"True": True, "TRUE": True, "true": True, "False": False, "FALSE": False, "false": False}
+_INT_RE = re.compile(r"[+-]?\d+\Z")
+_FLOAT_RE = re.compile(r"[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?\Z|[+-]?(?:inf|Inf|INF|infinity|Infinity)\Z")
+_ENCODINGS = ("utf-8-sig", "gbk")
+_SWAP = sys.byteorder == "big"
+
+
+def store_path(csv_path: str | os.PathLike[str]) -> Path:
+    """Return the store directory that belongs to ``csv_path``."""
+    return Path(csv_path).with_suffix(STORE_SUFFIX)
+
+
+def _is_throughput(name: str) -> bool:
+    return name == "Throughput" or bool(re.fullmatch(r"Throughput \d+", name))
+
+
+def _schema(headers: Sequence[str]) -> Optional[List[str]]:
+    """Column kinds (``"real"``/``"text"``), or ``None`` for a foreign header."""
+    expected = iter(RESULT_BASE_HEADERS)
+    kinds: List[str] = []
+    pending = next(expected, None)
+    for index, name in enumerate(headers):
+        if pending == "Throughput" and _is_throughput(name):
+            kinds.append("real")
+            if index + 1 < len(headers) and _is_throughput(headers[index + 1]):
+                continue
+            pending = next(expected, None)
+            continue
+        if name != pending:
+            return None
+        kinds.append("real" if name in _REAL_COLUMNS else "text")
+        pending = next(expected, None)
+    return kinds if pending is None and len(set(headers)) == len(headers) else None
+
+
+def _csv_stamp(csv_path: Path) -> Optional[List[int]]:
+    try:
+        stat = csv_path.stat()
+    except OSError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def _number(text: str) -> Optional[Tuple[float, bool]]:
+    """``(value, fractional)`` when ``pd.read_csv`` reads ``text`` as a number."""
+    if _INT_RE.match(text):
+        return float(text), False
+    if _FLOAT_RE.match(text):
+        return float(text), True
+    return None
+
+
+def _text_cells(texts: Sequence[str]) -> Tuple[List[Any], bool]:
+    """Cells ``pd.read_csv`` yields for non-numeric ``texts`` and whether they are booleans."""
+    as_bool = all(text in _BOOL_TEXT for text in texts if text not in _NA_TEXT)
+    cells = [math.nan if text in _NA_TEXT else (_BOOL_TEXT[text] if as_bool else text) for text in texts]
+    return cells, as_bool
+
+
+def _number_text(value: float) -> str:
+    """Text a stored number reads back as when its cell text was not kept."""
+    return str(int(value)) if value.is_integer() else repr(value)
+
+
+@dataclass
+class _Column:
+    """Schema entry and ``pd.read_csv`` dtype statistics of one column."""
+
+    name: str
+    kind: str
+    text_cells: int = 0
+    nulls: int = 0
+    fraction: bool = False
+    dict_size: int = 0
+    extras: int = 0
+
+    def note(self, text: str) -> Optional[Tuple[float, bool]]:
+        """Record ``text`` in the statistics and return its number, if any."""
+        if text in _NA_TEXT:
+            self.nulls += 1
+            return None
+        parsed = _number(text)
+        if parsed is None:
+            self.text_cells += 1
+        elif parsed[1]:
+            self.fraction = True
+        return parsed
+
+
+def _read_meta(directory: Path) -> Optional[Dict[str, Any]]:
+    try:
+        with (directory / "meta.json").open("r", encoding="utf-8") as handle:
+            meta = json.load(handle)
+    except FileNotFoundError:
+        return None
+    except Exception as exc:
+        logging.debug("Ignoring unreadable result store %s: %s", directory, exc)
+        return None
+    return meta if meta.get("version") == _STORE_VERSION else None
+
+
+def _fresh_meta(csv_path: Path) -> Optional[Dict[str, Any]]:
+    meta = _read_meta(store_path(csv_path))
+    if meta is None or meta.get("csv_stamp") != _csv_stamp(csv_path):
+        return None
+    return meta
+
+
+def _write_meta(directory: Path, columns: Sequence[_Column], rows: int, stamp: Optional[List[int]]) -> None:
+    meta = {
+        "version": _STORE_VERSION,
+        "rows": rows,
+        "csv_stamp": stamp,
+        "columns": [asdict(column) for column in columns],
+    }
+    tmp = directory / f"meta.json.{os.getpid()}.tmp"
+    with tmp.open("w", encoding="utf-8") as handle:
+        json.dump(meta, handle)
+    os.replace(tmp, directory / "meta.json")
+
+
+def _read_lines(path: Path, count: int) -> List[Any]:
+    if count <= 0:
+        return []
+    with path.open("r", encoding="utf-8") as handle:
+        return [json.loads(line) for _, line in zip(range(count), handle)]
+
+
+class _ColumnBuffer:
+    """Rows of one column not yet appended to its files."""
+
+    def __init__(self, column: _Column, values: Sequence[str] = ()) -> None:
+        self.column = column
+        self.values = array("d") if column.kind == "real" else array("i")
+        self.codes: Dict[str, int] = {}
+        self.new_entries: List[str] = []
+        self.new_extras = array("i")
+        for value in values:
+            self.codes[value] = len(self.codes)
+
+    def _code(self, text: str) -> int:
+        code = self.codes.get(text)
+        if code is None:
+            code = self.codes[text] = len(self.codes)
+            self.new_entries.append(text)
+        return code
+
+    def add(self, row: int, text: str) -> None:
+        column = self.column
+        parsed = column.note(text)
+        if column.kind == "real":
+            value = parsed[0] if parsed is not None else math.nan
+            self.values.append(value)
+            if text and (parsed is None or _number_text(value) != text):
+                self.new_extras.extend((row, self._code(text)))
+            return
+        self.values.append(self._code(text))
+
+    def write(self, directory: Path, index: int) -> None:
+        column = self.column
+        _append_array(directory / f"c{index}.{'f8' if column.kind == 'real' else 'i4'}", self.values)
+        _append_array(directory / f"c{index}.x4", self.new_extras)
+        if self.new_entries:
+            with (directory / f"c{index}.dict").open("a", encoding="utf-8") as handle:
+                handle.writelines(json.dumps(entry) + "\n" for entry in self.new_entries)
+        column.dict_size += len(self.new_entries)
+        column.extras += len(self.new_extras) // 2
+        self.values = array(self.values.typecode)
+        self.new_entries = []
+        self.new_extras = array("i")
+
+
+def _append_array(path: Path, values: array) -> None:
+    if not values:
+        return
+    if _SWAP:
+        values = array(values.typecode, values)
+        values.byteswap()
+    with path.open("ab") as handle:
+        handle.write(values.tobytes())
+
+
+def _read_array(path: Path, typecode: str, start: int, count: int) -> array:
+    values = array(typecode)
+    if count <= 0:
+        return values
+    with path.open("rb") as handle:
+        handle.seek(start * values.itemsize)
+        values.frombytes(handle.read(count * values.itemsize))
+    if _SWAP:
+        values.byteswap()
+    return values
+
+
+def _trim(directory: Path, columns: Sequence[_Column], rows: int) -> None:
+    """Drop bytes past the committed state (left by a crash mid-commit)."""
+    for index, column in enumerate(columns):
+        if column.kind == "real":
+            binaries = ((directory / f"c{index}.f8", rows * 8), (directory / f"c{index}.x4", column.extras * 8))
+        else:
+            binaries = ((directory / f"c{index}.i4", rows * 4),)
+        for binary, size in binaries:
+            if binary.exists() and binary.stat().st_size > size:
+                with binary.open("r+b") as handle:
+                    handle.truncate(size)
+        path, count = directory / f"c{index}.dict", column.dict_size
+        if path.exists():
+            with path.open("r", encoding="utf-8") as handle:
+                kept = [line for _, line in zip(range(count), handle)]
+            if len(kept) == count and path.stat().st_size > sum(len(line.encode("utf-8")) for line in kept):
+                path.write_text("".join(kept), encoding="utf-8")
+
+
+def _read_csv(csv_path: Path) -> Tuple[List[str], List[List[str]]]:
+    for encoding in _ENCODINGS:
+        try:
+            with csv_path.open(encoding=encoding, newline="") as handle:
+                reader = csv.reader(handle)
+                headers = [str(name).strip() for name in next(reader, [])]
+                return headers, [row for row in reader if row]
+        except UnicodeDecodeError:
+            continue
+    raise ValueError(f"{csv_path.name}: unsupported encoding")
+
+
+def _build_store(csv_path: Path, headers: Optional[Sequence[str]] = None) -> bool:
+    """(Re)create the store of ``csv_path`` from the CSV; return whether it exists."""
+    stamp = _csv_stamp(csv_path)
+    if stamp is None:
+        return False
+    csv_headers, rows = _read_csv(csv_path)
+    if headers is None:
+        headers = csv_headers
+    elif csv_headers and csv_headers != list(headers):
+        raise ValueError(f"{csv_path.name}: headers changed from {csv_headers} to {list(headers)}")
+    kinds = _schema(headers)
+    if kinds is None:
+        return False
+    columns = [_Column(name, kind) for name, kind in zip(headers, kinds)]
+    buffers = [_ColumnBuffer(column) for column in columns]
+    width = len(headers)
+    for row_index, row in enumerate(rows):
+        for buffer, text in zip(buffers, (row + [""] * width)[:width]):
+            buffer.add(row_index, text)
+    target = store_path(csv_path)
+    staging = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    shutil.rmtree(staging, ignore_errors=True)
+    staging.mkdir()
+    for index, buffer in enumerate(buffers):
+        buffer.write(staging, index)
+    # The stamp from before reading: rows appended meanwhile make it stale.
+    _write_meta(staging, columns, len(rows), stamp)
+    retired = target.with_name(f"{target.name}.{os.getpid()}.old")
+    if target.exists():
+        os.replace(target, retired)
+    os.replace(staging, target)
+    shutil.rmtree(retired, ignore_errors=True)
+    return True
+
+
+class ResultStore:
+    """Mirror the rows of one result CSV into its columnar store.
+
+    Call :meth:`commit` after the CSV has been flushed so the recorded stamp
+    matches the file.  Raises ``ValueError`` when ``headers`` do not follow
+    :data:`RESULT_BASE_HEADERS`.
+    """
+
+    def __init__(self, csv_path: str | os.PathLike[str], headers: Sequence[str]) -> None:
+        self.csv_path = Path(csv_path)
+        self.headers = list(headers)
+        if _schema(self.headers) is None:
+            raise ValueError(f"{self.csv_path.name}: headers do not match the result schema")
+        self._lock = threading.Lock()
+        self._buffers: Optional[List[_ColumnBuffer]] = None
+        self._rows = 0
+        self._open()
+
+    def _open(self) -> None:
+        meta = _fresh_meta(self.csv_path)
+        if meta is None:
+            if not _build_store(self.csv_path, self.headers):
+                raise FileNotFoundError(self.csv_path)
+            meta = _read_meta(store_path(self.csv_path))
+        directory = store_path(self.csv_path)
+        columns = [_Column(**entry) for entry in meta["columns"]]
+        _trim(directory, columns, meta["rows"])
+        self._rows = meta["rows"]
+        self._buffers = [
+            _ColumnBuffer(column, _read_lines(directory / f"c{index}.dict", column.dict_size))
+            for index, column in enumerate(columns)
+        ]
+
+    @property
+    def closed(self) -> bool:
+        return self._buffers is None
+
+    def append(self, line: str) -> None:
+        """Add one CSV line (as written to the result file)."""
+        cells = next(csv.reader([line]), [])
+        width = len(self.headers)
+        if len(cells) != width:
+            logging.debug("Result row has %d cells for %d columns: %s", len(cells), width, line)
+            cells = (cells + [""] * width)[:width]
+        with self._lock:
+            if self._buffers is None:
+                raise ValueError(f"result store for {self.csv_path} is closed")
+            for buffer, text in zip(self._buffers, cells):
+                buffer.add(self._rows, text)
+            self._rows += 1
+
+    def commit(self) -> None:
+        """Append pending rows and record the CSV's current stamp."""
+        with self._lock:
+            if self._buffers is None:
+                return
+            directory = store_path(self.csv_path)
+            for index, buffer in enumerate(self._buffers):
+                buffer.write(directory, index)
+            _write_meta(directory, [buffer.column for buffer in self._buffers], self._rows, _csv_stamp(self.csv_path))
+
+    def close(self) -> None:
+        self.commit()
+        with self._lock:
+            self._buffers = None
+
+    def discard(self) -> None:
+        """Drop the store, e.g. after a row could not be mirrored."""
+        with self._lock:
+            self._buffers = None
+            shutil.rmtree(store_path(self.csv_path), ignore_errors=True)
+
+    def rename(self, csv_path: str | os.PathLike[str]) -> None:
+        """Follow a rename of the CSV (call after the CSV has been moved)."""
+        reopen = not self.closed
+        self.close()
+        target = Path(csv_path)
+        with suppress(FileNotFoundError):
+            os.replace(store_path(self.csv_path), store_path(target))
+        self.csv_path = target
+        if reopen:
+            self._open()
+
+
+class ResultTable:
+    """Read access to a fresh result store (see :func:`open_result_table`)."""
+
+    def __init__(self, directory: Path, meta: Dict[str, Any]) -> None:
+        self.directory = directory
+        self.row_count: int = meta["rows"]
+        self._columns = {entry["name"]: (index, _Column(**entry)) for index, entry in enumerate(meta["columns"])}
+        self.headers: List[str] = list(self._columns)
+
+    def _range(self, start: int, stop: Optional[int]) -> Tuple[int, int]:
+        stop = self.row_count if stop is None else max(0, min(stop, self.row_count))
+        start = max(0, min(start, stop))
+        return start, stop - start
+
+    def _load(
+        self, name: str, start: int, count: int, with_extras: bool = True
+    ) -> Tuple[_Column, array, List[Any], Dict[int, str]]:
+        """Raw array, dictionary and (optionally) extras of ``name`` for ``count`` rows."""
+        if name not in self._columns:
+            raise KeyError(f"unknown result column: {name}")
+        index, column = self._columns[name]
+        real = column.kind == "real"
+        values = _read_array(self.directory / f"c{index}.{'f8' if real else 'i4'}", "d" if real else "i", start, count)
+        entries: List[Any] = []
+        extras: Dict[int, str] = {}
+        if not real or (column.extras and with_extras):
+            entries = _read_lines(self.directory / f"c{index}.dict", column.dict_size)
+        if real and column.extras and with_extras:
+            pairs = _read_array(self.directory / f"c{index}.x4", "i", 0, column.extras * 2)
+            for row, code in zip(pairs[::2], pairs[1::2]):
+                if start <= row < start + count:
+                    extras[row - start] = entries[code]
+        return column, values, entries, extras
+
+    def _texts(self, name: str, start: int, count: int) -> List[str]:
+        column, values, entries, extras = self._load(name, start, count)
+        if column.kind == "text":
+            return [entries[code] for code in values]
+        if column.nulls or column.text_cells:
+            texts = ["" if value != value else _number_text(value) for value in values]
+        else:
+            texts = list(map(_number_text, values))
+        for row, text in extras.items():
+            texts[row] = text
+        return texts
+
+    def rows(self, names: Optional[Sequence[str]] = None, start: int = 0, stop: Optional[int] = None) -> List[Dict[str, str]]:
+        """Rows ``start:stop`` as the string dicts ``csv.DictReader`` yields for the CSV."""
+        keys = list(names) if names is not None else list(self.headers)
+        first, count = self._range(start, stop)
+        texts = [self._texts(name, first, count) for name in keys]
+        return [dict(zip(keys, row)) for row in zip(*texts)]
+
+    def reader(self, names: Optional[Sequence[str]] = None) -> "_RowReader":
+        """A ``csv.DictReader`` stand-in (``fieldnames`` plus row iteration)."""
+        fieldnames = list(names) if names is not None else list(self.headers)
+        return _RowReader(fieldnames, self.rows(fieldnames))
+
+    def frame(self, names: Optional[Sequence[str]] = None, start: int = 0, stop: Optional[int] = None):
+        """Rows ``start:stop`` of ``names`` as the DataFrame ``pd.read_csv`` returns."""
+        import numpy as np
+        import pandas as pd
+
+        keys = list(names) if names is not None else list(self.headers)
+        first, count = self._range(start, stop)
+        series = {}
+        for name in keys:
+            column, values, entries, _ = self._load(name, first, count, with_extras=False)
+            if not count:
+                series[name] = pd.Series([], dtype=object)
+                continue
+            if column.kind == "real":
+                data = np.frombuffer(values, dtype=np.float64)
+                if column.text_cells:
+                    cells, as_bool = _text_cells(self._texts(name, first, count))
+                    series[name] = pd.Series(cells, dtype=bool if as_bool and not column.nulls else None)
+                elif column.fraction or column.nulls:
+                    series[name] = pd.Series(data.copy())
+                else:
+                    series[name] = pd.Series(data.astype(np.int64))
+                continue
+            codes = np.frombuffer(values, dtype=np.int32)
+            if column.text_cells:
+                cells, as_bool = _text_cells(entries)
+                lookup = np.empty(len(cells), dtype=object)
+                lookup[:] = cells
+                if as_bool and not column.nulls:
+                    lookup = lookup.astype(bool)
+            elif column.fraction or column.nulls:
+                lookup = np.array([np.nan if entry in _NA_TEXT else float(entry) for entry in entries], dtype=np.float64)
+            else:
+                lookup = np.array([int(entry) for entry in entries], dtype=np.int64)
+            series[name] = pd.Series(lookup[codes])
+        return pd.DataFrame(series, columns=keys)
+
+
+class _RowReader:
+    def __init__(self, fieldnames: List[str], rows: List[Dict[str, str]]) -> None:
+        self.fieldnames = fieldnames
+        self._rows = rows
+
+    def __iter__(self) -> Iterator[Dict[str, str]]:
+        return iter(self._rows)
+
+
+def open_result_table(csv_path: str | os.PathLike[str]) -> Optional[ResultTable]:
+    """Return the store of ``csv_path`` when it matches the CSV, else ``None``.
+
+    A stale store is rebuilt first, unless the CSV still has a journal (a
+    live writer, or rows that could not be recovered).  Result files that
+    never had a store return ``None``; callers then parse the CSV.
+    """
+
+    csv_path = Path(csv_path)
+    directory = store_path(csv_path)
+    if not directory.is_dir():
+        return None
+    meta = _fresh_meta(csv_path)
+    if meta is None:
+        if csv_path.with_name(csv_path.name + JOURNAL_SUFFIX).exists():
+            return None
+        try:
+            if not _build_store(csv_path):
+                return None
+        except Exception as exc:
+            logging.warning("Cannot rebuild result store %s: %s", directory, exc)
+            return None
+        meta = _fresh_meta(csv_path)
+        if meta is None:
+            return None
+    return ResultTable(directory, meta)
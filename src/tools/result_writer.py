@@ -0,0 +1,211 @@
+"""Buffered, journaled CSV writer for performance results.
+
+``PerformanceResult.save_result`` used to open the result CSV, append one
+line and close it again for every measurement.  :class:`ResultRowWriter`
+keeps the file open with a write buffer instead and makes the rows durable
+in two stages:
+
+* every row is first appended to ``<csv>.journal`` and fsynced, so a row is
+  safe once :meth:`ResultRowWriter.append` returns;
+* the buffered CSV is flushed to the OS at step boundaries (and at least
+  every ``flush_interval`` seconds) and fsynced at scenario end by
+  :meth:`ResultRowWriter.sync`, which then resets the journal.
+
+The journal starts with ``#offset <bytes> pid <pid>``: the CSV size at the
+last sync and the writing process.  After a crash, :func:`recover_result_journal`
+compares the CSV bytes past that offset with the journaled rows and appends
+whatever did not reach the CSV; readers call it before loading a result
+file.  Journals of writers that are still alive are left alone.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+__all__ = ["JOURNAL_SUFFIX", "ResultRowWriter", "recover_result_journal"]
+
+JOURNAL_SUFFIX = ".journal"
+_OFFSET_PREFIX = "#offset "
+_BUFFER_SIZE = 64 * 1024
+# Result files with an open writer in this process.
+_OPEN_PATHS: set[Path] = set()
+
+
+def _journal_path(path: Path) -> Path:
+    return path.with_name(path.name + JOURNAL_SUFFIX)
+
+
+def _fsync(handle) -> None:
+    handle.flush()
+    try:
+        os.fsync(handle.fileno())
+    except OSError as exc:  # pragma: no cover - e.g. network shares
+        logging.debug("fsync failed for %s: %s", getattr(handle, "name", handle), exc)
+
+
+def _writer_alive(pid: int) -> bool:
+    if pid == os.getpid():
+        return False
+    try:
+        import psutil
+    except ImportError:  # pragma: no cover - psutil is a runtime requirement
+        return False
+    return psutil.pid_exists(pid)
+
+
+def recover_result_journal(path: str | os.PathLike[str]) -> int:
+    """Append journaled rows that are missing from ``path``; return their count.
+
+    The journal is removed afterwards.  A journal whose rows do not continue
+    the CSV (the file was edited or replaced) is left untouched for manual
+    inspection.
+    """
+
+    csv_path = Path(path)
+    journal = _journal_path(csv_path)
+    if not journal.exists() or csv_path.resolve() in _OPEN_PATHS:
+        return 0
+    try:
+        with journal.open("rb") as f:
+            raw = f.read()
+        offset = 0
+        journaled = raw
+        if raw.startswith(_OFFSET_PREFIX.encode("ascii")):
+            marker, _, journaled = raw.partition(b"\n")
+            fields = marker.decode("ascii").split()
+            offset = int(fields[1])
+            if len(fields) >= 4 and _writer_alive(int(fields[3])):
+                return 0
+        with csv_path.open("rb") as f:
+            f.seek(offset)
+            tail = f.read()
+    except FileNotFoundError:
+        return 0
+    except Exception as exc:
+        logging.warning("Cannot recover result journal %s: %s", journal, exc)
+        return 0
+    if not journaled.startswith(tail):
+        logging.warning("Result journal %s does not match %s; left in place", journal, csv_path)
+        return 0
+    missing = journaled[len(tail):]
+    recovered = missing.count(b"\n")
+    if missing:
+        with csv_path.open("ab") as f:
+            f.write(missing)
+            f.flush()
+            os.fsync(f.fileno())
+        logging.warning("Recovered %d result row(s) into %s from its journal", recovered, csv_path)
+    try:
+        journal.unlink()
+    except OSError:
+        pass
+    return recovered
+
+
+class ResultRowWriter:
+    """Append CSV lines to a kept-open file, journaled until synced."""
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        header: Optional[str] = None,
+        *,
+        encoding: str = "utf-8-sig",
+        flush_interval: float = 2.0,
+    ) -> None:
+        self.path = Path(path)
+        self.encoding = encoding
+        self.flush_interval = flush_interval
+        self._lock = threading.RLock()
+        self._file = None
+        self._journal = None
+        self._last_flush = time.monotonic()
+        recover_result_journal(self.path)
+        self._open(header)
+
+    # ------------------------------------------------------------------
+    # file handling
+    # ------------------------------------------------------------------
+    def _open(self, header: Optional[str] = None) -> None:
+        self._file = open(self.path, "a", encoding=self.encoding, buffering=_BUFFER_SIZE)
+        if header is not None and self._file.tell() == 0:
+            self._file.write(header)
+            self._file.write("\n")
+        _fsync(self._file)
+        self._journal = open(_journal_path(self.path), "w", encoding="utf-8")
+        self._reset_journal()
+        _OPEN_PATHS.add(self.path.resolve())
+
+    def _reset_journal(self) -> None:
+        size = os.fstat(self._file.fileno()).st_size
+        self._journal.seek(0)
+        self._journal.truncate()
+        self._journal.write(f"{_OFFSET_PREFIX}{size} pid {os.getpid()}\n")
+        _fsync(self._journal)
+
+    @property
+    def closed(self) -> bool:
+        return self._file is None
+
+    # ------------------------------------------------------------------
+    # writing
+    # ------------------------------------------------------------------
+    def append(self, line: str) -> None:
+        """Write one CSV line; it is journaled and fsynced before returning."""
+        with self._lock:
+            if self._file is None:
+                raise ValueError(f"result writer for {self.path} is closed")
+            self._journal.write(line)
+            self._journal.write("\n")
+            _fsync(self._journal)
+            self._file.write(line)
+            self._file.write("\n")
+            if time.monotonic() - self._last_flush >= self.flush_interval:
+                self.flush()
+
+    def flush(self) -> None:
+        """Hand buffered rows to the OS so readers of the CSV see them."""
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+            self._last_flush = time.monotonic()
+
+    def sync(self) -> None:
+        """Make the CSV durable and start a fresh journal."""
+        with self._lock:
+            if self._file is None:
+                return
+            _fsync(self._file)
+            self._last_flush = time.monotonic()
+            self._reset_journal()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is None:
+                return
+            self.sync()
+            self._file.close()
+            self._journal.close()
+            self._file = None
+            self._journal = None
+            _OPEN_PATHS.discard(self.path.resolve())
+            try:
+                _journal_path(self.path).unlink()
+            except OSError:
+                pass
+
+    def rename(self, new_path: str | os.PathLike[str]) -> None:
+        """Move the CSV (open handles cannot be renamed on Windows)."""
+        with self._lock:
+            reopen = self._file is not None
+            self.close()
+            target = Path(new_path)
+            os.replace(self.path, target)
+            self.path = target
+            if reopen:
+                self._open()
@@ -4,14 +4,15 @@ This module defines a :class:`yamlTool` class that resolves a YAML file
 relative to the configuration base directory and provides methods for
 loading and accessing its contents.  Errors during loading are logged,
 and multiple encodings are attempted to support different file origins.
+Parsing goes through :func:`src.util.yaml_cache.load_yaml_file`, so
+repeated loads of the router xpath files hit the on-disk parse cache.
 """
 import logging
 from pathlib import Path
 from typing import Union
 
-import yaml
-
 from src.util.constants import get_config_base
+from src.util.yaml_cache import load_yaml_file
 
 
 class yamlTool:
@@ -47,22 +48,18 @@ class yamlTool:
     def _load_file(self) -> dict:
         """Load the YAML file from disk using multiple encodings.
 
-        The method attempts to open the file using UTF-8 and GBK encodings.
-        If decoding fails for both encodings or another exception is raised,
-        an empty dictionary is returned and an error is logged.
+        The file is decoded as UTF-8 or GBK (the working encoding is
+        remembered by the cache).  If decoding fails for both encodings or
+        another exception is raised, an empty dictionary is returned and an
+        error is logged.
 
         Returns:
             dict: The parsed YAML content as a dictionary; empty if loading fails.
         """
-        for encoding in ("utf-8", "gbk"):
-            try:
-                with self.path.open(encoding=encoding) as stream:
-                    return yaml.load(stream, Loader=yaml.FullLoader) or {}
-            except UnicodeDecodeError:
-                continue
-            except Exception as exc:  # pragma: no cover - I/O depends on environment
-                logging.error("Failed to load yaml %s: %s", self.path, exc)
-                break
+        try:
+            return load_yaml_file(self.path, loader="full") or {}
+        except Exception as exc:  # pragma: no cover - I/O depends on environment
+            logging.error("Failed to load yaml %s: %s", self.path, exc)
         return {}
 
     def get_note(self, note: str):
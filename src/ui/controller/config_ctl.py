@@ -949,6 +949,15 @@ class ConfigController(
         exitfirst_flag = bool(duration_cfg.get("exitfirst"))
         retry_str = str(duration_cfg.get("retry_limit", "")).strip()
         retry_limit = int(retry_str) if retry_str.isdigit() and int(retry_str) > 0 else 0
+        resume_flag = bool(duration_cfg.get("resume"))
+
+        telemetry_cfg = source.get("telemetry", {})
+        if not isinstance(telemetry_cfg, Mapping):
+            telemetry_cfg = {}
+        telemetry = {
+            "enabled": bool(telemetry_cfg.get("enabled", True)),
+            "mysql_sync": bool(telemetry_cfg.get("mysql_sync")),
+        }
 
         check_point_cfg = source.get("check_point", {})
         check_point = {key: bool(value) for key, value in check_point_cfg.items()}
@@ -988,8 +997,10 @@ class ConfigController(
                 "duration_hours": duration_value,
                 "exitfirst": exitfirst_flag,
                 "retry_limit": retry_limit,
+                "resume": resume_flag,
             },
             "check_point": check_point,
+            "telemetry": telemetry,
             "cases": cases,
         }
 
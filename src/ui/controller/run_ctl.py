@@ -7,6 +7,7 @@ import multiprocessing, subprocess
 import queue
 import shutil
 import tempfile
+import threading
 import time, json
 from datetime import datetime
 from pathlib import Path
@@ -16,12 +17,33 @@ from PyQt5.QtCore import QThread, pyqtSignal, Qt
 from src.util.constants import Paths
 from src.ui.view.theme import STYLE_BASE, TEXT_COLOR
 from src.test.stability import (
+    STABILITY_CHECKPOINT_ENV,
     is_stability_case_path,
     load_stability_plan,
     prepare_stability_environment,
     run_stability_plan,
+    stability_checkpoint_path,
 )
 from src.util.pytest_redact import install_redactor_for_current_process
+from src.util.run_events import (
+    CaseFinished,
+    CaseProgress,
+    CaseStarted,
+    PlanEstimate,
+    clear_event_sink,
+    install_event_sink,
+)
+from src.util.run_estimator import history_case_seconds
+from src.util.lab_resources import (
+    LAB_LOCKS,
+    ConflictSchedule,
+    DutTarget,
+    ResourceClaim,
+    case_resources,
+    declared_resources,
+    parse_resource_spec,
+    plan_parallelism,
+)
 import pytest, os, sys, allure
 import pandas as pd
 try:
@@ -34,6 +56,14 @@ try:
 except ImportError:
     _generate_allure_report_cli = None
 
+#: Worker log lines travel to the GUI in ``("log_batch", [lines])`` chunks of
+#: at most this many lines, or older than ``_LOG_BATCH_INTERVAL`` seconds.
+_LOG_BATCH_MAX_LINES = 256
+_LOG_BATCH_INTERVAL = 0.05
+#: The persistent python.log is flushed on this period instead of per line.
+_LOG_FILE_FLUSH_INTERVAL = 0.5
+
+
 def reset_wizard_after_run(page: Any) -> None:
     """Reset Config wizard state after a successful run.
 
@@ -93,17 +123,29 @@ class LiveLogWriter:
 
 
 class _RunLogSession:
-    """Manage stdout redirection and persistent logging for a worker process."""
+    """Manage stdout redirection and persistent logging for a worker process.
+
+    Lines are batched: they are queued as ``("log_batch", [lines])`` once
+    ``_LOG_BATCH_MAX_LINES`` accumulate or a background flusher finds them
+    older than ``_LOG_BATCH_INTERVAL``, and the log file is written through
+    its buffer and flushed every ``_LOG_FILE_FLUSH_INTERVAL``.  Other worker
+    events, including typed :mod:`src.util.run_events` published by pytest
+    hooks, go through :meth:`put`, which flushes pending lines first so the
+    GUI sees everything in emission order.
+    """
 
     def __init__(self, q: multiprocessing.Queue, log_file_path_str: str | None):
         self._queue = q
         self._log_file_path = self._resolve_log_path(log_file_path_str)
         self._log_handle: io.TextIOWrapper | None = self._open_handle()
         self._log_write_failed = False
+        self._pending: list[str] = []
+        self._pending_since = 0.0
+        self._batch_lock = threading.Lock()
+        self._stop_flusher = threading.Event()
         self._writer = LiveLogWriter(self._handle_line)
-        self._old_stdout = __import__("sys").stdout
-        self._old_stderr = __import__("sys").stderr
-        sys = __import__("sys")
+        self._old_stdout = sys.stdout
+        self._old_stderr = sys.stderr
         sys.stdout = sys.stderr = self._writer
         self._root_logger = logging.getLogger()
         self._old_handlers = self._root_logger.handlers[:]
@@ -118,6 +160,9 @@ class _RunLogSession:
         self._stream_handler.setFormatter(formatter)
         self._root_logger.addHandler(self._stream_handler)
         self._root_logger.setLevel(logging.INFO)
+        self._flusher = threading.Thread(target=self._flush_loop, name="log-batch-flusher", daemon=True)
+        self._flusher.start()
+        install_event_sink(self.put)
 
     def _resolve_log_path(self, explicit: str | None) -> Path | None:
         if explicit:
@@ -139,35 +184,57 @@ class _RunLogSession:
         if not self._log_file_path:
             return None
         try:
-            return open(self._log_file_path, "w", encoding="utf-8")
+            return open(self._log_file_path, "w", encoding="utf-8", buffering=1 << 16)
         except Exception:
             return None
 
     def _handle_line(self, line: str) -> None:
-        self._queue.put(("log", line))
-        import re
-        from contextlib import suppress
-
-        match = re.search(r"\[PYQT_PROGRESS\]\s+(\d+)/(\d+)", line)
-        if match:
-            finished = int(match.group(1))
-            total = int(match.group(2))
-            percent = int(finished / total * 100) if total else 0
-            self._queue.put(("progress", percent))
-        if self._log_handle and not self._log_write_failed:
-            try:
-                self._log_handle.write(line + "\n")
-                self._log_handle.flush()
-            except Exception:
-                self._log_write_failed = True
-                with suppress(Exception):
-                    self._log_handle.close()
-                self._log_handle = None
+        with self._batch_lock:
+            if not self._pending:
+                self._pending_since = time.monotonic()
+            self._pending.append(line)
+            if self._log_handle and not self._log_write_failed:
+                try:
+                    self._log_handle.write(line + "\n")
+                except Exception:
+                    self._drop_log_handle()
+            if len(self._pending) >= _LOG_BATCH_MAX_LINES:
+                self._flush_pending_locked()
+
+    def _drop_log_handle(self) -> None:
+        self._log_write_failed = True
+        with contextlib.suppress(Exception):
+            self._log_handle.close()
+        self._log_handle = None
+
+    def _flush_pending_locked(self) -> None:
+        if self._pending:
+            batch, self._pending = self._pending, []
+            self._queue.put(("log_batch", batch))
+
+    def _flush_loop(self) -> None:
+        last_file_flush = time.monotonic()
+        while not self._stop_flusher.wait(_LOG_BATCH_INTERVAL):
+            now = time.monotonic()
+            with self._batch_lock:
+                if self._pending and now - self._pending_since >= _LOG_BATCH_INTERVAL:
+                    self._flush_pending_locked()
+                if now - last_file_flush >= _LOG_FILE_FLUSH_INTERVAL:
+                    last_file_flush = now
+                    if self._log_handle and not self._log_write_failed:
+                        try:
+                            self._log_handle.flush()
+                        except Exception:
+                            self._drop_log_handle()
+
+    def put(self, item: tuple[str, Any]) -> None:
+        """Queue a non-log event after every line emitted before it."""
+        with self._batch_lock:
+            self._flush_pending_locked()
+            self._queue.put(item)
 
     def close(self) -> None:
-        from contextlib import suppress
-        import sys
-
+        clear_event_sink()
         for handler in self._root_logger.handlers[:]:
             self._root_logger.removeHandler(handler)
         for handler in self._old_handlers:
@@ -175,15 +242,21 @@ class _RunLogSession:
         self._root_logger.setLevel(self._old_level)
         sys.stdout = self._old_stdout
         sys.stderr = self._old_stderr
-        with suppress(Exception):
+        with contextlib.suppress(Exception):
             self._writer.flush()
-        if self._log_handle:
-            with suppress(Exception):
-                self._log_handle.flush()
-            with suppress(Exception):
-                self._log_handle.close()
+        self._stop_flusher.set()
+        self._flusher.join(timeout=1)
+        with self._batch_lock:
+            with contextlib.suppress(Exception):
+                self._flush_pending_locked()
+            if self._log_handle:
+                with contextlib.suppress(Exception):
+                    self._log_handle.flush()
+                with contextlib.suppress(Exception):
+                    self._log_handle.close()
+                self._log_handle = None
         if self._log_file_path:
-            with suppress(Exception):
+            with contextlib.suppress(Exception):
                 self._queue.put(("python_log", str(self._log_file_path)))
 
 
@@ -194,17 +267,27 @@ class CaseRunner(QThread):
     progress_signal = pyqtSignal(int)
     report_dir_signal = pyqtSignal(str)
     finished_signal = pyqtSignal()
+    #: Typed worker events (:mod:`src.util.run_events`).
+    event_signal = pyqtSignal(object)
 
     def __init__(self, case_path: str, account_name: str | None = None, display_case_path: str | None = None, shared_allure_results_dir: str | Path | None = None,
-                 shared_pytest_log_file: str | Path | None = None, parent=None):
+                 shared_pytest_log_file: str | Path | None = None, dut: DutTarget | None = None,
+                 resources: tuple[ResourceClaim, ...] | None = None, row_report_dir: str | Path | None = None,
+                 parent=None):
         super().__init__(parent)
         self.case_path = case_path
+        # Multi-DUT mode: run against ``dut`` and hold ``resources`` (plus the
+        # DUT itself) in LAB_LOCKS while the worker is alive.
+        self.dut = dut
+        self.resources = tuple(resources or ())
         self.account_name = (account_name or "").strip()
         self.display_case_path = display_case_path or case_path
         self.last_exit_code: int = 0
         # 存储共享路径（可能为 None）
         self._shared_allure_results_dir = Path(shared_allure_results_dir) if shared_allure_results_dir else None
         self._shared_pytest_log_file = Path(shared_pytest_log_file) if shared_pytest_log_file else None
+        # Parallel plan rows: report folder of this row inside the plan folder.
+        self._row_report_dir = Path(row_report_dir) if row_report_dir else None
 
         self._ctx = multiprocessing.get_context("spawn")
         self._queue = self._ctx.Queue()
@@ -227,6 +310,40 @@ class CaseRunner(QThread):
             print(f"[INIT] ⚠️ No shared allure dir provided")
 
     def run(self) -> None:  # type: ignore[override]
+        """Claim lab resources, run the worker and release the claims."""
+        claims = self._resource_claims()
+        if not claims:
+            self._run_worker()
+            return
+        owner = self._lock_owner()
+        described = ", ".join(claim.describe() for claim in claims)
+        if not LAB_LOCKS.try_acquire(owner, claims):
+            self.log_signal.emit(
+                f"<span style='{STYLE_BASE} color:gray;'>Waiting for lab resources: {described}</span>"
+            )
+            if not LAB_LOCKS.acquire(owner, claims, should_stop=lambda: self._should_stop):
+                self.log_signal.emit("<b style='color:red;'>The operation has been terminated</b>")
+                self.finished_signal.emit()
+                return
+        logging.info("CaseRunner: %s holds %s", owner, described)
+        try:
+            self._run_worker()
+        finally:
+            LAB_LOCKS.release(owner)
+
+    def _resource_claims(self) -> tuple[ResourceClaim, ...]:
+        if self.dut is None and not self.resources:
+            return ()
+        claims = self.resources
+        if self.dut is not None:
+            claims = (self.dut.claim(),) + claims
+        return claims
+
+    def _lock_owner(self) -> str:
+        label = self.dut.label if self.dut is not None else "local"
+        return f"{label}:{self.case_path}:{id(self)}"
+
+    def _run_worker(self) -> None:
         """Spawn the worker process and relay events to the UI."""
         from datetime import datetime
 
@@ -246,9 +363,13 @@ class CaseRunner(QThread):
             self.case_path,
         )
         for kind, payload in self._monitor_worker_events():
-            if kind == "log":
-                for message in self._normalize_log_messages(str(payload)):
-                    self.log_signal.emit(message)
+            if kind == "log_batch":
+                for line in payload:
+                    self.log_signal.emit(str(line))
+            elif kind == "log":
+                self.log_signal.emit(str(payload))
+            elif kind == "event":
+                self._on_worker_event(payload)
             elif kind == "progress":
                 self.progress_signal.emit(payload)
             elif kind == "report_dir":
@@ -258,11 +379,8 @@ class CaseRunner(QThread):
                 self._python_log_path = str(payload)
             elif kind == "exit_code":
                 self.last_exit_code = int(payload)
-        # Flush any in-flight case timing marker.
-        if self._case_start_time is not None:
-            duration_ms = int((time.time() - self._case_start_time) * 1000)
-            self.log_signal.emit(f"[PYQT_CASETIME]{duration_ms}")
-            self._case_start_time = None
+        # Flush any in-flight case timing.
+        self._finish_case_timing()
         # Record aggregated pytest run duration for history.
         try:
             from src.util.test_history import append_test_history_record
@@ -315,17 +433,31 @@ class CaseRunner(QThread):
             mode_str = "EXE" if is_exe else "DEV"
             print(f"[LAUNCH] {mode_str} MODE: No shared allure dir (independent mode)")
 
+        worker_args = (
+            python_log_path,
+            # 传递共享路径
+            allure_dir_to_pass,
+            #str(self._shared_allure_results_dir) if self._shared_allure_results_dir else None,
+            str(self._shared_pytest_log_file) if self._shared_pytest_log_file else None,
+            {"type": self.dut.kind, "address": self.dut.address} if self.dut else None,
+            str(self._row_report_dir) if self._row_report_dir else None,
+        )
+        # Prefer a pre-warmed pool process; its event queue replaces ours.
+        from src.ui.controller.worker_pool import checkout_worker
+
+        pooled = None
+        try:
+            pooled = checkout_worker()
+        except Exception as exc:
+            logging.warning("CaseRunner: worker pool unavailable, spawning a fresh process: %s", exc)
+        if pooled is not None:
+            self._queue = pooled.events
+            pooled.submit((self.case_path, *worker_args))
+            return pooled.process
+
         proc = self._ctx.Process(
             target=worker,
-            args=(
-                self.case_path,
-                self._queue,
-                python_log_path,
-                # 传递共享路径
-                allure_dir_to_pass,
-                #str(self._shared_allure_results_dir) if self._shared_allure_results_dir else None,
-                str(self._shared_pytest_log_file) if self._shared_pytest_log_file else None,
-            ),
+            args=(self.case_path, self._queue, *worker_args),
         )
         proc.start()
         return proc
@@ -362,24 +494,21 @@ class CaseRunner(QThread):
         except queue.Empty:
             return None
 
-    def _normalize_log_messages(self, payload: str) -> list[str]:
-        """Inject synthetic CASETIME markers as needed for the UI."""
-        messages: list[str] = []
-        # Payload lines may include timestamps and prefixes; locate the raw marker.
-        marker_index = payload.find("[PYQT_")
-        marker = payload[marker_index:] if marker_index != -1 else payload
-
-        if marker.startswith("[PYQT_CASE]"):
-            if self._case_start_time is not None:
-                duration_ms = int((time.time() - self._case_start_time) * 1000)
-                messages.append(f"[PYQT_CASETIME]{duration_ms}")
-            self._case_start_time = time.time()
-        elif marker.startswith("[PYQT_PROGRESS]") and self._case_start_time is not None:
+    def _finish_case_timing(self) -> None:
+        if self._case_start_time is not None:
             duration_ms = int((time.time() - self._case_start_time) * 1000)
-            messages.append(f"[PYQT_CASETIME]{duration_ms}")
+            self.event_signal.emit(CaseFinished(duration_ms))
             self._case_start_time = None
-        messages.append(payload)
-        return messages
+
+    def _on_worker_event(self, event) -> None:
+        """Track case timing, drive the progress bar and re-emit ``event``."""
+        if isinstance(event, CaseStarted):
+            self._finish_case_timing()
+            self._case_start_time = time.time()
+        elif isinstance(event, CaseProgress):
+            self._finish_case_timing()
+            self.progress_signal.emit(event.percent)
+        self.event_signal.emit(event)
 
     def _prepare_python_log_path(self) -> str | None:
         """Return a writable python.log path for the worker process."""
@@ -407,6 +536,10 @@ class CaseRunner(QThread):
         # 优先使用共享日志文件路径
         if self._shared_pytest_log_file:
             target = self._shared_pytest_log_file
+            if src.resolve() == target.resolve():
+                # The worker logged straight into the shared file.
+                self._python_log_copied = True
+                return messages
         else:
             # 原有逻辑：使用自己的报告目录
             target_dir = Path(self._report_dir) if self._report_dir else Path(Paths.BASE_DIR) / "report"
@@ -489,9 +622,10 @@ def _init_worker_env(
     log_file_path_str: str | None = None,
     shared_allure_results_dir: str | None = None,  # 新增参数
     shared_pytest_log_file: str | None = None,     # 新增参数
+    dut_override: dict[str, str] | None = None,
+    row_report_dir: str | None = None,
 ) -> "_WorkerContext":
     """Prepare logging, report directories, and pytest arguments."""
-    session = _RunLogSession(q, log_file_path_str)
     import os, sys,  random, subprocess, tempfile
     from datetime import datetime
     from pathlib import Path
@@ -508,6 +642,11 @@ def _init_worker_env(
         # ========== ExcelPlanRunner 共享模式 ==========
         allure_results_dir = Path(shared_allure_results_dir).resolve()
         report_dir = allure_results_dir.parent  # 主报告目录
+        if row_report_dir:
+            # Parallel plan rows keep logs and artifacts in their own folder; allure results stay shared.
+            report_dir = Path(row_report_dir).resolve()
+            report_dir.mkdir(parents=True, exist_ok=True)
+            os.environ["PYTEST_WORKER_LOG_DIR"] = str(report_dir)
         # 日志路径：优先使用传入的共享日志文件，否则在主报告目录下创建
         effective_log_path = (
             shared_pytest_log_file
@@ -518,6 +657,9 @@ def _init_worker_env(
         timestamp = datetime.now().strftime("%Y.%m.%d_%H.%M.%S")
         pid = os.getpid()
         timestamp = f"{timestamp}_{random.randint(1000, 9999)}"
+        if dut_override:
+            # One report folder per DUT in multi-DUT runs.
+            timestamp = f"{timestamp}_{DutTarget(dut_override['type'], dut_override['address']).label}"
         report_dir = (Path.cwd() / "report" / timestamp).resolve()
         report_dir.mkdir(parents=True, exist_ok=True)
         allure_results_dir = report_dir / "allure_report"
@@ -530,7 +672,7 @@ def _init_worker_env(
     # --- 通知队列报告目录 ---
     from contextlib import suppress
     with suppress(Exception):
-        q.put(("report_dir", str(report_dir)))
+        session.put(("report_dir", str(report_dir)))
     # ---
 
     plugin = install_redactor_for_current_process()
@@ -584,7 +726,16 @@ def _init_worker_env(
             print(f"[DEBUG _init_worker_env] DEV mode: Using absolute path (fallback): {pytest_case_path}")
 
     os.environ["PYTEST_REPORT_DIR"] = str(report_dir)
-    allure_results_dir = report_dir / "allure_report"
+    if dut_override:
+        os.environ["PYTEST_DUT_OVERRIDE"] = json.dumps(dut_override)
+        # Parallel DUT workers keep separate checkpoints; the name stays stable across runs for resume.
+        label = DutTarget(dut_override['type'], dut_override['address']).label
+        checkpoint = stability_checkpoint_path()
+        os.environ[STABILITY_CHECKPOINT_ENV] = str(
+            checkpoint.with_name(f"{checkpoint.stem}_{label}{checkpoint.suffix}")
+        )
+        # DUT workers share the cwd, so pytest.log and kernel_log.txt go to the DUT's report folder.
+        os.environ["PYTEST_WORKER_LOG_DIR"] = str(report_dir)
     allure_results_dir.mkdir(parents=True, exist_ok=True)
     #os.environ['ALLURE_REPORT_DIR'] = str(allure_results_dir)
     # --- END PATH HANDLING ---
@@ -598,6 +749,10 @@ def _init_worker_env(
         "--alluredir", str(allure_results_dir),
         pytest_case_path,
     ]
+    worker_log_dir = os.environ.get("PYTEST_WORKER_LOG_DIR")
+    if worker_log_dir:
+        # Overrides ``log_file = pytest.log`` from pytest.ini.
+        pytest_args[-1:-1] = ["-o", f"log_file={Path(worker_log_dir) / 'pytest.log'}"]
     print(f"[MODE]  Added --alluredir={allure_results_dir} | Plugin status: REGISTERED")
     # if not is_exe:  # 非 EXE 模式（即 DEV 模式）
     #     pytest_args.insert(-1, "--alluredir")  # 插入在 case_path 前
@@ -618,7 +773,7 @@ def _init_worker_env(
         # 从配置加载DUT设置到环境变量
         from src.util.constants import load_config
         cfg = load_config(refresh=True)
-        connect_cfg = cfg.get("connect_type") or {}
+        connect_cfg = _apply_dut_override(cfg.get("connect_type") or {}, dut_override)
         dut_type = connect_cfg.get("type") or "Android"
 
         os.environ["PYTEST_DUT_TYPE"] = dut_type
@@ -641,7 +796,7 @@ def _init_worker_env(
 
         from src.util.constants import load_config
         cfg = load_config(refresh=True)
-        connect_cfg = cfg.get("connect_type") or {}
+        connect_cfg = _apply_dut_override(cfg.get("connect_type") or {}, dut_override)
         dut_type = connect_cfg.get("type")
 
         # 添加自定义参数到命令行
@@ -675,7 +830,8 @@ def _init_worker_env(
 
     return _WorkerContext(
         case_path=pytest_case_path,
-        queue=q,
+        # Events go through the session so they stay ordered with log batches.
+        queue=session,
         pytest_args=pytest_args,
         report_dir=report_dir,
         plugin=plugin,
@@ -686,6 +842,32 @@ def _init_worker_env(
         #effective_log_path=str(effective_log_path),
     )
 
+def _resolve_case_file(case_path: str) -> Path:
+    """Return the script file ``_init_worker_env`` would run for ``case_path``."""
+
+    path = Path(case_path)
+    if path.is_absolute():
+        return path
+    base_dir = Path(sys._MEIPASS) if getattr(sys, "frozen", False) else Path(__file__).resolve().parents[3]
+    candidate = base_dir / "src/test/function" / case_path
+    return candidate if candidate.exists() else base_dir / case_path
+
+
+def _apply_dut_override(connect_cfg: dict[str, Any], dut_override: dict[str, str] | None) -> dict[str, Any]:
+    """Return ``connect_cfg`` pointed at the DUT chosen for a multi-DUT worker."""
+
+    if not dut_override:
+        return connect_cfg
+    merged = dict(connect_cfg)
+    kind = dut_override.get("type") or "Android"
+    merged["type"] = kind
+    if kind == "Linux":
+        merged["Linux"] = {**(connect_cfg.get("Linux") or {}), "ip": dut_override.get("address")}
+    else:
+        merged["Android"] = {**(connect_cfg.get("Android") or {}), "device": dut_override.get("address")}
+    return merged
+
+
 def _apply_exitfirst_flags(pytest_args: list[str], plan) -> list[str]:
     """Return pytest args extended with exit-first and retry flags when requested."""
 
@@ -744,6 +926,15 @@ def _stream_pytest_events(ctx: "_WorkerContext") -> None:
                     f"<span style='{STYLE_BASE} color:{TEXT_COLOR};'>[Stability] Iteration {iteration} started ({phase_desc}).</span>",
                 )
             )
+        elif kind == "plan_resumed":
+            completed_loops = payload["completed_loops"]
+            elapsed_seconds = payload["elapsed_seconds"]
+            q.put(
+                (
+                    "log",
+                    f"<span style='{STYLE_BASE} color:{TEXT_COLOR};'>[Stability] Resuming from checkpoint: {completed_loops} loop(s) done, {elapsed_seconds / 60:.1f} min of budget used.</span>",
+                )
+            )
         elif kind == "iteration_succeeded":
             iteration = payload["iteration"]
             q.put(
@@ -897,6 +1088,8 @@ def _pytest_worker(
     log_file_path_str: str | None = None,
     shared_allure_results_dir: str | None = None,
     shared_pytest_log_file: str | None = None,
+    dut_override: dict[str, str] | None = None,
+    row_report_dir: str | None = None,
 ) -> None:
     """Spawned multiprocessing entrypoint that runs pytest and streams logs."""
     ctx = None
@@ -916,14 +1109,17 @@ def _pytest_worker(
             log_file_path_str=log_file_path_str,  # 原始参数
             shared_allure_results_dir=shared_allure_results_dir,
             shared_pytest_log_file=shared_pytest_log_file,
+            dut_override=dut_override,
+            row_report_dir=row_report_dir,
         )
         _stream_pytest_events(ctx)
     except Exception as exc:  # pragma: no cover - defensive logging in worker
         import traceback as _tb
 
         tb = _tb.format_exc()
-        q.put(("log", f"<b style='{STYLE_BASE} color:red;'>Execution failed: {exc}</b>"))
-        q.put(("log", f"<pre style='{STYLE_BASE} color:{TEXT_COLOR};'>{tb}</pre>"))
+        events = ctx.queue if ctx is not None else q
+        events.put(("log", f"<b style='{STYLE_BASE} color:red;'>Execution failed: {exc}</b>"))
+        events.put(("log", f"<pre style='{STYLE_BASE} color:{TEXT_COLOR};'>{tb}</pre>"))
     finally:
         if ctx is not None:
             _finalize_run(ctx)
@@ -935,7 +1131,7 @@ class _WorkerContext:
     def __init__(
         self,
         case_path: str,
-        queue: multiprocessing.Queue,
+        queue: _RunLogSession,
         pytest_args: list[str],
         report_dir: Path,
         plugin: Any,
@@ -962,6 +1158,8 @@ class ExcelPlanRunner(QThread):
     progress_signal = pyqtSignal(int)
     report_dir_signal = pyqtSignal(str)
     finished_signal = pyqtSignal()
+    #: Typed worker events (:mod:`src.util.run_events`).
+    event_signal = pyqtSignal(object)
     case_report_ready_signal = pyqtSignal(str)
 
     def __init__(self, excel_path: str, parent=None):
@@ -1024,57 +1222,68 @@ class ExcelPlanRunner(QThread):
 
             print(f"[DEBUG ExcelPlanRunner.run] total_cases={total_cases}")
             print(f"[DEBUG ExcelPlanRunner.run] test_type={self.test_type}")
-            for idx, script_path in enumerate(script_paths):
-                print(f"[DEBUG ExcelPlanRunner.run] Processing case {idx + 1}/{total_cases}: {script_path}")
-                if self.isInterruptionRequested():
-                    self.log_signal.emit("<b style='color:red;'>Execution stopped by user.</b>")
-                    break
+            from src.util.constants import load_config
 
-                self.log_signal.emit(f"<br><b>▶️ Still Running: {script_path} ({idx + 1}/{total_cases})</b>")
-
-                # --- 【核心】创建 CaseRunner 并传入共享路径 ---
-                runner = CaseRunner(
-                    case_path=str(script_path),
-                    shared_allure_results_dir=self._shared_allure_dir,
-                    shared_pytest_log_file=self._shared_pytest_log,
-                )
-                # ---
-
-                # === 新增：监听子用例完成，更新实时报告 ===
-                # def make_handler(index=idx, runner_ref=runner):
-                #     def handler():
-                #         # 更新 Excel 状态（原有逻辑）
-                #         exit_code = runner_ref.last_exit_code
-                #         status = "Passed" if exit_code == 0 else "Failed"
-                #         print(f"[ExcelPlanRunner DEBUG] Case {index}: exit_code={exit_code}, status={status}")
-                #         self._update_excel_result(index, status)
-                #         # 👇 新增：生成实时 Allure 报告
-                #         self._safe_generate_allure_report()
-                #
-                #     return handler
-
-                #runner.finished_signal.connect(make_handler())
-
-                # 连接信号
-                runner.report_dir_signal.connect(self.case_report_ready_signal, Qt.DirectConnection)
-                runner.log_signal.connect(self.log_signal)
-                #runner.log_signal.connect(self.log_signal, Qt.QueuedConnection)
-                #runner.report_dir_signal.connect(self.report_dir_signal)
-                self._current_case_runner = runner
-
-                runner.start()
-                runner.wait()
-
-                self._current_case_runner = None
-
-                # 更新 Excel 状态
-                exit_code = runner.last_exit_code
-                status = "Passed" if runner.last_exit_code == 0 else "Failed"
-                print(f"[RELIABLE DEBUG] Row {idx}: exit_code={exit_code}, status={status}")
-                self._update_excel_result(idx, status)
-
-                # 发射整体进度
-                self.progress_signal.emit(int((idx + 1) / total_cases * 100))
+            max_parallel = plan_parallelism(load_config(refresh=True))
+            if max_parallel > 1:
+                self._run_parallel(script_paths, max_parallel)
+            else:
+                case_estimates = self._history_estimates(script_paths)
+                for idx, script_path in enumerate(script_paths):
+                    print(f"[DEBUG ExcelPlanRunner.run] Processing case {idx + 1}/{total_cases}: {script_path}")
+                    if self.isInterruptionRequested():
+                        self.log_signal.emit("<b style='color:red;'>Execution stopped by user.</b>")
+                        break
+
+                    self.log_signal.emit(f"<br><b>▶️ Still Running: {script_path} ({idx + 1}/{total_cases})</b>")
+                    self.event_signal.emit(
+                        PlanEstimate(idx, total_cases, case_estimates[idx], sum(case_estimates[idx + 1:]))
+                    )
+
+                    # --- 【核心】创建 CaseRunner 并传入共享路径 ---
+                    runner = CaseRunner(
+                        case_path=str(script_path),
+                        shared_allure_results_dir=self._shared_allure_dir,
+                        shared_pytest_log_file=self._shared_pytest_log,
+                    )
+                    # ---
+
+                    # === 新增：监听子用例完成，更新实时报告 ===
+                    # def make_handler(index=idx, runner_ref=runner):
+                    #     def handler():
+                    #         # 更新 Excel 状态（原有逻辑）
+                    #         exit_code = runner_ref.last_exit_code
+                    #         status = "Passed" if exit_code == 0 else "Failed"
+                    #         print(f"[ExcelPlanRunner DEBUG] Case {index}: exit_code={exit_code}, status={status}")
+                    #         self._update_excel_result(index, status)
+                    #         # 👇 新增：生成实时 Allure 报告
+                    #         self._safe_generate_allure_report()
+                    #
+                    #     return handler
+
+                    #runner.finished_signal.connect(make_handler())
+
+                    # 连接信号
+                    runner.report_dir_signal.connect(self.case_report_ready_signal, Qt.DirectConnection)
+                    runner.log_signal.connect(self.log_signal)
+                    runner.event_signal.connect(self.event_signal)
+                    #runner.log_signal.connect(self.log_signal, Qt.QueuedConnection)
+                    #runner.report_dir_signal.connect(self.report_dir_signal)
+                    self._current_case_runner = runner
+
+                    runner.start()
+                    runner.wait()
+
+                    self._current_case_runner = None
+
+                    # 更新 Excel 状态
+                    exit_code = runner.last_exit_code
+                    status = "Passed" if runner.last_exit_code == 0 else "Failed"
+                    print(f"[RELIABLE DEBUG] Row {idx}: exit_code={exit_code}, status={status}")
+                    self._update_excel_result(idx, status)
+
+                    # 发射整体进度
+                    self.progress_signal.emit(int((idx + 1) / total_cases * 100))
 
             self.log_signal.emit(f"<b>✅ 所有用例执行完毕！完整报告位于: {self._plan_report_dir}</b>")
             self.finished_signal.emit()
@@ -1096,6 +1305,133 @@ class ExcelPlanRunner(QThread):
             root_logger.setLevel(getattr(self, 'old_level', logging.WARNING))
             self.finished_signal.emit()
 
+    def _history_estimates(self, script_paths: list[str]) -> list[float]:
+        """Per-row duration estimates from the test history.
+
+        Rows without history use the mean of the rows that have one, so the
+        plan total is never silently short.
+        """
+        known = [history_case_seconds(str(path)) for path in script_paths]
+        seen = [seconds for seconds in known if seconds]
+        fallback = sum(seen) / len(seen) if seen else 0.0
+        return [seconds if seconds else fallback for seconds in known]
+
+    def _plan_claims(self, script_paths: list[str]) -> list[tuple[ResourceClaim, ...]]:
+        """Resolve each row's claims: Resources column, then script marker, then defaults."""
+        from src.util.report.excel.plan import read_plan_resources
+
+        try:
+            specs = read_plan_resources(self.excel_path)
+        except Exception as exc:
+            logging.warning("ExcelPlanRunner: failed to read Resources column: %s", exc)
+            specs = []
+        claims: list[tuple[ResourceClaim, ...]] = []
+        for idx, script_path in enumerate(script_paths):
+            spec = specs[idx] if idx < len(specs) else ""
+            declared = parse_resource_spec(spec) if spec else declared_resources(_resolve_case_file(script_path))
+            if not declared:
+                # Undeclared cases own the DUT, i.e. run one at a time as before.
+                declared = case_resources(script_path) + (ResourceClaim("dut", True),)
+            claims.append(declared)
+        return claims
+
+    def _run_parallel(self, script_paths: list[str], max_parallel: int) -> None:
+        """Run non-conflicting plan rows concurrently, reporting results in plan order.
+
+        Each row writes its logs and artifacts to ``row_<n>/`` in the plan
+        folder; a finished row's log is appended to the plan log in plan order.
+        """
+        total = len(script_paths)
+        claims = self._plan_claims(script_paths)
+        schedule = ConflictSchedule(claims)
+        self.log_signal.emit(f"<b>Parallel plan execution: up to {max_parallel} case(s) at once</b>")
+        for idx, script_path in enumerate(script_paths):
+            described = ", ".join(claim.describe() for claim in claims[idx])
+            after = ", ".join(f"#{i + 1}" for i in sorted(schedule.depends_on[idx])) or "-"
+            self.log_signal.emit(
+                f"<span style='{STYLE_BASE} color:gray;'>#{idx + 1} {script_path}: {described}; after {after}</span>"
+            )
+
+        running: dict[int, CaseRunner] = {}
+        exit_codes: dict[int, int] = {}
+        next_report = 0
+        case_estimates = self._history_estimates(script_paths)
+        started: set[int] = set()
+
+        def report_ready() -> None:
+            nonlocal next_report
+            while next_report in exit_codes:
+                status = "Passed" if exit_codes[next_report] == 0 else "Failed"
+                print(f"[RELIABLE DEBUG] Row {next_report}: exit_code={exit_codes[next_report]}, status={status}")
+                self._update_excel_result(next_report, status)
+                self._merge_row_log(next_report, script_paths[next_report])
+                self.log_signal.emit(f"<b>#{next_report + 1} {script_paths[next_report]}: {status}</b>")
+                next_report += 1
+                self.progress_signal.emit(int(next_report / total * 100))
+
+        while not schedule.finished:
+            if self.isInterruptionRequested():
+                for runner in running.values():
+                    runner.stop()
+                for idx, runner in running.items():
+                    runner.wait()
+                    exit_codes[idx] = runner.last_exit_code
+                    schedule.finish(idx)
+                running.clear()
+                schedule.skip_remaining()
+                self.log_signal.emit("<b style='color:red;'>Execution stopped by user.</b>")
+                break
+            for idx in schedule.ready(max_parallel - len(running)):
+                self.log_signal.emit(f"<br><b>▶️ Still Running: {script_paths[idx]} ({idx + 1}/{total})</b>")
+                row_dir = self._row_report_dir(idx)
+                runner = CaseRunner(
+                    case_path=str(script_paths[idx]),
+                    shared_allure_results_dir=self._shared_allure_dir,
+                    shared_pytest_log_file=row_dir / "python.log",
+                    row_report_dir=row_dir,
+                )
+                runner.report_dir_signal.connect(self.case_report_ready_signal, Qt.DirectConnection)
+                runner.log_signal.connect(
+                    lambda message, number=idx + 1: self.log_signal.emit(
+                        f"<span style='{STYLE_BASE} color:gray;'>[#{number}]</span> {message}"
+                    ),
+                    Qt.DirectConnection,
+                )
+                runner.event_signal.connect(self.event_signal, Qt.DirectConnection)
+                schedule.start(idx)
+                started.add(idx)
+                # Rows overlap, so the queue drains up to max_parallel times faster.
+                queued = sum(seconds for i, seconds in enumerate(case_estimates) if i not in started)
+                self.event_signal.emit(PlanEstimate(idx, total, case_estimates[idx], queued / max_parallel))
+                running[idx] = runner
+                runner.start()
+            for idx, runner in list(running.items()):
+                if runner.wait(100):
+                    exit_codes[idx] = runner.last_exit_code
+                    schedule.finish(idx)
+                    del running[idx]
+            report_ready()
+        report_ready()
+
+    def _row_report_dir(self, index: int) -> Path:
+        """Report folder of plan row ``index`` in parallel runs."""
+        return (self._plan_report_dir / f"row_{index + 1}").resolve()
+
+    def _merge_row_log(self, index: int, script_path: str) -> None:
+        """Append the log of parallel row ``index`` to the plan log (rows arrive in plan order)."""
+        row_log = self._row_report_dir(index) / "python.log"
+        if not row_log.exists():
+            return
+        try:
+            with open(row_log, "r", encoding="utf-8", errors="replace") as f_src, \
+                    open(self._shared_pytest_log, "a", encoding="utf-8") as f_target:
+                f_target.write("\n" + "=" * 50 + "\n")
+                f_target.write(f"Logs from plan row #{index + 1}: {script_path}\n")
+                f_target.write("=" * 50 + "\n")
+                shutil.copyfileobj(f_src, f_target)
+        except Exception as e:
+            self.log_signal.emit(f"<b style='color:orange;'>Failed to merge log of row #{index + 1}: {e}</b>")
+
     def _update_excel_result(self, row_index: int, status: str):
         """Update the 'Status' column in the Excel file."""
         try:
@@ -1161,5 +1497,88 @@ class ExcelPlanRunner(QThread):
             except Exception as e:
                 logging.warning("Failed to stop child CaseRunner: %s", e)
 
-__all__ = ["reset_wizard_after_run", "LiveLogWriter", "CaseRunner", "ExcelPlanRunner"]
+class MultiDutRunner(QThread):
+    """Run one case on every DUT in ``multi_dut.devices`` with one worker per DUT.
+
+    Each child :class:`CaseRunner` claims the case's lab resources plus its
+    DUT in ``LAB_LOCKS``; children with compatible claims run concurrently,
+    the rest queue behind the conflicting claim.  Every DUT gets its own
+    report folder and python log; UI log lines are prefixed with the DUT.
+    """
+
+    log_signal = pyqtSignal(str)
+    progress_signal = pyqtSignal(int)
+    report_dir_signal = pyqtSignal(str)
+    finished_signal = pyqtSignal()
+    #: Typed worker events (:mod:`src.util.run_events`).
+    event_signal = pyqtSignal(object)
+
+    def __init__(self, case_path: str, targets: list[DutTarget], account_name: str | None = None,
+                 display_case_path: str | None = None, parent=None):
+        super().__init__(parent)
+        self.case_path = case_path
+        self.targets = list(targets)
+        self.account_name = account_name
+        self.display_case_path = display_case_path or case_path
+        self.last_exit_code: int = 0
+        self.exit_codes: dict[str, int] = {}
+        self._runners: list[CaseRunner] = []
+        self._progress: dict[str, int] = {}
+
+    def run(self) -> None:  # type: ignore[override]
+        from src.util.constants import load_config
+
+        resources = case_resources(self.case_path, load_config(refresh=True))
+        described = ", ".join(claim.describe() for claim in resources) or "none"
+        self.log_signal.emit(
+            f"<b style='{STYLE_BASE} color:#a6e3ff;'>Multi-DUT run on {len(self.targets)} device(s); "
+            f"lab resources: {described}</b>"
+        )
+        for target in self.targets:
+            runner = CaseRunner(
+                self.case_path,
+                account_name=self.account_name,
+                display_case_path=self.display_case_path,
+                dut=target,
+                resources=resources,
+            )
+            label = target.label
+            self._progress[label] = 0
+            runner.log_signal.connect(
+                lambda message, label=label: self._forward_log(label, message), Qt.DirectConnection
+            )
+            runner.progress_signal.connect(
+                lambda percent, label=label: self._update_progress(label, percent), Qt.DirectConnection
+            )
+            runner.report_dir_signal.connect(self.report_dir_signal, Qt.DirectConnection)
+            self._runners.append(runner)
+        for runner in self._runners:
+            runner.start()
+        for runner in self._runners:
+            runner.wait()
+            self.exit_codes[runner.dut.label] = runner.last_exit_code
+        failed = {label: code for label, code in self.exit_codes.items() if code != 0}
+        self.last_exit_code = next(iter(failed.values()), 0)
+        summary_color = "red" if failed else "#a6e3ff"
+        summary = ", ".join(f"{label}: {'exit ' + str(code) if code else 'passed'}" for label, code in self.exit_codes.items())
+        self.log_signal.emit(f"<b style='{STYLE_BASE} color:{summary_color};'>Multi-DUT summary: {summary}</b>")
+        self.finished_signal.emit()
+
+    def _forward_log(self, label: str, message: str) -> None:
+        # Case events of parallel workers would interleave in the case table,
+        # so event_signal is not forwarded; progress is aggregated across DUTs.
+        self.log_signal.emit(f"<span style='{STYLE_BASE} color:gray;'>[{label}]</span> {message}")
+
+    def _update_progress(self, label: str, percent: int) -> None:
+        self._progress[label] = max(0, min(100, int(percent)))
+        self.progress_signal.emit(int(sum(self._progress.values()) / max(1, len(self._progress))))
+
+    def stop(self) -> None:
+        """Stop every child runner, including those still waiting for locks."""
+        for runner in self._runners:
+            with contextlib.suppress(Exception):
+                runner.stop()
+
+
+__all__ = ["reset_wizard_after_run", "LiveLogWriter", "CaseRunner", "ExcelPlanRunner", "MultiDutRunner"]
 
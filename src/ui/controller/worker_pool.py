@@ -0,0 +1,209 @@
+"""Pre-warmed pytest worker processes.
+
+``CaseRunner`` used to spawn a fresh ``spawn``-context process per run, and
+that process paid for importing pandas, openpyxl, pytest, allure and the
+``connect_tool`` DUT tree before the first test started.  The pool keeps
+``worker_pool.size`` processes that have already done those imports and
+block on a request queue:
+
+1. :func:`checkout_worker` hands an idle worker to a runner and immediately
+   spawns a replacement, so the next run finds a warm worker as well.
+2. The runner submits its ``_pytest_worker`` arguments together with its
+   current environment and working directory.  The worker adopts them, so
+   variables set after the worker was spawned (``TEST_TYPE``, ...) still
+   apply, and revalidates the config cache against the files on disk.
+3. The worker runs exactly one request and exits.  No state leaks between
+   runs; isolation is the same as with one process per run.
+
+Set ``worker_pool.enabled: false`` in ``config_basic.yaml`` to go back to
+one cold process per run.
+"""
+
+from __future__ import annotations
+
+import atexit
+import importlib
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Optional
+
+__all__ = ["PooledWorker", "WorkerPool", "checkout_worker", "start_worker_pool"]
+
+#: Imported by every pooled worker before it waits for a request.
+WARM_IMPORTS = (
+    "yaml",
+    "pandas",
+    "openpyxl",
+    "pytest",
+    "allure",
+    "allure_pytest.plugin",
+    "src.util.constants",
+    "src.tools.connect_tool.duts.android",
+    "src.tools.connect_tool.duts.linux",
+    "src.tools.connect_tool.duts.onn_dut",
+    "src.tools.connect_tool.duts.roku_dut",
+    "src.tools.connect_tool.transports.serial_tool",
+    "src.tools.connect_tool.transports.telnet_tool",
+    "src.tools.performance_result",
+    "src.tools.router_tool.Router",
+    "src.tools.reporting",
+    "src.test.stability",
+)
+
+
+def _pooled_worker_main(requests: multiprocessing.Queue, events: multiprocessing.Queue) -> None:
+    """Entry point of a pooled process: warm up, run one request, exit."""
+
+    started = time.perf_counter()
+    for name in WARM_IMPORTS:
+        try:
+            importlib.import_module(name)
+        except Exception:  # pragma: no cover - optional modules
+            logging.debug("Pooled worker could not pre-import %s", name, exc_info=True)
+    try:
+        from src.util.constants import load_config
+
+        load_config(refresh=True)
+    except Exception:  # pragma: no cover - config errors surface at run time
+        logging.debug("Pooled worker could not pre-load config", exc_info=True)
+    warm_seconds = time.perf_counter() - started
+
+    request = requests.get()
+    if request is None:
+        return
+    environ, cwd, args = request
+    os.environ.clear()
+    os.environ.update(environ)
+    os.chdir(cwd)
+    try:
+        from src.util.constants import config_snapshot
+
+        # Settings saved after warm-up would otherwise be hidden by the cached
+        # tree; only files whose stamp changed are parsed again.
+        config_snapshot(refresh=True)
+    except Exception:  # pragma: no cover - config errors surface at run time
+        logging.debug("Pooled worker could not refresh config", exc_info=True)
+    from src.ui.controller.run_ctl import _pytest_worker
+
+    events.put(("log", f"[WORKER_POOL] pre-warmed worker pid={os.getpid()} (warm-up {warm_seconds:.2f}s)"))
+    _pytest_worker(args[0], events, *args[1:])
+
+
+@dataclass
+class PooledWorker:
+    """A warm process plus the queues wired to it at spawn time."""
+
+    process: multiprocessing.Process
+    requests: multiprocessing.Queue
+    events: multiprocessing.Queue
+
+    def submit(self, args: tuple[Any, ...]) -> None:
+        """Start ``_pytest_worker(args[0], events, *args[1:])`` in the worker."""
+
+        self.requests.put((dict(os.environ), os.getcwd(), args))
+
+
+class WorkerPool:
+    """Keep ``size`` idle pre-warmed workers ready for ``CaseRunner``."""
+
+    def __init__(self, size: int = 1) -> None:
+        self.size = max(1, int(size))
+        self._ctx = multiprocessing.get_context("spawn")
+        self._idle: Deque[PooledWorker] = deque()
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def _spawn(self) -> PooledWorker:
+        requests = self._ctx.Queue()
+        events = self._ctx.Queue()
+        process = self._ctx.Process(
+            target=_pooled_worker_main,
+            args=(requests, events),
+            name="pytest-pool-worker",
+        )
+        process.start()
+        return PooledWorker(process, requests, events)
+
+    def fill(self) -> None:
+        """Spawn workers until ``size`` idle ones exist."""
+
+        with self._lock:
+            if self._closed:
+                return
+            self._idle = deque(worker for worker in self._idle if worker.process.is_alive())
+            while len(self._idle) < self.size:
+                self._idle.append(self._spawn())
+
+    def checkout(self) -> Optional[PooledWorker]:
+        """Return an idle worker (or ``None``) and spawn its replacement."""
+
+        with self._lock:
+            worker = None
+            while self._idle and worker is None:
+                candidate = self._idle.popleft()
+                if candidate.process.is_alive():
+                    worker = candidate
+        self.fill()
+        return worker
+
+    def shutdown(self) -> None:
+        with self._lock:
+            self._closed = True
+            idle, self._idle = list(self._idle), deque()
+        for worker in idle:
+            try:
+                worker.requests.put(None)
+                worker.process.join(timeout=2)
+            except Exception:
+                pass
+            if worker.process.is_alive():
+                worker.process.terminate()
+
+
+_pool: Optional[WorkerPool] = None
+_pool_lock = threading.Lock()
+
+
+def _pool_settings() -> tuple[bool, int]:
+    from src.util.constants import load_config
+
+    section = load_config(refresh=False).get("worker_pool")
+    if not isinstance(section, dict):
+        return True, 1
+    try:
+        size = int(section.get("size") or 1)
+    except (TypeError, ValueError):
+        size = 1
+    return bool(section.get("enabled", True)), size
+
+
+def start_worker_pool() -> Optional[WorkerPool]:
+    """Create and fill the process-wide pool when enabled in the config."""
+
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            try:
+                enabled, size = _pool_settings()
+            except Exception as exc:
+                logging.warning("Worker pool disabled: %s", exc)
+                return None
+            if not enabled:
+                return None
+            _pool = WorkerPool(size)
+            atexit.register(_pool.shutdown)
+        pool = _pool
+    pool.fill()
+    return pool
+
+
+def checkout_worker() -> Optional[PooledWorker]:
+    """Return a warm worker, or ``None`` when the pool is disabled."""
+
+    pool = start_worker_pool()
+    return pool.checkout() if pool is not None else None
@@ -15,12 +15,22 @@ The design is intentionally small:
 - ``apply_rules`` executes rules for a given trigger field.
 - ``evaluate_all_rules`` is the unified entry point used by views and
   controllers.
+
+Rule lists are indexed by :class:`RuleGraph`: every rule *reads* its
+trigger field (plus ``depends_on``) and *writes* the targets of its
+``set_value`` / ``set_options`` effects.  A field change only evaluates the
+rules that read that field, value writes cascade in dependency order, and a
+read/write cycle is rejected with :class:`RuleCycleError` when the graph is
+built (the static rule lists are checked at import time).  Show/hide and
+enable/disable effects of one evaluation are collapsed to their final state
+and applied in a single batch.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Callable, Dict, List, Mapping, Optional
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+import heapq
 import logging
 import os
 
@@ -203,10 +213,33 @@ class SimpleRuleSpec:
         Dotted key for the field whose change should trigger this rule.
     effects:
         List of :class:`SimpleFieldEffect` to apply when the rule fires.
+    depends_on:
+        Additional fields read by the effect conditions.  A change to any of
+        them re-evaluates the rule just like a change to ``trigger_field``.
     """
 
     trigger_field: str
     effects: List[SimpleFieldEffect]
+    depends_on: Tuple[str, ...] = field(default_factory=tuple)
+
+    @property
+    def reads(self) -> Tuple[str, ...]:
+        """Fields whose change re-evaluates this rule."""
+        return tuple(dict.fromkeys((self.trigger_field, *self.depends_on)))
+
+    @property
+    def writes(self) -> Tuple[str, ...]:
+        """Fields whose value this rule may change."""
+        return tuple(
+            dict.fromkeys(
+                eff.target_field for eff in self.effects if eff.action in _VALUE_ACTIONS
+            )
+        )
+
+
+# Actions that change a field value (and may therefore cascade into the rules
+# reading that field); every other action only changes presentation.
+_VALUE_ACTIONS = frozenset({"set_value", "set_options"})
 
 
 # Registry of custom simple rules.  All UI behaviour is described here.
@@ -1616,6 +1649,193 @@ CUSTOM_TESTCASE_UI_RULES.append(
     )
 )
 
+class RuleCycleError(ValueError):
+    """Raised when rules write fields that feed back into their own reads."""
+
+
+class RuleGraph:
+    """
+    Dependency index over an ordered list of :class:`SimpleRuleSpec`.
+
+    Fields are nodes; each rule adds an edge from every field it reads to
+    every field it writes.  The fields are ranked topologically so that
+    cascaded value changes are processed upstream first and each rule runs
+    at most once per change.
+    """
+
+    def __init__(self, rules: Sequence[SimpleRuleSpec]) -> None:
+        self.rules: List[SimpleRuleSpec] = list(rules)
+        self._readers: Dict[str, List[SimpleRuleSpec]] = {}
+        self._groups: Dict[str, List[SimpleRuleSpec]] = {}
+        edges: Dict[str, set[str]] = {}
+        for rule in self.rules:
+            self._groups.setdefault(rule.trigger_field, []).append(rule)
+            for read in rule.reads:
+                self._readers.setdefault(read, []).append(rule)
+                edges.setdefault(read, set()).update(rule.writes)
+            for write in rule.writes:
+                edges.setdefault(write, set())
+        self._rank = self._rank_fields(edges)
+
+    @staticmethod
+    def _rank_fields(edges: Dict[str, set[str]]) -> Dict[str, int]:
+        indegree = {node: 0 for node in edges}
+        for targets in edges.values():
+            for target in targets:
+                indegree[target] += 1
+        ready = [node for node, degree in indegree.items() if degree == 0]
+        heapq.heapify(ready)
+        rank: Dict[str, int] = {}
+        while ready:
+            node = heapq.heappop(ready)
+            rank[node] = len(rank)
+            for target in edges[node]:
+                indegree[target] -= 1
+                if indegree[target] == 0:
+                    heapq.heappush(ready, target)
+        if len(rank) != len(edges):
+            raise RuleCycleError(
+                "UI rules form a dependency cycle: " + " -> ".join(_find_cycle(edges, rank))
+            )
+        return rank
+
+    def rules_reading(self, field_id: str) -> List[SimpleRuleSpec]:
+        """Rules to re-evaluate when ``field_id`` changes, in list order."""
+        return self._readers.get(field_id, [])
+
+    def trigger_groups(self) -> Iterator[Tuple[str, List[SimpleRuleSpec]]]:
+        """Yield ``(trigger_field, rules)`` in first-declared order."""
+        return iter(self._groups.items())
+
+    def rank(self, field_id: str) -> int:
+        """Topological position of ``field_id`` (unknown fields sort first)."""
+        return self._rank.get(field_id, -1)
+
+
+def _find_cycle(edges: Dict[str, set[str]], ranked: Mapping[str, int]) -> List[str]:
+    """Return one cycle among the nodes left unranked by the topological sort."""
+    remaining = sorted(node for node in edges if node not in ranked)
+    path: List[str] = []
+    on_path: Dict[str, int] = {}
+    node = remaining[0]
+    while node not in on_path:
+        on_path[node] = len(path)
+        path.append(node)
+        node = min(target for target in edges[node] if target not in ranked)
+    return path[on_path[node]:] + [node]
+
+
+# Graphs for the rule-list combinations seen so far.  The key holds the
+# identity and length of each list, so appending to a list rebuilds its
+# graph; the lists themselves are kept alive so their ids stay valid.
+_GRAPH_CACHE: Dict[Tuple[Tuple[int, int], ...], Tuple[Tuple[List[SimpleRuleSpec], ...], RuleGraph]] = {}
+_GRAPH_CACHE_MAX = 8
+
+
+def rule_graph(rule_lists: Sequence[List[SimpleRuleSpec]]) -> RuleGraph:
+    """Return the (cached) :class:`RuleGraph` of the concatenated rule lists."""
+    key = tuple((id(lst), len(lst)) for lst in rule_lists)
+    cached = _GRAPH_CACHE.get(key)
+    if cached is not None:
+        return cached[1]
+    graph = RuleGraph([rule for lst in rule_lists for rule in lst])
+    if len(_GRAPH_CACHE) >= _GRAPH_CACHE_MAX:
+        _GRAPH_CACHE.pop(next(iter(_GRAPH_CACHE)))
+    _GRAPH_CACHE[key] = (tuple(rule_lists), graph)
+    return graph
+
+
+def _apply_options(ui_adapter: Any, target_field: str, opts_list: List[Any]) -> None:
+    # Prefer adapter API when available.
+    fn = getattr(ui_adapter, "set_options", None)
+    if callable(fn):
+        try:
+            fn(target_field, opts_list)
+        except Exception:
+            logging.debug("ui_adapter.set_options failed", exc_info=True)
+        return
+    # Fallback: try to update the underlying widget directly.
+    try:
+        field_widgets: Dict[str, Any] = getattr(ui_adapter, "field_widgets", {}) or {}
+        widget = field_widgets.get(target_field)
+        if widget is not None and hasattr(widget, "clear") and hasattr(widget, "addItem"):
+            try:
+                widget.blockSignals(True)
+            except Exception:
+                pass
+            try:
+                widget.clear()
+                for opt in opts_list:
+                    widget.addItem(str(opt), str(opt))
+            finally:
+                try:
+                    widget.blockSignals(False)
+                except Exception:
+                    pass
+    except Exception:
+        logging.debug("Failed to apply set_options fallback", exc_info=True)
+
+
+class _EffectBatch:
+    """
+    Collect presentation effects and apply only their final state.
+
+    ``show``/``hide`` and ``enable``/``disable`` are idempotent, so when a
+    full pass toggles the same widget several times only the last state is
+    applied.  Value effects go straight to the adapter because later
+    conditions (and cascaded rules) read the updated widget value.
+    """
+
+    def __init__(self, ui_adapter: Any, values: Optional["_RuleValues"] = None) -> None:
+        self.ui_adapter = ui_adapter
+        self.values = values
+        self._visible: Dict[str, bool] = {}
+        self._enabled: Dict[str, bool] = {}
+
+    def run(self, rule: SimpleRuleSpec, values: Mapping[str, Any]) -> None:
+        for eff in rule.effects:
+            if eff.condition is not None and not eff.condition(values):
+                continue
+            if eff.action == "show":
+                self._visible[eff.target_field] = True
+            elif eff.action == "hide":
+                self._visible[eff.target_field] = False
+            elif eff.action == "enable":
+                self._enabled[eff.target_field] = True
+            elif eff.action == "disable":
+                self._enabled[eff.target_field] = False
+            elif eff.action == "set_value":
+                val = eff.value(values) if callable(eff.value) else eff.value
+                self.ui_adapter.set_value(eff.target_field, val)
+                self._changed(eff.target_field)
+            elif eff.action == "set_options":
+                opts = eff.value(values) if callable(eff.value) else eff.value
+                _apply_options(self.ui_adapter, eff.target_field, list(opts) if opts is not None else [])
+                self._changed(eff.target_field)
+
+    def _changed(self, field_id: str) -> None:
+        if self.values is not None:
+            self.values.invalidate(field_id)
+
+    def apply(self) -> None:
+        """Push the collected presentation state to the adapter."""
+        visible, self._visible = self._visible, {}
+        enabled, self._enabled = self._enabled, {}
+        if not visible and not enabled:
+            return
+        set_updates = getattr(self.ui_adapter, "setUpdatesEnabled", None)
+        if callable(set_updates):
+            set_updates(False)
+        try:
+            for target, state in visible.items():
+                (self.ui_adapter.show if state else self.ui_adapter.hide)(target)
+            for target, state in enabled.items():
+                (self.ui_adapter.enable if state else self.ui_adapter.disable)(target)
+        finally:
+            if callable(set_updates):
+                set_updates(True)
+
+
 def apply_rules(
     trigger_field: str,
     values: Dict[str, Any],
@@ -1637,107 +1857,92 @@ def apply_rules(
     """
     rule_source = rules if rules is not None else CUSTOM_SIMPLE_UI_RULES
 
-    for rule in rule_source:
-        if rule.trigger_field != trigger_field:
-            continue
-        for eff in rule.effects:
-            if eff.condition is not None and not eff.condition(values):
-                continue
-            if eff.action == "show":
-                ui_adapter.show(eff.target_field)
-            elif eff.action == "hide":
-                ui_adapter.hide(eff.target_field)
-            elif eff.action == "enable":
-                ui_adapter.enable(eff.target_field)
-            elif eff.action == "disable":
-                ui_adapter.disable(eff.target_field)
-            elif eff.action == "set_value":
-                val = eff.value(values) if callable(eff.value) else eff.value
-                ui_adapter.set_value(eff.target_field, val)
-            elif eff.action == "set_options":
-                opts = eff.value(values) if callable(eff.value) else eff.value
-                opts_list = list(opts) if opts is not None else []
-                # Prefer adapter API when available.
-                fn = getattr(ui_adapter, "set_options", None)
-                if callable(fn):
-                    try:
-                        fn(eff.target_field, opts_list)
-                    except Exception:
-                        logging.debug("ui_adapter.set_options failed", exc_info=True)
-                else:
-                    # Fallback: try to update the underlying widget directly.
-                    try:
-                        field_widgets: Dict[str, Any] = getattr(ui_adapter, "field_widgets", {}) or {}
-                        widget = field_widgets.get(eff.target_field)
-                        if widget is not None and hasattr(widget, "clear") and hasattr(widget, "addItem"):
-                            try:
-                                widget.blockSignals(True)
-                            except Exception:
-                                pass
-                            try:
-                                widget.clear()
-                                for opt in opts_list:
-                                    widget.addItem(str(opt), str(opt))
-                            finally:
-                                try:
-                                    widget.blockSignals(False)
-                                except Exception:
-                                    pass
-                    except Exception:
-                        logging.debug("Failed to apply set_options fallback", exc_info=True)
+    batch = _EffectBatch(ui_adapter)
+    for rule in rule_graph([rule_source]).rules_reading(trigger_field):
+        batch.run(rule, values)
+    batch.apply()
 
 
 # ---------------------------------------------------------------------------
-def evaluate_all_rules(
-    page: Any,
-    trigger_field: str | None = None,
-    extra_rule_lists: Optional[List[List[SimpleRuleSpec]]] = None,
-) -> None:
+def _widget_value(widget: Any) -> Any:
+    # Order matters: treat combo-like widgets (currentText) first so that
+    # checkable combo implementations do not get coerced via isChecked().
+    try:
+        # ComboBox (and similar) have currentText.
+        if hasattr(widget, "currentText"):
+            return str(widget.currentText())
+        # QCheckBox has isChecked.
+        if hasattr(widget, "isChecked"):
+            return bool(widget.isChecked())
+        # QSpinBox / QDoubleSpinBox have value() but no currentText.
+        if hasattr(widget, "value"):
+            return widget.value()
+        # LineEdit (and similar) have text.
+        if hasattr(widget, "text"):
+            return str(widget.text())
+    except Exception:
+        return None
+    return _MISSING
+
+
+_MISSING = object()
+
+
+class _RuleValues(Mapping[str, Any]):
     """
-    Evaluate all simple rules for the page.
+    Read-only view of the field values seen by rule conditions.
 
-    Parameters
-    ----------
-    page:
-        The Config page instance (or adapter) exposing ``field_widgets`` and
-        UIAdapter methods used by simple rules.
-    trigger_field:
-        Optional field identifier that has just changed.  When provided, only
-        rules for that field are executed; when ``None``, rules for all
-        trigger fields are evaluated using the current widget values.
+    Widget values and the derived ``testcase.*`` context are read on first
+    access and cached, so an incremental evaluation only touches the fields
+    its rules actually look at.  :meth:`invalidate` drops a cached value
+    after a rule (or a cascaded change) wrote it.
     """
-    field_widgets: Dict[str, Any] = getattr(page, "field_widgets", {}) or {}
 
-    # Collect current values from widgets.
-    # Order matters: treat combo-like widgets (currentText) first so that
-    # checkable combo implementations do not get coerced via isChecked().
-    values: Dict[str, Any] = {}
-    for key, widget in field_widgets.items():
+    def __init__(self, field_widgets: Mapping[str, Any], derived: Mapping[str, Callable[[], Any]]) -> None:
+        self._widgets = field_widgets
+        self._derived = derived
+        self._cache: Dict[str, Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
         try:
-            # ComboBox (and similar) have currentText.
-            if hasattr(widget, "currentText"):
-                values[key] = str(widget.currentText())
-            # QCheckBox has isChecked.
-            elif hasattr(widget, "isChecked"):
-                values[key] = bool(widget.isChecked())
-            # QSpinBox / QDoubleSpinBox have value() but no currentText.
-            elif hasattr(widget, "value") and not hasattr(widget, "currentText"):
-                values[key] = widget.value()
-            # LineEdit (and similar) have text.
-            elif hasattr(widget, "text"):
-                values[key] = str(widget.text())
-        except Exception:
-            values[key] = None
+            return self._cache[key]
+        except KeyError:
+            pass
+        value: Any = _MISSING
+        provider = self._derived.get(key)
+        if provider is not None:
+            value = provider()
+        if value is _MISSING and key in self._widgets:
+            value = _widget_value(self._widgets[key])
+        if value is _MISSING:
+            raise KeyError(key)
+        self._cache[key] = value
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._derived
+        for key in self._widgets:
+            if key not in self._derived:
+                yield key
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def invalidate(self, field_id: str) -> None:
+        self._cache.pop(field_id, None)
+
+
+def _testcase_context(page: Any) -> Dict[str, Callable[[], Any]]:
+    """Lazily computed values that are not backed by a single widget."""
 
     # Normalise connect_type.type value so that rules can rely on a
     # consistent label (Android / Linux).  This mirrors the helper used
     # elsewhere in the UI layer.
-    try:
-        ct = current_connect_type(page)
-        if ct:
-            values["connect_type.type"] = ct
-    except Exception:
-        pass
+    def connect_type() -> Any:
+        try:
+            return current_connect_type(page) or _MISSING
+        except Exception:
+            return _MISSING
 
     # Inject testcase context so that CUSTOM_TESTCASE_UI_RULES can express
     # conditions based on the selected script (basename, kind, etc.)
@@ -1748,69 +1953,150 @@ def evaluate_all_rules(
         case_path = ""
     basename = os.path.basename(case_path) if case_path else ""
 
-    values["testcase.path"] = case_path
-    values["testcase.basename"] = basename
-    values["testcase.is_rvo"] = bool(basename and "rvo" in basename)
-    values["testcase.is_rvr"] = bool(basename and "rvr" in basename)
-    values["testcase.is_peak_throughput"] = basename == "test_wifi_peak_throughput.py"
-
-    # Derive performance/stability/compatibility flags via the controller when available.
-    is_performance = False
-    is_stability = False
-    is_compatibility = False
+    # Derive performance/stability flags via the controller when available.
     config_ctl = getattr(page, "config_ctl", None)
-    if config_ctl is not None:
-        try:
-            if hasattr(config_ctl, "is_performance_case"):
-                is_performance = bool(config_ctl.is_performance_case(case_path))
-        except Exception:
-            logging.debug("evaluate_all_rules: is_performance_case failed", exc_info=True)
-        try:
-            if hasattr(config_ctl, "is_stability_case"):
-                is_stability = bool(config_ctl.is_stability_case(case_path))
-        except Exception:
-            logging.debug("evaluate_all_rules: is_stability_case failed", exc_info=True)
+
+    def case_flag(method: str) -> Callable[[], bool]:
+        def compute() -> bool:
+            if config_ctl is None or not hasattr(config_ctl, method):
+                return False
+            try:
+                return bool(getattr(config_ctl, method)(case_path))
+            except Exception:
+                logging.debug("evaluate_all_rules: %s failed", method, exc_info=True)
+                return False
+
+        return compute
 
     # Treat any testcase whose path contains a "compatibility" segment as a
     # compatibility case.  This mirrors the folder-based Settings layout
     # logic in the view/controller layer.
-    try:
-        norm_path = case_path.replace("\\", "/")
-        is_compatibility = bool("/compatibility/" in norm_path)
-    except Exception:
-        is_compatibility = False
+    def is_compatibility() -> bool:
+        try:
+            return bool("/compatibility/" in case_path.replace("\\", "/"))
+        except Exception:
+            return False
+
+    return {
+        "connect_type.type": connect_type,
+        "testcase.path": lambda: case_path,
+        "testcase.basename": lambda: basename,
+        "testcase.is_rvo": lambda: bool(basename and "rvo" in basename),
+        "testcase.is_rvr": lambda: bool(basename and "rvr" in basename),
+        "testcase.is_peak_throughput": lambda: basename == "test_wifi_peak_throughput.py",
+        "testcase.is_performance": case_flag("is_performance_case"),
+        "testcase.is_stability": case_flag("is_stability_case"),
+        "testcase.is_compatibility": is_compatibility,
+    }
+
+
+@dataclass
+class _Evaluation:
+    """State of the rule evaluation currently running for one page."""
+
+    graph: RuleGraph
+    values: _RuleValues
+    batch: _EffectBatch
+    pending: List[Tuple[int, str]] = field(default_factory=list)
+    queued: set[str] = field(default_factory=set)
+    full_requested: bool = False
+    full_done: bool = False
+
+    def request(self, trigger_field: Optional[str]) -> None:
+        if not trigger_field:
+            self.full_requested = True
+            return
+        # The field's value changed: re-read it and re-run its readers.
+        self.values.invalidate(trigger_field)
+        if trigger_field not in self.queued:
+            self.queued.add(trigger_field)
+            heapq.heappush(self.pending, (self.graph.rank(trigger_field), trigger_field))
+
+
+# Evaluations in progress, keyed by page identity.  Value effects make the
+# widgets emit change signals that call back into ``evaluate_all_rules``;
+# those calls are queued on the running evaluation instead of recursing.
+_ACTIVE_EVALUATIONS: Dict[int, _Evaluation] = {}
+# Upper bound on cascaded field changes handled by one evaluation.
+_MAX_CASCADE_STEPS = 256
+
+
+def evaluate_all_rules(
+    page: Any,
+    trigger_field: str | None = None,
+    extra_rule_lists: Optional[List[List[SimpleRuleSpec]]] = None,
+) -> None:
+    """
+    Evaluate all simple rules for the page.
+
+    Parameters
+    ----------
+    page:
+        The Config page instance (or adapter) exposing ``field_widgets`` and
+        UIAdapter methods used by simple rules.
+    trigger_field:
+        Optional field identifier that has just changed.  When provided, only
+        rules reading that field are executed, followed by the rules reading
+        any field they changed; when ``None``, rules for all trigger fields
+        are evaluated using the current widget values.
+    """
+    active = _ACTIVE_EVALUATIONS.get(id(page))
+    if active is not None:
+        active.request(trigger_field)
+        return
 
-    values["testcase.is_performance"] = is_performance
-    values["testcase.is_stability"] = is_stability
-    values["testcase.is_compatibility"] = is_compatibility
     # Build combined ordered rule list(s): testcase-specific lists first,
     # followed by any extra lists and then the global rule list.  This
     # ordering lets testcase rules define the editable surface while
     # simple rules refine behaviour within that boundary.
-    combined_rules: List[SimpleRuleSpec] = []
-    combined_rules.extend(CUSTOM_TESTCASE_UI_RULES)
-    if extra_rule_lists:
-        for lst in extra_rule_lists:
-            combined_rules.extend(lst or [])
-    combined_rules.extend(CUSTOM_SIMPLE_UI_RULES)
-
-    if trigger_field:
-        apply_rules(trigger_field, values, page, rules=combined_rules)
-        return
+    rule_lists: List[List[SimpleRuleSpec]] = [CUSTOM_TESTCASE_UI_RULES]
+    rule_lists.extend(lst for lst in (extra_rule_lists or []) if lst)
+    rule_lists.append(CUSTOM_SIMPLE_UI_RULES)
+    graph = rule_graph(rule_lists)
+
+    field_widgets: Dict[str, Any] = getattr(page, "field_widgets", {}) or {}
+    values = _RuleValues(field_widgets, _testcase_context(page))
+    evaluation = _Evaluation(graph, values, _EffectBatch(page, values))
+    evaluation.request(trigger_field)
+
+    _ACTIVE_EVALUATIONS[id(page)] = evaluation
+    try:
+        steps = 0
+        while evaluation.pending or (evaluation.full_requested and not evaluation.full_done):
+            if evaluation.full_requested and not evaluation.full_done:
+                # No specific trigger: evaluate rules for all known trigger fields.
+                evaluation.full_done = True
+                for _tf, rules in graph.trigger_groups():
+                    for rule in rules:
+                        evaluation.batch.run(rule, values)
+                continue
+            steps += 1
+            if steps > _MAX_CASCADE_STEPS:
+                logging.warning(
+                    "evaluate_all_rules: dropping %d cascaded field change(s) after %d steps",
+                    len(evaluation.pending),
+                    _MAX_CASCADE_STEPS,
+                )
+                break
+            _rank, changed = heapq.heappop(evaluation.pending)
+            evaluation.queued.discard(changed)
+            for rule in graph.rules_reading(changed):
+                evaluation.batch.run(rule, values)
+    finally:
+        del _ACTIVE_EVALUATIONS[id(page)]
+        evaluation.batch.apply()
+
 
-    # No specific trigger: evaluate rules for all known trigger fields.
-    seen: set[str] = set()
-    for rule in combined_rules:
-        tf = rule.trigger_field
-        if tf in seen:
-            continue
-        seen.add(tf)
-        apply_rules(tf, values, page, rules=combined_rules)
+# Reject read/write cycles in the declared rules when the module loads.
+rule_graph([CUSTOM_TESTCASE_UI_RULES, CUSTOM_SIMPLE_UI_RULES])
 
 
 __all__ = [
     "SimpleFieldEffect",
     "SimpleRuleSpec",
+    "RuleCycleError",
+    "RuleGraph",
+    "rule_graph",
     "CUSTOM_SIMPLE_UI_RULES",
     "CUSTOM_TESTCASE_UI_RULES",
     "apply_rules",
@@ -14,8 +14,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import List
 
-import yaml
-
+from src.util.yaml_cache import load_yaml_file
 from src.util.constants import get_model_config_base
 
 
@@ -36,8 +35,7 @@ def _registry_path() -> Path:
 def load_tools_registry() -> List[ToolSpec]:
     """Return the list of ToolSpec items defined in tools_registry.yaml."""
     path = _registry_path()
-    text = path.read_text(encoding="utf-8")
-    data = yaml.safe_load(text) or {}
+    data = load_yaml_file(path, encodings=("utf-8",)) or {}
     tools_raw = data.get("tools") or []
     specs: list[ToolSpec] = []
     for item in tools_raw:
@@ -12,8 +12,6 @@ from pathlib import Path, PurePosixPath
 from typing import Any, Dict, Iterable, Mapping, Sequence
 from contextlib import ExitStack
 
-import yaml
-
 from PyQt5.QtCore import Qt, QSignalBlocker, pyqtSignal, QObject
 from PyQt5.QtWidgets import (
     QAbstractItemView,
@@ -28,6 +26,7 @@ from PyQt5.QtWidgets import (
 )
 from qfluentwidgets import CardWidget, ComboBox, LineEdit, PushButton, TableWidget
 
+from src.util.yaml_cache import load_yaml_file
 from src.util.constants import AUTH_OPTIONS, OPEN_AUTH
 from src.ui.view.theme import apply_theme, apply_font_and_selection, FORMLIST_CHECKBOX_COL_WIDTH
 
@@ -44,11 +43,7 @@ def _load_view_event_table() -> Dict[str, Any]:
     if not path.exists():
         return {}
     try:
-        text = path.read_text(encoding="utf-8")
-    except Exception:
-        return {}
-    try:
-        data = yaml.safe_load(text) or {}
+        data = load_yaml_file(path, encodings=("utf-8",)) or {}
     except Exception:
         return {}
     if not isinstance(data, dict):
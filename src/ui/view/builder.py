@@ -31,7 +31,7 @@ from src.util.constants import (
 from src.ui.model.options import get_field_choices
 from src.ui.view.common import RfStepSegmentsWidget
 from PyQt5.QtGui import QFont
-import yaml
+from src.util.yaml_cache import load_yaml_file
 
 
 @dataclass
@@ -50,11 +50,7 @@ def _load_yaml_schema(filename: str, *, base: Path | None = None) -> Dict[str, A
     base_dir = base if base is not None else get_model_config_base()
     path = base_dir / filename
     try:
-        text = path.read_text(encoding="utf-8")
-    except Exception:
-        return {}
-    try:
-        data = yaml.safe_load(text) or {}
+        data = load_yaml_file(path, encodings=("utf-8",)) or {}
     except Exception:
         return {}
     return data
@@ -0,0 +1,100 @@
+"""Coalesced rendering for high-volume run logs.
+
+The Run page used to append one HTML fragment per log line, which made the
+GUI thread re-layout the document for every line a chatty test printed.
+:class:`LogViewModel` buffers incoming lines and writes them into a
+``QPlainTextEdit`` in one block per timer tick; the widget's
+``maximumBlockCount`` bounds memory and :class:`LogHighlighter` colours
+lines by level without per-line HTML.  Status messages the runner emits as
+HTML (``<b style=...>``) are still rendered as rich text.
+"""
+
+from __future__ import annotations
+
+import re
+from collections import deque
+from typing import Deque
+
+from PyQt5.QtCore import QObject, QTimer
+from PyQt5.QtGui import QColor, QSyntaxHighlighter, QTextCharFormat
+from PyQt5.QtWidgets import QPlainTextEdit
+
+from src.ui.view.theme.style import LOG_LEVEL_COLORS
+
+__all__ = ["LogHighlighter", "LogViewModel"]
+
+_HTML_LINE_RE = re.compile(r"^\s*<(?:b|span|pre|font|p|div)\b[^>]*>", re.IGNORECASE)
+# ``[ERROR]`` tags as well as the ``| ERROR |`` column of the worker log format.
+_LEVEL_RE = re.compile(r"\[(ERROR|WARNING|INFO|SUCCESS)\]|\|\s*(ERROR|WARNING|CRITICAL)\s*\|", re.IGNORECASE)
+
+
+class LogHighlighter(QSyntaxHighlighter):
+    """Colour plain-text log lines by their level tag."""
+
+    def __init__(self, document) -> None:
+        super().__init__(document)
+        self._formats: dict[str, QTextCharFormat] = {}
+        for level, color in LOG_LEVEL_COLORS.items():
+            fmt = QTextCharFormat()
+            fmt.setForeground(QColor(color))
+            self._formats[level] = fmt
+        self._formats["critical"] = self._formats["error"]
+
+    def highlightBlock(self, text: str) -> None:  # type: ignore[override]
+        match = _LEVEL_RE.search(text)
+        if match is None:
+            return
+        level = (match.group(1) or match.group(2)).lower()
+        self.setFormat(0, len(text), self._formats[level])
+
+
+class LogViewModel(QObject):
+    """Buffer log lines and flush them into ``view`` every ``interval_ms``.
+
+    Lines arriving while the user has scrolled up are appended without
+    moving the viewport; otherwise the view follows the tail.
+    """
+
+    def __init__(self, view: QPlainTextEdit, *, interval_ms: int = 50, max_blocks: int = 2000, parent=None) -> None:
+        super().__init__(parent or view)
+        self._view = view
+        self._view.setMaximumBlockCount(max_blocks)
+        self._view.setUndoRedoEnabled(False)
+        # Lines beyond max_blocks would be trimmed right after insertion.
+        self._pending: Deque[str] = deque(maxlen=max_blocks)
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self.flush)
+
+    def append(self, line: str) -> None:
+        self._pending.append(line)
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def flush(self) -> None:
+        """Write every pending line to the view."""
+        self._timer.stop()
+        if not self._pending:
+            return
+        lines, self._pending = list(self._pending), deque(maxlen=self._pending.maxlen)
+        scrollbar = self._view.verticalScrollBar()
+        follow = scrollbar.value() >= scrollbar.maximum() - 4
+        plain: list[str] = []
+        for line in lines:
+            if _HTML_LINE_RE.match(line):
+                if plain:
+                    self._view.appendPlainText("\n".join(plain))
+                    plain = []
+                self._view.appendHtml(line)
+            else:
+                plain.append(line)
+        if plain:
+            self._view.appendPlainText("\n".join(plain))
+        if follow:
+            scrollbar.setValue(scrollbar.maximum())
+
+    def clear(self) -> None:
+        self._timer.stop()
+        self._pending.clear()
+        self._view.clear()
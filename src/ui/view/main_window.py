@@ -4,6 +4,12 @@ This module hosts the :class:`MainWindow` class and UI-specific helpers
 that were previously defined in ``main.py``.  The goal is to keep
 widget creation, navigation wiring and animations inside the view
 layer so that ``main.py`` can focus on application bootstrap only.
+
+The Report and About pages are registered as :class:`LazyPage`
+placeholders: their modules (the report controller pulls in pandas and
+matplotlib) are imported and the widgets built the first time the page is
+shown or its controller is needed.  Startup steps and page construction are
+accounted in :data:`~src.util.startup_profiler.STARTUP_PROFILER`.
 """
 
 from __future__ import annotations
@@ -12,9 +18,8 @@ from pathlib import Path
 import os
 import traceback
 import logging
-import time
 from contextlib import suppress
-from typing import Annotated
+from typing import Annotated, Any, Callable
 
 from PyQt5.QtWidgets import (
     QAbstractButton,
@@ -44,11 +49,7 @@ from src.ui import SIDEBAR_PAGE_LABELS, SIDEBAR_PAGE_KEYS
 from src.ui.view.case import RvrWifiConfigPage
 from src.ui.view.config.page import CaseConfigPage
 from src.ui.view.run import RunPage
-from src.ui.view.report import ReportView
-from src.ui.view.about import AboutView
 from src.ui.view.account import CompanyLoginPage
-from src.ui.controller.about_ctl import AboutController
-from src.ui.controller.report_ctl import ReportController
 from src.ui.controller.account_ctl import (
     get_configured_ldap_server,
     ldap_authenticate,
@@ -62,6 +63,7 @@ from src.ui.view.theme import BACKGROUND_COLOR, TEXT_COLOR
 from src.ui.controller.tools_ctl import GlobalToolsController
 from src.ui.view.toolbar.tool_bar import GlobalToolsChrome
 from src.ui.view.titlebar.menu_title_bar import MenuTitleBar
+from src.util.startup_profiler import STARTUP_PROFILER
 
 
 def log_exception(exc_type, exc_value, exc_tb) -> None:
@@ -76,6 +78,63 @@ def log_exception(exc_type, exc_value, exc_tb) -> None:
     logging.error("Unhandled exception:\n%s", formatted)
 
 
+class LazyPage(QWidget):
+    """Navigation placeholder that builds its real page on first show.
+
+    ``factory(parent)`` returns ``(widget, controller)``; the widget is placed
+    inside the placeholder so routing, navigation buttons and the stacked
+    widget keep referring to the same object.
+    """
+
+    def __init__(self, name: str, factory: Callable[[QWidget], tuple[QWidget, Any]], parent=None) -> None:
+        super().__init__(parent)
+        self.setObjectName(name)
+        self._factory = factory
+        self._content: QWidget | None = None
+        self._controller: Any = None
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+    @property
+    def is_built(self) -> bool:
+        return self._content is not None
+
+    def content(self) -> QWidget:
+        """Return the real page, building it on first use."""
+        if self._content is None:
+            with STARTUP_PROFILER.measure(self.objectName(), page=True):
+                self._content, self._controller = self._factory(self)
+            self.layout().addWidget(self._content)
+        return self._content
+
+    def controller(self) -> Any:
+        self.content()
+        return self._controller
+
+    def showEvent(self, event) -> None:
+        self.content()
+        super().showEvent(event)
+
+
+def _build_report_page(parent: QWidget) -> tuple[QWidget, Any]:
+    from src.ui.view.report import ReportView
+    from src.ui.controller.report_ctl import ReportController
+
+    view = ReportView(parent)
+    return view, ReportController(view)
+
+
+def _build_about_page(parent: QWidget) -> tuple[QWidget, Any]:
+    from src.ui.view.about import AboutView
+    from src.ui.controller.about_ctl import AboutController
+
+    view = AboutView(parent)
+    # Attach behaviour from the controller (migrated from the old AboutPage)
+    controller = AboutController(view)
+    controller.populate_metadata()
+    return view, controller
+
+
 class MainWindow(FluentWindow):
     """Main application window for the Wi-Fi Test Tool.
 
@@ -85,9 +144,8 @@ class MainWindow(FluentWindow):
     """
 
     def __init__(self) -> None:
-        self._startup_t0 = time.perf_counter()
         super().__init__()
-        print(f"[STARTUP_TIME] MainWindow.__init__ start: 0.000s")
+        STARTUP_PROFILER.mark("MainWindow.__init__ start")
         self._deferred_init_done = False
         self.setTitleBar(MenuTitleBar(self))
         self.setWindowIcon(QIcon("res/logo/wifi.ico"))
@@ -98,7 +156,7 @@ class MainWindow(FluentWindow):
         self.resize(width, height)
         self.setMinimumSize(width, height)
         self.center_window()
-        print(f"[STARTUP_TIME] MainWindow.geometry: {time.perf_counter() - self._startup_t0:.3f}s")
+        STARTUP_PROFILER.mark("MainWindow.geometry")
 
         self._loading_page = QWidget(self)
         loading_layout = QVBoxLayout(self._loading_page)
@@ -108,7 +166,7 @@ class MainWindow(FluentWindow):
         loading_layout.addStretch(1)
         self.stackedWidget.addWidget(self._loading_page)
         self.stackedWidget.setCurrentWidget(self._loading_page)
-        print(f"[STARTUP_TIME] MainWindow.loading_page: {time.perf_counter() - self._startup_t0:.3f}s")
+        STARTUP_PROFILER.mark("MainWindow.loading_page")
 
         self._active_account: dict | None = None
 
@@ -144,7 +202,7 @@ class MainWindow(FluentWindow):
 
         self._show_group.finished.connect(_restore)
         # Start the animation once the window is shown (see showEvent).
-        print(f"[STARTUP_TIME] MainWindow.__init__ end: {time.perf_counter() - self._startup_t0:.3f}s")
+        STARTUP_PROFILER.mark("MainWindow.__init__ end")
 
     def showEvent(self, event) -> None:
         super().showEvent(event)
@@ -152,41 +210,45 @@ class MainWindow(FluentWindow):
             return
         self._deferred_init_done = True
         self._show_group.start()
-        print(f"[STARTUP_TIME] MainWindow.showEvent: {time.perf_counter() - self._startup_t0:.3f}s")
+        STARTUP_PROFILER.mark("MainWindow.showEvent")
         QTimer.singleShot(0, self._deferred_init)
 
+    def _start_worker_pool(self) -> None:
+        try:
+            from src.ui.controller.worker_pool import start_worker_pool
+
+            start_worker_pool()
+        except Exception as exc:
+            logging.warning("Failed to start pytest worker pool: %s", exc)
+
     def _deferred_init(self) -> None:
         """Initialize heavyweight UI pieces after the window is visible."""
-        t_step = time.perf_counter()
         # Global tools (toolbar + side panel)
-        tool_specs = load_tools_registry()
-        print(f"[STARTUP_TIME] load_tools_registry: {time.perf_counter() - t_step:.3f}s")
-        t_step = time.perf_counter()
-        self._tools_chrome = GlobalToolsChrome(self.stackedWidget, tool_specs)
-        print(f"[STARTUP_TIME] GlobalToolsChrome: {time.perf_counter() - t_step:.3f}s")
+        with STARTUP_PROFILER.measure("load_tools_registry"):
+            tool_specs = load_tools_registry()
+        with STARTUP_PROFILER.measure("GlobalToolsChrome"):
+            self._tools_chrome = GlobalToolsChrome(self.stackedWidget, tool_specs)
         self.global_tools_bar_frame = self._tools_chrome.bar_frame
         self.global_tools_bar = self._tools_chrome.bar
         self.global_tools_panel = self._tools_chrome.panel
         self.global_tools_bar_frame.show()
         self.global_tools_bar_frame.raise_()
         self._update_global_tools_geometry()
-        t_step = time.perf_counter()
-        self.global_tools_controller = GlobalToolsController(
-            self, self.global_tools_bar, self.global_tools_panel, tool_specs
-        )
-        print(f"[STARTUP_TIME] GlobalToolsController: {time.perf_counter() - t_step:.3f}s")
+        with STARTUP_PROFILER.measure("GlobalToolsController"):
+            self.global_tools_controller = GlobalToolsController(
+                self, self.global_tools_bar, self.global_tools_panel, tool_specs
+            )
 
         # Pages
-        t_step = time.perf_counter()
-        self.login_page = CompanyLoginPage(self)
+        with STARTUP_PROFILER.measure("account", page=True):
+            self.login_page = CompanyLoginPage(self)
         self.login_page.loginResult.connect(self._on_login_result)
         self.login_page.logoutRequested.connect(self._on_logout_requested)
-        print(f"[STARTUP_TIME] CompanyLoginPage: {time.perf_counter() - t_step:.3f}s")
 
-        t_step = time.perf_counter()
-        self.caseConfigPage = CaseConfigPage(self.on_run)
-        self.rvr_wifi_config_page = RvrWifiConfigPage()
-        print(f"[STARTUP_TIME] CaseConfigPage+RvrWifiConfigPage: {time.perf_counter() - t_step:.3f}s")
+        with STARTUP_PROFILER.measure("config", page=True):
+            self.caseConfigPage = CaseConfigPage(self.on_run)
+        with STARTUP_PROFILER.measure("case", page=True):
+            self.rvr_wifi_config_page = RvrWifiConfigPage()
 
         # Keep RvR Wi-Fi Case page in sync with the selected CSV from
         # the Config page.
@@ -196,14 +258,13 @@ class MainWindow(FluentWindow):
         initial_csv = self.caseConfigPage.selected_csv_path
         if initial_csv:
             self.rvr_wifi_config_page.on_csv_file_changed(initial_csv)
-        self.run_page = RunPage("", parent=self)
-        # Ensure run page starts empty
-        self.run_page.reset()
+        with STARTUP_PROFILER.measure("run", page=True):
+            self.run_page = RunPage("", parent=self)
+            # Ensure run page starts empty
+            self.run_page.reset()
         self._silent_init_mysql()
-        # Report page (disabled until report_dir created)
-        self.report_view = ReportView(self)
-        self.report_ctl = ReportController(self.report_view)
-        print(f"[STARTUP_TIME] Pages (run+report): {time.perf_counter() - self._startup_t0:.3f}s")
+        # Report page (disabled until report_dir created); built on first use.
+        self.report_view = LazyPage("report", _build_report_page, self)
 
         # Navigation buttons
         # Logical sidebar keys (top -> bottom): account, config, case, run, report, about
@@ -254,9 +315,7 @@ class MainWindow(FluentWindow):
 
         self.last_report_dir = None
 
-        self.about_page = AboutView(self)
-        # Attach behaviour from the controller (migrated from the old AboutPage)
-        self.about_ctl = AboutController(self.about_page)
+        self.about_page = LazyPage("about", _build_about_page, self)
         self.about_nav_button = self._create_sidebar_button(
             "about",
             self.about_page,
@@ -308,6 +367,8 @@ class MainWindow(FluentWindow):
         self._init_menu_bar()
 
         QTimer.singleShot(500, self._silent_init_mysql)
+        # Warm pytest workers in the background so Run starts without import cost.
+        QTimer.singleShot(1500, self._start_worker_pool)
 
         # Backward compatibility fields
         self._run_nav_button = self.run_nav_button
@@ -321,7 +382,8 @@ class MainWindow(FluentWindow):
         self.setMicaEffectEnabled(True)
         # Position global tools after initial layout
         self._update_global_tools_geometry()
-        print(f"[STARTUP_TIME] MainWindow.deferred_init done: {time.perf_counter() - self._startup_t0:.3f}s")
+        STARTUP_PROFILER.mark("MainWindow.deferred_init done")
+        STARTUP_PROFILER.report()
 
     def _init_menu_bar(self) -> None:
         menu_bar = self.titleBar.menu_bar
@@ -603,9 +665,23 @@ class MainWindow(FluentWindow):
         clear_auth_state()
         self.login_page.set_status_message("Signed out. Please sign in again.", state="info")
 
+    @property
+    def report_ctl(self):
+        """Report controller; builds the Report page on first access."""
+        return self.report_view.controller()
+
+    @property
+    def about_ctl(self):
+        """About controller; builds the About page on first access."""
+        return self.about_page.controller()
+
     def refresh_about_metadata(self) -> None:
-        """Refresh the About page metadata, including total test duration."""
-        self.about_ctl.populate_metadata()
+        """Refresh the About page metadata, including total test duration.
+
+        An unbuilt About page is skipped; it populates itself when first shown.
+        """
+        if self.about_page.is_built:
+            self.about_ctl.populate_metadata()
 
     # ------------------------------------------------------------------
     # RVR Wi-Fi page animation
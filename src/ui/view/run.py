@@ -16,19 +16,27 @@ import sys
 from pathlib import Path
 from contextlib import suppress
 import logging, time
-import json
 from collections import deque
 
 from PyQt5.QtCore import QEvent, Qt, QTimer, QEasingCurve, QUrl, QPoint, QSize
-from PyQt5.QtGui import QTextCursor, QDesktopServices, QIcon
-from PyQt5.QtWidgets import QApplication, QFrame, QHBoxLayout, QLabel, QTextEdit, QVBoxLayout
+from PyQt5.QtGui import QDesktopServices, QIcon
+from PyQt5.QtWidgets import QApplication, QFrame, QHBoxLayout, QLabel, QPlainTextEdit, QVBoxLayout
 from qfluentwidgets import CardWidget, PushButton, StrongBodyLabel, MessageBox
 from http.server import HTTPServer, SimpleHTTPRequestHandler
 from PyQt5 import sip
 from src.util.constants import get_src_base, Paths
-from src.ui.controller.run_ctl import CaseRunner, ExcelPlanRunner
-
-from src.ui.view.theme import ACCENT_COLOR, CONTROL_HEIGHT, FONT_FAMILY, apply_theme, format_log_html
+from src.ui.controller.run_ctl import CaseRunner, ExcelPlanRunner, MultiDutRunner
+
+from src.ui.view.theme import ACCENT_COLOR, CONTROL_HEIGHT, FONT_FAMILY, apply_theme
+from src.ui.view.log_view import LogHighlighter, LogViewModel
+from src.util.run_events import (
+    CaseFinished,
+    CaseProgress,
+    CaseStarted,
+    FixtureParams,
+    PlanEstimate,
+    RemainingEstimate,
+)
 from src.ui.view.common import animate_progress_fill, attach_view_to_page
 from src.util.constants import get_config_base
 
@@ -89,10 +97,11 @@ class RunView(CardWidget):
         layout.addWidget(self.case_path_label)
 
         # Log area
-        self.log_area = QTextEdit(self)
+        self.log_area = QPlainTextEdit(self)
         self.log_area.setReadOnly(True)
         self.log_area.setMinimumHeight(400)
         apply_theme(self.log_area)
+        self.log_highlighter = LogHighlighter(self.log_area.document())
         layout.addWidget(self.log_area, stretch=5)
 
         # Floating button (bottom-right of log area) to open the
@@ -308,8 +317,9 @@ class RunPage(CardWidget):
 
         self.case_path_label: StrongBodyLabel = self.view.case_path_label
         self.case_path_label.setText(self.display_case_path)
-        self.log_area: QTextEdit = self.view.log_area
-        self.log_area.document().setMaximumBlockCount(2000)
+        self.log_area: QPlainTextEdit = self.view.log_area
+        # Lines are buffered and written to the view every 50 ms.
+        self.log_model = LogViewModel(self.log_area, interval_ms=50, max_blocks=2000, parent=self)
         self.case_info_label: QLabel = self.view.case_info_label
         self.process: QFrame = self.view.process
         self.process_fill: QFrame = self.view.process_fill
@@ -437,57 +447,39 @@ class RunPage(CardWidget):
             # 记录当前日志
             self._excel_log_cache.append((msg, current_time))
 
-        # Extract raw PYQT markers from log lines that include timestamps/prefixes.
-        marker_index = msg.find("[PYQT_")
-        marker = msg[marker_index:] if marker_index != -1 else msg
+        self.log_model.append(msg)
 
-        if marker.startswith("[PYQT_FIX]"):
-            info = json.loads(marker[len("[PYQT_FIX]") :])
-            name = str(info.get("fixture", "")).strip()
-            params = str(info.get("params", "")).strip()
+    def _on_run_event(self, event) -> None:
+        """Update the case info and remaining-time widgets from a worker event."""
+        if isinstance(event, FixtureParams):
+            name = event.fixture.strip()
+            params = event.params.strip()
             if name and params:
                 self._fixture_upsert(name, params)
-            return
-        if marker.startswith("[PYQT_CASE]"):
-            fn = marker[len("[PYQT_CASE]") :].strip()
+        elif isinstance(event, CaseStarted):
+            fn = event.name.strip()
             if fn != getattr(self, "_case_fn", ""):
                 self._case_fn = fn
                 self._fixture_chain = []
             self._case_name_base = f"Current case : {fn}"
             self._rebuild_case_info_label()
-            return
-        if marker.startswith("[PYQT_CASEINFO]"):
-            info = json.loads(marker[len("[PYQT_CASEINFO]") :])
-            fixtures = info.get("fixtures") or []
-            self._current_has_fixture = bool(fixtures)
-            self._update_remaining_time_label()
-            return
-        if marker.startswith("[PYQT_CASETIME]"):
-            try:
-                duration_ms = int(marker[len("[PYQT_CASETIME]") :])
-            except ValueError:
-                return
+        elif isinstance(event, CaseFinished):
             self.finished_count += 1
-            self._duration_sum += duration_ms
+            self._duration_sum += event.duration_ms
             self.avg_case_duration = self._duration_sum / self.finished_count
             self._update_remaining_time_label()
-            return
-        if marker.startswith("[PYQT_PROGRESS]"):
-            parts = marker[len("[PYQT_PROGRESS]") :].strip().split("/")
-            if len(parts) == 2:
-                with suppress(ValueError):
-                    self.finished_count = int(parts[0])
-                    self.total_count = int(parts[1])
+        elif isinstance(event, CaseProgress):
+            self.finished_count = event.finished
+            self.total_count = event.total
             self._update_remaining_time_label()
-            return
-        html = format_log_html(msg)
-        self.log_area.append(html)
-        doc = self.log_area.document()
-        if doc.blockCount() > 5000:
-            cursor = QTextCursor(doc.firstBlock())
-            cursor.select(QTextCursor.BlockUnderCursor)
-            cursor.removeSelectedText()
-            cursor.deleteChar()
+        elif isinstance(event, RemainingEstimate):
+            # The step model supersedes the per-case average for this case.
+            self._step_estimate_active = True
+            self._restart_remaining_timer(event.remaining_s + self._plan_queued_s)
+        elif isinstance(event, PlanEstimate):
+            self._step_estimate_active = False
+            self._plan_queued_s = event.queued_s
+            self._restart_remaining_timer(event.current_s + event.queued_s)
 
     def _format_hms(self, seconds: int) -> str:
         s = max(0, int(seconds))
@@ -505,6 +497,13 @@ class RunPage(CardWidget):
         if not self._remaining_time_timer.isActive():
             self._remaining_time_timer.start()
 
+    def _restart_remaining_timer(self, seconds: float) -> None:
+        if int(seconds) <= 0:
+            return
+        self._remaining_overtime = False
+        self._overtime_seconds = 0
+        self._start_remaining_timer(int(seconds))
+
     def _stop_remaining_timer(self) -> None:
         self._remaining_time_timer.stop()
         self._remaining_overtime = False
@@ -535,12 +534,14 @@ class RunPage(CardWidget):
         self.remaining_time_label.setText(self._format_hms(self._remaining_seconds))
 
     def _update_remaining_time_label(self) -> None:
+        if self._step_estimate_active:
+            return
         remaining_cases = max(self.total_count - self.finished_count, 0)
         if remaining_cases <= 0:
             self._stop_remaining_timer()
             return
 
-        remaining_ms = self.avg_case_duration * remaining_cases
+        remaining_ms = self.avg_case_duration * remaining_cases + self._plan_queued_s * 1000
         seconds = int(remaining_ms // 1000) if remaining_ms > 0 else -1
         if seconds > 0:
             self._start_remaining_timer(seconds)
@@ -581,10 +582,12 @@ class RunPage(CardWidget):
     def reset(self) -> None:
         with suppress(Exception):
             self.cleanup()
-        self.log_area.clear()
+        self.log_model.clear()
         self.update_progress(0)
         self.remaining_time_label.hide()
         self._stop_remaining_timer()
+        self._step_estimate_active = False
+        self._plan_queued_s = 0.0
         self._case_fn = ""
         self._case_name_base = "Current case : "
         self._fixture_chain: list[tuple[str, str]] = []
@@ -708,23 +711,39 @@ class RunPage(CardWidget):
             # 连接最终完成信号（原有）
             self.runner.finished_signal.connect(self._finalize_runner)
         else:
-            # --- Mode 2: Run Single Case (Original Logic) ---
-            print(f"[DEBUG] Branch taken: Creating CaseRunner for '{self.case_path}'")
-            self.runner = CaseRunner(
-                self.case_path,
-                account_name=account_name,
-                display_case_path=self.display_case_path
-            )
+            from src.util.constants import load_config
+            from src.util.lab_resources import dut_targets, multi_dut_enabled
+
+            cfg = load_config(refresh=True)
+            targets = dut_targets(cfg) if multi_dut_enabled(cfg) else []
+            if targets:
+                # --- Mode 3: same case on every attached DUT ---
+                print(f"[DEBUG] Branch taken: Creating MultiDutRunner for '{self.case_path}' on {len(targets)} DUT(s)")
+                self.runner = MultiDutRunner(
+                    self.case_path,
+                    targets,
+                    account_name=account_name,
+                    display_case_path=self.display_case_path,
+                )
+            else:
+                # --- Mode 2: Run Single Case (Original Logic) ---
+                print(f"[DEBUG] Branch taken: Creating CaseRunner for '{self.case_path}'")
+                self.runner = CaseRunner(
+                    self.case_path,
+                    account_name=account_name,
+                    display_case_path=self.display_case_path
+                )
         #self.runner = CaseRunner(self.case_path, account_name=account_name, display_case_path=self.display_case_path)
 
         # # Connect signals for both runners
         self.runner.log_signal.connect(self._append_log)
         self.runner.progress_signal.connect(self.update_progress)
+        self.runner.event_signal.connect(self._on_run_event)
         with suppress(Exception):
             self.runner.report_dir_signal.connect(self._on_report_dir_ready)
         if isinstance(self.runner, ExcelPlanRunner):
             self.runner.finished_signal.connect(self._finalize_runner)
-        elif isinstance(self.runner, CaseRunner):
+        elif isinstance(self.runner, (CaseRunner, MultiDutRunner)):
             self.runner.finished.connect(self._finalize_runner)
         else:
             raise TypeError(f"Unknown runner type: {type(self.runner)}")
@@ -778,7 +797,7 @@ class RunPage(CardWidget):
         if isinstance(runner, ExcelPlanRunner):
             with suppress((TypeError, RuntimeError)):
                 runner.finished_signal.disconnect(self._finalize_runner)
-        elif isinstance(runner, CaseRunner):
+        elif isinstance(runner, (CaseRunner, MultiDutRunner)):
             with suppress((TypeError, RuntimeError)):
                 runner.finished.disconnect(self._finalize_runner)
 
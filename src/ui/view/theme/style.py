@@ -123,18 +123,21 @@ def apply_font_and_selection(
     view.viewport().update()
 
 
+#: Colour of log lines tagged ``[ERROR]``, ``[WARNING]``, ``[INFO]`` or ``[SUCCESS]``.
+LOG_LEVEL_COLORS = {
+    "error": "#ff6b6b",
+    "warning": "#facc15",
+    "info": "#a6e3ff",
+    "success": "#6ee7b7",
+}
+
+
 def format_log_html(message: str) -> str:
     theme = _theme_module()
     base_style = theme.STYLE_BASE
     text_color = theme.TEXT_COLOR
-    colors = {
-        "error": "#ff6b6b",
-        "warning": "#facc15",
-        "info": "#a6e3ff",
-        "success": "#6ee7b7",
-    }
     upper_msg = message.upper()
-    for token, color in colors.items():
+    for token, color in LOG_LEVEL_COLORS.items():
         if f"[{token.upper()}]" in upper_msg:
             return f"<span style='{base_style} color:{color};'>{message}</span>"
     return f"<span style='{base_style} color:{text_color};'>{message}</span>"
@@ -4,11 +4,12 @@
 # @Author  : chao.li
 # @File    : __init__.py.py
 
-from typing import Any, Iterable
+import math
+from typing import Any, Iterable, Optional, Sequence
 
 from .constants import Paths, RouterConst, RokuConst
 
-__all__ = ["Paths", "RouterConst", "RokuConst", "parse_host_list"]
+__all__ = ["Paths", "RouterConst", "RokuConst", "parse_host_list", "percentile"]
 
 
 def parse_host_list(raw: Any) -> tuple[str, ...]:
@@ -33,3 +34,17 @@ def parse_host_list(raw: Any) -> tuple[str, ...]:
         seen.add(text)
         hosts.append(text)
     return tuple(hosts)
+
+
+def percentile(samples: Sequence[float], fraction: float) -> Optional[float]:
+    """Return the linearly interpolated ``fraction`` percentile of ``samples``."""
+
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    position = (len(ordered) - 1) * min(max(fraction, 0.0), 1.0)
+    lower = math.floor(position)
+    upper = math.ceil(position)
+    if lower == upper:
+        return ordered[lower]
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
@@ -0,0 +1,36 @@
+"""Atomic replacement of small state and cache files.
+
+Summaries, cost models and cache entries are rewritten while other
+processes may read them.  :func:`atomic_write` writes a temporary sibling
+and renames it over the target, so readers see either the old or the new
+content, never a partial file.
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+from contextlib import suppress
+from pathlib import Path
+
+__all__ = ["atomic_write"]
+
+
+def atomic_write(path: str | os.PathLike[str], data: str | bytes, *, encoding: str = "utf-8") -> None:
+    """Replace ``path`` with ``data`` (text is encoded with ``encoding``).
+
+    The parent directory must exist.  Raises ``OSError`` when the file cannot
+    be written; the temporary file is removed in that case.
+    """
+
+    target = Path(path)
+    payload = data.encode(encoding) if isinstance(data, str) else data
+    fd, tmp_name = tempfile.mkstemp(dir=str(target.parent), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(payload)
+        os.replace(tmp_name, target)
+    except BaseException:
+        with suppress(OSError):
+            os.unlink(tmp_name)
+        raise
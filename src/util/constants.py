@@ -2,21 +2,23 @@
 import sys
 import json
 import shutil
-from functools import lru_cache
 import yaml
 import re
 import logging
 import copy
 import signal
 import tempfile
+import threading
 from src.tools.connect_tool import command_batch as subprocess
 import atexit
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Final, Mapping
+from typing import Any, Final, Iterator, Mapping
 from contextlib import suppress
 
+from src.util.yaml_cache import load_yaml_file
+
 # Default RF attenuation spec (start,stop:step format).
 # Shared by UI and performance modules to avoid scattered literals.
 DEFAULT_RF_STEP_SPEC: Final[str] = "0,75:3"
@@ -128,6 +130,10 @@ BASIC_SECTION_KEYS: Final[frozenset[str]] = frozenset(
         "router",
         # Shared throughput generator configuration.
         "rvr",
+        # Parallel per-DUT execution (see src.util.lab_resources).
+        "multi_dut",
+        "plan_execution",
+        "worker_pool",
     }
 )
 DUT_SECTION_KEYS = BASIC_SECTION_KEYS
@@ -717,13 +723,11 @@ def _read_yaml_dict(path: Path) -> dict[str, Any]:
         logging.debug("Config file %s does not exist; using empty mapping", path)
         return {}
     try:
-        content = path.read_text(encoding="utf-8")
+        data = load_yaml_file(path, encodings=("utf-8",)) or {}
     except (
-        Exception
+        OSError, UnicodeDecodeError
     ) as exc:  # pragma: no cover - file permission issues are environment-dependent
         raise RuntimeError(f"Failed to read config file {path}: {exc}") from exc
-    try:
-        data = yaml.safe_load(content) or {}
     except yaml.YAMLError as exc:
         raise RuntimeError(f"Failed to parse YAML file {path}: {exc}") from exc
     if not isinstance(data, Mapping):
@@ -749,46 +753,116 @@ def _write_yaml_dict(path: Path, payload: Mapping[str, Any]) -> None:
         raise RuntimeError(f"Failed to write config file {path}: {exc}") from exc
 
 
-@lru_cache(maxsize=None)
-def _load_config_cached(base_dir: str) -> dict[str, Any]:
-    """Load configuration sections from disk and merge them."""
-    config_dir = Path(base_dir)
-    basic_path = config_dir / BASIC_CONFIG_FILENAME
-    execution_path = config_dir / EXECUTION_CONFIG_FILENAME
-    stability_path = config_dir / STABILITY_CONFIG_FILENAME
-    tool_path = config_dir / TOOL_CONFIG_FILENAME
-    compatibility_path = config_dir / COMPATIBILITY_CONFIG_FILENAME
-    toolbar_path = config_dir / TOOLBAR_CONFIG_FILENAME
-    required_paths = [
-        basic_path,
-        execution_path,
-        stability_path,
-        tool_path,
-        compatibility_path,
-        toolbar_path,
-    ]
-    missing = [str(path) for path in required_paths if not path.exists()]
-    if missing:
-        raise RuntimeError(
-            "Missing required config file(s): "
-            + ", ".join(missing)
-            + f" (config base: {config_dir})"
-        )
-    basic_section = _read_yaml_dict(basic_path)
-    execution_section = _read_yaml_dict(execution_path)
-    stability_section = _read_yaml_dict(stability_path)
-    tool_section = _read_yaml_dict(tool_path)
-    compatibility_section = _read_yaml_dict(compatibility_path)
-    toolbar_section = _read_yaml_dict(toolbar_path)
-    logging.debug("compatibility section loaded: %s", compatibility_section)
-    return merge_config_sections(
-        basic_section,
-        execution_section,
-        stability_section,
-        compatibility_section,
-        tool_section,
-        toolbar_section,
-    )
+class FrozenConfig(Mapping[str, Any]):
+    """Read-only view of a cached configuration tree.
+
+    Nested mappings are wrapped on access and lists are returned as tuples,
+    so the view shares structure with the cache instead of copying it.  Use
+    :meth:`thaw` to get a mutable deep copy for editing and ``save_config``.
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data: Mapping[str, Any]) -> None:
+        self._data = data
+
+    def __getitem__(self, key: str) -> Any:
+        return _freeze(self._data[key])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return f"FrozenConfig({self._data!r})"
+
+    def thaw(self) -> dict[str, Any]:
+        """Return a mutable deep copy."""
+        return copy.deepcopy(dict(self._data))
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, Mapping):
+        return FrozenConfig(value)
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+# Parsed YAML per file and merged tree per config dir, each stored with the
+# (mtime_ns, size) stamps it was built from.  A refresh only re-stats the
+# files and re-parses the ones whose stamp changed.
+_CONFIG_FILE_CACHE: dict[str, tuple[tuple[int, int], dict[str, Any]]] = {}
+_CONFIG_MERGED_CACHE: dict[str, tuple[tuple[tuple[int, int], ...], dict[str, Any]]] = {}
+_CONFIG_CACHE_LOCK = threading.RLock()
+
+
+def _config_stamp(path: Path) -> tuple[int, int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _read_yaml_dict_cached(path: Path, stamp: tuple[int, int]) -> dict[str, Any]:
+    key = str(path)
+    cached = _CONFIG_FILE_CACHE.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    data = _read_yaml_dict(path)
+    _CONFIG_FILE_CACHE[key] = (stamp, data)
+    return data
+
+
+def _invalidate_config_cache() -> None:
+    with _CONFIG_CACHE_LOCK:
+        _CONFIG_FILE_CACHE.clear()
+        _CONFIG_MERGED_CACHE.clear()
+
+
+def _load_config_cached(base_dir: str, *, validate: bool = False) -> dict[str, Any]:
+    """Return the merged configuration of *base_dir* (shared, do not mutate).
+
+    Without *validate* an existing merged tree is returned as is; with it the
+    file stamps are checked first and changed files are re-parsed.
+    """
+    with _CONFIG_CACHE_LOCK:
+        cached = _CONFIG_MERGED_CACHE.get(base_dir)
+        if cached is not None and not validate:
+            return cached[1]
+        config_dir = Path(base_dir)
+        required_paths = [
+            config_dir / BASIC_CONFIG_FILENAME,
+            config_dir / EXECUTION_CONFIG_FILENAME,
+            config_dir / STABILITY_CONFIG_FILENAME,
+            config_dir / COMPATIBILITY_CONFIG_FILENAME,
+            config_dir / TOOL_CONFIG_FILENAME,
+            config_dir / TOOLBAR_CONFIG_FILENAME,
+        ]
+        stamps = [_config_stamp(path) for path in required_paths]
+        missing = [str(path) for path, stamp in zip(required_paths, stamps) if stamp is None]
+        if missing:
+            raise RuntimeError(
+                "Missing required config file(s): "
+                + ", ".join(missing)
+                + f" (config base: {config_dir})"
+            )
+        key = tuple(stamps)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        # merge_config_sections may adjust nested mappings in place, so it
+        # works on copies and the per-file cache stays pristine.
+        sections = [
+            copy.deepcopy(_read_yaml_dict_cached(path, stamp))
+            for path, stamp in zip(required_paths, stamps)
+        ]
+        logging.debug("compatibility section loaded: %s", sections[3])
+        merged = merge_config_sections(*sections)
+        _CONFIG_MERGED_CACHE[base_dir] = (key, merged)
+        return merged
 
 
 def load_config(
@@ -798,16 +872,29 @@ def load_config(
 ) -> dict[str, Any]:
     """Return a deep-copied configuration dictionary including stability data.
 
-    Set ``refresh=True`` to discard the cached content and re-read from disk.
+    Set ``refresh=True`` to pick up changes on disk; files whose mtime and
+    size are unchanged are not parsed again.  Read-only callers should
+    prefer :func:`config_snapshot`, which skips the deep copy.
     """
     config_base = Path(base_dir) if base_dir is not None else get_config_base()
-    cache_key = str(config_base.resolve())
-    if refresh:
-        _load_config_cached.cache_clear()
-    data = _load_config_cached(cache_key)
+    data = _load_config_cached(str(config_base.resolve()), validate=refresh)
     return copy.deepcopy(data)
 
 
+def config_snapshot(
+    refresh: bool = False,
+    *,
+    base_dir: str | os.PathLike[str] | None = None,
+) -> FrozenConfig:
+    """Return an immutable view of the configuration without copying it.
+
+    ``refresh`` behaves as in :func:`load_config`; call
+    :meth:`FrozenConfig.thaw` when a mutable copy is needed.
+    """
+    config_base = Path(base_dir) if base_dir is not None else get_config_base()
+    return FrozenConfig(_load_config_cached(str(config_base.resolve()), validate=refresh))
+
+
 def _coerce_truthy(value: Any) -> bool:
     if isinstance(value, str):
         return value.strip().lower() in {"1", "true", "yes", "on"}
@@ -921,7 +1008,7 @@ def save_config(
         toolbar_section,
         base_dir=base_dir,
     )
-    _load_config_cached.cache_clear()
+    _invalidate_config_cache()
 
 
 def get_telnet_connect_window(
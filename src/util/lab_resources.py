@@ -0,0 +1,324 @@
+"""Shared lab resources and the lock model used for multi-DUT runs.
+
+One pytest worker runs per DUT.  Before a worker starts, its runner claims
+the lab resources the case needs, and cases whose claims do not conflict
+run concurrently:
+
+* ``router`` -- shared while a case only connects to the configured router,
+  exclusive while it reconfigures it or power-cycles APs.
+* ``attenuator`` and ``turntable`` -- always exclusive (RF control).
+* ``serial`` -- exclusive while the serial console (``serial_port.status``)
+  is enabled: there is one configured port, and only one worker can hold it.
+* ``dut:<label>`` -- implicit exclusive claim, so one DUT never runs two
+  cases at once.
+
+Needs are derived from the case path (performance/RvR/RvO cases take RF
+control, compatibility cases own the router, everything else shares it)
+and can be overridden per case stem in ``multi_dut.resources``::
+
+    multi_dut:
+      enabled: true
+      devices:
+        - {type: Android, device: SERIAL1}
+        - {type: Linux, ip: 192.168.1.20}
+      resources:
+        test_switch_wifi_str: {router: shared}
+
+Excel plans run rows concurrently when ``plan_execution.max_parallel`` is
+above one.  A row's claims come from its ``Resources`` column or from a
+``pytest.mark.lab_resources("router:shared", "serial")`` marker in the
+script; undeclared rows also claim the whole ``dut`` so they keep the old
+one-at-a-time behaviour.  :class:`ConflictSchedule` orders conflicting rows
+by plan position and lets the rest overlap.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path, PurePath
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence
+
+__all__ = [
+    "LAB_RESOURCES",
+    "LAB_LOCKS",
+    "DutTarget",
+    "ResourceClaim",
+    "ResourceLockManager",
+    "ConflictSchedule",
+    "case_resources",
+    "claims_conflict",
+    "declared_resources",
+    "dut_targets",
+    "multi_dut_enabled",
+    "parse_resource_spec",
+    "plan_parallelism",
+]
+
+#: Resources understood by :func:`case_resources`.
+LAB_RESOURCES = ("router", "attenuator", "turntable", "serial")
+
+_RF_CONTROL_HINTS = ("performance", "rvr", "rvo", "peak_throughput")
+_ROUTER_OWNER_HINTS = ("compatibility",)
+_SPEC_SPLIT_RE = re.compile(r"[,;\s]+")
+_MARKER_RE = re.compile(r"mark\.lab_resources\(([^)]*)\)")
+_MARKER_ARG_RE = re.compile(r"[\"']([^\"']+)[\"']")
+
+
+@dataclass(frozen=True)
+class ResourceClaim:
+    """A shared or exclusive claim on one lab resource."""
+
+    name: str
+    exclusive: bool = True
+
+    def conflicts(self, other_exclusive: bool) -> bool:
+        return self.exclusive or other_exclusive
+
+    def describe(self) -> str:
+        return f"{self.name}({'exclusive' if self.exclusive else 'shared'})"
+
+
+@dataclass(frozen=True)
+class DutTarget:
+    """One attached DUT: ``kind`` is ``Android`` (ADB serial) or ``Linux`` (telnet IP)."""
+
+    kind: str
+    address: str
+
+    @property
+    def label(self) -> str:
+        """File-system safe identifier used for report folders and lock names."""
+
+        return re.sub(r"[^A-Za-z0-9_.-]+", "_", self.address) or self.kind
+
+    def claim(self) -> ResourceClaim:
+        return ResourceClaim(f"dut:{self.label}", True)
+
+
+def multi_dut_enabled(config: Mapping[str, Any] | None) -> bool:
+    section = config.get("multi_dut") if isinstance(config, Mapping) else None
+    return isinstance(section, Mapping) and bool(section.get("enabled"))
+
+
+def dut_targets(config: Mapping[str, Any] | None) -> List[DutTarget]:
+    """Return the DUTs listed in ``multi_dut.devices`` (duplicates dropped)."""
+
+    section = config.get("multi_dut") if isinstance(config, Mapping) else None
+    entries = section.get("devices") if isinstance(section, Mapping) else None
+    targets: List[DutTarget] = []
+    for entry in entries or []:
+        if not isinstance(entry, Mapping):
+            continue
+        kind = str(entry.get("type") or "Android").strip()
+        if kind.lower() in ("linux", "telnet"):
+            kind, address = "Linux", str(entry.get("ip") or "").strip()
+        else:
+            kind, address = "Android", str(entry.get("device") or "").strip()
+        if not address:
+            logging.warning("Ignoring multi_dut entry without address: %s", dict(entry))
+            continue
+        target = DutTarget(kind, address)
+        if target not in targets:
+            targets.append(target)
+    return targets
+
+
+def case_resources(case_path: str, config: Mapping[str, Any] | None = None) -> tuple[ResourceClaim, ...]:
+    """Return the lab resource claims of ``case_path`` (DUT claim excluded)."""
+
+    path = str(case_path).replace("\\", "/").lower()
+    stem = PurePath(path).stem
+    if any(hint in path for hint in _RF_CONTROL_HINTS):
+        needs = {"router": True, "attenuator": True, "turntable": True}
+    elif any(hint in path for hint in _ROUTER_OWNER_HINTS):
+        needs = {"router": True}
+    else:
+        needs = {"router": False}
+    serial_cfg = config.get("serial_port") if isinstance(config, Mapping) else None
+    if isinstance(serial_cfg, Mapping) and serial_cfg.get("status"):
+        needs["serial"] = True
+
+    section = config.get("multi_dut") if isinstance(config, Mapping) else None
+    overrides = section.get("resources") if isinstance(section, Mapping) else None
+    override = overrides.get(stem) if isinstance(overrides, Mapping) else None
+    if isinstance(override, Mapping):
+        for name, mode in override.items():
+            mode_text = str(mode or "").strip().lower()
+            if mode_text in ("", "none", "false"):
+                needs.pop(str(name), None)
+            else:
+                needs[str(name)] = mode_text != "shared"
+    return tuple(ResourceClaim(name, exclusive) for name, exclusive in needs.items())
+
+
+def parse_resource_spec(spec: Any) -> tuple[ResourceClaim, ...]:
+    """Parse ``"router:shared, serial"`` into claims (bare names are exclusive)."""
+
+    claims: Dict[str, bool] = {}
+    for token in _SPEC_SPLIT_RE.split(str(spec or "").strip()):
+        if not token:
+            continue
+        name, _, mode = token.partition(":")
+        name = name.strip().lower()
+        if name:
+            claims[name] = mode.strip().lower() != "shared"
+    return tuple(ResourceClaim(name, exclusive) for name, exclusive in claims.items())
+
+
+def declared_resources(case_file: str | Path) -> Optional[tuple[ResourceClaim, ...]]:
+    """Return claims of a ``lab_resources`` marker in ``case_file``, if any.
+
+    The script is scanned as text so planning never imports test modules.
+    """
+
+    try:
+        source = Path(case_file).read_text(encoding="utf-8", errors="ignore")
+    except OSError:
+        return None
+    match = _MARKER_RE.search(source)
+    if match is None:
+        return None
+    return parse_resource_spec(",".join(_MARKER_ARG_RE.findall(match.group(1))))
+
+
+def claims_conflict(first: Iterable[ResourceClaim], second: Iterable[ResourceClaim]) -> bool:
+    """Return True when the two claim sets cannot be held at the same time."""
+
+    held = {claim.name: claim.exclusive for claim in first}
+    return any(claim.name in held and claim.conflicts(held[claim.name]) for claim in second)
+
+
+def plan_parallelism(config: Mapping[str, Any] | None) -> int:
+    """Return ``plan_execution.max_parallel`` (1 keeps plans sequential)."""
+
+    section = config.get("plan_execution") if isinstance(config, Mapping) else None
+    try:
+        value = int(section.get("max_parallel") or 1) if isinstance(section, Mapping) else 1
+    except (TypeError, ValueError):
+        value = 1
+    return max(1, value)
+
+
+class ConflictSchedule:
+    """Dependency graph of plan items derived from resource conflicts.
+
+    Item ``j`` depends on every earlier item ``i`` whose claims conflict with
+    its own, so conflicting items keep plan order while independent ones may
+    run side by side.
+    """
+
+    def __init__(self, claims: Sequence[Sequence[ResourceClaim]]) -> None:
+        self._claims = [tuple(item) for item in claims]
+        self.depends_on: List[set[int]] = [
+            {i for i in range(j) if claims_conflict(self._claims[i], self._claims[j])}
+            for j in range(len(self._claims))
+        ]
+        self._started: set[int] = set()
+        self._done: set[int] = set()
+
+    def __len__(self) -> int:
+        return len(self._claims)
+
+    @property
+    def finished(self) -> bool:
+        return len(self._done) == len(self._claims)
+
+    def ready(self, limit: int) -> List[int]:
+        """Return up to ``limit`` unstarted items whose dependencies are done."""
+
+        items: List[int] = []
+        for index in range(len(self._claims)):
+            if len(items) >= limit:
+                break
+            if index in self._started or not self.depends_on[index] <= self._done:
+                continue
+            items.append(index)
+        return items
+
+    def start(self, index: int) -> None:
+        self._started.add(index)
+
+    def finish(self, index: int) -> None:
+        self._started.add(index)
+        self._done.add(index)
+
+    def skip_remaining(self) -> List[int]:
+        """Mark every unstarted item as done and return them."""
+
+        skipped = [i for i in range(len(self._claims)) if i not in self._started]
+        for index in skipped:
+            self.finish(index)
+        return skipped
+
+
+class ResourceLockManager:
+    """All-or-nothing acquisition of shared/exclusive resource claims.
+
+    Claims of one owner are granted together, so two runners can never each
+    hold half of what the other needs.
+    """
+
+    def __init__(self) -> None:
+        self._cond = threading.Condition()
+        # resource -> {owner: exclusive}
+        self._holders: Dict[str, Dict[str, bool]] = {}
+
+    def _available(self, owner: str, claims: Iterable[ResourceClaim]) -> bool:
+        for claim in claims:
+            for holder, exclusive in self._holders.get(claim.name, {}).items():
+                if holder != owner and claim.conflicts(exclusive):
+                    return False
+        return True
+
+    def try_acquire(self, owner: str, claims: Sequence[ResourceClaim]) -> bool:
+        with self._cond:
+            if not self._available(owner, claims):
+                return False
+            for claim in claims:
+                self._holders.setdefault(claim.name, {})[owner] = claim.exclusive
+            return True
+
+    def acquire(
+        self,
+        owner: str,
+        claims: Sequence[ResourceClaim],
+        *,
+        timeout: Optional[float] = None,
+        should_stop: Optional[Callable[[], bool]] = None,
+    ) -> bool:
+        """Block until every claim is granted; False on timeout or stop request."""
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while not self._available(owner, claims):
+                if should_stop is not None and should_stop():
+                    return False
+                wait = 0.5
+                if deadline is not None:
+                    wait = min(wait, deadline - time.monotonic())
+                    if wait <= 0:
+                        return False
+                self._cond.wait(wait)
+            for claim in claims:
+                self._holders.setdefault(claim.name, {})[owner] = claim.exclusive
+            return True
+
+    def release(self, owner: str) -> None:
+        with self._cond:
+            for name in list(self._holders):
+                self._holders[name].pop(owner, None)
+                if not self._holders[name]:
+                    del self._holders[name]
+            self._cond.notify_all()
+
+    def holders(self) -> Dict[str, Dict[str, bool]]:
+        with self._cond:
+            return {name: dict(owners) for name, owners in self._holders.items()}
+
+
+#: Process-wide lock table shared by every runner in the GUI process.
+LAB_LOCKS = ResourceLockManager()
@@ -5,9 +5,23 @@ This package is the canonical home for all reporting utilities, including:
 - Result import/export utilities
 - Project report (xlsx) generation
 - RVR chart dataframe preparation
+
+The exported names are resolved on first access, so importing a submodule
+(e.g. ``src.util.report.excel.plan``) does not load the report builder.
 """
 
-from .facade import generate_project_report
-from .rvr_chart_facade import RvrChartLogic
+from importlib import import_module
+
+_EXPORTS = {
+    "generate_project_report": ".facade",
+    "RvrChartLogic": ".rvr_chart_facade",
+}
 
 __all__ = ["generate_project_report", "RvrChartLogic"]
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(module, __name__), name)
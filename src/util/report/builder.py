@@ -4,10 +4,11 @@ import csv
 import logging
 import math
 from collections import Counter
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from io import BytesIO
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 
 from openpyxl import Workbook
 from openpyxl.chart import Reference, ScatterChart, Series
@@ -24,7 +25,7 @@ from openpyxl.utils import get_column_letter, column_index_from_string
 from openpyxl.worksheet.worksheet import Worksheet
 
 from src.test.performance import get_rvo_static_db_list, get_rvo_target_rssi_list
-from src.tools.performance.rvr_chart_generator import PerformanceRvrChartGenerator
+from src.tools.result_store import open_result_table
 from src.util.constants import (
     TEST_REPORT_PEAK_THROUGHPUT,
     TEST_REPORT_RVO,
@@ -32,6 +33,9 @@ from src.util.constants import (
 )
 from src.util.report import style
 from src.util.report.style import *  # noqa: F401,F403
+
+if TYPE_CHECKING:  # pragma: no cover
+    from src.tools.performance.rvr_chart_generator import PerformanceRvrChartGenerator
 LOGGER = logging.getLogger(__name__)
 
 # Path to embedded report logo placed alongside this module.
@@ -1686,6 +1690,8 @@ def _add_group_charts(
 
 
 def _prepare_rvo_chart_context(result_file: Path | str) -> dict[str, Any]:
+    from src.tools.performance.rvr_chart_generator import PerformanceRvrChartGenerator
+
     chart_dir = Path(result_file).resolve().parent / "rvo_charts"
     chart_dir.mkdir(parents=True, exist_ok=True)
     generator = PerformanceRvrChartGenerator()
@@ -1842,6 +1848,17 @@ def _add_rvo_polar_chart(
 # ---------------------------------------------------------------------------
 
 
+@contextmanager
+def _open_result_rows(path: Path):
+    """Yield a ``csv.DictReader`` over ``path``, served from its result store when fresh."""
+    table = open_result_table(path)
+    if table is not None:
+        yield table.reader()
+        return
+    with path.open('r', encoding='utf-8-sig', newline='') as handle:
+        yield csv.DictReader(handle)
+
+
 def _load_scenario_groups(result_file: Path | str, *, test_type: str | None = None) -> List[ScenarioGroup]:
     path = Path(result_file)
     if not path.exists():
@@ -1855,8 +1872,7 @@ def _load_scenario_groups(result_file: Path | str, *, test_type: str | None = No
     matched_rows = 0
     type_counts: Counter[str] = Counter()
     try:
-        with path.open('r', encoding='utf-8-sig', newline='') as handle:
-            reader = csv.DictReader(handle)
+        with _open_result_rows(path) as reader:
             fieldnames = [str(name or "").strip() for name in (reader.fieldnames or [])]
             throughput_cols = [name for name in fieldnames if name.startswith("Throughput")]
             def _throughput_col_key(name: str) -> tuple[int, str]:
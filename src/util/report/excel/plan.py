@@ -36,6 +36,21 @@ def read_script_paths(path: Union[str, Path], include_test_type: bool = False) -
     return test_type, script_paths
 
 
+def read_plan_resources(path: Union[str, Path]) -> List[str]:
+    """Return the optional ``Resources`` cell of every row with a script path.
+
+    The list lines up with :func:`read_script_paths`; rows without a value
+    (or plans without the column) yield ``""``.
+    """
+    df = pd.read_excel(path)
+    if PLAN_COLS.SCRIPT_PATH not in df.columns:
+        raise ValueError(f"Excel file must contain a '{PLAN_COLS.SCRIPT_PATH}' column.")
+    rows = df[df[PLAN_COLS.SCRIPT_PATH].notna()]
+    if PLAN_COLS.RESOURCES not in df.columns:
+        return [""] * len(rows)
+    return ["" if pd.isna(v) else str(v).strip() for v in rows[PLAN_COLS.RESOURCES].tolist()]
+
+
 def update_row_status(
     path: str | Path,
     *,
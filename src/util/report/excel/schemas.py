@@ -25,6 +25,7 @@ class PlanColumns:
     STATUS: str = "Status"
     STEP_DETAILS: str = "Step_Details"
     TEST_TYPE = "Test Type"
+    RESOURCES: str = "Resources"
 
 
 PLAN_COLS: Final[PlanColumns] = PlanColumns()
@@ -2,7 +2,9 @@
 
 Callers should import :func:`generate_project_report` from this module.
 Implementation details (builder/style) live in sibling modules so we can
-iterate on formatting without touching callers.
+iterate on formatting without touching callers.  The builder (openpyxl and
+the chart stack) is imported when a report is generated, not with this
+module.
 """
 
 from __future__ import annotations
@@ -10,9 +12,6 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Optional
 
-from src.util.report.builder import generate_project_report as _generate
-
-
 def generate_project_report(
     result_file: str | Path,
     output: str | Path,
@@ -20,6 +19,8 @@ def generate_project_report(
     forced_test_type: Optional[str] = None,
     sheet_name: str | None = None,
 ) -> None:
+    from src.util.report.builder import generate_project_report as _generate
+
     return _generate(
         result_file,
         output,
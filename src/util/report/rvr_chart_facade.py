@@ -4,6 +4,14 @@ This module extracts the data preparation logic that was previously
 embedded in the report page UI so it can be reused by both the GUI and
 non-interactive workflows (e.g. automated chart generation after tests
 finish).
+
+Result columns hold few distinct values (a handful of bands, modes and
+directions; repeated attenuation steps), so the preparation pipeline works
+column by column: each column is coded by distinct cell, the per-value
+formatters run once per code and the results are gathered back by code.
+Throughput repeat cells are parsed once per distinct text into a padded
+numeric array.  ``tools/bench_rvr_chart_pipeline.py`` times the pipeline on
+a synthetic campaign.
 """
 
 from __future__ import annotations
@@ -13,8 +21,9 @@ import math
 import re
 from pathlib import Path
 from dataclasses import dataclass
-from typing import Iterable, Optional
+from typing import Callable, Iterable, Optional
 
+import numpy as np
 import pandas as pd
 
 from src.util.constants import (
@@ -27,6 +36,77 @@ from src.util.constants import (
     TEST_REPORT_RVR,
     TEST_TYPE_ORDER_MAP,
 )
+from src.tools.result_store import open_result_table
+from src.tools.result_writer import recover_result_journal
+
+_ANGLE_COLUMNS = (
+    "Angel",
+    "Angle",
+    "corner",
+    "Corner",
+    "corner_angle",
+    "Corner_Angle",
+    "turntable",
+    "Turntable",
+)
+_BLANK_TEXTS = frozenset({"", "nan", "null", "none", "n/a", "na", "-"})
+
+
+def _distinct_codes(series: pd.Series) -> Optional[np.ndarray]:
+    """Number the distinct cells of ``series`` in order of first appearance.
+
+    Cells only share a code when every formatter here treats them alike:
+    floats are compared bit for bit (``-0.0`` formats differently from
+    ``0.0``), object columns may only mix strings with missing values, and
+    missing values are told apart by type (``None`` is not ``NaN``).  Returns
+    None for columns that do not qualify.
+    """
+    dtype = series.dtype
+    if not isinstance(dtype, np.dtype):
+        return None
+    values = series.to_numpy()
+    if dtype.kind == "f":
+        codes, _ = pd.factorize(np.ascontiguousarray(values).view(f"i{dtype.itemsize}"))
+        return codes
+    if dtype.kind in "biu":
+        codes, _ = pd.factorize(values)
+        return codes
+    if dtype.kind != "O":
+        return None
+    codes, uniques = pd.factorize(values)
+    if len(uniques) and pd.api.types.infer_dtype(uniques, skipna=False) != "string":
+        return None
+    missing = np.flatnonzero(codes < 0)
+    if missing.size:
+        by_type: dict[type, int] = {}
+        for position in missing:
+            kind = type(values[position])
+            if kind not in by_type:
+                by_type[kind] = len(uniques) + len(by_type)
+            codes[position] = by_type[kind]
+    return codes
+
+
+def _map_distinct(series: pd.Series, func: Callable) -> pd.Series:
+    """``series.apply(func)``, calling ``func`` once per distinct cell."""
+    codes = _distinct_codes(series) if len(series) else None
+    if codes is None:
+        return series.apply(func)
+    _, first = np.unique(codes, return_index=True)
+    # Applying to one representative per code keeps apply's dtype inference.
+    mapped = series.iloc[first].apply(func)
+    return pd.Series(mapped.to_numpy()[codes], index=series.index, name=series.name)
+
+
+def _first_present(candidates: Iterable[np.ndarray], size: int) -> tuple[np.ndarray, np.ndarray]:
+    """Per row, the first non-None value of ``candidates``; also the rows without one."""
+    result = np.full(size, None, dtype=object)
+    pending = np.ones(size, dtype=bool)
+    for values in candidates:
+        hit = pending & pd.notna(values)
+        result[hit] = values[hit]
+        pending &= ~hit
+    return result, pending
 
 
 @dataclass
@@ -47,8 +127,9 @@ class RvrDataFrame:
 class RvrChartLogic:
     """Mixin that provides common helpers for RVR chart preparation."""
 
-    def _load_rvr_dataframe(self, path: Path) -> pd.DataFrame:
-        raw = self._read_rvr_results(path)
+    def _load_rvr_dataframe(self, path: Path, raw: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+        if raw is None:
+            raw = self._read_rvr_results(path)
         if raw is None or raw.empty:
             return pd.DataFrame()
         prepared = self._prepare_rvr_dataframe(raw)
@@ -61,6 +142,11 @@ class RvrChartLogic:
         """Read raw RVR results from CSV or Excel without post-processing."""
         try:
             if path.suffix.lower() == ".csv":
+                # Rows journaled by a run that crashed before syncing.
+                recover_result_journal(path)
+                table = open_result_table(path)
+                if table is not None:
+                    return table.frame()
                 try:
                     return pd.read_csv(path)
                 except UnicodeDecodeError:
@@ -89,7 +175,13 @@ class RvrChartLogic:
         prepared = df.copy()
         prepared.columns = [str(c).strip() for c in prepared.columns]
         for column in prepared.columns:
-            prepared[column] = prepared[column].apply(lambda v: v.strip() if isinstance(v, str) else v)
+            series = prepared[column]
+            # Only object columns can hold strings; apply would return numeric ones unchanged.
+            if not isinstance(series, pd.Series) or (
+                isinstance(series.dtype, np.dtype) and series.dtype.kind in "biufcmM"
+            ):
+                continue
+            prepared[column] = _map_distinct(series, lambda v: v.strip() if isinstance(v, str) else v)
         if "Direction" in prepared.columns:
             prepared["Direction"] = prepared["Direction"].astype(str).str.upper()
         for col in ("Freq_Band", "Standard", "BW", "CH_Freq_MHz", "DB"):
@@ -112,108 +204,95 @@ class RvrChartLogic:
     def _attach_display_columns(self, prepared: pd.DataFrame, source_series) -> None:
         """Populate derived display columns (standard/bandwidth/freq/etc)."""
         standard_series = source_series("Standard")
-        prepared["__standard_display__"] = standard_series.apply(self._format_standard_display).replace("", "Unknown")
+        prepared["__standard_display__"] = _map_distinct(standard_series, self._format_standard_display).replace(
+            "", "Unknown"
+        )
 
         bandwidth_series = source_series("BW", "Bandwidth")
-        prepared["__bandwidth_display__"] = bandwidth_series.apply(self._format_bandwidth_display).replace("", "Unknown")
+        prepared["__bandwidth_display__"] = _map_distinct(bandwidth_series, self._format_bandwidth_display).replace(
+            "", "Unknown"
+        )
 
         freq_series = source_series("Freq_Band", "Frequency Band", "Band")
-        freq_display = freq_series.apply(self._format_freq_band_display)
+        freq_display = _map_distinct(freq_series, self._format_freq_band_display)
         if freq_display.eq("").all() and "CH_Freq_MHz" in prepared.columns:
-            channel_freq = source_series("CH_Freq_MHz").apply(self._format_freq_band_display)
+            channel_freq = _map_distinct(source_series("CH_Freq_MHz"), self._format_freq_band_display)
             freq_display = freq_display.where(freq_display != "", channel_freq)
         prepared["__freq_band_display__"] = freq_display.replace("", "Unknown")
 
-        prepared["__direction_display__"] = source_series("Direction").apply(self._format_direction_display)
+        prepared["__direction_display__"] = _map_distinct(source_series("Direction"), self._format_direction_display)
 
-        prepared["__channel_display__"] = source_series("CH_Freq_MHz", "Channel").apply(
-            self._format_channel_display
+        prepared["__channel_display__"] = _map_distinct(
+            source_series("CH_Freq_MHz", "Channel"), self._format_channel_display
         )
 
-        prepared["__db_display__"] = source_series("DB", "Total_Path_Loss", "RxP", "Attenuation", "Path_Loss").apply(
-            self._format_db_display
+        prepared["__db_display__"] = _map_distinct(
+            source_series("DB", "Total_Path_Loss", "RxP", "Attenuation", "Path_Loss"), self._format_db_display
         )
 
-        prepared["__rssi_display__"] = source_series("RSSI", "Data_RSSI", "Data RSSI").apply(
-            self._format_metric_display
+        prepared["__rssi_display__"] = _map_distinct(
+            source_series("RSSI", "Data_RSSI", "Data RSSI"), self._format_metric_display
         )
 
     def _attach_profile_metadata(self, prepared: pd.DataFrame, source_series) -> None:
         """Add normalized profile mode/value metadata used by reports."""
-        profile_mode_series = source_series("Profile_Mode", "Profile Mode", "RVO_Profile_Mode").apply(
-            self._normalize_profile_mode_value
+        profile_mode_series = _map_distinct(
+            source_series("Profile_Mode", "Profile Mode", "RVO_Profile_Mode"), self._normalize_profile_mode_value
         )
-        profile_value_series = source_series("Profile_Value", "Profile Value", "RVO_Profile_Value").apply(
-            self._normalize_profile_value
+        profile_value_series = _map_distinct(
+            source_series("Profile_Value", "Profile Value", "RVO_Profile_Value"), self._normalize_profile_value
         )
         prepared["__profile_mode__"] = profile_mode_series
         prepared["__profile_value__"] = profile_value_series
-        prepared["__profile_key__"] = [
-            self._build_profile_key(mode, value) for mode, value in zip(profile_mode_series, profile_value_series)
-        ]
-        prepared["__profile_label__"] = [
-            self._format_profile_label(mode, value)
-            for mode, value in zip(profile_mode_series, profile_value_series)
-        ]
+        mode_codes, _ = pd.factorize(profile_mode_series)
+        value_codes, value_uniques = pd.factorize(profile_value_series)
+        pair_codes, _ = pd.factorize(mode_codes * (len(value_uniques) + 1) + value_codes)
+        _, first = np.unique(pair_codes, return_index=True)
+        pairs = list(zip(profile_mode_series.to_numpy()[first], profile_value_series.to_numpy()[first]))
+        keys = np.array([self._build_profile_key(mode, value) for mode, value in pairs], dtype=object)
+        labels = np.array([self._format_profile_label(mode, value) for mode, value in pairs], dtype=object)
+        prepared["__profile_key__"] = keys[pair_codes]
+        prepared["__profile_label__"] = labels[pair_codes]
 
     def _attach_angle_columns(self, prepared: pd.DataFrame, source_series) -> None:
         """Attach normalized angle columns for downstream filtering."""
-        angle_series = source_series(
-            "Angel",
-            "Angle",
-            "corner",
-            "Corner",
-            "corner_angle",
-            "Corner_Angle",
-            "CornerAngle",
-            "turntable",
-            "Turntable",
-        )
-        prepared["__angle_value__"] = angle_series.apply(self._parse_angle_value)
-        prepared["__angle_display__"] = angle_series.apply(self._format_angle_display)
+        angle_series = source_series(*_ANGLE_COLUMNS[:6], "CornerAngle", *_ANGLE_COLUMNS[6:])
+        prepared["__angle_value__"] = _map_distinct(angle_series, self._parse_angle_value)
+        prepared["__angle_display__"] = _map_distinct(angle_series, self._format_angle_display)
 
     def _attach_step_labels(self, prepared: pd.DataFrame) -> None:
         """Derive the attenuation step label used by RVR charts."""
         step_candidates = ("DB", "Total_Path_Loss", "RxP", "Step", "Attenuation")
 
-        def resolve_step(row: pd.Series) -> Optional[str]:
-            for name in step_candidates:
-                if name in row:
-                    value = row.get(name)
-                    display = self._format_db_display(value)
-                    if display:
-                        return display
-                    normalized = self._normalize_step(value)
-                    if normalized:
-                        return normalized
-            return None
+        def resolve_step(value) -> Optional[str]:
+            display = self._format_db_display(value)
+            if display:
+                return display
+            return self._normalize_step(value) or None
 
-        prepared["__step__"] = prepared.apply(resolve_step, axis=1)
-        row_count = len(prepared)
-        fallback_steps = pd.Series([str(i + 1) for i in range(row_count)], index=prepared.index)
-        prepared["__step__"] = prepared["__step__"].fillna(fallback_steps)
-        empty_mask = prepared["__step__"] == ""
-        if empty_mask.any():
-            prepared.loc[empty_mask, "__step__"] = fallback_steps[empty_mask]
+        candidates = [
+            _map_distinct(prepared[name], resolve_step).to_numpy(dtype=object)
+            for name in step_candidates
+            if name in prepared.columns
+        ]
+        steps, missing = _first_present(candidates, len(prepared))
+        # Rows without a step label fall back to their 1-based position.
+        steps[missing] = [str(i + 1) for i in np.flatnonzero(missing)]
+        prepared["__step__"] = steps
 
     def _attach_throughput_values(self, prepared: pd.DataFrame, source_series) -> None:
         """Attach the computed throughput column respecting aliases."""
         throughput_columns = self._resolve_throughput_columns(prepared.columns)
         if throughput_columns:
-            prepared["__throughput_value__"] = prepared.apply(
-                lambda row: self._aggregate_throughput_row(row, throughput_columns),
-                axis=1,
-            )
+            prepared["__throughput_value__"] = self._aggregate_throughput_columns(prepared, throughput_columns)
         else:
             throughput_alias = self._select_throughput_alias(prepared.columns)
             if throughput_alias:
-                prepared["__throughput_value__"] = source_series(throughput_alias, "Throughput").apply(self._safe_float)
+                prepared["__throughput_value__"] = _map_distinct(
+                    source_series(throughput_alias, "Throughput"), self._safe_float
+                )
             else:
-                prepared["__throughput_value__"] = source_series("Throughput").apply(self._safe_float)
-
-        prepared["__throughput_value__"] = prepared["__throughput_value__"].apply(
-            lambda value: float(value) if isinstance(value, (int, float)) else value
-        )
+                prepared["__throughput_value__"] = _map_distinct(source_series("Throughput"), self._safe_float)
 
     def _resolve_throughput_columns(self, columns: Iterable[str]) -> list[str]:
         column_list = [str(col) for col in columns]
@@ -243,13 +322,49 @@ class RvrChartLogic:
                 return text
         return None
 
-    def _aggregate_throughput_row(self, row: pd.Series, columns: list[str]) -> Optional[float]:
-        values: list[float] = []
-        for col in columns:
-            values.extend(self._parse_numeric_list(row.get(col)))
-        if not values:
-            return None
-        return sum(values) / len(values)
+    def _aggregate_throughput_columns(self, df: pd.DataFrame, columns: list[str]) -> pd.Series:
+        """Mean of all numbers in ``columns`` per row; None where a row has none.
+
+        Each distinct cell is parsed once into a row of a padded array, and the
+        numbers are summed in column and repeat order so every mean equals the
+        one a per-row ``sum(values) / len(values)`` gives.
+        """
+        row_count = len(df)
+        totals = np.zeros(row_count)
+        counts = np.zeros(row_count, dtype=np.int64)
+        for column in columns:
+            series = df[column]
+            if isinstance(series.dtype, np.dtype) and series.dtype.kind in "biuf":
+                # Numeric cells are one number each, NaN included.
+                totals += series.to_numpy(dtype=float)
+                counts += 1
+                continue
+            codes = _distinct_codes(series)
+            if codes is None:
+                codes = np.arange(row_count)
+                cells = series.tolist()
+            else:
+                _, first = np.unique(codes, return_index=True)
+                cells = series.iloc[first].tolist()
+            parsed = [self._parse_numeric_list(cell) for cell in cells]
+            lengths = np.array([len(numbers) for numbers in parsed], dtype=np.int64)
+            width = int(lengths.max(initial=0))
+            if not width:
+                continue
+            padded = np.zeros((len(parsed), width))
+            for index, numbers in enumerate(parsed):
+                padded[index, : len(numbers)] = numbers
+            row_lengths = lengths[codes]
+            for repeat in range(width):
+                hit = row_lengths > repeat
+                totals[hit] += padded[codes[hit], repeat]
+            counts += row_lengths
+        if not counts.any():
+            return pd.Series([None] * row_count, index=df.index, dtype=object)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            means = totals / counts
+        means[counts == 0] = np.nan
+        return pd.Series(means, index=df.index)
 
     def _parse_numeric_list(self, value) -> list[float]:
         if value is None:
@@ -270,48 +385,47 @@ class RvrChartLogic:
                 continue
         return numbers
 
-    def _detect_test_type_from_row(self, row: pd.Series) -> str:
-        for column in ("Test_Category", "Sub_Category", "Data_Rate", "Protocol"):
-            value = row.get(column)
-            normalized = self._normalize_value(value)
-            if not normalized:
-                continue
-            if "peak" in normalized and "throughput" in normalized:
-                return TEST_REPORT_PEAK_THROUGHPUT
-            if TEST_REPORT_RVO.lower() in normalized:
-                return TEST_REPORT_RVO
-            if TEST_REPORT_RVR.lower() in normalized:
-                return TEST_REPORT_RVR
-
-        angle_value = self._extract_first_non_empty(
-            row,
-            (
-                "Angel",
-                "Angle",
-                "corner",
-                "Corner",
-                "corner_angle",
-                "Corner_Angle",
-                "turntable",
-                "Turntable",
-            ),
-        )
-        if angle_value is not None:
-            normalized_angle = self._normalize_value(angle_value)
-            if normalized_angle and normalized_angle not in {"", "null", "none"}:
-                return TEST_REPORT_RVO
+    def _classify_test_type_text(self, value) -> Optional[str]:
+        normalized = self._normalize_value(value)
+        if not normalized:
+            return None
+        if "peak" in normalized and "throughput" in normalized:
+            return TEST_REPORT_PEAK_THROUGHPUT
+        if TEST_REPORT_RVO.lower() in normalized:
+            return TEST_REPORT_RVO
+        if TEST_REPORT_RVR.lower() in normalized:
+            return TEST_REPORT_RVR
+        return None
 
-        for value in row.tolist():
-            normalized = self._normalize_value(value)
-            if not normalized:
-                continue
-            if "peak" in normalized and "throughput" in normalized:
-                return TEST_REPORT_PEAK_THROUGHPUT
-            if TEST_REPORT_RVO.lower() in normalized:
-                return TEST_REPORT_RVO
-            if TEST_REPORT_RVR.lower() in normalized:
-                return TEST_REPORT_RVR
-        return TEST_REPORT_RVR
+    def _detect_test_types(self, df: pd.DataFrame) -> np.ndarray:
+        """Test type of every row of ``df``.
+
+        A row's type comes from the first of its category columns that names
+        one, then from a filled-in angle column (RVO), then from any cell in
+        column order, and defaults to RVR.
+        """
+
+        def classify(series: pd.Series) -> np.ndarray:
+            return _map_distinct(series, self._classify_test_type_text).to_numpy(dtype=object)
+
+        def has_angle(value) -> bool:
+            return value is not None and str(value).strip().lower() not in _BLANK_TEXTS
+
+        row_count = len(df)
+        candidates = [
+            classify(df[column])
+            for column in ("Test_Category", "Sub_Category", "Data_Rate", "Protocol")
+            if column in df.columns
+        ]
+        angle_rows = np.zeros(row_count, dtype=bool)
+        for column in _ANGLE_COLUMNS:
+            if column in df.columns:
+                angle_rows |= _map_distinct(df[column], has_angle).to_numpy(dtype=bool)
+        candidates.append(np.where(angle_rows, TEST_REPORT_RVO, None))
+        candidates.extend(classify(df.iloc[:, position]) for position in range(df.shape[1]))
+        types, undetected = _first_present(candidates, row_count)
+        types[undetected] = TEST_REPORT_RVR
+        return types
 
     def _resolve_dataframe_test_type(self, df: pd.DataFrame, path: Optional[Path]) -> Optional[str]:
         if df is None or df.empty:
@@ -341,11 +455,7 @@ class RvrChartLogic:
             return TEST_REPORT_RVO
 
         sample = df.head(200)
-        detected: set[str] = set()
-        for _, row in sample.iterrows():
-            candidate = self._detect_test_type_from_row(row)
-            if candidate:
-                detected.add(candidate.upper())
+        detected = {candidate.upper() for candidate in self._detect_test_types(sample)}
         if TEST_REPORT_RVO in detected:
             return TEST_REPORT_RVO
         if TEST_REPORT_PEAK_THROUGHPUT in detected:
@@ -413,15 +523,17 @@ class RvrChartLogic:
         if not angle_columns:
             return False
 
+        def is_angle(value) -> bool:
+            normalized = self._normalize_value(value)
+            return bool(normalized) and normalized not in {"", "null", "none", "nan"}
+
         for column in angle_columns:
             try:
                 series = df[column] if isinstance(df[column], pd.Series) else pd.Series(df[column])
             except Exception:
                 continue
-            for value in series.tolist():
-                normalized = self._normalize_value(value)
-                if normalized and normalized not in {"", "null", "none", "nan"}:
-                    return True
+            if _map_distinct(series, is_angle).any():
+                return True
         return False
 
     def _format_standard_display(self, value) -> str:
@@ -720,8 +832,15 @@ class RvrChartLogic:
             diff = abs((normalized_value - normalized_target + 180.0) % 360.0 - 180.0)
             return diff <= tolerance
 
-        mask = df["__angle_value__"].apply(_matches)
-        return df[mask]
+        values = df["__angle_value__"]
+        if values.dtype.kind != "f":
+            return df[values.apply(_matches)]
+        numeric = values.to_numpy()
+        with np.errstate(invalid="ignore"):
+            # np.mod rounds like Python's float %, so this matches _matches.
+            normalized = np.mod(numeric, 360.0)
+            diff = np.abs(np.mod(normalized - normalized_target + 180.0, 360.0) - 180.0)
+        return df[np.isfinite(numeric) & (diff <= tolerance)]
 
     def _parse_db_numeric(self, value) -> Optional[float]:
         if value is None:
@@ -1041,16 +1160,16 @@ class RvrChartLogic:
             normalized += 360.0
         return normalized
 
-    def _format_angle_label_from_numeric(self, value: float) -> str:
-        if value is None or not math.isfinite(float(value)):
-            return ""
-        rounded = round(value)
-        if abs(value - rounded) < 1e-6:
-            return f"{int(rounded)}°"
-        formatted = f"{value:.1f}°"
-        if formatted.endswith(".0°"):
-            formatted = formatted[:-3] + "°"
-        return formatted
+    def _format_angle_label_from_numeric(self, value: float) -> str:
+        if value is None or not math.isfinite(float(value)):
+            return ""
+        rounded = round(value)
+        if abs(value - rounded) < 1e-6:
+            return f"{int(rounded)}°"
+        formatted = f"{value:.1f}°"
+        if formatted.endswith(".0°"):
+            formatted = formatted[:-3] + "°"
+        return formatted
 
     def _format_angle_display(self, value) -> str:
         numeric = self._parse_angle_value(value)
@@ -1058,19 +1177,6 @@ class RvrChartLogic:
             return str(value).strip() if value is not None else ""
         return self._format_angle_label_from_numeric(self._normalize_angle_numeric(numeric) or numeric)
 
-    def _extract_first_non_empty(self, row: pd.Series, columns: tuple[str, ...]):
-        for column in columns:
-            if column not in row:
-                continue
-            value = row.get(column)
-            if value is None:
-                continue
-            s = str(value).strip()
-            if not s or s.lower() in {"nan", "null", "none", "n/a", "na", "-"}:
-                continue
-            return value
-        return None
-
     def _safe_float(self, value) -> Optional[float]:
         if value is None:
             return None
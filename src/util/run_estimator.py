@@ -0,0 +1,353 @@
+"""Run-time estimates for performance sweeps learned from past step timings.
+
+An RVR/RVO or peak-throughput run is a sequence of a few kinds of slow
+steps: router reconfiguration, Wi-Fi (re)connection, attenuation changes,
+iperf runs and turntable moves.  The performance tests time those steps
+with :func:`timed_step`; :class:`StepCostModel` keeps a running mean per
+step kind, DUT type and router model in ``config/step_costs.json`` (with
+DUT-only, router-only and global fallbacks, then built-in defaults).
+
+When pytest has collected the items, ``conftest`` derives the planned step
+counts from the item parameters (:func:`plan_steps_from_items`) and
+:data:`RUN_ESTIMATOR` publishes a :class:`~src.util.run_events.RemainingEstimate`.
+Each completed step refines the model and publishes an updated estimate;
+the remaining time is scaled by how far this run's finished steps deviated
+from their prediction, so a slow lab day is reflected immediately.  The
+Run page shows the estimate in its remaining-time label.
+
+For Excel plans :func:`history_case_seconds` supplies per-case averages from
+``test_history.csv`` for the cases that have not started yet.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+from src.util.atomic_file import atomic_write
+from src.util.run_events import RemainingEstimate, publish
+
+__all__ = [
+    "DEFAULT_STEP_SECONDS",
+    "RUN_ESTIMATOR",
+    "RunEstimator",
+    "STEP_ATTENUATION",
+    "STEP_IPERF",
+    "STEP_KINDS",
+    "STEP_ROUTER_CONFIG",
+    "STEP_TURNTABLE",
+    "STEP_WIFI_CONNECT",
+    "StepCost",
+    "StepCostModel",
+    "estimator_key",
+    "history_case_seconds",
+    "plan_steps_from_items",
+    "record_step",
+    "timed_step",
+]
+
+STEP_ROUTER_CONFIG = "router_config"
+STEP_WIFI_CONNECT = "wifi_connect"
+STEP_ATTENUATION = "attenuation"
+STEP_IPERF = "iperf"
+STEP_TURNTABLE = "turntable"
+STEP_KINDS = (STEP_ROUTER_CONFIG, STEP_WIFI_CONNECT, STEP_ATTENUATION, STEP_IPERF, STEP_TURNTABLE)
+
+#: Used for a step kind until it has been observed on any DUT/router.
+DEFAULT_STEP_SECONDS: Dict[str, float] = {
+    STEP_ROUTER_CONFIG: 90.0,
+    STEP_WIFI_CONNECT: 30.0,
+    STEP_ATTENUATION: 5.0,
+    STEP_IPERF: 40.0,
+    STEP_TURNTABLE: 15.0,
+}
+
+STEP_COSTS_FILENAME = "step_costs.json"
+_WILDCARD = "*"
+# After this many samples the running mean becomes an exponential average so
+# that lab changes (new firmware, another router) show up in the estimate.
+_MEAN_WINDOW = 50
+# Bounds of the factor applied for this run's observed speed.
+_DRIFT_MIN = 0.5
+_DRIFT_MAX = 2.0
+
+EstimatorKey = Tuple[str, str]
+
+
+@dataclass(slots=True)
+class StepCost:
+    """Running mean duration of one step kind."""
+
+    samples: int = 0
+    mean_s: float = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.samples += 1
+        self.mean_s += (seconds - self.mean_s) / min(self.samples, _MEAN_WINDOW)
+
+
+def estimator_key(cfg: Optional[Mapping[str, Any]] = None) -> EstimatorKey:
+    """Return ``(dut_type, router_model)`` from the tool configuration."""
+
+    if cfg is None:
+        from src.util.constants import config_snapshot
+
+        cfg = config_snapshot()
+    connect = cfg.get("connect_type") or {}
+    router = cfg.get("router") or {}
+    dut_type = str(connect.get("type") or "").strip().lower() if isinstance(connect, Mapping) else ""
+    router_model = str(router.get("name") or "").strip().lower() if isinstance(router, Mapping) else ""
+    return dut_type or _WILDCARD, router_model or _WILDCARD
+
+
+def _fallback_keys(kind: str, key: EstimatorKey) -> List[str]:
+    dut_type, router_model = key
+    candidates = [
+        (dut_type, router_model),
+        (dut_type, _WILDCARD),
+        (_WILDCARD, router_model),
+        (_WILDCARD, _WILDCARD),
+    ]
+    return list(dict.fromkeys(f"{kind}|{dut}|{router}" for dut, router in candidates))
+
+
+class StepCostModel:
+    """Per-step duration means persisted in ``step_costs.json``."""
+
+    def __init__(self, path: Optional[Path] = None) -> None:
+        if path is None:
+            from src.util.constants import Paths
+
+            path = Path(Paths.CONFIG_DIR) / STEP_COSTS_FILENAME
+        self.path = Path(path)
+        self.costs: Dict[str, StepCost] = {}
+        self._pending: List[Tuple[str, EstimatorKey, float]] = []
+        self._lock = threading.Lock()
+
+    def load(self) -> "StepCostModel":
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return self
+        except Exception as exc:
+            logging.debug("Ignoring unreadable step cost file %s: %s", self.path, exc)
+            return self
+        try:
+            self.costs = {name: StepCost(**entry) for name, entry in (data.get("costs") or {}).items()}
+        except Exception as exc:
+            logging.debug("Ignoring malformed step cost file %s: %s", self.path, exc)
+            self.costs = {}
+        return self
+
+    def _apply(self, kind: str, key: EstimatorKey, seconds: float) -> None:
+        for name in _fallback_keys(kind, key):
+            self.costs.setdefault(name, StepCost()).observe(seconds)
+
+    def observe(self, kind: str, key: EstimatorKey, seconds: float) -> None:
+        """Fold one measured step into the exact and all fallback entries."""
+        with self._lock:
+            self._apply(kind, key, seconds)
+            self._pending.append((kind, key, seconds))
+
+    def cost(self, kind: str, key: EstimatorKey) -> float:
+        """Expected seconds of ``kind`` for ``key``, most specific entry first."""
+        with self._lock:
+            for name in _fallback_keys(kind, key):
+                entry = self.costs.get(name)
+                if entry is not None and entry.samples:
+                    return entry.mean_s
+        return DEFAULT_STEP_SECONDS.get(kind, 0.0)
+
+    def save(self) -> None:
+        """Merge the observations of this process into the file on disk.
+
+        The file is re-read first, so workers running side by side (multi-DUT
+        runs) do not overwrite each other's samples.
+        """
+        with self._lock:
+            if not self._pending:
+                return
+            merged = StepCostModel(self.path).load()
+            for kind, key, seconds in self._pending:
+                merged._apply(kind, key, seconds)
+            data = {"version": 1, "costs": {name: asdict(entry) for name, entry in merged.costs.items()}}
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                atomic_write(self.path, json.dumps(data, indent=1, sort_keys=True))
+            except Exception as exc:
+                logging.warning("Failed to save step costs to %s: %s", self.path, exc)
+                return
+            self.costs = merged.costs
+            self._pending.clear()
+
+
+def _router_directions(router: Any) -> int:
+    total = 0
+    parsed = False
+    for attr in ("tx", "rx"):
+        try:
+            total += int(str(getattr(router, attr)).strip())
+            parsed = True
+        except (AttributeError, TypeError, ValueError):
+            continue
+    return total if parsed else 1
+
+
+def plan_steps_from_items(items: Iterable[Any]) -> Dict[str, int]:
+    """Count the steps the collected performance items will execute.
+
+    A router scenario is any parameter with ``ssid``/``band`` (RVR and peak
+    throughput) or a case carrying ``router_info`` (RVO).  Each distinct
+    router costs one reconfiguration and one connection; every item runs
+    iperf once per enabled direction; ``db_set`` and RVO cases add an
+    attenuation step and RVO cases with a corner add a turntable move.
+    """
+
+    counts = dict.fromkeys(STEP_KINDS, 0)
+    routers: set[int] = set()
+    for item in items:
+        params = getattr(getattr(item, "callspec", None), "params", None) or {}
+        router = None
+        case = None
+        for value in params.values():
+            if hasattr(value, "ssid") and hasattr(value, "band"):
+                router = value
+            elif hasattr(value, "router_info"):
+                case = value
+        if router is None and case is not None:
+            router = case.router_info
+        if router is None:
+            continue
+        if id(router) not in routers:
+            routers.add(id(router))
+            counts[STEP_ROUTER_CONFIG] += 1
+            counts[STEP_WIFI_CONNECT] += 1
+        counts[STEP_IPERF] += _router_directions(router)
+        if "db_set" in params or case is not None:
+            counts[STEP_ATTENUATION] += 1
+        if case is not None and getattr(case, "corner", None) is not None:
+            counts[STEP_TURNTABLE] += 1
+    return {kind: count for kind, count in counts.items() if count}
+
+
+class RunEstimator:
+    """Track planned vs. completed steps of the running session."""
+
+    def __init__(self, model: Optional[StepCostModel] = None) -> None:
+        self._model = model
+        self._lock = threading.Lock()
+        self._key: EstimatorKey = (_WILDCARD, _WILDCARD)
+        self._planned: Dict[str, int] = {}
+        self._done: Dict[str, int] = {}
+        self._costs: Dict[str, float] = {}
+        self._actual_s = 0.0
+        self._predicted_done_s = 0.0
+
+    @property
+    def model(self) -> StepCostModel:
+        if self._model is None:
+            self._model = StepCostModel().load()
+        return self._model
+
+    @property
+    def active(self) -> bool:
+        return bool(self._planned)
+
+    def begin(self, planned: Mapping[str, int], key: Optional[EstimatorKey] = None) -> Optional[float]:
+        """Start estimating a session with ``planned`` step counts.
+
+        Returns the predicted total in seconds, or ``None`` for an empty plan
+        (non-performance runs), in which case nothing is published.
+        """
+        try:
+            resolved_key = key if key is not None else estimator_key()
+        except Exception as exc:
+            logging.debug("Run estimate keyed on defaults: %s", exc)
+            resolved_key = (_WILDCARD, _WILDCARD)
+        with self._lock:
+            self._key = resolved_key
+            self._planned = {kind: int(count) for kind, count in planned.items() if count}
+            self._done = {}
+            self._costs = {kind: self.model.cost(kind, resolved_key) for kind in self._planned}
+            self._actual_s = 0.0
+            self._predicted_done_s = 0.0
+            if not self._planned:
+                return None
+            total = self.total_seconds()
+        publish(RemainingEstimate(total, total))
+        return total
+
+    def total_seconds(self) -> float:
+        return sum(count * self._costs.get(kind, 0.0) for kind, count in self._planned.items())
+
+    def remaining_seconds(self) -> float:
+        """Predicted time for the steps not run yet, scaled by this run's pace."""
+        remaining = sum(
+            max(0, count - self._done.get(kind, 0)) * self._costs.get(kind, 0.0)
+            for kind, count in self._planned.items()
+        )
+        drift = 1.0
+        if self._predicted_done_s > 0:
+            drift = min(_DRIFT_MAX, max(_DRIFT_MIN, self._actual_s / self._predicted_done_s))
+        return remaining * drift
+
+    def record(self, kind: str, seconds: float) -> None:
+        """Learn from one measured step and publish the updated estimate."""
+        seconds = max(0.0, float(seconds))
+        self.model.observe(kind, self._key, seconds)
+        with self._lock:
+            if kind not in self._planned:
+                return
+            self._done[kind] = self._done.get(kind, 0) + 1
+            if self._done[kind] <= self._planned[kind]:
+                self._actual_s += seconds
+                self._predicted_done_s += self._costs.get(kind, 0.0)
+            remaining = self.remaining_seconds()
+            total = self._actual_s + remaining
+        publish(RemainingEstimate(remaining, total))
+
+    def finish(self) -> None:
+        """Persist what this session learned."""
+        with self._lock:
+            self._planned = {}
+        if self._model is not None:
+            self._model.save()
+
+
+#: Estimator of the current pytest process.
+RUN_ESTIMATOR = RunEstimator()
+
+
+def record_step(kind: str, seconds: float) -> None:
+    try:
+        RUN_ESTIMATOR.record(kind, seconds)
+    except Exception as exc:  # pragma: no cover - estimates must never fail a test
+        logging.debug("Step timing for %s dropped: %s", kind, exc)
+
+
+@contextmanager
+def timed_step(kind: str) -> Iterator[None]:
+    """Time the enclosed step; failed steps are not learned from."""
+
+    started = time.perf_counter()
+    yield
+    record_step(kind, time.perf_counter() - started)
+
+
+def history_case_seconds(test_case: str) -> Optional[float]:
+    """Average recorded duration of ``test_case`` from the test history."""
+
+    try:
+        from src.util.test_history import get_history_store
+
+        stats = get_history_store().case_stats(test_case)
+    except Exception as exc:
+        logging.debug("No history estimate for %s: %s", test_case, exc)
+        return None
+    return stats.average_seconds if stats and stats.runs else None
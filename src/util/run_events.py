@@ -0,0 +1,144 @@
+"""Typed progress and status events from pytest workers to the GUI.
+
+Case status used to travel as ``[PYQT_*]`` text markers inside log lines and
+was recovered on the GUI side by scanning every line, which cost a search
+per line and misfired when a test printed a look-alike string.  Workers now
+:func:`publish` the dataclasses below; ``_pytest_worker`` installs a sink that
+puts ``("event", <event>)`` on the worker queue, in order with the log
+batches, and :class:`~src.ui.controller.run_ctl.CaseRunner` re-emits them via
+its ``event_signal``.  Log lines stay plain text.
+
+Outside the GUI (plain ``pytest`` runs) no sink is installed and events are
+logged as readable lines instead.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+__all__ = [
+    "CaseFinished",
+    "CaseProgress",
+    "CaseStarted",
+    "FixtureParams",
+    "PlanEstimate",
+    "RemainingEstimate",
+    "RunEvent",
+    "clear_event_sink",
+    "install_event_sink",
+    "publish",
+]
+
+
+@dataclass(frozen=True)
+class RunEvent:
+    """Base class of worker events."""
+
+    def describe(self) -> str:
+        return repr(self)
+
+
+@dataclass(frozen=True)
+class CaseStarted(RunEvent):
+    """A test item is about to run."""
+
+    name: str
+
+    def describe(self) -> str:
+        return f"Case started: {self.name}"
+
+
+@dataclass(frozen=True)
+class CaseProgress(RunEvent):
+    """``finished`` of ``total`` test items are done."""
+
+    finished: int
+    total: int
+
+    @property
+    def percent(self) -> int:
+        return int(self.finished / self.total * 100) if self.total else 0
+
+    def describe(self) -> str:
+        return f"Progress: {self.finished}/{self.total}"
+
+
+@dataclass(frozen=True)
+class CaseFinished(RunEvent):
+    """Wall time of the case that just ended (synthesised by the runner)."""
+
+    duration_ms: int
+
+
+@dataclass(frozen=True)
+class FixtureParams(RunEvent):
+    """Actual parameters of a fixture of the running case."""
+
+    fixture: str
+    params: str
+    tag: str = "FIX"
+
+    def describe(self) -> str:
+        return f"Fixture {self.fixture}: {self.params}"
+
+
+def _hms(seconds: float) -> str:
+    total = max(0, int(seconds))
+    return f"{total // 3600:02d}:{total % 3600 // 60:02d}:{total % 60:02d}"
+
+
+@dataclass(frozen=True)
+class RemainingEstimate(RunEvent):
+    """Step-model prediction for the running session (see ``run_estimator``)."""
+
+    remaining_s: float
+    total_s: float
+
+    def describe(self) -> str:
+        return f"Estimated remaining: {_hms(self.remaining_s)} of {_hms(self.total_s)}"
+
+
+@dataclass(frozen=True)
+class PlanEstimate(RunEvent):
+    """History-based estimate of a plan's current case and the cases after it."""
+
+    case_index: int
+    case_count: int
+    current_s: float
+    queued_s: float
+
+    def describe(self) -> str:
+        return (
+            f"Plan case {self.case_index + 1}/{self.case_count}: "
+            f"~{_hms(self.current_s)} now, ~{_hms(self.queued_s)} queued"
+        )
+
+
+_sink: Optional[Callable[[tuple[str, RunEvent]], None]] = None
+
+
+def install_event_sink(sink: Callable[[tuple[str, RunEvent]], None]) -> None:
+    """Route :func:`publish` to ``sink`` (for example a worker queue's ``put``)."""
+
+    global _sink
+    _sink = sink
+
+
+def clear_event_sink() -> None:
+    global _sink
+    _sink = None
+
+
+def publish(event: RunEvent) -> None:
+    """Send ``event`` to the GUI, or log it when no GUI is attached."""
+
+    sink = _sink
+    if sink is None:
+        logging.info("%s", event.describe())
+        return
+    try:
+        sink(("event", event))
+    except Exception as exc:  # pragma: no cover - queue already closed
+        logging.debug("Dropping run event %r: %s", event, exc)
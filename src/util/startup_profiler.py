@@ -0,0 +1,177 @@
+"""Startup cost accounting for the GUI.
+
+``main.py`` and :class:`~src.ui.view.main_window.MainWindow` report their
+startup steps through :data:`STARTUP_PROFILER` instead of ad-hoc prints.  The
+console still shows the familiar ``[STARTUP_TIME]`` lines; in addition the
+profiler keeps every stage and every lazily built page, so
+:meth:`StartupProfiler.report` can list where the time went.
+
+Per-module import cost is only collected when ``WIFI_TOOL_PROFILE_STARTUP=1``
+is set (or ``--profile-startup`` is passed to ``main.py``), because the
+import hook adds a little overhead to every ``import`` statement.  The hook
+times the first import of each module on the main thread and records both
+the inclusive time and the self time (inclusive minus nested first
+imports).  The report is also written to ``startup_profile.json`` in the
+working directory.
+"""
+
+from __future__ import annotations
+
+import builtins
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+__all__ = ["ImportCost", "StartupProfiler", "STARTUP_PROFILER", "profiling_requested"]
+
+PROFILE_ENV = "WIFI_TOOL_PROFILE_STARTUP"
+
+
+def profiling_requested(argv: Optional[List[str]] = None) -> bool:
+    """Return True when import profiling was asked for via env or argv."""
+
+    if os.environ.get(PROFILE_ENV, "").strip().lower() in ("1", "true", "yes", "on"):
+        return True
+    return "--profile-startup" in (sys.argv if argv is None else argv)
+
+
+@dataclass
+class ImportCost:
+    """First-import cost of one module, in seconds."""
+
+    module: str
+    inclusive_s: float
+    self_s: float
+
+
+class StartupProfiler:
+    """Collect startup stages, page construction and import costs."""
+
+    def __init__(self) -> None:
+        self.t0 = time.perf_counter()
+        self.stages: List[tuple[str, float]] = []
+        self.pages: Dict[str, float] = {}
+        self.imports: Dict[str, ImportCost] = {}
+        self._original_import: Any = None
+        self._stack: List[List[float]] = []
+        self._main_thread = threading.main_thread()
+
+    # ------------------------------------------------------------------
+    # stages and pages
+    # ------------------------------------------------------------------
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.t0
+
+    def mark(self, label: str) -> float:
+        """Record ``label`` at the time elapsed since process start."""
+
+        elapsed = self.elapsed()
+        self.stages.append((label, elapsed))
+        print(f"[STARTUP_TIME] {label}: {elapsed:.3f}s")
+        return elapsed
+
+    @contextmanager
+    def measure(self, label: str, *, page: bool = False) -> Iterator[None]:
+        """Time the enclosed block; ``page=True`` files it under page construction."""
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            if page:
+                self.pages[label] = self.pages.get(label, 0.0) + duration
+            else:
+                self.stages.append((label, duration))
+            print(f"[STARTUP_TIME] {'page ' if page else ''}{label}: {duration:.3f}s")
+
+    # ------------------------------------------------------------------
+    # import hook
+    # ------------------------------------------------------------------
+    @property
+    def import_hook_installed(self) -> bool:
+        return self._original_import is not None
+
+    def install_import_hook(self, *, force: bool = False) -> bool:
+        """Start timing first imports; no-op unless profiling was requested."""
+
+        if self.import_hook_installed or not (force or profiling_requested()):
+            return self.import_hook_installed
+        original = builtins.__import__
+        self._original_import = original
+
+        def _timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+            if threading.current_thread() is not self._main_thread:
+                return original(name, globals, locals, fromlist, level)
+            module_name = name
+            if level and globals:
+                package = globals.get("__package__") or ""
+                base = package.rsplit(".", level - 1)[0] if level > 1 else package
+                module_name = f"{base}.{name}" if name else base
+            if module_name in sys.modules:
+                return original(name, globals, locals, fromlist, level)
+            # [inclusive time of nested first imports]
+            self._stack.append([0.0])
+            start = time.perf_counter()
+            try:
+                return original(name, globals, locals, fromlist, level)
+            finally:
+                inclusive = time.perf_counter() - start
+                nested = self._stack.pop()[0]
+                if self._stack:
+                    self._stack[-1][0] += inclusive
+                if module_name in sys.modules and module_name not in self.imports:
+                    self.imports[module_name] = ImportCost(module_name, inclusive, max(0.0, inclusive - nested))
+
+        builtins.__import__ = _timed_import
+        return True
+
+    def uninstall_import_hook(self) -> None:
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+
+    # ------------------------------------------------------------------
+    # reporting
+    # ------------------------------------------------------------------
+    def top_imports(self, limit: int = 15) -> List[ImportCost]:
+        return sorted(self.imports.values(), key=lambda cost: cost.self_s, reverse=True)[:limit]
+
+    def summary(self, limit: int = 15) -> Dict[str, Any]:
+        return {
+            "elapsed_s": round(self.elapsed(), 4),
+            "stages": [{"label": label, "seconds": round(value, 4)} for label, value in self.stages],
+            "pages": {name: round(value, 4) for name, value in self.pages.items()},
+            "imports": [asdict(cost) for cost in self.top_imports(limit)],
+            "imports_total": len(self.imports),
+        }
+
+    def report(self, limit: int = 15, *, path: str | Path | None = None) -> Dict[str, Any]:
+        """Print page and import costs; write JSON when the import hook ran."""
+
+        summary = self.summary(limit)
+        for name, seconds in sorted(self.pages.items(), key=lambda item: item[1], reverse=True):
+            print(f"[STARTUP_PROFILE] page {name}: {seconds * 1000:.1f} ms")
+        if self.import_hook_installed:
+            for cost in self.top_imports(limit):
+                print(
+                    f"[STARTUP_PROFILE] import {cost.module}: self {cost.self_s * 1000:.1f} ms, "
+                    f"cumulative {cost.inclusive_s * 1000:.1f} ms"
+                )
+            target = Path(path) if path else Path.cwd() / "startup_profile.json"
+            try:
+                target.write_text(json.dumps(summary, indent=2), encoding="utf-8")
+            except OSError as exc:
+                logging.debug("Startup profile not written: %s", exc)
+        return summary
+
+
+#: Process-wide profiler; its clock starts when this module is first imported.
+STARTUP_PROFILER = StartupProfiler()
@@ -0,0 +1,256 @@
+"""Per-iteration phase telemetry for stability and STR reconnect runs.
+
+Loops record timestamped phase events (suspend, resume, reconnect, DHCP,
+ping recovery, ...) through :class:`TelemetrySink`.  Every event is appended
+to ``telemetry_<suite>.jsonl`` in the report directory as soon as it is
+recorded, so a crashed run keeps what it measured.  :meth:`TelemetrySink.close`
+exports ``telemetry_<suite>.csv`` plus a ``telemetry_<suite>.json`` that holds
+the events and per-phase percentile summaries.  When
+``stability.telemetry.mysql_sync`` is enabled the summaries are also written
+to the ``stability_telemetry`` table.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Mapping, Optional
+
+from src.util import percentile
+
+__all__ = ["PhaseEvent", "TelemetrySink", "summarize_phases", "telemetry_settings"]
+
+_CSV_COLUMNS = ("suite", "iteration", "phase", "started_at", "duration_s", "status", "attrs")
+
+
+@dataclass(frozen=True)
+class PhaseEvent:
+    """One timed phase of a stability iteration."""
+
+    suite: str
+    iteration: int
+    phase: str
+    started_at: float
+    duration_s: float
+    status: str = "ok"
+    attrs: Mapping[str, Any] = field(default_factory=dict)
+
+
+def telemetry_settings(config: Mapping[str, Any] | None) -> Dict[str, bool]:
+    """Return ``{"enabled", "mysql_sync"}`` from ``stability.telemetry``."""
+
+    stability = config.get("stability") if isinstance(config, Mapping) else None
+    section = stability.get("telemetry") if isinstance(stability, Mapping) else None
+    if not isinstance(section, Mapping):
+        return {"enabled": True, "mysql_sync": False}
+    return {
+        "enabled": bool(section.get("enabled", True)),
+        "mysql_sync": bool(section.get("mysql_sync")),
+    }
+
+
+def summarize_phases(events: List[PhaseEvent]) -> Dict[str, Dict[str, Any]]:
+    """Return per-phase count, failures and min/p50/p95/max/mean durations."""
+
+    grouped: Dict[str, List[PhaseEvent]] = {}
+    for event in events:
+        grouped.setdefault(event.phase, []).append(event)
+    summary: Dict[str, Dict[str, Any]] = {}
+    for phase, phase_events in grouped.items():
+        durations = [e.duration_s for e in phase_events if e.status == "ok"]
+        summary[phase] = {
+            "count": len(phase_events),
+            "failed": sum(1 for e in phase_events if e.status != "ok"),
+            "min_s": min(durations) if durations else None,
+            "p50_s": percentile(durations, 0.5),
+            "p95_s": percentile(durations, 0.95),
+            "max_s": max(durations) if durations else None,
+            "mean_s": sum(durations) / len(durations) if durations else None,
+        }
+    return summary
+
+
+class TelemetrySink:
+    """Collect phase events of one suite and export them.
+
+    Parameters:
+        suite: Short suite name used in file names and the ``suite`` column.
+        directory: Output directory; defaults to ``PYTEST_REPORT_DIR`` or
+            ``./report`` resolved at first write.
+        enabled: When False every call is a cheap no-op.
+    """
+
+    def __init__(self, suite: str, directory: str | Path | None = None, *, enabled: bool = True) -> None:
+        self.suite = suite
+        self.enabled = enabled
+        self._directory = Path(directory) if directory else None
+        self._events: List[PhaseEvent] = []
+        self._lock = threading.Lock()
+        #: Iteration used when callers do not pass one explicitly;
+        #: ``iterate_stability_loops`` keeps it current.
+        self.iteration = 0
+        self._synced = 0
+
+    @property
+    def directory(self) -> Path:
+        if self._directory is None:
+            report_dir = os.environ.get("PYTEST_REPORT_DIR")
+            self._directory = Path(report_dir) if report_dir else Path.cwd() / "report"
+        return self._directory
+
+    @property
+    def events(self) -> List[PhaseEvent]:
+        with self._lock:
+            return list(self._events)
+
+    def _path(self, suffix: str) -> Path:
+        return self.directory / f"telemetry_{self.suite}{suffix}"
+
+    def record(
+        self,
+        phase: str,
+        duration_s: float,
+        *,
+        iteration: Optional[int] = None,
+        status: str = "ok",
+        started_at: Optional[float] = None,
+        **attrs: Any,
+    ) -> Optional[PhaseEvent]:
+        """Append one phase event and journal it to disk."""
+
+        if not self.enabled:
+            return None
+        event = PhaseEvent(
+            suite=self.suite,
+            iteration=int(self.iteration if iteration is None else iteration),
+            phase=phase,
+            started_at=started_at if started_at is not None else time.time() - duration_s,
+            duration_s=round(float(duration_s), 4),
+            status=status,
+            attrs=dict(attrs),
+        )
+        with self._lock:
+            self._events.append(event)
+            try:
+                path = self._path(".jsonl")
+                path.parent.mkdir(parents=True, exist_ok=True)
+                with open(path, "a", encoding="utf-8") as handle:
+                    handle.write(json.dumps(asdict(event), ensure_ascii=False, default=str) + "\n")
+            except OSError as exc:
+                logging.debug("Telemetry journal write failed: %s", exc)
+        return event
+
+    @contextmanager
+    def phase(self, name: str, *, iteration: Optional[int] = None, **attrs: Any) -> Iterator[Dict[str, Any]]:
+        """Time the enclosed block as ``name``.
+
+        The yielded dict may be updated with extra attributes; an exception or
+        setting ``attrs["status"]`` marks the phase as failed.
+        """
+
+        extra: Dict[str, Any] = dict(attrs)
+        started_at = time.time()
+        start = time.perf_counter()
+        status = "ok"
+        try:
+            yield extra
+        except BaseException:
+            status = "fail"
+            raise
+        finally:
+            status = str(extra.pop("status", status))
+            self.record(
+                name,
+                time.perf_counter() - start,
+                iteration=iteration,
+                status=status,
+                started_at=started_at,
+                **extra,
+            )
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        return summarize_phases(self.events)
+
+    def export_csv(self, path: str | Path | None = None) -> Path:
+        target = Path(path) if path else self._path(".csv")
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with open(target, "w", newline="", encoding="utf-8") as handle:
+            writer = csv.writer(handle)
+            writer.writerow(_CSV_COLUMNS)
+            for event in self.events:
+                writer.writerow(
+                    [
+                        event.suite,
+                        event.iteration,
+                        event.phase,
+                        time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(event.started_at)),
+                        f"{event.duration_s:.4f}",
+                        event.status,
+                        json.dumps(dict(event.attrs), ensure_ascii=False, default=str) if event.attrs else "",
+                    ]
+                )
+        return target
+
+    def export_json(self, path: str | Path | None = None) -> Path:
+        target = Path(path) if path else self._path(".json")
+        target.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "suite": self.suite,
+            "summary": self.summary(),
+            "events": [asdict(event) for event in self.events],
+        }
+        with open(target, "w", encoding="utf-8") as handle:
+            json.dump(payload, handle, ensure_ascii=False, indent=2, default=str)
+        return target
+
+    def close(self, *, mysql_sync: bool = False) -> Dict[str, Dict[str, Any]]:
+        """Export CSV/JSON, optionally sync summaries to MySQL, return the summary.
+
+        The sink stays usable afterwards; later calls export everything again.
+        """
+
+        if not self.enabled or not self.events:
+            return {}
+        summary = self.summary()
+        try:
+            csv_path = self.export_csv()
+            self.export_json()
+        except OSError as exc:
+            logging.warning("Telemetry export failed for %s: %s", self.suite, exc)
+            return summary
+        for phase, stats in summary.items():
+            if stats["p50_s"] is None:
+                logging.info("[TELEMETRY] %s %s: %s failed", self.suite, phase, stats["failed"])
+                continue
+            logging.info(
+                "[TELEMETRY] %s %s: n=%s failed=%s min/p50/p95/max = %.2f/%.2f/%.2f/%.2f s",
+                self.suite,
+                phase,
+                stats["count"],
+                stats["failed"],
+                stats["min_s"],
+                stats["p50_s"],
+                stats["p95_s"],
+                stats["max_s"],
+            )
+        if mysql_sync:
+            # Only events recorded since the previous sync, so repeated
+            # closes (one per parametrised module) do not duplicate rows.
+            events = self.events
+            pending = summarize_phases(events[self._synced:])
+            if pending:
+                try:
+                    from src.tools.mysql_tool.operations import sync_telemetry_to_db
+
+                    sync_telemetry_to_db(None, suite=self.suite, summary=pending, csv_file=str(csv_path))
+                    self._synced = len(events)
+                except Exception as exc:  # pragma: no cover - database optional
+                    logging.warning("Telemetry MySQL sync failed for %s: %s", self.suite, exc)
+        return summary
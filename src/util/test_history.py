@@ -1,16 +1,27 @@
 from __future__ import annotations
 
 import csv
+import hashlib
+import io
+import json
 import logging
-from dataclasses import dataclass
+import threading
+from dataclasses import asdict, dataclass
 from datetime import datetime
 from pathlib import Path
+from typing import Any, Optional
 
+from src.util.atomic_file import atomic_write
 from src.util.constants import Paths
 
 
 TEST_HISTORY_FILENAME = "test_history.csv"
 TEST_HISTORY_HEADERS = ("account", "start_time", "test_case", "duration")
+# Running aggregates persisted next to the CSV (see ``TestHistoryStore``).
+TEST_HISTORY_SUMMARY_FILENAME = "test_history.summary.json"
+_SUMMARY_VERSION = 1
+# Leading bytes hashed to detect a rewritten (not just appended) CSV.
+_HEAD_HASH_BYTES = 4096
 
 
 @dataclass(slots=True)
@@ -26,6 +37,23 @@ class TestHistoryRecord:
         return [self.account, start_str, self.test_case, duration_str]
 
 
+@dataclass(slots=True)
+class CaseHistoryStats:
+    """Aggregated history of one test case."""
+
+    runs: int = 0
+    total_minutes: int = 0
+    last_start: str = ""
+
+    @property
+    def total_seconds(self) -> int:
+        return self.total_minutes * 60
+
+    @property
+    def average_seconds(self) -> float:
+        return self.total_seconds / self.runs if self.runs else 0.0
+
+
 def get_history_path() -> Path:
     """Return the absolute path to the test_history.csv file under CONFIG_DIR."""
     return Path(Paths.CONFIG_DIR) / TEST_HISTORY_FILENAME
@@ -116,6 +144,9 @@ def append_test_history_record(
             writer.writerow(record.to_row())
     except Exception as exc:
         logging.warning("Failed to append test history record to %s: %s", path, exc)
+        return
+    # Fold the new row into the running aggregates right away.
+    get_history_store().refresh()
 
 
 def _parse_duration_to_minutes(value: str) -> int:
@@ -133,13 +164,196 @@ def _parse_duration_to_minutes(value: str) -> int:
         return 0
 
 
+class TestHistoryStore:
+    """
+    Running aggregates over ``test_history.csv``.
+
+    The totals (overall and per test case) are kept in memory and persisted
+    to ``test_history.summary.json`` together with the number of CSV bytes
+    they cover.  :meth:`refresh` validates them against the CSV's size and
+    mtime: an unchanged file costs one ``stat``, an appended file is read
+    from the covered offset onwards, and a truncated, rotated or rewritten
+    file (detected through a hash of its leading bytes) is re-summed from
+    scratch.  Queries are therefore independent of the history length.
+    """
+
+    def __init__(self, path: Optional[Path] = None, summary_path: Optional[Path] = None) -> None:
+        self.path = Path(path) if path is not None else get_history_path()
+        self.summary_path = (
+            Path(summary_path)
+            if summary_path is not None
+            else self.path.with_name(TEST_HISTORY_SUMMARY_FILENAME)
+        )
+        self._lock = threading.RLock()
+        self._loaded = False
+        self._reset()
+
+    def _reset(self) -> None:
+        self._stamp: tuple[int, int] | None = None
+        self._offset = 0
+        self._head_hash = ""
+        self._runs = 0
+        self._total_minutes = 0
+        self._cases: dict[str, CaseHistoryStats] = {}
+
+    # ------------------------------------------------------------------
+    # validation and incremental parsing
+    # ------------------------------------------------------------------
+    def refresh(self) -> None:
+        """Bring the aggregates in line with the CSV on disk."""
+        with self._lock:
+            if not self._loaded:
+                self._loaded = True
+                self._load_summary()
+            try:
+                stat = self.path.stat()
+            except FileNotFoundError:
+                if self._stamp is not None or self._runs:
+                    self._reset()
+                    self._save_summary()
+                return
+            except OSError as exc:
+                logging.warning("Failed to stat test history file %s: %s", self.path, exc)
+                return
+            stamp = (stat.st_mtime_ns, stat.st_size)
+            if stamp == self._stamp:
+                return
+            try:
+                with self.path.open("rb") as f:
+                    if stat.st_size < self._offset or self._read_head_hash(f) != self._head_hash:
+                        self._reset()
+                    f.seek(self._offset)
+                    self._consume(f.read())
+                    self._head_hash = self._read_head_hash(f)
+            except Exception as exc:
+                logging.warning("Failed to read test history file %s: %s", self.path, exc)
+                return
+            self._stamp = stamp
+            self._save_summary()
+
+    def _read_head_hash(self, f: Any) -> str:
+        covered = min(self._offset, _HEAD_HASH_BYTES)
+        if not covered:
+            return ""
+        f.seek(0)
+        return hashlib.sha1(f.read(covered)).hexdigest()
+
+    def _consume(self, data: bytes) -> None:
+        # Only complete lines are consumed; a partially written last row is
+        # picked up by the next refresh.
+        end = data.rfind(b"\n") + 1
+        if not end:
+            return
+        text = data[:end].decode("utf-8", errors="replace")
+        at_start = self._offset == 0
+        for row in csv.reader(io.StringIO(text, newline="")):
+            if at_start:
+                at_start = False
+                # Skip header if present; otherwise treat the first row as
+                # a data row as best effort.
+                if tuple(row) == TEST_HISTORY_HEADERS:
+                    continue
+            if not row or len(row) < 4:
+                continue
+            minutes = _parse_duration_to_minutes(row[3])
+            self._runs += 1
+            self._total_minutes += minutes
+            stats = self._cases.setdefault(row[2], CaseHistoryStats())
+            stats.runs += 1
+            stats.total_minutes += minutes
+            stats.last_start = max(stats.last_start, row[1])
+        self._offset += end
+
+    # ------------------------------------------------------------------
+    # persistence
+    # ------------------------------------------------------------------
+    def _load_summary(self) -> None:
+        try:
+            data = json.loads(self.summary_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return
+        except Exception as exc:
+            logging.debug("Ignoring unreadable test history summary %s: %s", self.summary_path, exc)
+            return
+        try:
+            if data.get("version") != _SUMMARY_VERSION:
+                return
+            self._stamp = tuple(data["stamp"]) if data.get("stamp") else None  # type: ignore[assignment]
+            self._offset = int(data["offset"])
+            self._head_hash = str(data["head_hash"])
+            self._runs = int(data["runs"])
+            self._total_minutes = int(data["total_minutes"])
+            self._cases = {name: CaseHistoryStats(**stats) for name, stats in data["cases"].items()}
+        except Exception as exc:
+            logging.debug("Ignoring malformed test history summary %s: %s", self.summary_path, exc)
+            self._reset()
+
+    def _save_summary(self) -> None:
+        data = {
+            "version": _SUMMARY_VERSION,
+            "stamp": list(self._stamp) if self._stamp else None,
+            "offset": self._offset,
+            "head_hash": self._head_hash,
+            "runs": self._runs,
+            "total_minutes": self._total_minutes,
+            "cases": {name: asdict(stats) for name, stats in self._cases.items()},
+        }
+        try:
+            atomic_write(self.summary_path, json.dumps(data, ensure_ascii=False))
+        except Exception as exc:
+            logging.debug("Failed to write test history summary %s: %s", self.summary_path, exc)
+
+    # ------------------------------------------------------------------
+    # queries
+    # ------------------------------------------------------------------
+    def total_seconds(self) -> int:
+        """Total recorded test duration in seconds."""
+        self.refresh()
+        return max(0, self._total_minutes * 60)
+
+    def run_count(self) -> int:
+        """Number of recorded runs."""
+        self.refresh()
+        return self._runs
+
+    def case_stats(self, test_case: str) -> Optional[CaseHistoryStats]:
+        """Aggregates for ``test_case`` (as recorded), or ``None`` if never run."""
+        self.refresh()
+        with self._lock:
+            stats = self._cases.get((test_case or "").strip())
+            return CaseHistoryStats(stats.runs, stats.total_minutes, stats.last_start) if stats else None
+
+    def all_case_stats(self) -> dict[str, CaseHistoryStats]:
+        """Copy of the per-case aggregates."""
+        self.refresh()
+        with self._lock:
+            return {
+                name: CaseHistoryStats(stats.runs, stats.total_minutes, stats.last_start)
+                for name, stats in self._cases.items()
+            }
+
+
+_store: Optional[TestHistoryStore] = None
+_store_lock = threading.Lock()
+
+
+def get_history_store() -> TestHistoryStore:
+    """Return the process-wide store for :func:`get_history_path`."""
+    global _store
+    path = get_history_path()
+    with _store_lock:
+        if _store is None or _store.path != path:
+            _store = TestHistoryStore(path)
+        return _store
+
+
 def get_total_test_duration_seconds() -> int:
     """
     Return the total accumulated test duration in seconds.
 
-    The value is derived by summing the HH:mm duration column from the
-    history CSV. If the file does not exist or cannot be parsed,
-    ``0`` is returned.
+    The value is the sum of the HH:mm duration column of the history CSV,
+    served from the running aggregates of :class:`TestHistoryStore`. If the
+    file does not exist or cannot be parsed, ``0`` is returned.
     """
     path = get_history_path()
     if not path.exists():
@@ -147,28 +361,7 @@ def get_total_test_duration_seconds() -> int:
         # inspect it from the config directory if needed.
         ensure_history_file_exists()
         return 0
-
-    total_minutes = 0
-    try:
-        with path.open("r", newline="", encoding="utf-8") as f:
-            reader = csv.reader(f)
-            # Skip header if present.
-            first = next(reader, None)
-            if first and tuple(first) != TEST_HISTORY_HEADERS:
-                # If the first row is not the expected header, treat it
-                # as a data row as best effort.
-                row = first
-                if len(row) >= 4:
-                    total_minutes += _parse_duration_to_minutes(row[3])
-            for row in reader:
-                if not row or len(row) < 4:
-                    continue
-                total_minutes += _parse_duration_to_minutes(row[3])
-    except Exception as exc:
-        logging.warning("Failed to read test history file %s: %s", path, exc)
-        return 0
-
-    return max(0, int(total_minutes) * 60)
+    return get_history_store().total_seconds()
 
 
 def format_duration_hh_mm(total_seconds: float | int) -> str:
@@ -0,0 +1,191 @@
+"""YAML loading with libyaml and a validated on-disk parse cache.
+
+Every config, UI schema and router xpath file used to be parsed by the
+pure-Python loader on each GUI start and in every pytest worker.
+:func:`load_yaml_file` prefers libyaml's ``CSafeLoader``/``CFullLoader``
+when PyYAML was built with it, and stores each parse result with
+:mod:`marshal` (plain data only, nothing is executed on load) keyed by the
+file's absolute path and loader:
+
+* when the file's ``(mtime_ns, size)`` stamp matches the entry, the cached
+  data is returned without reading the YAML file;
+* when only the stamp differs, the content hash decides whether the entry
+  is still valid (a ``touch`` or a checkout does not force a parse);
+* the encoding that decoded the file (``utf-8`` or ``gbk``) is remembered
+  and tried first next time.
+
+The cache lives in the user's private cache directory (``%LOCALAPPDATA%``
+on Windows, ``$XDG_CACHE_HOME`` or ``~/.cache`` elsewhere).  On POSIX it is
+only used when the directory belongs to the current user and is not
+accessible to anyone else.  Set ``WIFI_TOOL_YAML_CACHE_DIR`` to move it, or
+to ``off`` to disable it.  Results marshal cannot store (``!!timestamp``
+values, Python tags of the full loader) are simply parsed every time.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import marshal
+import os
+import stat as stat_mode
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence
+
+import yaml
+
+from src.util.atomic_file import atomic_write
+
+__all__ = ["FAST_FULL_LOADER", "FAST_SAFE_LOADER", "load_yaml_file", "yaml_cache_dir"]
+
+FAST_SAFE_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+FAST_FULL_LOADER = getattr(yaml, "CFullLoader", yaml.FullLoader)
+_LOADERS = {"safe": FAST_SAFE_LOADER, "full": FAST_FULL_LOADER}
+_ENCODINGS = ("utf-8-sig", "gbk")
+_CACHE_ENV = "WIFI_TOOL_YAML_CACHE_DIR"
+# Bump when the entry layout changes.
+_CACHE_VERSION = 2
+_private_dirs: Dict[Path, bool] = {}
+
+
+def _default_cache_root() -> Optional[Path]:
+    local_app_data = os.environ.get("LOCALAPPDATA", "").strip()
+    if os.name == "nt" and local_app_data:
+        return Path(local_app_data)
+    xdg_cache = os.environ.get("XDG_CACHE_HOME", "").strip()
+    if xdg_cache:
+        return Path(xdg_cache)
+    try:
+        return Path.home() / ".cache"
+    except RuntimeError:
+        return None
+
+
+def _is_private_dir(cache_dir: Path) -> bool:
+    """Create ``cache_dir`` if needed and check nobody else can write to it."""
+
+    if cache_dir in _private_dirs:
+        return _private_dirs[cache_dir]
+    private = False
+    try:
+        cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+        info = os.lstat(cache_dir)
+        if not stat_mode.S_ISDIR(info.st_mode):
+            logging.warning("YAML cache disabled: %s is not a directory", cache_dir)
+        elif hasattr(os, "getuid") and info.st_uid != os.getuid():
+            logging.warning("YAML cache disabled: %s is owned by another user", cache_dir)
+        elif hasattr(os, "getuid") and stat_mode.S_IMODE(info.st_mode) & 0o077:
+            logging.warning("YAML cache disabled: %s is accessible to other users (mode %o)",
+                            cache_dir, stat_mode.S_IMODE(info.st_mode))
+        else:
+            private = True
+    except OSError as exc:
+        logging.debug("YAML cache disabled: cannot prepare %s: %s", cache_dir, exc)
+    _private_dirs[cache_dir] = private
+    return private
+
+
+def yaml_cache_dir() -> Optional[Path]:
+    """Return the cache directory, or ``None`` when caching is disabled or unsafe."""
+
+    configured = os.environ.get(_CACHE_ENV, "").strip()
+    if configured.lower() in ("0", "off", "false", "no"):
+        return None
+    if configured:
+        cache_dir = Path(configured)
+    else:
+        root = _default_cache_root()
+        if root is None:
+            return None
+        cache_dir = root / "wifi_test" / "yaml_cache"
+    return cache_dir if _is_private_dir(cache_dir) else None
+
+
+def _entry_path(cache_dir: Path, path: Path, loader: str) -> Path:
+    digest = hashlib.sha1(f"{path}|{loader}|{marshal.version}".encode("utf-8")).hexdigest()
+    return cache_dir / f"{digest}.marshal"
+
+
+def _read_entry(entry_path: Path, path: Path, loader: str) -> Optional[dict[str, Any]]:
+    try:
+        entry = marshal.loads(entry_path.read_bytes())
+    except FileNotFoundError:
+        return None
+    except Exception as exc:
+        logging.debug("Discarding unreadable YAML cache entry %s: %s", entry_path, exc)
+        return None
+    if (
+        not isinstance(entry, dict)
+        or entry.get("version") != _CACHE_VERSION
+        or entry.get("path") != str(path)
+        or entry.get("loader") != loader
+    ):
+        return None
+    return entry
+
+
+def _write_entry(entry_path: Path, entry: dict[str, Any]) -> None:
+    try:
+        atomic_write(entry_path, marshal.dumps(entry))
+    except Exception as exc:  # pragma: no cover - cache is best effort
+        logging.debug("Could not write YAML cache entry %s: %s", entry_path, exc)
+
+
+def _decode(raw: bytes, preferred: Optional[str], encodings: Sequence[str]) -> tuple[str, str]:
+    candidates = [preferred] if preferred else []
+    candidates += [encoding for encoding in encodings if encoding != preferred]
+    for encoding in candidates:
+        try:
+            return raw.decode(encoding), encoding
+        except UnicodeDecodeError:
+            continue
+    raise UnicodeDecodeError(candidates[-1], raw, 0, len(raw), "no configured encoding matched")
+
+
+def load_yaml_file(
+    path: str | os.PathLike[str],
+    *,
+    loader: str = "safe",
+    encodings: Sequence[str] = _ENCODINGS,
+) -> Any:
+    """Parse the YAML file at ``path``, using the on-disk cache when valid.
+
+    ``loader`` is ``"safe"`` or ``"full"``.  The returned object is always a
+    fresh copy.  Raises ``OSError`` when the file cannot be read,
+    ``UnicodeDecodeError`` when no encoding fits and ``yaml.YAMLError`` on
+    malformed content.
+    """
+
+    resolved = Path(path).resolve()
+    loader_cls = _LOADERS[loader]
+    stat = resolved.stat()
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cache_dir = yaml_cache_dir()
+    entry_path = _entry_path(cache_dir, resolved, loader) if cache_dir is not None else None
+    entry = _read_entry(entry_path, resolved, loader) if entry_path is not None else None
+    if entry is not None and tuple(entry["stamp"]) == stamp:
+        return entry["data"]
+
+    raw = resolved.read_bytes()
+    content_hash = hashlib.sha1(raw).hexdigest()
+    if entry is not None and entry.get("hash") == content_hash:
+        entry["stamp"] = stamp
+        _write_entry(entry_path, entry)
+        return entry["data"]
+
+    text, encoding = _decode(raw, entry.get("encoding") if entry else None, encodings)
+    data = yaml.load(text, Loader=loader_cls)
+    if entry_path is not None:
+        _write_entry(
+            entry_path,
+            {
+                "version": _CACHE_VERSION,
+                "path": str(resolved),
+                "loader": loader,
+                "stamp": stamp,
+                "hash": content_hash,
+                "encoding": encoding,
+                "data": data,
+            },
+        )
+    return data
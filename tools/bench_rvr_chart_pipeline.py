@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+RVR chart pipeline benchmark — time chart data preparation on a synthetic campaign.
+
+Writes a result CSV shaped like PerformanceResult output (bands, modes,
+directions, attenuation steps, one ``Throughput n`` column per repeat) and
+times each stage of ``RvrChartLogic._load_rvr_dataframe`` on it:
+1) reading the CSV,
+2) ``_prepare_rvr_dataframe`` (display columns, steps, throughput means),
+3) test type detection.
+
+Usage (run at repo root):
+    python tools/bench_rvr_chart_pipeline.py
+    python tools/bench_rvr_chart_pipeline.py --rows 200000 --repeats 5 --runs 5
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, List
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from src.tools.result_store import RESULT_BASE_HEADERS  # noqa: E402
+from src.util.report.rvr_chart_facade import RvrChartLogic  # noqa: E402
+
+BANDS = (("2.4G", "1", "20"), ("5G", "36", "80"), ("5G", "149", "160"), ("6G", "37", "160"))
+STANDARDS = ("11ax", "11ac", "11n", "11be")
+DIRECTIONS = ("UL", "DL")
+PROFILES = (("", ""), ("TARGET_RSSI", "-60"), ("STATIC_DB", "15"))
+
+
+def write_campaign(path: Path, rows: int, repeats: int, seed: int) -> None:
+    """Write ``rows`` result lines with ``repeats`` throughput columns to ``path``."""
+    rng = random.Random(seed)
+    throughput = [f"Throughput {index}" for index in range(1, repeats + 1)] if repeats > 1 else ["Throughput"]
+    headers: List[str] = []
+    for name in RESULT_BASE_HEADERS:
+        headers.extend(throughput if name == "Throughput" else [name])
+    lines = [",".join(headers)]
+    for index in range(rows):
+        band, channel, bandwidth = BANDS[index // 400 % len(BANDS)]
+        step = index % 40 * 2
+        mode, value = PROFILES[index // 1600 % len(PROFILES)]
+        cells = {
+            "SerianNumber": f"SN{index // 4000:04d}",
+            "Test_Category": "RVR",
+            "Standard": STANDARDS[index // 3200 % len(STANDARDS)],
+            "Freq_Band": band,
+            "BW": bandwidth,
+            "Data_Rate": "auto",
+            "Channel": channel,
+            "Angel": "",
+            "Protocol": "TCP",
+            "Direction": DIRECTIONS[index // 40 % len(DIRECTIONS)],
+            "Total_Path_Loss": str(step + 20),
+            "DB": str(step),
+            "RSSI": str(-30 - step),
+            "MCS_Rate": "HE-MCS11",
+            "Expect_Rate": "0",
+            "Beacon_RSSI": str(-28 - step),
+            "WF0_RSSI": str(-31 - step),
+            "WF1_RSSI": str(-32 - step),
+            "Latency": "NULL",
+            "Packet_Loss": "NULL",
+            "Profile_Mode": mode,
+            "Profile_Value": value,
+            "Scenario_Group_Key": f"{band}|{channel}",
+        }
+        peak = max(5.0, 900.0 - step * 10)
+        for name in throughput:
+            cells[name] = f"{peak * rng.uniform(0.9, 1.1):.2f}"
+        lines.append(",".join(cells[name] for name in headers))
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def best_of(runs: int, func: Callable[[], object]) -> float:
+    """Fastest wall time of ``runs`` calls, in milliseconds."""
+    best = float("inf")
+    for _ in range(runs):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000.0
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Time RVR chart data preparation on a synthetic result CSV.")
+    ap.add_argument("--rows", type=int, default=50000, help="result rows to generate")
+    ap.add_argument("--repeats", type=int, default=3, help="throughput repeat columns per row")
+    ap.add_argument("--runs", type=int, default=3, help="timed runs per stage; the best is reported")
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args()
+
+    import pandas as pd
+
+    logic = RvrChartLogic()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "rvr_campaign.csv"
+        write_campaign(path, args.rows, args.repeats, args.seed)
+        raw = pd.read_csv(path)
+        prepared = logic._prepare_rvr_dataframe(raw)
+        stages = [
+            ("read csv", lambda: pd.read_csv(path)),
+            ("prepare", lambda: logic._prepare_rvr_dataframe(raw)),
+            ("test type", lambda: logic._resolve_dataframe_test_type(prepared, None)),
+            ("total", lambda: logic._load_rvr_dataframe(path)),
+        ]
+        print(f"{args.rows} rows, {args.repeats} repeat(s), best of {args.runs}")
+        for name, func in stages:
+            print(f"  {name:<10} {best_of(args.runs, func):9.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
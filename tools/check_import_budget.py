@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Import budget check — keep the result-recording path free of heavy imports.
+
+Every pytest worker imports the result-recording modules, so pandas, numpy,
+matplotlib or openpyxl sneaking into their import graph costs each run
+hundreds of milliseconds.  This script imports every module in BUDGETS in
+a fresh interpreter with ``-X importtime`` and fails when:
+1) a forbidden package shows up in the module's import graph, or
+2) the module's cumulative import time exceeds its budget (times --scale).
+
+Usage (run at repo root):
+    python tools/check_import_budget.py
+    python tools/check_import_budget.py --scale 2 --verbose
+
+Exit code 0 when every module is within budget, 1 otherwise.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+ROOT = Path(__file__).resolve().parents[1]
+
+HEAVY = ("pandas", "numpy", "matplotlib", "openpyxl")
+
+# module -> (budget in ms, top-level packages it must not import)
+BUDGETS: Dict[str, Tuple[float, Tuple[str, ...]]] = {
+    "src.tools.result_writer": (50.0, HEAVY),
+    "src.tools.result_store": (80.0, HEAVY),
+    "src.tools.performance_result": (150.0, HEAVY),
+    "src.tools.performance": (150.0, HEAVY),
+    "src.util.run_events": (150.0, HEAVY),
+    "src.util.report": (250.0, HEAVY),
+    "src.util.report.facade": (250.0, HEAVY),
+    "src.tools.reporting": (250.0, HEAVY),
+}
+
+_LINE_RE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def measure(module: str) -> Tuple[float, List[Tuple[int, str]], str]:
+    """Return (cumulative ms, (depth, name) per import, error) for ``module``."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(ROOT), env.get("PYTHONPATH", "")]))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=str(ROOT),
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    imported: List[Tuple[int, str]] = []
+    cumulative_us = 0
+    for line in proc.stderr.splitlines():
+        match = _LINE_RE.match(line)
+        if not match:
+            continue
+        imported.append((len(match.group(3)), match.group(4)))
+        if match.group(4) == module:
+            cumulative_us = int(match.group(2))
+    error = ""
+    if proc.returncode != 0:
+        tail = [line for line in proc.stderr.splitlines() if not line.startswith("import time:")]
+        error = tail[-1] if tail else f"exit code {proc.returncode}"
+    return cumulative_us / 1000.0, imported, error
+
+
+def import_chain(imported: List[Tuple[int, str]], target: str) -> List[str]:
+    """Names from ``target`` up to the root; -X importtime lists parents after children."""
+    for index, (depth, name) in enumerate(imported):
+        if name != target:
+            continue
+        chain = [name]
+        for parent_depth, parent in imported[index + 1:]:
+            if parent_depth < depth:
+                chain.append(parent)
+                depth = parent_depth
+        return chain
+    return [target]
+
+
+def check(scale: float, verbose: bool) -> int:
+    failures = 0
+    for module, (budget_ms, forbidden) in BUDGETS.items():
+        elapsed_ms, imported, error = measure(module)
+        if error:
+            # Missing third-party packages are an environment problem, not a regression.
+            print(f"SKIP  {module}: {error}")
+            continue
+        heavy = sorted({name for _, name in imported if name in forbidden})
+        limit = budget_ms * scale
+        problems = []
+        if heavy:
+            problems.append("imports " + ", ".join(heavy))
+        if elapsed_ms > limit:
+            problems.append(f"{elapsed_ms:.0f} ms > {limit:.0f} ms")
+        status = "FAIL" if problems else "ok"
+        print(f"{status:<5} {module}: {elapsed_ms:.0f} ms (budget {limit:.0f} ms)" + (f" — {'; '.join(problems)}" if problems else ""))
+        if verbose and heavy:
+            print(f"      via {' <- '.join(import_chain(imported, heavy[0]))}")
+        failures += bool(problems)
+    return 1 if failures else 0
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Fail when recording modules exceed their import budget.")
+    ap.add_argument("--scale", type=float, default=1.0, help="multiply every time budget (slow machines/CI)")
+    ap.add_argument("--verbose", action="store_true", help="show which heavy modules were pulled in")
+    args = ap.parse_args()
+    return check(args.scale, args.verbose)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
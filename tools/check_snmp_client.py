@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SNMP client check — drive SnmpClient against a local UDP SNMP responder.
+
+Starts a minimal SNMP agent on 127.0.0.1 that keeps an OID -> value table and
+answers GetRequest / SetRequest PDUs, then verifies that the client:
+1) writes and reads back outlet states (single and pipelined requests),
+2) ignores a forged response with a matching request id from another port,
+3) retransmits when the responder drops the first datagram,
+4) returns None for an agent that never answers.
+
+Usage (run at repo root):
+    python tools/check_snmp_client.py
+
+Exit code 0 when every check passes, 1 otherwise.
+"""
+from __future__ import annotations
+
+import socket
+import sys
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from src.tools.relay_tool.snmp_client import (  # noqa: E402
+    PDU_RESPONSE,
+    PDU_SET,
+    SnmpClient,
+    SnmpRequest,
+    decode_message,
+    encode_message,
+)
+
+OUTLET_OID = "1.3.6.1.4.1.23280.9.1.2.{}"
+
+
+class SnmpResponder:
+    """Local SNMP agent serving an in-memory OID table."""
+
+    def __init__(self, *, drop_first: int = 0, forge: bool = False) -> None:
+        self.table: Dict[str, Any] = {}
+        self.received = 0
+        self._drop = drop_first
+        self._forge = forge
+        self._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._sock.bind(("127.0.0.1", 0))
+        self._sock.settimeout(0.2)
+        self._forger = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+
+    @property
+    def port(self) -> int:
+        return self._sock.getsockname()[1]
+
+    def __enter__(self) -> "SnmpResponder":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._stop.set()
+        self._thread.join()
+        self._sock.close()
+        self._forger.close()
+
+    def _serve(self) -> None:
+        while not self._stop.is_set():
+            try:
+                data, client = self._sock.recvfrom(65535)
+            except socket.timeout:
+                continue
+            self.received += 1
+            if self._drop > 0:
+                self._drop -= 1
+                continue
+            version, community, pdu_type, pdu = decode_message(data)
+            if pdu_type == PDU_SET:
+                self.table.update(pdu.varbinds)
+            values = [(oid, self.table.get(oid)) for oid, _ in pdu.varbinds]
+            if self._forge:
+                bogus = [(oid, 99) for oid, _ in pdu.varbinds]
+                forged = SnmpRequest("127.0.0.1", bogus, PDU_RESPONSE, pdu.request_id)
+                self._forger.sendto(encode_message(forged, community=community, version=version), client)
+            reply = SnmpRequest("127.0.0.1", values, PDU_RESPONSE, pdu.request_id)
+            self._sock.sendto(encode_message(reply, community=community, version=version), client)
+
+
+def check_set_get() -> None:
+    with SnmpResponder() as agent:
+        client = SnmpClient(port=agent.port, timeout=0.5, retries=2)
+        assert client.set("127.0.0.1", [(OUTLET_OID.format(1), 1)]), "set failed"
+        assert client.get("127.0.0.1", [OUTLET_OID.format(1)]) == {OUTLET_OID.format(1): 1}
+
+
+def check_pipelined() -> None:
+    with SnmpResponder() as agent:
+        client = SnmpClient(port=agent.port, timeout=0.5, retries=2)
+        requests = [SnmpRequest("127.0.0.1", [(OUTLET_OID.format(i), i % 2 + 1)], PDU_SET) for i in range(8)]
+        responses = client.request_many(requests)
+        assert all(r is not None and r.ok for r in responses), "pipelined set lost a response"
+        assert [r.request_id for r in responses] == [q.request_id for q in requests], "responses out of order"
+        values = client.get("127.0.0.1", [OUTLET_OID.format(i) for i in range(8)])
+        assert values == {OUTLET_OID.format(i): i % 2 + 1 for i in range(8)}, values
+        assert agent.received == 9, f"expected 9 datagrams, agent saw {agent.received}"
+
+
+def check_forged_response() -> None:
+    with SnmpResponder(forge=True) as agent:
+        client = SnmpClient(port=agent.port, timeout=0.5, retries=1)
+        client.set("127.0.0.1", [(OUTLET_OID.format(3), 2)])
+        values = client.get("127.0.0.1", [OUTLET_OID.format(3)])
+        assert values == {OUTLET_OID.format(3): 2}, f"accepted forged response: {values}"
+
+
+def check_retransmit() -> None:
+    with SnmpResponder(drop_first=1) as agent:
+        client = SnmpClient(port=agent.port, timeout=0.3, retries=3)
+        assert client.set("127.0.0.1", [(OUTLET_OID.format(4), 1)]), "no retransmission"
+        assert agent.received == 2, f"expected 2 datagrams, agent saw {agent.received}"
+
+
+def check_timeout() -> None:
+    with SnmpResponder() as agent:
+        port = agent.port
+    client = SnmpClient(port=port, timeout=0.2, retries=2)
+    assert client.get("127.0.0.1", [OUTLET_OID.format(1)]) is None
+
+
+CHECKS: List[Callable[[], None]] = [
+    check_set_get,
+    check_pipelined,
+    check_forged_response,
+    check_retransmit,
+    check_timeout,
+]
+
+
+def main() -> int:
+    failures = 0
+    for check in CHECKS:
+        try:
+            check()
+        except Exception as exc:
+            failures += 1
+            print(f"FAIL  {check.__name__}: {exc}")
+        else:
+            print(f"ok    {check.__name__}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())